@@ -27,71 +27,142 @@ from baidubce import compat
 _logger = logging.getLogger(__name__)
 
 
-def _get_canonical_headers(headers, headers_to_sign=None):
+_DEFAULT_HEADERS_TO_SIGN = frozenset([b"host",
+                                      b"content-md5",
+                                      b"content-length",
+                                      b"content-type"])
+
+
+def _get_canonical_headers(headers, headers_to_sign=None, normalized_names=None):
     headers = headers or {}
 
     if headers_to_sign is None or len(headers_to_sign) == 0:
-        headers_to_sign = set([b"host",
-                               b"content-md5",
-                               b"content-length",
-                               b"content-type"])
+        headers_to_sign = _DEFAULT_HEADERS_TO_SIGN
     result = []
     for k in headers:
-        k_lower = k.strip().lower()
         value = utils.convert_to_standard_string(headers[k]).strip()
         # 值为空字符的header不参与签名计算
         if not value:
             continue
+        if normalized_names is None:
+            k_lower = k.strip().lower()
+            name = None
+        else:
+            name = normalized_names.get(k)
+            if name is not None:
+                k_lower = name[0]
+            else:
+                k_lower = k.strip().lower()
         if k_lower.startswith(http_headers.BCE_PREFIX) \
                 or k_lower in headers_to_sign:
-            str_tmp = b"%s:%s" % (utils.normalize_string(k_lower), utils.normalize_string(value))
+            if name is None:
+                name = (k_lower, utils.normalize_string(k_lower))
+                if normalized_names is not None:
+                    normalized_names[k] = name
+            str_tmp = b"%s:%s" % (name[1], utils.normalize_string(value))
             result.append(str_tmp)
     result.sort()
     return (b'\n').join(result)
 
 
-def sign(credentials, http_method, path, headers, params,
-         timestamp=0, expiration_in_seconds=1800, headers_to_sign=None):
-    """
-    Create the authorization
+class Signer(object):
     """
+    Signer of the bce-auth-v1 protocol.
 
-    _logger.debug('Sign params: %s %s %s %s %d %d %s' % (
-        http_method, path, headers, params, timestamp, expiration_in_seconds, headers_to_sign))
-
-    headers = headers or {}
-    params = params or {}
-
-    sign_key_info = b'bce-auth-v1/%s/%s/%d' % (
-        credentials.access_key_id,
-        utils.get_canonical_time(timestamp),
-        expiration_in_seconds)
-    sign_key = hmac.new(
-        credentials.secret_access_key,
-        sign_key_info,
-        hashlib.sha256).hexdigest()
-
-    canonical_uri = path
-    canonical_querystring = utils.get_canonical_querystring(params, True)
+    It produces the same authorization as sign(), but keeps the signing keys it derived,
+    keyed by access key, timestamp second and expiration, and the normalized names of the
+    headers it has signed, so that requests signed within the same second only compute the
+    final HMAC. An instance is a callable with the signature of sign() and can be passed
+    wherever a sign_function is expected.
+    """
 
-    canonical_headers = _get_canonical_headers(headers, headers_to_sign)
-    string_to_sign = (b'\n').join([
-        http_method, canonical_uri,
-        canonical_querystring, canonical_headers
-        ])
-    sign_result = hmac.new(compat.convert_to_bytes(sign_key), string_to_sign, hashlib.sha256).hexdigest()
-    # convert to bytes
-    sign_result = compat.convert_to_bytes(sign_result)
+    def __init__(self, max_cached_keys=64, max_cached_header_names=1024):
+        """
+        :param max_cached_keys: max number of signing keys kept
+        :type max_cached_keys: int
+        :param max_cached_header_names: max number of normalized header names kept
+        :type max_cached_header_names: int
+        """
+        self._max_cached_keys = max_cached_keys
+        self._max_cached_header_names = max_cached_header_names
+        self._sign_keys = {}
+        self._header_names = {}
+
+    def _get_sign_key(self, credentials, canonical_time, expiration_in_seconds):
+        cache_key = (credentials.access_key_id, credentials.secret_access_key,
+                     canonical_time, expiration_in_seconds)
+        cached = self._sign_keys.get(cache_key)
+        if cached is not None:
+            return cached
+        sign_key_info = b'bce-auth-v1/%s/%s/%d' % (
+            credentials.access_key_id,
+            canonical_time,
+            expiration_in_seconds)
+        sign_key = hmac.new(
+            credentials.secret_access_key,
+            sign_key_info,
+            hashlib.sha256).hexdigest()
+        cached = (sign_key_info, compat.convert_to_bytes(sign_key))
+        if len(self._sign_keys) >= self._max_cached_keys:
+            # timestamps only move forward, old keys are not needed any more
+            self._sign_keys.clear()
+        self._sign_keys[cache_key] = cached
+        return cached
+
+    def sign(self, credentials, http_method, path, headers, params,
+             timestamp=0, expiration_in_seconds=1800, headers_to_sign=None):
+        """
+        Create the authorization
+        """
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug('Sign params: %s %s %s %s %d %d %s' % (
+                http_method, path, headers, params, timestamp, expiration_in_seconds,
+                headers_to_sign))
+
+        headers = headers or {}
+        params = params or {}
+
+        sign_key_info, sign_key = self._get_sign_key(
+            credentials, utils.get_canonical_time(timestamp), expiration_in_seconds)
+
+        canonical_uri = path
+        canonical_querystring = utils.get_canonical_querystring(params, True)
+
+        if len(self._header_names) >= self._max_cached_header_names:
+            self._header_names.clear()
+        canonical_headers = _get_canonical_headers(headers, headers_to_sign, self._header_names)
+        string_to_sign = (b'\n').join([
+            http_method, canonical_uri,
+            canonical_querystring, canonical_headers
+            ])
+        sign_result = hmac.new(sign_key, string_to_sign, hashlib.sha256).hexdigest()
+        # convert to bytes
+        sign_result = compat.convert_to_bytes(sign_result)
+
+        if headers_to_sign:
+            result = b'%s/%s/%s' % (sign_key_info, (b';').join(headers_to_sign), sign_result)
+        else:
+            result = b'%s//%s' % (sign_key_info, sign_result)
+
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug('sign_key=[%s] sign_string=[%d bytes][ %s ]' %
+                          (sign_key, len(string_to_sign), string_to_sign))
+            _logger.debug('result=%s' % result)
+        return result
+
+    __call__ = sign
+
+
+_default_signer = Signer()
 
-    if headers_to_sign:
-        result = b'%s/%s/%s' % (sign_key_info, (b';').join(headers_to_sign), sign_result)
-    else:
-        result = b'%s//%s' % (sign_key_info, sign_result)
 
-    _logger.debug('sign_key=[%s] sign_string=[%d bytes][ %s ]' %
-                  (sign_key, len(string_to_sign), string_to_sign))
-    _logger.debug('result=%s' % result)
-    return result
+def sign(credentials, http_method, path, headers, params,
+         timestamp=0, expiration_in_seconds=1800, headers_to_sign=None):
+    """
+    Create the authorization
+    """
+    return _default_signer.sign(credentials, http_method, path, headers, params,
+                                timestamp, expiration_in_seconds, headers_to_sign)
 
 
 def resource_pool_sign(credentials, http_method, path, headers, params,
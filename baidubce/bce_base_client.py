@@ -19,6 +19,7 @@ from builtins import str, bytes
 
 import baidubce
 from baidubce import bce_client_configuration
+from baidubce import json_codec
 from baidubce.exception import BceClientError
 from baidubce.auth import bce_v1_signer
 from baidubce.http import handler
@@ -70,6 +71,12 @@ class BceBaseClient(object):
             self.config, bce_v1_signer.sign, [handler.parse_error, handler.parse_json],
             http_method, path, body, headers, params)
 
+    def _json_dumps(self, obj, **kwargs):
+        """
+        Serialize a request body with the json codec of the client configuration.
+        """
+        return json_codec.dumps(obj, getattr(self.config, 'json_codec', None), **kwargs)
+
     def _get_config(self, apiDict, apiName):
         return copy.deepcopy(apiDict[apiName])
 
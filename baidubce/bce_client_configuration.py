@@ -44,6 +44,12 @@ class BceClientConfiguration(object):
                  auto_follow_redirect=False,
                  under_line_headers=True,
                  request_payer=False,
+                 connection_pool_enabled=None,
+                 max_connections_per_host=None,
+                 connection_idle_timeout_in_mills=None,
+                 lazy_json_response=None,
+                 keep_json_raw_data=None,
+                 json_codec=None,
                  ):
         self.credentials = credentials
         self.endpoint = compat.convert_to_bytes(endpoint) if endpoint is not None else endpoint
@@ -67,6 +73,15 @@ class BceClientConfiguration(object):
         if request_payer is not None and not isinstance(request_payer, bool):
             raise TypeError(b'request_payer must be a bool value')
         self.request_payer = request_payer
+        self.connection_pool_enabled = connection_pool_enabled
+        self.max_connections_per_host = max_connections_per_host
+        self.connection_idle_timeout_in_mills = connection_idle_timeout_in_mills
+        # objects of json responses translate their attribute names on first access
+        self.lazy_json_response = lazy_json_response
+        # keep the json response body text as response.raw_data
+        self.keep_json_raw_data = keep_json_raw_data
+        # "json", "auto", "orjson", "ujson" or a codec object, see baidubce.json_codec
+        self.json_codec = json_codec
 
     def merge_non_none_values(self, other):
         """
@@ -84,10 +99,22 @@ DEFAULT_REGION = baidubce.region.BEIJING
 DEFAULT_CONNECTION_TIMEOUT_IN_MILLIS = 50 * 1000
 DEFAULT_SEND_BUF_SIZE = 1024 * 1024
 DEFAULT_RECV_BUF_SIZE = 10 * 1024 * 1024
+DEFAULT_CONNECTION_POOL_ENABLED = True
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 32
+DEFAULT_CONNECTION_IDLE_TIMEOUT_IN_MILLIS = 30 * 1000
+DEFAULT_LAZY_JSON_RESPONSE = False
+DEFAULT_KEEP_JSON_RAW_DATA = True
+DEFAULT_JSON_CODEC = 'json'
 DEFAULT_CONFIG = BceClientConfiguration(
     protocol=DEFAULT_PROTOCOL,
     region=DEFAULT_REGION,
     connection_timeout_in_mills=DEFAULT_CONNECTION_TIMEOUT_IN_MILLIS,
     send_buf_size=DEFAULT_SEND_BUF_SIZE,
     recv_buf_size=DEFAULT_RECV_BUF_SIZE,
-    retry_policy=BackOffRetryPolicy())
+    retry_policy=BackOffRetryPolicy(),
+    connection_pool_enabled=DEFAULT_CONNECTION_POOL_ENABLED,
+    max_connections_per_host=DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    connection_idle_timeout_in_mills=DEFAULT_CONNECTION_IDLE_TIMEOUT_IN_MILLIS,
+    lazy_json_response=DEFAULT_LAZY_JSON_RESPONSE,
+    keep_json_raw_data=DEFAULT_KEEP_JSON_RAW_DATA,
+    json_codec=DEFAULT_JSON_CODEC)
@@ -0,0 +1,541 @@
+# Copyright 2014 Baidu, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+# -*- coding: utf-8 -*-
+"""
+This module provides an asyncio based http request function for bce services.
+
+It mirrors baidubce.http.bce_http_client.send_request: the same signer, response handlers and
+retry policy are used, but connections are asyncio streams and retry delays do not block the
+event loop. Python 3.5+ is required.
+"""
+import asyncio
+import http.client
+import io
+import logging
+import ssl
+import time
+import traceback
+import weakref
+
+import baidubce
+from baidubce import bce_client_configuration
+from baidubce import compat
+from baidubce import utils
+from baidubce.exception import BceClientError
+from baidubce.exception import BceHttpClientError
+from baidubce.exception import BceServerError
+from baidubce.http import bce_http_client
+from baidubce.http import http_headers
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse
+
+_logger = logging.getLogger(__name__)
+
+_MAX_LINE_SIZE = 64 * 1024
+
+# connection pools are bound to the event loop which created their streams
+_connection_pools = weakref.WeakKeyDictionary()
+
+
+class AsyncConnection(object):
+    """
+    A keep-alive http connection over asyncio streams.
+    """
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.last_used = time.time()
+
+    def is_dropped(self):
+        """
+        an idle connection with buffered data or EOF has been closed or corrupted by the peer
+        """
+        return self.writer.is_closing() or self.reader.at_eof() \
+            or len(getattr(self.reader, '_buffer', b'')) > 0
+
+    def close(self):
+        """
+        close the underlying transport
+        """
+        try:
+            self.writer.close()
+        except Exception:
+            _logger.debug('ignore close connection error')
+
+
+class AsyncConnectionPool(object):
+    """
+    Idle connections of one event loop, keyed like bce_http_client's connection pool.
+    No locking is needed since a pool is only used from its own event loop.
+    """
+    def __init__(self):
+        self._idle = {}
+
+    def acquire(self, key, idle_timeout_in_mills):
+        """
+        take a live idle connection for key, or None
+        """
+        deadline = time.time() - idle_timeout_in_mills / 1000.0
+        entries = self._idle.get(key)
+        while entries:
+            conn = entries.pop()
+            if conn.last_used < deadline or conn.is_dropped():
+                conn.close()
+                continue
+            return conn
+        return None
+
+    def release(self, key, conn, max_connections_per_host):
+        """
+        put back a connection whose response has been fully read
+        """
+        entries = self._idle.setdefault(key, [])
+        if len(entries) < max_connections_per_host:
+            conn.last_used = time.time()
+            entries.append(conn)
+        else:
+            conn.close()
+
+    def clear(self):
+        """
+        close all idle connections
+        """
+        idle = self._idle
+        self._idle = {}
+        for entries in idle.values():
+            for conn in entries:
+                conn.close()
+
+
+def _get_connection_pool():
+    loop = asyncio.get_event_loop()
+    pool = _connection_pools.get(loop)
+    if pool is None:
+        pool = AsyncConnectionPool()
+        _connection_pools[loop] = pool
+    return pool
+
+
+class AsyncHttpResponse(object):
+    """
+    Http response read from an asyncio stream.
+
+    The body is either buffered by send_request, in which case the synchronous read() used by the
+    response handlers works as with http.client.HTTPResponse, or streamed by the caller with
+    ``await aread()``.
+    """
+    def __init__(self, status, reason, headers, connection, body_length, chunked, will_close,
+                 timeout, on_complete=None):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.will_close = will_close
+        self._connection = connection
+        self._length = body_length
+        self._chunked = chunked
+        self._chunk_left = None
+        self._timeout = timeout
+        self._on_complete = on_complete
+        self._buffer = None
+        self._closed = False
+        self._complete = False
+
+    def getheaders(self):
+        """
+        list of (header, value) tuples, as http.client.HTTPResponse.getheaders()
+        """
+        return list(self.headers)
+
+    def getheader(self, name, default=None):
+        """
+        get the value of header name
+        """
+        name = name.lower()
+        for k, v in self.headers:
+            if k.lower() == name:
+                return v
+        return default
+
+    async def _read_with_timeout(self, coroutine):
+        try:
+            return await asyncio.wait_for(coroutine, self._timeout)
+        except asyncio.IncompleteReadError:
+            raise http.client.RemoteDisconnected('Remote end closed connection before '
+                                                 'the whole body is received')
+
+    async def _read_chunk_size(self):
+        reader = self._connection.reader
+        line = await self._read_with_timeout(reader.readline())
+        if not line:
+            raise http.client.RemoteDisconnected('Remote end closed connection in chunk size')
+        size = int(line.split(b';', 1)[0].strip(), 16)
+        if size == 0:
+            # discard trailers
+            while True:
+                line = await self._read_with_timeout(reader.readline())
+                if line in (b'\r\n', b'\n', b''):
+                    break
+        return size
+
+    async def aread(self, amt=None):
+        """
+        Read at most amt bytes of the body, or the rest of the body if amt is None.
+        Returns b'' at the end of body.
+        """
+        if self._buffer is not None:
+            return self._buffer.read(amt)
+        if self._complete or self._closed:
+            return b''
+        if amt is not None and amt < 0:
+            amt = None
+        reader = self._connection.reader
+        if self._chunked:
+            data = []
+            while amt is None or amt > 0:
+                if not self._chunk_left:
+                    if self._chunk_left is not None:
+                        await self._read_with_timeout(reader.readexactly(2))
+                    self._chunk_left = await self._read_chunk_size()
+                    if self._chunk_left == 0:
+                        self._finish()
+                        break
+                n = self._chunk_left if amt is None else min(amt, self._chunk_left)
+                data.append(await self._read_with_timeout(reader.readexactly(n)))
+                self._chunk_left -= n
+                if amt is not None:
+                    amt -= n
+            return b''.join(data)
+        if self._length is None:
+            # body is delimited by the end of connection
+            if amt is None:
+                data = await self._read_with_timeout(reader.read())
+            else:
+                data = await self._read_with_timeout(reader.read(amt))
+            if not data:
+                self._finish()
+            return data
+        n = self._length if amt is None else min(amt, self._length)
+        data = await self._read_with_timeout(reader.readexactly(n))
+        self._length -= n
+        if self._length == 0:
+            self._finish()
+        return data
+
+    async def buffer(self):
+        """
+        read the whole body into memory, so that read() can be used synchronously
+        """
+        if self._buffer is None:
+            self._buffer = io.BytesIO(await self.aread())
+
+    def read(self, amt=None):
+        """
+        read the buffered body, as http.client.HTTPResponse.read()
+        """
+        if self._buffer is None:
+            if self._complete:
+                return b''
+            raise BceClientError('Body of a streamed response must be read with aread()')
+        return self._buffer.read(amt)
+
+    def _finish(self):
+        if self._complete:
+            return
+        self._complete = True
+        if self._on_complete is not None:
+            self._on_complete(self)
+
+    def isclosed(self):
+        """
+        True if the body has been read or the response has been closed
+        """
+        return self._complete or self._closed
+
+    def close(self):
+        """
+        Close the response. The connection is released to the pool if the body has been read
+        completely, otherwise it is closed.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if not self._complete:
+            self._connection.close()
+
+
+async def _open_connection(protocol, host, port, timeout, proxy_host=None, proxy_port=None):
+    host = compat.convert_to_string(host)
+    if protocol.name == baidubce.protocol.HTTP.name:
+        if proxy_host and proxy_port:
+            _logger.debug('Using proxy host: %s, port: %d' % (proxy_host, proxy_port))
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(proxy_host, proxy_port), timeout)
+        else:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    elif protocol.name == baidubce.protocol.HTTPS.name:
+        ssl_context = ssl.create_default_context()
+        if proxy_host and proxy_port:
+            _logger.debug('Using proxy host: %s, port: %d' % (host, port))
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(proxy_host, proxy_port), timeout)
+            writer.write(compat.convert_to_bytes('CONNECT %s:%d HTTP/1.0\r\n\r\n' % (host, port)))
+            await writer.drain()
+            status, reason, _ = await asyncio.wait_for(_read_response_head(reader), timeout)
+            if status != http.client.OK:
+                writer.close()
+                raise OSError('Tunnel connection failed: %d %s' % (status, reason))
+            if not hasattr(writer, 'start_tls'):
+                writer.close()
+                raise BceClientError('HTTPS proxy requires python 3.11 or later in async client')
+            await asyncio.wait_for(
+                writer.start_tls(ssl_context, server_hostname=host), timeout)
+        else:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port, ssl=ssl_context, server_hostname=host),
+                timeout)
+    else:
+        raise ValueError(
+            'Invalid protocol: %s, either HTTP or HTTPS is expected.' % protocol)
+    return AsyncConnection(reader, writer)
+
+
+async def _read_response_head(reader):
+    line = await reader.readline()
+    if not line:
+        raise http.client.RemoteDisconnected('Remote end closed connection without response')
+    if len(line) > _MAX_LINE_SIZE:
+        raise http.client.LineTooLong('status line')
+    parts = line.decode('latin-1').rstrip('\r\n').split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+        raise http.client.BadStatusLine(line)
+    status = int(parts[1])
+    reason = parts[2] if len(parts) > 2 else ''
+    headers = []
+    while True:
+        line = await reader.readline()
+        if len(line) > _MAX_LINE_SIZE:
+            raise http.client.LineTooLong('header line')
+        if line in (b'\r\n', b'\n', b''):
+            break
+        k, _, v = line.decode('latin-1').partition(':')
+        headers.append((k.strip(), v.strip()))
+    return status, reason, headers
+
+
+async def _send_http_request(conn, http_method, uri, headers, body, send_buf_size, timeout,
+                             on_complete=None):
+    lines = [b'%s %s HTTP/1.1' % (compat.convert_to_bytes(http_method),
+                                  compat.convert_to_bytes(uri))]
+    for k, v in headers.items():
+        lines.append(b'%s: %s' % (utils.convert_to_standard_string(k),
+                                  utils.convert_to_standard_string(v)))
+    lines.append(b'\r\n')
+    writer = conn.writer
+    writer.write(b'\r\n'.join(lines))
+
+    if body:
+        if isinstance(body, bytes):
+            writer.write(body)
+        else:
+            total = int(headers[http_headers.CONTENT_LENGTH])
+            sent = 0
+            # file reads may block, keep them off the event loop
+            loop = None if isinstance(body, io.BytesIO) else asyncio.get_event_loop()
+            while sent < total:
+                size = total - sent
+                if size > send_buf_size:
+                    size = send_buf_size
+                if loop is None:
+                    buf = body.read(size)
+                else:
+                    buf = await loop.run_in_executor(None, body.read, size)
+                if not buf:
+                    raise BceClientError(
+                        'Insufficient data, only %d bytes available while %s is %d' % (
+                            sent, http_headers.CONTENT_LENGTH, total))
+                writer.write(buf)
+                await asyncio.wait_for(writer.drain(), timeout)
+                sent += len(buf)
+    await asyncio.wait_for(writer.drain(), timeout)
+
+    status, reason, response_headers = await asyncio.wait_for(
+        _read_response_head(conn.reader), timeout)
+    header_map = dict((k.lower(), v) for k, v in response_headers)
+    will_close = header_map.get('connection', '').lower() == 'close'
+    chunked = 'chunked' in header_map.get('transfer-encoding', '').lower()
+    if compat.convert_to_bytes(http_method) == b'HEAD' or status in (204, 304) \
+            or 100 <= status < 200:
+        length = 0
+    elif chunked:
+        length = None
+    elif 'content-length' in header_map:
+        length = int(header_map['content-length'])
+    else:
+        length = None
+        will_close = True
+    http_response = AsyncHttpResponse(status, reason, response_headers, conn, length, chunked,
+                                      will_close, timeout, on_complete)
+    if length == 0:
+        http_response._finish()
+    return http_response
+
+
+async def _follow_redirect(protocol, location, timeout):
+    parsed_url = urlparse(location)
+    conn = await _open_connection(protocol, parsed_url.hostname,
+                                  parsed_url.port or protocol.default_port, timeout)
+    redirect_uri = parsed_url.path
+    if parsed_url.query:
+        redirect_uri += "?" + parsed_url.query
+    return await _send_http_request(conn, b'GET', redirect_uri, {'Host': parsed_url.netloc},
+                                    None, 0, timeout, lambda r: conn.close())
+
+
+async def send_request(
+        config,
+        sign_function,
+        response_handler_functions,
+        http_method, path, body, headers, params, use_backup_endpoint=False, stream=False):
+    """
+    Send request to BCE services on the running event loop.
+
+    :param config
+    :type config: baidubce.BceClientConfiguration
+
+    :param sign_function:
+
+    :param response_handler_functions:
+    :type response_handler_functions: list
+
+    :param stream: if True, the body of a 2xx response is not buffered and must be read by the
+                   caller with ``await http_response.aread()``
+    :type stream: bool
+
+    :return:
+    :rtype: baidubce.BceResponse
+    """
+    _logger.debug(b'%s async request start: %s %s, %s, %s',
+                  http_method, path, headers, params, body)
+    body, headers, offset, should_get_new_date, protocol, host, port, uri = \
+        bce_http_client._prepare_request(config, http_method, path, body,
+                                         headers, params, use_backup_endpoint)
+    response_handler_functions = bce_http_client._get_response_handler_functions(
+        config, response_handler_functions)
+    timeout = config.connection_timeout_in_mills / 1000
+    pool_enabled = bce_http_client._get_config_value(
+        config, 'connection_pool_enabled',
+        bce_client_configuration.DEFAULT_CONNECTION_POOL_ENABLED)
+    pool_key = bce_http_client._get_pool_key(protocol, host, port,
+                                             config.proxy_host, config.proxy_port)
+    pool = _get_connection_pool()
+
+    def release_connection(http_response):
+        if pool_enabled and not http_response.will_close:
+            pool.release(pool_key, http_response._connection, bce_http_client._get_config_value(
+                config, 'max_connections_per_host',
+                bce_client_configuration.DEFAULT_MAX_CONNECTIONS_PER_HOST))
+        else:
+            http_response._connection.close()
+
+    retries_attempted = 0
+    errors = []
+    stale_connection_retried = False
+    while True:
+        conn = None
+        conn_reused = False
+        first_response = None
+        http_response = None
+        try:
+            if should_get_new_date is True:
+                headers[http_headers.BCE_DATE] = utils.get_canonical_time()
+
+            headers[http_headers.AUTHORIZATION] = sign_function(
+                config.credentials, http_method, path, headers, params)
+
+            # restore the offset of fp body when retrying
+            if (retries_attempted > 0 or stale_connection_retried) and offset is not None:
+                body.seek(offset)
+
+            if pool_enabled and not stale_connection_retried:
+                conn = pool.acquire(pool_key, bce_http_client._get_config_value(
+                    config, 'connection_idle_timeout_in_mills',
+                    bce_client_configuration.DEFAULT_CONNECTION_IDLE_TIMEOUT_IN_MILLIS))
+                conn_reused = conn is not None
+            if conn is None:
+                conn = await _open_connection(protocol, host, port, timeout,
+                                              config.proxy_host, config.proxy_port)
+            _logger.debug('request args: method=%s, uri=%s, headers=%s, patams=%s, body=%s',
+                          http_method, uri, headers, params, body)
+
+            http_response = await _send_http_request(
+                conn, http_method, uri, headers, body, config.send_buf_size, timeout,
+                release_connection)
+            first_response = http_response
+
+            headers_list = bce_http_client._get_response_headers(http_response.getheaders())
+            _logger.debug(
+                'request return: status=%d, headers=%s' % (http_response.status, headers_list))
+            response = bce_http_client._new_bce_response(config, headers_list)
+            if config.auto_follow_redirect:
+                if http_method == b'GET' and 300 <= http_response.status < 400:
+                    location = http_response.getheader('location')
+                    if location is not None:
+                        try:
+                            await http_response.buffer()
+                        except Exception:
+                            _logger.info("ignore read response body error")
+                        _logger.debug('request auto follow redirect location is %s', location)
+                        http_response = await _follow_redirect(protocol, location, timeout)
+            if not stream or http_response.status // 100 != http.client.OK // 100:
+                await http_response.buffer()
+            for handler_function in response_handler_functions:
+                if handler_function(http_response, response):
+                    break
+            return response
+        except Exception as e:
+            # a completely read response has already released its connection to the pool
+            if http_response is not None and not http_response.isclosed():
+                http_response.close()
+            if conn is not None and (first_response is None or not first_response.isclosed()):
+                conn.close()
+
+            if not stale_connection_retried and bce_http_client._should_retry_stale_connection(
+                    config, e, conn_reused, first_response is not None, body, offset):
+                _logger.debug('Reused connection is closed by server, retry with new connection')
+                stale_connection_retried = True
+                continue
+
+            # insert ">>>>" before all trace back lines and then save it
+            errors.append('\n'.join('>>>>' + line for line in traceback.format_exc().splitlines()))
+            if isinstance(e, BceServerError):
+                request_id = e.request_id
+                status_code = e.status_code
+                code = e.code
+            else:
+                request_id = None
+                status_code = None
+                code = None
+            if config.retry_policy.should_retry(e, retries_attempted):
+                delay_in_millis = config.retry_policy.get_delay_before_next_retry_in_millis(
+                    e, retries_attempted)
+                await asyncio.sleep(delay_in_millis / 1000.0)
+            else:
+                raise BceHttpClientError('Unable to execute HTTP request. Retried %d times. '
+                                         'All trace backs:\n%s' % (retries_attempted,
+                                                                   '\n'.join(errors)), e,
+                                                                   status_code, code,
+                                                                   request_id=request_id)
+
+        stale_connection_retried = False
+        retries_attempted += 1
@@ -15,6 +15,7 @@ This module provide http request function for bce services.
 """
 from future.utils import iteritems, iterkeys, itervalues
 from builtins import str, bytes
+import functools
 import logging
 import http.client
 import sys
@@ -22,13 +23,18 @@ import time
 import traceback
 
 import baidubce
+from baidubce import bce_client_configuration
 from baidubce import compat
+from baidubce import json_codec
 from baidubce import utils
 from baidubce.bce_response import BceResponse
 from baidubce.exception import BceHttpClientError
 from baidubce.exception import BceServerError
 from baidubce.exception import BceClientError
+from baidubce.http import handler
 from baidubce.http import http_headers
+from baidubce.http.connection_pool import ConnectionPool
+from baidubce.retry.retry_policy import NoRetryPolicy
 try:
     from urllib.parse import urlparse
 except ImportError:
@@ -36,6 +42,34 @@ except ImportError:
 
 _logger = logging.getLogger(__name__)
 
+# shared by all clients, so that connections are reused across calls and clients
+_connection_pool = ConnectionPool()
+
+# errors raised when a reused keep-alive connection turns out to be closed by the server.
+# timeouts are deliberately excluded, they are left to the retry policy
+try:
+    _STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError,
+                                ConnectionResetError)
+except (AttributeError, NameError):
+    # python 2: a server closing an idle connection shows up as an empty status line
+    _STALE_CONNECTION_ERRORS = (http.client.BadStatusLine,)
+
+
+def _should_retry_stale_connection(config, error, conn_reused, response_started, body, offset):
+    """
+    Whether a request failed on a pooled connection closed by the server while idle, and can be
+    sent again on a new connection without consuming the retry policy.
+
+    :param error: the raised exception
+    :param conn_reused: whether the connection came from the pool
+    :param response_started: whether any byte of the response was received
+    """
+    if not conn_reused or response_started or isinstance(config.retry_policy, NoRetryPolicy):
+        return False
+    if not isinstance(error, _STALE_CONNECTION_ERRORS):
+        return False
+    return offset is not None or not body or isinstance(body, bytes)
+
 
 def _get_connection(protocol, host, port, connection_timeout_in_millis, proxy_host=None, proxy_port=None):
     """
@@ -69,6 +103,87 @@ def _get_connection(protocol, host, port, connection_timeout_in_millis, proxy_ho
             'Invalid protocol: %s, either HTTP or HTTPS is expected.' % protocol)
 
 
+def _get_config_value(config, attr, default):
+    value = getattr(config, attr, None)
+    if value is None:
+        return default
+    return value
+
+
+def _get_response_handler_functions(config, response_handler_functions):
+    """
+    Pass the json options set in config to the handlers marked by handler.json_body_parser.
+    """
+    lazy = _get_config_value(config, 'lazy_json_response',
+                             bce_client_configuration.DEFAULT_LAZY_JSON_RESPONSE)
+    keep_raw_data = _get_config_value(config, 'keep_json_raw_data',
+                                      bce_client_configuration.DEFAULT_KEEP_JSON_RAW_DATA)
+    codec = json_codec.get_codec(_get_config_value(config, 'json_codec',
+                                                   bce_client_configuration.DEFAULT_JSON_CODEC))
+    if codec is json_codec.STDLIB_CODEC:
+        codec = None
+    if not lazy and keep_raw_data and codec is None:
+        return response_handler_functions
+    result = []
+    for f in response_handler_functions:
+        if f is handler.parse_json:
+            f = handler.get_json_parser(lazy, keep_raw_data, codec)
+        elif getattr(f, 'json_options', False):
+            f = functools.partial(f, keep_raw_data=keep_raw_data, lazy=lazy, codec=codec)
+        result.append(f)
+    return result
+
+
+def _get_pool_key(protocol, host, port, proxy_host, proxy_port):
+    return (protocol.name, compat.convert_to_string(host), port, proxy_host, proxy_port)
+
+
+def _acquire_connection(config, protocol, host, port):
+    """
+    Get a connection from the connection pool, or create a new one.
+
+    :return: tuple of connection and whether it has been reused from the pool
+    """
+    timeout_in_millis = config.connection_timeout_in_mills
+    if _get_config_value(config, 'connection_pool_enabled',
+                         bce_client_configuration.DEFAULT_CONNECTION_POOL_ENABLED):
+        key = _get_pool_key(protocol, host, port, config.proxy_host, config.proxy_port)
+        conn = _connection_pool.acquire(key, _get_config_value(
+            config, 'connection_idle_timeout_in_mills',
+            bce_client_configuration.DEFAULT_CONNECTION_IDLE_TIMEOUT_IN_MILLIS))
+        if conn is not None:
+            # clients sharing the pool may be configured with different timeouts
+            conn.timeout = timeout_in_millis / 1000
+            if conn.sock is not None:
+                conn.sock.settimeout(conn.timeout)
+            return conn, True
+    return _get_connection(protocol, host, port, timeout_in_millis,
+                           config.proxy_host, config.proxy_port), False
+
+
+def _is_response_reusable(http_response):
+    """
+    A connection can only be reused after its response body has been read completely, otherwise
+    the unread bytes would be taken as the next response. Chunked responses are not reused since
+    http.client can not tell a fully read chunked body from an abandoned one.
+    """
+    if not isinstance(http_response, http.client.HTTPResponse):
+        return False
+    if http_response.will_close or getattr(http_response, 'chunked', False):
+        return False
+    return http_response.isclosed() and http_response.length == 0
+
+
+def _release_connection(config, protocol, host, port, conn, http_response):
+    if _get_config_value(config, 'connection_pool_enabled',
+                         bce_client_configuration.DEFAULT_CONNECTION_POOL_ENABLED) \
+            and _is_response_reusable(http_response):
+        key = _get_pool_key(protocol, host, port, config.proxy_host, config.proxy_port)
+        _connection_pool.release(key, conn, _get_config_value(
+            config, 'max_connections_per_host',
+            bce_client_configuration.DEFAULT_MAX_CONNECTIONS_PER_HOST))
+
+
 def _send_http_request(conn, http_method, uri, headers, body, send_buf_size):
     # putrequest() need that http_method and uri is Ascii on Py2 and unicode \
     # on Py3
@@ -115,30 +230,15 @@ def check_headers(headers):
             raise BceClientError(r'There should not be any "\n" in header[%s]:%s' % (k, v))
 
 
-def send_request(
-        config,
-        sign_function,
-        response_handler_functions,
-        http_method, path, body, headers, params, use_backup_endpoint=False):
+def _prepare_request(config, http_method, path, body, headers, params,
+                     use_backup_endpoint=False):
     """
-    Send request to BCE services.
-
-    :param config
-    :type config: baidubce.BceClientConfiguration
+    Fill the common headers and build the request uri. The request is signed by the caller
+    before every attempt.
 
-    :param sign_function:
-
-    :param response_handler_functions:
-    :type response_handler_functions: list
-
-    :param request:
-    :type request: baidubce.internal.InternalRequest
-
-    :return:
-    :rtype: baidubce.BceResponse
+    :return: tuple of body, headers, offset of fp body, whether x-bce-date should be refreshed on
+             every attempt, protocol, host, port and uri
     """
-    _logger.debug(b'%s request start: %s %s, %s, %s',
-                  http_method, path, headers, params, body)
     headers = headers or {}
 
     user_agent = 'bce-sdk-python/%s/%s/%s' % (
@@ -176,21 +276,77 @@ def send_request(
     if port != config.protocol.default_port:
         headers[http_headers.HOST] += b':' + compat.convert_to_bytes(port)
 
-    headers[http_headers.AUTHORIZATION] = sign_function(
-        config.credentials, http_method, path, headers, params)
-
     encoded_params = utils.get_canonical_querystring(params, False)
     if len(encoded_params) > 0:
         uri = path + b'?' + encoded_params
     else:
         uri = path
     check_headers(headers)
+    return body, headers, offset, should_get_new_date, protocol, host, port, uri
+
+
+def _get_response_headers(headers_list):
+    """
+    on py3 ,values of headers_list is decoded with ios-8859-1 from utf-8 binary bytes.
+    headers_list[*][0] is lowercase on py2, headers_list[*][0] is raw value py3
+    """
+    if compat.PY3 and isinstance(headers_list, list):
+        temp_heads = []
+        for k, v in headers_list:
+            k = k.encode('latin-1').decode('utf-8')
+            v = v.encode('latin-1').decode('utf-8')
+            k = k.lower()
+            temp_heads.append((k, v))
+        headers_list = temp_heads
+    return headers_list
+
+
+def _new_bce_response(config, headers_list):
+    response = BceResponse()
+    if config.under_line_headers:
+        response.set_metadata_from_headers(dict(headers_list))
+    else:
+        response.set_metadata_from_headers_no_underlined(dict(headers_list))
+    return response
+
+
+def send_request(
+        config,
+        sign_function,
+        response_handler_functions,
+        http_method, path, body, headers, params, use_backup_endpoint=False):
+    """
+    Send request to BCE services.
+
+    :param config
+    :type config: baidubce.BceClientConfiguration
+
+    :param sign_function:
+
+    :param response_handler_functions:
+    :type response_handler_functions: list
+
+    :param request:
+    :type request: baidubce.internal.InternalRequest
+
+    :return:
+    :rtype: baidubce.BceResponse
+    """
+    _logger.debug(b'%s request start: %s %s, %s, %s',
+                  http_method, path, headers, params, body)
+    body, headers, offset, should_get_new_date, protocol, host, port, uri = _prepare_request(
+        config, http_method, path, body, headers, params, use_backup_endpoint)
+    response_handler_functions = _get_response_handler_functions(config,
+                                                                 response_handler_functions)
 
     retries_attempted = 0
     errors = []
+    stale_connection_retried = False
     while True:
         conn = None
+        conn_reused = False
         redirect_conn = None
+        http_response = None
         try:
             # restore the offset of fp body when retrying
             if should_get_new_date is True:
@@ -199,40 +355,25 @@ def send_request(
             headers[http_headers.AUTHORIZATION] = sign_function(
                 config.credentials, http_method, path, headers, params)
 
-            if retries_attempted > 0 and offset is not None:
+            if (retries_attempted > 0 or stale_connection_retried) and offset is not None:
                 body.seek(offset)
 
-            conn = _get_connection(protocol, host, port, config.connection_timeout_in_mills,
-                                   config.proxy_host, config.proxy_port)
+            if stale_connection_retried:
+                conn = _get_connection(protocol, host, port, config.connection_timeout_in_mills,
+                                       config.proxy_host, config.proxy_port)
+            else:
+                conn, conn_reused = _acquire_connection(config, protocol, host, port)
             _logger.debug('request args: method=%s, uri=%s, headers=%s, patams=%s, body=%s',
                           http_method, uri, headers, params, body)
 
             http_response = _send_http_request(
                 conn, http_method, uri, headers, body, config.send_buf_size)
 
-            headers_list = http_response.getheaders()
-
-            # on py3 ,values of headers_list is decoded with ios-8859-1 from
-            # utf-8 binary bytes
-
-            # headers_list[*][0] is lowercase on py2
-            # headers_list[*][0] is raw value py3
-            if compat.PY3 and isinstance(headers_list, list):
-                temp_heads = []
-                for k, v in headers_list:
-                    k = k.encode('latin-1').decode('utf-8')
-                    v = v.encode('latin-1').decode('utf-8')
-                    k = k.lower()
-                    temp_heads.append((k, v))
-                headers_list = temp_heads
+            headers_list = _get_response_headers(http_response.getheaders())
 
             _logger.debug(
                 'request return: status=%d, headers=%s' % (http_response.status, headers_list))
-            response = BceResponse()
-            if config.under_line_headers:
-                response.set_metadata_from_headers(dict(headers_list))
-            else:
-                response.set_metadata_from_headers_no_underlined(dict(headers_list))
+            response = _new_bce_response(config, headers_list)
             if config.auto_follow_redirect:
                 if http_method == b'GET' and  300 <= http_response.status < 400:
                     headers_map = {k: v for k, v in headers_list}
@@ -267,6 +408,8 @@ def send_request(
             for handler_function in response_handler_functions:
                 if handler_function(http_response, response):
                     break
+            if redirect_conn is None:
+                _release_connection(config, protocol, host, port, conn, http_response)
             return response
         except Exception as e:
             if conn is not None:
@@ -274,6 +417,14 @@ def send_request(
             if redirect_conn is not None:
                 redirect_conn.close()
 
+            # a pooled connection may have been closed by the server while idle, retry once
+            # on a new connection without consuming the retry policy
+            if not stale_connection_retried and _should_retry_stale_connection(
+                    config, e, conn_reused, http_response is not None, body, offset):
+                _logger.debug('Reused connection is closed by server, retry with new connection')
+                stale_connection_retried = True
+                continue
+
             # insert ">>>>" before all trace back lines and then save it
             errors.append('\n'.join('>>>>' + line for line in traceback.format_exc().splitlines()))
             if isinstance(e, BceServerError):
@@ -295,4 +446,5 @@ def send_request(
                                                                    status_code, code,
                                                                    request_id=request_id)
 
+        stale_connection_retried = False
         retries_attempted += 1
@@ -0,0 +1,150 @@
+# Copyright 2014 Baidu, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+# -*- coding: utf-8 -*-
+"""
+This module provides a thread-safe keep-alive connection pool for bce_http_client.
+"""
+import logging
+import select
+import threading
+import time
+
+_logger = logging.getLogger(__name__)
+
+
+def is_connection_dropped(conn):
+    """
+    Check whether an idle connection has been closed or half-closed by the peer.
+
+    An idle keep-alive socket must not be readable: readability means either EOF (the server
+    closed its side) or unexpected data, and the connection can not be reused in both cases.
+
+    :param conn: an http.client.HTTPConnection or HTTPSConnection
+    :return: True if the connection should be discarded
+    :rtype: bool
+    """
+    sock = getattr(conn, 'sock', None)
+    if sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([sock], [], [], 0.0)
+    except (ValueError, select.error, OSError):
+        return True
+    return bool(readable)
+
+
+class ConnectionPool(object):
+    """
+    Pool of idle http connections keyed by (protocol, host, port, proxy_host, proxy_port).
+
+    Connections are checked out with acquire() and handed back with release() once their response
+    has been fully read. At most max_connections_per_host idle connections are kept per key, and
+    connections idle longer than idle_timeout_in_mills are evicted.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._idle = {}
+
+    def acquire(self, key, idle_timeout_in_mills):
+        """
+        Take an idle connection for key out of the pool.
+
+        :param key: pool key
+        :type key: tuple
+
+        :param idle_timeout_in_mills: connections idle longer than this are closed
+        :type idle_timeout_in_mills: int
+
+        :return: a live connection, or None if no reusable connection is available
+        """
+        deadline = time.time() - idle_timeout_in_mills / 1000.0
+        while True:
+            with self._lock:
+                entries = self._idle.get(key)
+                if not entries:
+                    return None
+                # most recently used first, it is the most likely one to be alive
+                conn, last_used = entries.pop()
+                if not entries:
+                    del self._idle[key]
+            if last_used < deadline or is_connection_dropped(conn):
+                _logger.debug('Discard idle connection to %s', key)
+                _close_quietly(conn)
+                continue
+            return conn
+
+    def release(self, key, conn, max_connections_per_host):
+        """
+        Put a connection back into the pool, closing it if the pool for key is full.
+
+        :param key: pool key
+        :type key: tuple
+
+        :param conn: connection whose last response has been fully read
+        :param max_connections_per_host: maximum number of idle connections kept for key
+        :type max_connections_per_host: int
+        """
+        with self._lock:
+            entries = self._idle.setdefault(key, [])
+            if len(entries) < max_connections_per_host:
+                entries.append((conn, time.time()))
+                return
+        _close_quietly(conn)
+
+    def evict_idle(self, idle_timeout_in_mills):
+        """
+        Close all connections which have been idle longer than idle_timeout_in_mills.
+
+        :param idle_timeout_in_mills: idle timeout
+        :type idle_timeout_in_mills: int
+        """
+        deadline = time.time() - idle_timeout_in_mills / 1000.0
+        expired = []
+        with self._lock:
+            for key in list(self._idle):
+                entries = self._idle[key]
+                alive = [e for e in entries if e[1] >= deadline]
+                expired.extend(e[0] for e in entries if e[1] < deadline)
+                if alive:
+                    self._idle[key] = alive
+                else:
+                    del self._idle[key]
+        for conn in expired:
+            _close_quietly(conn)
+
+    def clear(self):
+        """
+        Close all idle connections.
+        """
+        with self._lock:
+            idle = self._idle
+            self._idle = {}
+        for entries in idle.values():
+            for conn, _ in entries:
+                _close_quietly(conn)
+
+    def size(self, key=None):
+        """
+        Number of idle connections for key, or in total if key is None.
+        """
+        with self._lock:
+            if key is not None:
+                return len(self._idle.get(key, []))
+            return sum(len(entries) for entries in self._idle.values())
+
+
+def _close_quietly(conn):
+    try:
+        conn.close()
+    except Exception:
+        _logger.debug('ignore close connection error')
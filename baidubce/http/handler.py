@@ -14,16 +14,45 @@
 This module provides general http handler functions for processing http responses from BCE services.
 """
 
+import functools
 import http.client
 from builtins import str
 from builtins import bytes
 import json
+from future.utils import iteritems
 from baidubce import utils
 from baidubce import compat
 from baidubce.exception import BceClientError
 from baidubce.exception import BceServerError
 
-def parse_json(http_response, response):
+def json_body_parser(func):
+    """Mark a response handler as accepting the json options of BceClientConfiguration.
+
+    send_request calls the marked handlers with the keyword arguments keep_raw_data, lazy and
+    codec when the configuration differs from the default behaviour, see parse_json.
+    """
+    func.json_options = True
+    return func
+
+
+def load_python_object(body, codec=None, object_hook=None):
+    """Decode a json body the way json.loads(body, object_hook=object_hook) does.
+
+    :param body: json text
+    :param codec: a codec of baidubce.json_codec, None for the json module
+    :param object_hook: converter of every dict, utils.dict_to_python_object by default
+    """
+    if object_hook is None:
+        object_hook = utils.dict_to_python_object
+    if codec is None:
+        return json.loads(body, object_hook=object_hook)
+    if object_hook is utils.dict_to_python_object:
+        return utils.json_to_python_object(codec.loads(body))
+    return utils.apply_object_hook(codec.loads(body), object_hook)
+
+
+@json_body_parser
+def parse_json(http_response, response, keep_raw_data=True, lazy=False, codec=None):
     """If the body is not empty, convert it to a python object and set as the value of
     response.body. http_response is always closed if no error occurs.
 
@@ -33,19 +62,98 @@ def parse_json(http_response, response):
     :param response: general response object which will be returned to the caller
     :type response: baidubce.BceResponse
 
+    :param keep_raw_data: whether to keep the body text as response.raw_data
+    :type keep_raw_data: bool
+
+    :param lazy: translate attribute names on first access, see parse_json_lazy
+    :type lazy: bool
+
+    :param codec: a codec of baidubce.json_codec, None for the json module
+    :type codec: baidubce.json_codec.JsonCodec
+
+    :return: always true
+    :rtype bool
+    """
+    if lazy:
+        return parse_json_lazy(http_response, response, keep_raw_data, codec)
+    body = http_response.read()
+    if body:
+        body = compat.convert_to_string(body)
+        response.__dict__.update(load_python_object(body, codec).__dict__)
+        if keep_raw_data:
+            response.__dict__["raw_data"] = body
+        response.__dict__["status_code"] = http_response.status
+    http_response.close()
+    return True
+
+
+def parse_json_lazy(http_response, response, keep_raw_data=True, codec=None):
+    """Same as parse_json, but the nested objects are utils.LazyExpando which translate their
+    attribute names on first access instead of while the body is decoded.
+
+    :param http_response: the http_response object returned by HTTPConnection.getresponse()
+    :type http_response: httplib.HTTPResponse
+
+    :param response: general response object which will be returned to the caller
+    :type response: baidubce.BceResponse
+
+    :param keep_raw_data: whether to keep the body text as response.raw_data
+    :type keep_raw_data: bool
+
+    :param codec: a codec of baidubce.json_codec, None for the json module
+    :type codec: baidubce.json_codec.JsonCodec
+
     :return: always true
     :rtype bool
     """
     body = http_response.read()
     if body:
         body = compat.convert_to_string(body)
-        response.__dict__.update(json.loads(body, object_hook=utils.dict_to_python_object).__dict__)
-        response.__dict__["raw_data"] = body
+        data = json.loads(body) if codec is None else codec.loads(body)
+        for k, v in iteritems(data):
+            response.__dict__[utils.pythonize_name_cached(k)] = utils.lazy_json_value(v)
+        if keep_raw_data:
+            response.__dict__["raw_data"] = body
         response.__dict__["status_code"] = http_response.status
     http_response.close()
     return True
 
 
+def _parse_json_without_raw_data(http_response, response):
+    return parse_json(http_response, response, False)
+
+
+def _parse_json_lazy_without_raw_data(http_response, response):
+    return parse_json_lazy(http_response, response, False)
+
+
+_JSON_PARSERS = {
+    (False, True): parse_json,
+    (False, False): _parse_json_without_raw_data,
+    (True, True): parse_json_lazy,
+    (True, False): _parse_json_lazy_without_raw_data,
+}
+
+
+def get_json_parser(lazy=False, keep_raw_data=True, codec=None):
+    """Return the json body parser for the given response mode.
+
+    :param lazy: translate attribute names on access, see parse_json_lazy
+    :type lazy: bool
+
+    :param keep_raw_data: whether to keep the body text as response.raw_data
+    :type keep_raw_data: bool
+
+    :param codec: a codec of baidubce.json_codec, None for the json module
+    :type codec: baidubce.json_codec.JsonCodec
+
+    :return: a handler function with the signature of parse_json
+    """
+    if codec is None:
+        return _JSON_PARSERS[(bool(lazy), bool(keep_raw_data))]
+    return functools.partial(parse_json, keep_raw_data=keep_raw_data, lazy=lazy, codec=codec)
+
+
 def parse_error(http_response, response):
     """If the body is not empty, convert it to a python object and set as the value of
     response.body. http_response is always closed if no error occurs.
@@ -0,0 +1,150 @@
+# Copyright 2014 Baidu, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""
+This module provides the json codecs used to serialize request bodies and parse responses.
+
+A codec is selected with BceClientConfiguration.json_codec:
+
+    * "json" (default): the standard json module
+    * "auto": orjson if it is installed, then ujson, then the standard json module
+    * "orjson" or "ujson": that codec, BceClientError if it is not installed
+    * any object with dumps(obj, **kwargs) returning str and loads(str_or_bytes) methods
+
+The accelerated codecs produce the same data as the json module but not the same text, e.g.
+there are no spaces after separators and non-ASCII characters are not escaped. Whatever they
+reject, such as non-string keys or integers out of 64 bits, and calls with json.dumps keyword
+arguments other than default are handed to the json module, so errors are the ones json raises.
+"""
+import json
+
+from baidubce import compat
+from baidubce.exception import BceClientError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JsonCodec(object):
+    """
+    json codec backed by the standard json module
+    """
+    name = 'json'
+
+    def dumps(self, obj, **kwargs):
+        """
+        :param obj: object to serialize
+        :param kwargs: keyword arguments of json.dumps
+        :return: json text
+        :rtype: str
+        """
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, data):
+        """
+        :param data: json text
+        :type data: str or bytes
+        :return: the decoded object
+        """
+        return json.loads(compat.convert_to_string(data))
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    json codec backed by orjson
+    """
+    name = 'orjson'
+
+    def dumps(self, obj, **kwargs):
+        if kwargs and set(kwargs) != set(['default']):
+            return json.dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, **kwargs).decode('utf-8')
+        except (TypeError, ValueError, OverflowError):
+            return json.dumps(obj, **kwargs)
+
+    def loads(self, data):
+        try:
+            return orjson.loads(data)
+        except (TypeError, ValueError, OverflowError):
+            return json.loads(compat.convert_to_string(data))
+
+
+class UjsonCodec(JsonCodec):
+    """
+    json codec backed by ujson
+    """
+    name = 'ujson'
+
+    def dumps(self, obj, **kwargs):
+        if kwargs and set(kwargs) != set(['default']):
+            return json.dumps(obj, **kwargs)
+        try:
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False, **kwargs)
+        except (TypeError, ValueError, OverflowError):
+            return json.dumps(obj, **kwargs)
+
+    def loads(self, data):
+        try:
+            return ujson.loads(data)
+        except (TypeError, ValueError, OverflowError):
+            return json.loads(compat.convert_to_string(data))
+
+
+STDLIB_CODEC = JsonCodec()
+_CODECS = {'json': STDLIB_CODEC}
+if orjson is not None:
+    _CODECS['orjson'] = OrjsonCodec()
+if ujson is not None:
+    _CODECS['ujson'] = UjsonCodec()
+_AUTO_CODEC = _CODECS.get('orjson') or _CODECS.get('ujson') or STDLIB_CODEC
+
+
+def get_codec(codec=None):
+    """
+    Resolve the value of BceClientConfiguration.json_codec.
+
+    :param codec: None or "json" for the json module, "auto" for the fastest installed codec,
+        a codec name or a codec object
+    :return: the codec object
+    """
+    if codec is None:
+        return STDLIB_CODEC
+    if not isinstance(codec, (str, bytes, compat.string_types)):
+        return codec
+    name = compat.convert_to_string(codec).lower()
+    if name == 'auto':
+        return _AUTO_CODEC
+    if name not in _CODECS:
+        raise BceClientError('json codec %s is not installed' % name)
+    return _CODECS[name]
+
+
+def dumps(obj, codec=None, **kwargs):
+    """
+    Serialize obj to json text with the given codec, see get_codec.
+    """
+    return get_codec(codec).dumps(obj, **kwargs)
+
+
+def loads(data, codec=None):
+    """
+    Parse json text with the given codec, see get_codec.
+    """
+    return get_codec(codec).loads(data)
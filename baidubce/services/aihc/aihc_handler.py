@@ -25,14 +25,16 @@ Functions:
 """
 
 import http.client
-import json
-from baidubce import compat, utils
+from baidubce import compat
+from baidubce import json_codec
 from baidubce.utils import Expando
 from baidubce.exception import BceClientError
 from baidubce.exception import BceServerError
+from baidubce.http import handler
 
 
-def parse_json(http_response, response):
+@handler.json_body_parser
+def parse_json(http_response, response, keep_raw_data=True, lazy=False, codec=None):
     """
     Parse JSON response and convert to Python object.
     
@@ -51,8 +53,8 @@ def parse_json(http_response, response):
     """
     body = http_response.read()
     if body:
-        response.__dict__.update(json.loads(
-            body, object_hook=dict_to_python_object).__dict__)
+        response.__dict__.update(handler.load_python_object(
+            body, codec, dict_to_python_object).__dict__)
         
         # 移除metadata key（如果存在）
         if 'metadata' in response.__dict__:
@@ -78,7 +80,8 @@ def dict_to_python_object(d):
     return Expando(attr)
 
 
-def parse_json_list(http_response, response):
+@handler.json_body_parser
+def parse_json_list(http_response, response, keep_raw_data=True, lazy=False, codec=None):
     """
     Parse JSON list response and convert to Python object.
     
@@ -95,8 +98,9 @@ def parse_json_list(http_response, response):
     body = http_response.read()
     if body:
         body = compat.convert_to_string(body)
-        response.__dict__["result"] = json.loads(body, object_hook=utils.dict_to_python_object)
-        response.__dict__["raw_data"] = body
+        response.__dict__["result"] = handler.load_python_object(body, codec)
+        if keep_raw_data:
+            response.__dict__["raw_data"] = body
     http_response.close()
     return True
 
@@ -129,7 +133,7 @@ def parse_error(http_response, response):
         bse.status_code = http_response.status
         raise bse
 
-    error_dict = json.loads(compat.convert_to_string(body))
+    error_dict = json_codec.loads(compat.convert_to_string(body))
     message = str(error_dict)
     if 'message' in error_dict and error_dict['message'] is not None:
         message = error_dict['message']
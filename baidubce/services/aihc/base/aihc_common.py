@@ -13,7 +13,7 @@
 """
 AIHC common utilities module.
 """
-import json
+from baidubce import json_codec
 
 
 def build_request_params(action, **kwargs):
@@ -45,4 +45,4 @@ def build_request_body(**kwargs):
     for key, value in kwargs.items():
         if value is not None:
             body[key] = value
-    return json.dumps(body) if body else None 
\ No newline at end of file
+    return json_codec.dumps(body) if body else None 
\ No newline at end of file
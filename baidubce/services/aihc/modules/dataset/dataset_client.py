@@ -13,7 +13,6 @@
 """
 AIHC dataset client module.
 """
-import json
 
 from baidubce.bce_response import BceResponse
 from baidubce.http import http_methods
@@ -149,7 +148,7 @@ class DatasetClient(AIHCBaseClient):
         return self._send_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
 
@@ -240,7 +239,7 @@ class DatasetClient(AIHCBaseClient):
         return self._send_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
 
@@ -380,7 +379,7 @@ class DatasetClient(AIHCBaseClient):
         return self._send_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
  
\ No newline at end of file
@@ -190,7 +190,7 @@ class DevInstanceClient(AIHCBaseClient):
         return self._send_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
 
@@ -259,7 +259,7 @@ class DevInstanceClient(AIHCBaseClient):
         return self._send_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
 
@@ -326,7 +326,7 @@ class DevInstanceClient(AIHCBaseClient):
         return self._send_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
 
@@ -385,6 +385,6 @@ class DevInstanceClient(AIHCBaseClient):
         return self._send_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
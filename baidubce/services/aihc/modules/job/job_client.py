@@ -13,7 +13,6 @@
 """
 AIHC job client module.
 """
-import json
 
 from baidubce.http import http_methods
 from baidubce.services.aihc.base.aihc_base_client import AIHCBaseClient
@@ -88,7 +87,7 @@ class JobClient(AIHCBaseClient):
         return self._send_job_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
 
@@ -128,7 +127,7 @@ class JobClient(AIHCBaseClient):
         }
         if needDetail is not None:
             body['needDetail'] = needDetail
-        return self._send_job_request(http_methods.POST, path, body=json.dumps(body), params=params)
+        return self._send_job_request(http_methods.POST, path, body=self._json_dumps(body), params=params)
 
     def DeleteJob(self, resourcePoolId, jobId):
         """
@@ -156,7 +155,7 @@ class JobClient(AIHCBaseClient):
         body = {
             'jobId': jobId,
         }
-        return self._send_job_request(http_methods.POST, path, body=json.dumps(body), params=params)
+        return self._send_job_request(http_methods.POST, path, body=self._json_dumps(body), params=params)
 
     def ModifyJob(self, resourcePoolId, jobId, priority):
         """
@@ -185,7 +184,7 @@ class JobClient(AIHCBaseClient):
             'jobId': jobId,
             'priority': priority,
         }
-        return self._send_job_request(http_methods.POST, path, body=json.dumps(body), params=params)
+        return self._send_job_request(http_methods.POST, path, body=self._json_dumps(body), params=params)
 
     def DescribeJobEvents(
         self,
@@ -224,7 +223,7 @@ class JobClient(AIHCBaseClient):
             body['startTime'] = startTime
         if endTime is not None:
             body['endTime'] = endTime
-        return self._send_job_request(http_methods.POST, path, body=json.dumps(body), params=params)
+        return self._send_job_request(http_methods.POST, path, body=self._json_dumps(body), params=params)
 
     def DescribeJobLogs(
         self,
@@ -287,7 +286,7 @@ class JobClient(AIHCBaseClient):
         return self._send_job_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
 
@@ -335,7 +334,7 @@ class JobClient(AIHCBaseClient):
         return self._send_job_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
 
@@ -367,7 +366,7 @@ class JobClient(AIHCBaseClient):
         return self._send_job_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
 
@@ -399,7 +398,7 @@ class JobClient(AIHCBaseClient):
         return self._send_job_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
 
@@ -446,7 +445,7 @@ class JobClient(AIHCBaseClient):
         return self._send_job_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
 
@@ -529,7 +528,7 @@ class JobClient(AIHCBaseClient):
         return self._send_job_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
 
@@ -587,6 +586,6 @@ class JobClient(AIHCBaseClient):
         return self._send_job_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
@@ -13,7 +13,6 @@
 """
 AIHC model client module.
 """
-import json
 from typing import Optional
 
 from baidubce.http import http_methods
@@ -93,7 +92,7 @@ class ModelClient(AIHCBaseClient):
         return self._send_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
 
@@ -146,7 +145,7 @@ class ModelClient(AIHCBaseClient):
         return self._send_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
 
@@ -263,7 +262,7 @@ class ModelClient(AIHCBaseClient):
         return self._send_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
 
@@ -13,7 +13,6 @@
 """
 AIHC service client module.
 """
-import json
 from typing import Optional
 
 from baidubce.http import http_methods
@@ -159,7 +158,7 @@ class ServiceClient(AIHCBaseClient):
         return self._send_request(
             http_methods.POST,
             path,
-            body=json.dumps(serviceConf),
+            body=self._json_dumps(serviceConf),
             params=params
         )
 
@@ -235,7 +234,7 @@ class ServiceClient(AIHCBaseClient):
         return self._send_request(
             http_methods.POST,
             path,
-            body=json.dumps(serviceConf),
+            body=self._json_dumps(serviceConf),
             params=params
         )
 
@@ -306,7 +305,7 @@ class ServiceClient(AIHCBaseClient):
         return self._send_request(
             http_methods.POST,
             path,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params
         )
 
@@ -2,7 +2,6 @@
 This module provides a client class for AS.
 """
 import copy
-import json
 import uuid
 
 from baidubce import bce_base_client, compat
@@ -161,7 +160,7 @@ class AsClient(bce_base_client.BceBaseClient):
         body = {
             "groupIds": group_ids
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body))
 
     def create_group(self, group_name=None, config=None, health_check=None, blb=None, rds=None, scs=None,
                      shrinkage_strategy=None, zone_infos=None, assign_tag_info=None, node_list=None,
@@ -246,7 +245,7 @@ class AsClient(bce_base_client.BceBaseClient):
             'cmdConfig': cmd_config,
             'bccNameConfig': bcc_name_config
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body))
 
     @required(group_id=str, nodes=list)
     def detach_node(self, group_id, nodes):
@@ -266,7 +265,7 @@ class AsClient(bce_base_client.BceBaseClient):
         body = {
             "nodes": nodes
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params)
 
     @required(rule_name=str, group_id=str, state=str, rule_type=str, action_type=str, action_num=int,
               cooldown_in_sec=int)
@@ -335,7 +334,7 @@ class AsClient(bce_base_client.BceBaseClient):
             "periodStartTime": period_start_time,
             "periodEndTime": period_end_time
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body))
 
     @required(rule_id=str, rule_name=str, group_id=str, state=str, rule_type=str, action_type=str, action_num=int,
               cooldown_in_sec=int)
@@ -405,7 +404,7 @@ class AsClient(bce_base_client.BceBaseClient):
             "periodStartTime": period_start_time,
             "periodEndTime": period_end_time
         }
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body))
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body))
 
     @required(rule_id=str)
     def get_rule(self, rule_id):
@@ -469,7 +468,7 @@ class AsClient(bce_base_client.BceBaseClient):
             "ruleIds": rule_ids,
             "groupIds": group_ids
         }
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body))
 
     def get_records(self, group_id, page_no=1, page_size=1000, order=None, order_by="startTime",
                     start_time=None, end_time=None):
@@ -541,7 +540,7 @@ class AsClient(bce_base_client.BceBaseClient):
         body = {
             "ruleId": rule_id
         }
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body))
 
     def scaling_up(self, group_id, node_count, zone, expansion_strategy=None):
         """
@@ -576,7 +575,7 @@ class AsClient(bce_base_client.BceBaseClient):
             "zone": zone,
             "expansionStrategy": expansion_strategy
         }
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body))
 
     def scaling_down(self, group_id, nodes):
         """
@@ -601,7 +600,7 @@ class AsClient(bce_base_client.BceBaseClient):
         body = {
             "nodes": nodes,
         }
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body))
 
     def adjust_node(self, group_id, adjust_num):
         """
@@ -627,7 +626,7 @@ class AsClient(bce_base_client.BceBaseClient):
         body = {
             "adjustNum": adjust_num,
         }
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body))
 
     def attach_node(self, group_id, nodes):
         """
@@ -650,4 +649,4 @@ class AsClient(bce_base_client.BceBaseClient):
         body = {
             "nodes": nodes,
         }
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body))
@@ -14,7 +14,6 @@
 This module provides a client class for BBC.
 """
 import copy
-import json
 import logging
 import random
 import string
@@ -214,7 +213,7 @@ class BbcClient(bce_base_client.BceBaseClient):
             body['autoRenewTime'] = auto_renew_time
         if tags is not None:
             body['tags'] = tags
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
 
@@ -329,7 +328,7 @@ class BbcClient(bce_base_client.BceBaseClient):
         params = {
             'stop': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=(bytes, str))
@@ -361,7 +360,7 @@ class BbcClient(bce_base_client.BceBaseClient):
         params = {
             'reboot': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=str)
@@ -386,7 +385,7 @@ class BbcClient(bce_base_client.BceBaseClient):
         params = {
 
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=str, private_ips=list)
@@ -405,7 +404,7 @@ class BbcClient(bce_base_client.BceBaseClient):
         params = {
 
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=(bytes, str),
@@ -439,7 +438,7 @@ class BbcClient(bce_base_client.BceBaseClient):
         params = {
 
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=(bytes, str))
@@ -460,7 +459,7 @@ class BbcClient(bce_base_client.BceBaseClient):
         params = {
 
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def describe_regions(self, region, config=None):
@@ -481,7 +480,7 @@ class BbcClient(bce_base_client.BceBaseClient):
             'region': region
         }
         params = {}
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config, api_version=self.prefix_v2)
 
     @required(instance_id=(bytes, str),
@@ -511,7 +510,7 @@ class BbcClient(bce_base_client.BceBaseClient):
         params = {
             'rename': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
 
@@ -541,7 +540,7 @@ class BbcClient(bce_base_client.BceBaseClient):
         params = {
             'updateDesc': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=(bytes, str),
@@ -603,7 +602,7 @@ class BbcClient(bce_base_client.BceBaseClient):
         params = {
             'rebuild': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=(bytes, str))
@@ -660,7 +659,7 @@ class BbcClient(bce_base_client.BceBaseClient):
         params = {
             'changePass': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(bbc_ids = list)
@@ -680,7 +679,7 @@ class BbcClient(bce_base_client.BceBaseClient):
             'bbcIds': bbc_ids
         }
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), config = config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), config = config)
 
     @required(instance_id=(bytes, str), change_tags = list)
     def unbind_tags(self, instance_id, change_tags, config=None):
@@ -710,7 +709,7 @@ class BbcClient(bce_base_client.BceBaseClient):
             'changeTags': change_tags
         }
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body),
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=(bytes, str), change_tags = list)
@@ -741,7 +740,7 @@ class BbcClient(bce_base_client.BceBaseClient):
             'changeTags': change_tags
         }
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body),
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body),
                                   params=params, config=config)
 
 
@@ -763,7 +762,7 @@ class BbcClient(bce_base_client.BceBaseClient):
         params = {
             'bind': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config, api_version=self.prefix_v2)
 
     @required(reserved_instance_ids=list,
@@ -784,7 +783,7 @@ class BbcClient(bce_base_client.BceBaseClient):
         params = {
             'unbind': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config, api_version=self.prefix_v2)
 
     def list_flavors(self, config=None):
@@ -876,7 +875,7 @@ class BbcClient(bce_base_client.BceBaseClient):
             'instanceId': instance_id
         }
 
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def list_images(self, image_type='All', marker=None, max_keys=1000, config=None):
@@ -1039,7 +1038,7 @@ class BbcClient(bce_base_client.BceBaseClient):
             body["name"] = name
         if desc is not None:
             body['desc'] = desc
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def list_deploy_sets(self, config=None):
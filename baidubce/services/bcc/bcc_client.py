@@ -18,7 +18,6 @@ This module provides a client class for BCC.
 from __future__ import unicode_literals
 
 import copy
-import json
 import logging
 import random
 import string
@@ -483,7 +482,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['resGroupId'] = res_group_id
         body['cdsAutoRenew'] = cds_auto_renew
 
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(cpu_count=int, memory_capacity_in_gb=int, dedicated_host_id=(bytes, str),  # ***Unicode***
@@ -590,7 +589,7 @@ class BccClient(bce_base_client.BceBaseClient):
             secret_access_key = self.config.credentials.secret_access_key
             cipher_admin_pass = aes128_encrypt_16char_key(admin_pass, secret_access_key)
             body['adminPass'] = cipher_admin_pass
-        return self._send_request(http_methods.POST, path, json.dumps(body), params=params,
+        return self._send_request(http_methods.POST, path, self._json_dumps(body), params=params,
                                   config=config)
 
     @required(cpu_count=int, memory_capacity_in_gb=int, dedicated_host_id=(bytes, str),  # ***Unicode***
@@ -695,7 +694,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['subnetId'] = subnet_id
         if security_group_id is not None:
             body['securityGroupId'] = security_group_id
-        return self._send_request(http_methods.POST, path, json.dumps(body), params=params,
+        return self._send_request(http_methods.POST, path, self._json_dumps(body), params=params,
                                   config=config)
 
     @required(cpu_count=int,
@@ -1088,7 +1087,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['keepImageLogin'] = is_keep_image_login
         body['isEipAutoRelatedDelete'] = is_eip_auto_related_delete
 
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def list_instances(self, marker=None, max_keys=None, internal_ip=None, dedicated_host_id=None,
@@ -1312,7 +1311,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'stop': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=(bytes, str))  # ***Unicode***
@@ -1345,7 +1344,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'reboot': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_ids=list)
@@ -1378,7 +1377,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'reboot': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=str)
@@ -1420,7 +1419,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
 
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=str, private_ips=list)
@@ -1439,7 +1438,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
 
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=(bytes, str),  # ***Unicode***
@@ -1475,7 +1474,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'changePass': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=(bytes, str),  # ***Unicode***
@@ -1520,7 +1519,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'modifyAttribute': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=(bytes, str),
@@ -1550,7 +1549,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'modifyDesc': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=(bytes, str),  # ***Unicode***
@@ -1656,7 +1655,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'rebuild': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=(bytes, str))  # ***Unicode***
@@ -1766,7 +1765,7 @@ class BccClient(bce_base_client.BceBaseClient):
                 'resize': None,
                 'clientToken': client_token
             }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=(bytes, str),  # ***Unicode***
@@ -1794,7 +1793,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'bind': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=(bytes, str),  # ***Unicode***
@@ -1822,7 +1821,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'unbind': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(reserved_instance_ids=list,
@@ -1843,7 +1842,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'bind': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(reserved_instance_ids=list,
@@ -1864,7 +1863,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'unbind': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def bind_tags_batch_by_resource_type(self, resource_type, resource_ids, tags, is_relation_tag, config=None):
@@ -1887,7 +1886,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'action': 'AttachTags'
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config, prefix=self.prefix_v3)
 
     def unbind_tags_batch_by_resource_type(self, resource_type, resource_ids, tags, is_relation_tag, config=None):
@@ -1910,7 +1909,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'action': 'DetachTags'
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config, prefix=self.prefix_v3)
 
     @required(instance_id=(bytes, str),
@@ -1933,7 +1932,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'bind': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=(bytes, str),
@@ -1956,7 +1955,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'unbind': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=(bytes, str))  # ***Unicode***
@@ -2042,7 +2041,7 @@ class BccClient(bce_base_client.BceBaseClient):
             }
         if related_renew_flag is not None:
             params['relatedRenewFlag'] = related_renew_flag
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def list_instance_specs(self, config=None):
@@ -2202,7 +2201,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['chargeType'] = charge_type
         if enable_delete_protection is not None:
             body['enableDeleteProtection'] = enable_delete_protection
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(snapshot_id=(bytes, str))  # ***Unicode***
@@ -2342,7 +2341,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['instanceId'] = instance_id
         if charge_type is not None:
             body['chargeType'] = charge_type
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def list_volumes(self, instance_id=None, zone_name=None, marker=None, max_keys=None,
@@ -2442,7 +2441,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'attach': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(volume_id=(bytes, str),  # ***Unicode***
@@ -2473,7 +2472,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'detach': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def describe_regions(self, region, config=None):
@@ -2494,7 +2493,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'region': region
         }
         params = {}
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(volume_id=(bytes, str))  # ***Unicode***
@@ -2576,7 +2575,7 @@ class BccClient(bce_base_client.BceBaseClient):
                 'resize': None,
                 'clientToken': client_token
             }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(volume_id=(bytes, str),  # ***Unicode***
@@ -2611,7 +2610,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'rollback': None,
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(volume_id=(bytes, str))  # ***Unicode***
@@ -2669,7 +2668,7 @@ class BccClient(bce_base_client.BceBaseClient):
                 'purchaseReserved': None,
                 'clientToken': client_token
             }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(volume_id=(bytes, str),
@@ -2703,7 +2702,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'modify': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(volume_id=(bytes, str))
@@ -2739,7 +2738,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'modifyChargeType': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(image_name=(bytes, str),  # ***Unicode***
@@ -2808,7 +2807,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['relateCds'] = relate_cds
         if detection:
             body['detection'] = detection
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(image_name=(bytes, str),  # ***Unicode***
@@ -2868,7 +2867,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['encryptKey'] = encrypt_key
         if detection:
             body['detection'] = detection
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def list_images(self, image_type='All', marker=None, max_keys=None, image_name=None,
@@ -2972,7 +2971,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'remoteCopy': None
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(image_id=(bytes, str))
@@ -3027,7 +3026,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'share': None
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(image_id=(bytes, str))
@@ -3065,7 +3064,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'unshare': None
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(image_id=(bytes, str))
@@ -3095,7 +3094,7 @@ class BccClient(bce_base_client.BceBaseClient):
         body = {
             'instanceIds': instance_id_list
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body), config=config)
+        return self._send_request(http_methods.POST, path, self._json_dumps(body), config=config)
 
     @required(volume_id=(bytes, str),  # ***Unicode***
               snapshot_name=(bytes, str))  # ***Unicode***
@@ -3166,7 +3165,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if tags is not None:
             tag_list = [tag.__dict__ for tag in tags]
             body['tags'] = tag_list
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def list_snapshots(self, marker=None, max_keys=None, volume_id=None, config=None):
@@ -3306,7 +3305,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if tags is not None:
             tag_list = [tag.__dict__ for tag in tags]
             body['tags'] = tag_list
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def list_security_groups(self, instance_id=None, vpc_id=None, security_group_id=None, security_group_ids=None,
@@ -3425,7 +3424,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'rule': rule.__dict__
         }
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(security_group_id=(bytes, str),  # ***Unicode***
@@ -3467,7 +3466,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'rule': rule.__dict__
         }
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def update_security_group_rule(self, security_group_rule_id,
@@ -3542,7 +3541,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if destgroup_id is not None:
             body['destGroupId'] = destgroup_id
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params if params else None, config=config)
 
     @required(security_group_rule_id=(bytes, str))  # ***Unicode***
@@ -3636,7 +3635,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'repeatWeekdays': repeat_week_days,
             'retentionDays': retention_days
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(asp_id=(bytes, str),
@@ -3660,7 +3659,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'attach': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(asp_id=(bytes, str),
@@ -3684,7 +3683,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'detach': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(asp_id=(bytes, str))
@@ -3753,7 +3752,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'create': None
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keypair_name=(bytes, str),
@@ -3781,7 +3780,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'import': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def list_keypairs(self, marker=None, max_keys=None, name=None, config=None):
@@ -3835,7 +3834,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'attach': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keypair_id=(bytes, str),
@@ -3859,7 +3858,7 @@ class BccClient(bce_base_client.BceBaseClient):
         params = {
             'detach': None
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keypair_id=(bytes, str))
@@ -3899,7 +3898,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'rename': None
         }
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keypair_id=(bytes, str),
@@ -3924,7 +3923,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'updateDesc': None
         }
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(cluster_size_in_gb=int)
@@ -3961,7 +3960,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if renew_time is not None:
             body['renewTime'] = renew_time
 
-        return self._send_request(http_methods.POST, path, json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, self._json_dumps(body), params=params, config=config)
 
     def list_volume_cluster(self, cluster_name=None, zone_name=None, marker=None, max_keys=None,
                             config=None):
@@ -4012,7 +4011,7 @@ class BccClient(bce_base_client.BceBaseClient):
                 'resize': None,
                 'clientToken': client_token
             }
-        return self._send_request(http_methods.PUT, path, json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body), params=params, config=config)
 
     @required(cluster_id=(bytes, str))  # ***Unicode***
     def renew_volume_cluster(self, cluster_id, reservation_length=6, reservation_time_unit='month',
@@ -4039,7 +4038,7 @@ class BccClient(bce_base_client.BceBaseClient):
                 'purchaseReserved': None,
                 'clientToken': client_token
             }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(cluster_id=(bytes, str))  # ***Unicode***
@@ -4064,7 +4063,7 @@ class BccClient(bce_base_client.BceBaseClient):
             params = {
                 'clientToken': client_token
             }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(cluster_id=(bytes, str))  # ***Unicode***
@@ -4086,7 +4085,7 @@ class BccClient(bce_base_client.BceBaseClient):
             params = {
                 'clientToken': client_token
             }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def list_recycled_instances(self, marker=None, max_keys=None, instance_id=None, name=None, payment_timing=None,
@@ -4146,7 +4145,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['recycleBegin'] = recycle_begin
         if recycle_end is not None:
             body['recycleEnd'] = recycle_end
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     @required(spec=str, image_id=(bytes, str))  # ***Unicode***
     def create_instance_by_spec(self, spec, image_id, root_disk_size_in_gb=0, root_disk_storage_type=None,
@@ -4565,7 +4564,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['reservedInstance'] = reserved_instance
         if enable_delete_protection is not None:
             body['enableDeleteProtection'] = enable_delete_protection
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(instance_id=(bytes, str))
@@ -4611,7 +4610,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'releaseTime': release_time,
             'isEipAutoRelatedDelete': is_eip_auto_related_delete
         }
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(instance_id=(bytes, str))  # ***Unicode***
     def release_instance_with_related_resources(self, instance_id, related_release_flag=None,
@@ -4668,7 +4667,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['bccRecycleFlag'] = bcc_recycle_flag
         if bcc_recycle_flag is not None:
             body['cdsAttributeActive'] = cds_attribute_active
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(instance_id=(bytes, str))  # ***Unicode***
     def release_prepaid_instance_with_related_resources(self, instance_id, related_release_flag=None,
@@ -4716,7 +4715,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['deleteCdsSnapshotFlag'] = delete_cds_snapshot_flag
         if delete_related_enis_flag is not None:
             body['deleteRelatedEnisFlag'] = delete_related_enis_flag
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(instance_id=(bytes, str))  # ***Unicode***
     def get_instance_with_deploy_set(self, instance_id, contains_failed=None, config=None):
@@ -4813,7 +4812,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['reboot'] = reboot
         if is_open_hostname_domain is not None:
             body['isOpenHostnameDomain'] = is_open_hostname_domain
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(instance_id_list=(list))  # ***Unicode***
     def recovery_instances(self, instance_id_list, client_token=None, config=None):
@@ -4839,7 +4838,7 @@ class BccClient(bce_base_client.BceBaseClient):
         body = {
             "instanceIds": list_of_item
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(instance_ids=(list))
     def batch_refund_resources(self, instance_ids, related_release_flag=None,
@@ -4885,7 +4884,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['deleteCdsSnapshotFlag'] = delete_cds_snapshot_flag
         if delete_related_enis_flag is not None:
             body['deleteRelatedEnisFlag'] = delete_related_enis_flag
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(instance_type=str, cpu_count=int, memory_cap_in_gb=int)  # ***Unicode***
     def get_bid_instance_price(self, instance_type, cpu_count, memory_cap_in_gb,
@@ -5069,7 +5068,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if network_cap_in_mbps is not None:
             body['networkCapacityInMbps'] = network_cap_in_mbps
 
-        return self._send_request(http_methods.POST, path, json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, self._json_dumps(body), params=params, config=config)
 
     def list_bid_flavor(self, client_token=None, config=None):
         """
@@ -5112,7 +5111,7 @@ class BccClient(bce_base_client.BceBaseClient):
         body = {
             "deletionProtection": deletion_protection
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body), params=params, config=config)
 
     @required(instance_id=(bytes, str), is_eip_auto_related_delete=bool)
     def modify_related_delete_policy(self, instance_id, is_eip_auto_related_delete, client_token=None, config=None):
@@ -5140,7 +5139,7 @@ class BccClient(bce_base_client.BceBaseClient):
         body = {
             "isEipAutoRelatedDelete": is_eip_auto_related_delete
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body), params=params, config=config)
 
     @required(volume_id=(bytes, str))  # ***Unicode***
     def release_volume_new(self, volume_id, auto_snapshot=None, manual_snapshot=None,
@@ -5185,7 +5184,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if recycle is not None:
             body['recycle'] = recycle
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(volume_id=str, renew_time=int, renew_time_unit=str)  # ***Unicode***
     def auto_renew_cds_volume(self, volume_id, renew_time, renew_time_unit, client_token=None, config=None):
@@ -5222,7 +5221,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'renewTimeUnit': renew_time_unit
         }
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(volume_id=str)  # ***Unicode***
     def cancel_auto_renew_cds_volume(self, volume_id, client_token=None, config=None):
@@ -5245,7 +5244,7 @@ class BccClient(bce_base_client.BceBaseClient):
             params['clientToken'] = generate_client_token()
         else:
             params['clientToken'] = client_token
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(zone_name=str)  # ***Unicode***
@@ -5302,7 +5301,7 @@ class BccClient(bce_base_client.BceBaseClient):
             tag_list = [tag.__dict__ for tag in tags]
             body['changeTags'] = tag_list
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body), params=params, config=config)
 
     @required(volume_id=str)  # ***Unicode***
     def untag_volume(self, volume_id, relation_tag=None, tags=None, client_token=None, config=None):
@@ -5336,7 +5335,7 @@ class BccClient(bce_base_client.BceBaseClient):
             tag_list = [tag.__dict__ for tag in tags]
             body['changeTags'] = tag_list
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body), params=params, config=config)
 
     @required(volume_id=str)  # ***Unicode***
     def list_snapshot_chain(self, volume_id, order=None, order_by=None,
@@ -5416,7 +5415,7 @@ class BccClient(bce_base_client.BceBaseClient):
             tag_list = [tag.__dict__ for tag in tags]
             body['changeTags'] = tag_list
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body), params=params, config=config)
 
     @required(chain_id=str)  # ***Unicode***
     def untag_snapshot_chain(self, chain_id, tags=None, client_token=None, config=None):
@@ -5448,7 +5447,7 @@ class BccClient(bce_base_client.BceBaseClient):
             tag_list = [tag.__dict__ for tag in tags]
             body['changeTags'] = tag_list
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body), params=params, config=config)
 
     def update_asp(self, name=None, asp_id=None, time_points=None, repeat_week_days=None, retention_days=None,
                    client_token=None, config=None):
@@ -5498,7 +5497,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if retention_days is not None:
             body['retentionDays'] = retention_days
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def get_price_by_spec(self, spec_id=None, spec=None, payment_timing=None, zone_name=None, purchase_num=None,
@@ -5555,7 +5554,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if purchase_length is not None:
             body['purchaseLength'] = purchase_length
 
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def list_type_zones(self, spec_id=None, spec=None, product_type=None, instance_type=None,
@@ -5656,7 +5655,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if enterprise_security_group_ids is not None:
             body['enterpriseSecurityGroupIds'] = enterprise_security_group_ids
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     def instance_change_vpc(self, instance_id, subnet_id=None,
                             internal_ip=None, reboot=None, security_group_ids=None, enterprise_security_group_ids=None,
@@ -5704,7 +5703,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if enterprise_security_group_ids is not None:
             body['enterpriseSecurityGroupIds'] = enterprise_security_group_ids
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(chain_id=str)  # ***Unicode***
     def list_instance_enis(self, instance_id, client_token=None, config=None):
@@ -5792,7 +5791,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if enable_jumbo_frame is not None:
             body['enableJumboFrame'] = enable_jumbo_frame
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     def batch_rebuild_instances(self, image_id, admin_pass, instance_ids, keypair_id=None, is_keep_image_login=None,
                                 client_token=None, config=None, user_data=None, use_last_user_data=None,
@@ -5878,7 +5877,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['dataPartitionType'] = data_partition_type
         if root_partition_type is not None:
             body['rootPartitionType'] = root_partition_type
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     def change_to_prepaid(self, instance_id, duration, relation_cds, auto_renew, auto_renew_period=None,
                           client_token=None, config=None):
@@ -5928,7 +5927,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['autoRenewPeriod'] = auto_renew_period
         if relation_cds is not None:
             body['relationCds'] = relation_cds
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def list_instance_no_charge(self, marker=None, max_keys=None, internal_ip=None, keypair_id=None,
                                 zone_name=None, instance_ids=None, client_token=None, config=None):
@@ -6006,7 +6005,7 @@ class BccClient(bce_base_client.BceBaseClient):
         body = {
             "orderId": order_id
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def batch_create_auto_renew_rules(self, instance_id, renew_time_unit="month", renew_time=1,
                                       renew_cds=None, renew_eip=None, client_token=None, config=None):
@@ -6048,7 +6047,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if renew_eip is not None:
             body["renewEip"] = renew_eip
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def batch_delete_auto_renew_rules(self, instance_id, renew_cds=None, renew_eip=None,
                                       client_token=None, config=None):
@@ -6080,7 +6079,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if renew_eip is not None:
             body["renewEip"] = renew_eip
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def delete_recycled_instance(self, instance_id, client_token=None, config=None):
         """
@@ -6101,7 +6100,7 @@ class BccClient(bce_base_client.BceBaseClient):
         else:
             params['clientToken'] = client_token
         body = {}
-        return self._send_request(http_methods.DELETE, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.DELETE, path, body=self._json_dumps(body), params=params, config=config)
 
     def list_instance_by_instance_ids(self, instance_ids, marker=None, max_keys=None, client_token=None, config=None):
         """
@@ -6138,7 +6137,7 @@ class BccClient(bce_base_client.BceBaseClient):
         body = {
             "instanceIds": instance_ids
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def get_instance_delete_progress(self, instance_ids, client_token=None, config=None):
         """
@@ -6160,7 +6159,7 @@ class BccClient(bce_base_client.BceBaseClient):
         body = {
             "instanceIds": instance_ids
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def batch_delete_instance_with_related_resource(self, instance_ids, related_release_flag=None,
                                                     delete_cds_snapshot_flag=None, delete_related_enis_flag=None,
@@ -6212,7 +6211,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['bccRecycleFlag'] = bcc_recycle_flag
         if bcc_recycle_flag is not None:
             body['cdsAttributeActive'] = cds_attribute_active
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def batch_start_instance(self, instance_ids, client_token=None, config=None):
         """
@@ -6236,7 +6235,7 @@ class BccClient(bce_base_client.BceBaseClient):
         body = {
             "instanceIds": instance_ids
         }
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     def batch_stop_instance(self, instance_ids, force_stop=None, stop_with_no_charge=None,
                             client_token=None, config=None):
@@ -6273,7 +6272,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['forceStop'] = force_stop
         if stop_with_no_charge is not None:
             body['stopWithNoCharge'] = stop_with_no_charge
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     def list_id_mappings(self, ids, id_type, object_type, client_token=None, config=None):
         """
@@ -6305,7 +6304,7 @@ class BccClient(bce_base_client.BceBaseClient):
             "idType": id_type,
             "objectType": object_type
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def batch_resize_instance(self, instance_ids, spec, subnet_id=None, logical_zone=None, internal_ip_v4=None,
                               enable_jumbo_frame=None, client_token=None, config=None):
@@ -6368,7 +6367,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if enable_jumbo_frame is not None:
             body['enableJumboFrame'] = enable_jumbo_frame
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     def list_available_resize_specs(self, instance_ids, spec=None, spec_id=None, logical_zone=None,
                                     client_token=None, config=None):
@@ -6410,7 +6409,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['specId'] = spec_id
         if logical_zone is not None:
             body['zone'] = logical_zone
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def batch_change_instance_to_prepay(self, change_pay_timing_req_list, client_token=None, config=None):
         """
@@ -6434,7 +6433,7 @@ class BccClient(bce_base_client.BceBaseClient):
         body = {
             "config": [change_pay_timing_req.__dict__ for change_pay_timing_req in change_pay_timing_req_list]
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def batch_change_instance_to_postpay(self, change_pay_timing_req_list, client_token=None, config=None):
         """
@@ -6458,7 +6457,7 @@ class BccClient(bce_base_client.BceBaseClient):
         body = {
             "config": [change_pay_timing_req.__dict__ for change_pay_timing_req in change_pay_timing_req_list]
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def list_instance_roles(self, client_token=None, config=None):
         """
@@ -6505,7 +6504,7 @@ class BccClient(bce_base_client.BceBaseClient):
             "instances": instances,
             "roleName": role_name
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def unbind_instance_role(self, instance_ids, role_name, client_token=None, config=None):
         """
@@ -6537,7 +6536,7 @@ class BccClient(bce_base_client.BceBaseClient):
             "instances": instances,
             "roleName": role_name
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def add_ipv6(self, instance_id, ipv6_address, reboot=False, client_token=None, config=None):
         """
@@ -6569,7 +6568,7 @@ class BccClient(bce_base_client.BceBaseClient):
             "ipv6Address": ipv6_address,
             "reboot": reboot
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def delete_ipv6(self, instance_id, reboot=False, client_token=None, config=None):
         """
@@ -6596,7 +6595,7 @@ class BccClient(bce_base_client.BceBaseClient):
             "instanceId": instance_id,
             "reboot": reboot
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def bind_image_to_tags(self, image_id, tags, client_token=None, config=None):
         """
@@ -6626,7 +6625,7 @@ class BccClient(bce_base_client.BceBaseClient):
         body = {
             'changeTags': tag_list
         }
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     def unbind_image_to_tags(self, image_id, tags, client_token=None, config=None):
         """
@@ -6656,7 +6655,7 @@ class BccClient(bce_base_client.BceBaseClient):
         body = {
             'changeTags': tag_list
         }
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     def import_custom_image(self, os_name, os_arch, os_type, os_version, name, bos_url, client_token=None, config=None,
                             detection=None, generation_type=None):
@@ -6708,7 +6707,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['detection'] = detection
         if generation_type is not None:
             body['generationType'] = generation_type
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def create_remote_copy_snapshot(self, snapshot_id, dest_region_infos, client_token=None, config=None):
         """
@@ -6735,7 +6734,7 @@ class BccClient(bce_base_client.BceBaseClient):
         body = {
             "destRegionInfos": [dest_region_info.__dict__ for dest_region_info in dest_region_infos]
         }
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     def create_deploy_set(self, name=None, strategy=None, desc=None, concurrency=None, client_token=None, config=None):
         """
@@ -6777,7 +6776,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if concurrency is not None:
             body['concurrency'] = concurrency
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def list_deploy_sets(self, client_token=None, config=None, deployment_set_ids=None):
         """
@@ -6852,7 +6851,7 @@ class BccClient(bce_base_client.BceBaseClient):
             body['name'] = name
         if desc is not None:
             body['desc'] = desc
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     def get_deploy_set(self, deploy_set_id, client_token=None, config=None):
         """
@@ -6902,7 +6901,7 @@ class BccClient(bce_base_client.BceBaseClient):
         }
         if force is not None:
             body['force'] = force
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def del_instance_deploy(self, instance_id_list, deploy_set_id, client_token=None, config=None):
         """
@@ -6929,7 +6928,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'instanceIdList': instance_id_list,
             'deployId': deploy_set_id
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def create_ehc_cluster(self, name, zone_name, description=None, client_token=None, config=None):
         """
@@ -6962,7 +6961,7 @@ class BccClient(bce_base_client.BceBaseClient):
         }
         if description is not None:
             body['description'] = description
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def modify_ehc_cluster(self, ehc_cluster_id, name=None, description=None, client_token=None, config=None):
         """
@@ -6997,7 +6996,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if description is not None:
             body['description'] = description
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def get_ehc_cluster_list(self, ehc_cluster_id_list=None, name_list=None, zone_name=None, config=None):
         """
@@ -7028,7 +7027,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if zone_name is not None:
             body['zoneName'] = zone_name
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def delete_ehc_cluster(self, ehc_cluster_id_list, client_token=None, config=None):
         """
@@ -7051,7 +7050,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'ehcClusterIdList': ehc_cluster_id_list
         }
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def get_available_images_by_spec(self, marker=None, max_keys=None, spec=None, os_name=None, config=None):
         """
@@ -7211,7 +7210,7 @@ class BccClient(bce_base_client.BceBaseClient):
             tag_list = [tag.__dict__ for tag in tags]
             body['tags'] = tag_list
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def modify_reserved_instances(self, reserved_instances=None, client_token=None, config=None):
 
@@ -7236,7 +7235,7 @@ class BccClient(bce_base_client.BceBaseClient):
             reserved_instances_list = [reserved_instance.__dict__ for reserved_instance in reserved_instances]
             body['reservedInstances'] = reserved_instances_list
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     def get_instance_user_data(self, instance_id, client_token=None, config=None):
         """
@@ -7251,7 +7250,7 @@ class BccClient(bce_base_client.BceBaseClient):
         body = {
             "instanceId": instance_id
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def modify_volume_delete_protection(self, volume_ids, enable_delete_protection, client_token=None, config=None):
@@ -7276,7 +7275,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'volumeIds': volume_ids,
             'enableDeleteProtection': enable_delete_protection
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, self._json_dumps(body), params=params, config=config)
 
     def create_snapshot_share(self, snapshot_id, account_ids, client_token=None, config=None):
         """
@@ -7303,7 +7302,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'snapshotId': snapshot_id,
             'accountIds': account_ids
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                 params=params, config=config)
 
     def cancel_snapshot_share(self, source_snapshot_id, account_ids, share_snapshot_id, client_token=None, config=None):
@@ -7336,7 +7335,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'accountIds': account_ids,
             'shareSnapshotId': share_snapshot_id
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def list_snapshot_share(self, marker, max_keys, client_token=None, config=None):
@@ -7364,7 +7363,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'marker': marker,
             'maxKeys': max_keys
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, self._json_dumps(body), params=params, config=config)
 
 
     def enter_rescue_mode(self, instance_id, force_stop, password, client_token=None, config=None):
@@ -7392,7 +7391,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'forceStop': force_stop,
             'password': password
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def exit_rescue_mode(self, instance_id, client_token=None, config=None):
@@ -7418,7 +7417,7 @@ class BccClient(bce_base_client.BceBaseClient):
         body = {
             'instanceId': instance_id
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def bind_sg(self, instance_ids, security_group_ids, security_group_type, client_token=None, config=None):
@@ -7445,7 +7444,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'securityGroupIds': security_group_ids,
             'securityGroupType': security_group_type
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def replace_sg(self, instance_ids, security_group_ids, security_group_type, client_token=None, config=None):
@@ -7473,7 +7472,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'securityGroupIds': security_group_ids,
             'securityGroupType': security_group_type
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def unbind_sg(self, instance_ids, security_group_ids, security_group_type, client_token=None, config=None):
@@ -7501,7 +7500,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'securityGroupIds': security_group_ids,
             'securityGroupType': security_group_type
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def authorize_server_event(self, authorize_maintenance_operation, server_event_id=None, instance_id=None,
@@ -7542,7 +7541,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'authorizeMaintenanceOperation': authorize_maintenance_operation,
             'executeTime': execute_time
         }
-        return self._send_action_request(http_methods.POST, path, json.dumps(body),
+        return self._send_action_request(http_methods.POST, path, self._json_dumps(body),
                                          params=params, config=config)
 
     def create_authorize_rule(self, server_event_category, authorize_maintenance_operations, rule_name,
@@ -7592,7 +7591,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'effectiveScope': effective_scope,
             'ruleName': rule_name
         }
-        return self._send_action_request(http_methods.POST, path, json.dumps(body),
+        return self._send_action_request(http_methods.POST, path, self._json_dumps(body),
                                          params=params, config=config)
 
     def modify_authorize_rule(self, rule_id, authorize_maintenance_operations=None, rule_name=None,
@@ -7642,7 +7641,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'ruleName': rule_name,
             "ruleId": rule_id
         }
-        return self._send_action_request(http_methods.POST, path, json.dumps(body),
+        return self._send_action_request(http_methods.POST, path, self._json_dumps(body),
                                          params=params, config=config)
 
     def delete_authorize_rule(self, rule_id, config=None, client_token=None):
@@ -7666,7 +7665,7 @@ class BccClient(bce_base_client.BceBaseClient):
         body = {
             'ruleId': rule_id
         }
-        return self._send_action_request(http_methods.POST, path, json.dumps(body),
+        return self._send_action_request(http_methods.POST, path, self._json_dumps(body),
                                          params=params, config=config)
 
     def describe_authorize_rules(self, max_keys, marker=None, rule_ids=None, rule_names=None, config=None):
@@ -7705,7 +7704,7 @@ class BccClient(bce_base_client.BceBaseClient):
             "ruleIds": rule_ids,
             "ruleNames": rule_names
         }
-        return self._send_action_request(http_methods.POST, path, json.dumps(body),
+        return self._send_action_request(http_methods.POST, path, self._json_dumps(body),
                                          params=params, config=config)
 
     def describe_planned_events(self, max_keys, marker=None, server_event_ids=None, instance_ids=None,
@@ -7779,7 +7778,7 @@ class BccClient(bce_base_client.BceBaseClient):
             "periodEndTime": period_end_time,
             "serverEventStatus": server_event_status
         }
-        return self._send_action_request(http_methods.POST, path, json.dumps(body),
+        return self._send_action_request(http_methods.POST, path, self._json_dumps(body),
                                          params=params, config=config)
 
     def describe_planned_recored_events(self, max_keys, marker=None, server_event_ids=None, instance_ids=None,
@@ -7849,7 +7848,7 @@ class BccClient(bce_base_client.BceBaseClient):
             "periodStartTime": period_start_time,
             "periodEndTime": period_end_time
         }
-        return self._send_action_request(http_methods.POST, path, json.dumps(body),
+        return self._send_action_request(http_methods.POST, path, self._json_dumps(body),
                                          params=params, config=config)
 
     def describe_unplanned_events(self, max_keys, marker=None, server_event_ids=None, instance_ids=None,
@@ -7923,7 +7922,7 @@ class BccClient(bce_base_client.BceBaseClient):
             "periodEndTime": period_end_time,
             "serverEventStatus": server_event_status
         }
-        return self._send_action_request(http_methods.POST, path, json.dumps(body),
+        return self._send_action_request(http_methods.POST, path, self._json_dumps(body),
                                          params=params, config=config)
 
     def describe_unplanned_recored_events(self, max_keys, marker=None, server_event_ids=None, instance_ids=None,
@@ -7993,7 +7992,7 @@ class BccClient(bce_base_client.BceBaseClient):
             "periodStartTime": period_start_time,
             "periodEndTime": period_end_time
         }
-        return self._send_action_request(http_methods.POST, path, json.dumps(body),
+        return self._send_action_request(http_methods.POST, path, self._json_dumps(body),
                                          params=params, config=config)
 
     def check_unplanned_event(self, server_event_id, check_result, issue_effect=None, issue_description=None,
@@ -8038,7 +8037,7 @@ class BccClient(bce_base_client.BceBaseClient):
             "issueDescription": issue_description,
             "authorizeMaintenanceOperation": authorize_maintenance_operation
         }
-        return self._send_action_request(http_methods.POST, path, json.dumps(body),
+        return self._send_action_request(http_methods.POST, path, self._json_dumps(body),
                                          params=params, config=config)
 
     def get_task(self, task_ids, max_keys=100, config=None):
@@ -8064,7 +8063,7 @@ class BccClient(bce_base_client.BceBaseClient):
             "taskIds": task_ids,
             "maxKeys": max_keys
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def list_task(self, max_keys=10, task_ids=None, task_action=None, task_status=None, resource_ids=None,
@@ -8101,7 +8100,7 @@ class BccClient(bce_base_client.BceBaseClient):
             "resourceIds": resource_ids,
             "maxKeys": max_keys,
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def get_cds_price(self, purchase_length, payment_timing, storage_type, cds_size_in_gb, purchase_count, zone_name,
@@ -8125,7 +8124,7 @@ class BccClient(bce_base_client.BceBaseClient):
         }
         if encrypt_key is not None:
             body['encryptKey'] = encrypt_key
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def get_diagnostic_schemas(self, config=None):
@@ -8154,7 +8153,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'status': status,
             'severity': severity
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def create_diagnostic(self, metric_set_id, instance_id, pid, instance_type="bcc", duration=180,
@@ -8175,7 +8174,7 @@ class BccClient(bce_base_client.BceBaseClient):
             'pid': pid,
             'duration': duration
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def delete_diagnostic_report(self, report_ids, client_token=None, config=None):
@@ -8191,7 +8190,7 @@ class BccClient(bce_base_client.BceBaseClient):
         body = {
             'reportIds': report_ids
         }
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def query_reserved_instance_price(self, spec_id, spec, offering_type, zone_name,
@@ -8227,7 +8226,7 @@ class BccClient(bce_base_client.BceBaseClient):
         if purchase_num is not None:
             body['purchaseNum'] = purchase_num
 
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
 
@@ -14,13 +14,12 @@
 This module provides a client class for BCM.
 """
 import copy
-import json
 import sys
 import uuid
 
 from baidubce import bce_base_client, utils, compat
 from baidubce.auth import bce_v1_signer
-from baidubce.http import handler, bce_http_client, http_methods
+from baidubce.http import handler, bce_http_client, http_headers, http_methods
 from baidubce.services.bcm import bcm_handler, bcm_model
 from baidubce.utils import required
 
@@ -306,7 +305,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "namespaceAlias": namespace_alias,
             "comment": comment,
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def batch_delete_namespaces(self, user_id, names, config=None):
         """
@@ -338,7 +337,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "userId": user_id,
             "names": names,
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def update_namespace(self, user_id, name, namespace_alias=None, comment=None, config=None):
         """
@@ -380,7 +379,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "namespaceAlias": namespace_alias,
             "comment": comment,
         }
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(body), config=config)
 
     def list_namespaces(self, user_id, name=None, page_no=None, page_size=None, config=None):
         """
@@ -502,7 +501,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         else:
             body["dimensions"] = []
 
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def batch_delete_namespace_metrics(self, user_id, namespace, ids, config=None):
         """
@@ -540,7 +539,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "namespace": namespace,
             "ids": ids,
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def update_namespace_metric(self, user_id, namespace, metric_name,
                                 metric_alias=None, unit=None, cycle=None, dimensions=None, config=None):
@@ -612,7 +611,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         if dimensions is not None:
             body["dimensions"] = dimensions
 
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(body), config=config)
 
     def list_namespace_metrics(self, user_id, namespace,
                                metric_name=None, metric_alias=None, page_no=None, page_size=None, config=None):
@@ -772,7 +771,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         if comment is not None:
             body["comment"] = comment
 
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def batch_delete_namespace_events(self, user_id, namespace, names, config=None):
         """
@@ -809,7 +808,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "namespace": namespace,
             "names": names,
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def update_namespace_event(self, user_id, namespace, event_name, event_level,
                                event_name_alias=None, comment=None, config=None):
@@ -869,7 +868,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         if comment is not None:
             body["comment"] = comment
 
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def list_namespace_events(self, user_id, namespace,
                               name=None, event_level=None, page_no=None, page_size=None, config=None):
@@ -996,7 +995,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "pageSize": page_size
         }
 
-        return self._send_request(http_methods.POST, path, headers=headers, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, headers=headers, body=self._json_dumps(body))
 
     @required(page_no=int, page_size=int)
     def list_notify_party(self, page_no, page_size, name=None):
@@ -1019,7 +1018,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "pageSize": page_size
         }
 
-        return self._send_request(http_methods.POST, path, headers=headers, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, headers=headers, body=self._json_dumps(body))
 
     @required(page_no=int, page_size=int, notifications=list, members=list)
     def create_action(self, user_id, notifications, members, alias, disable_times=None, action_callbacks=None):
@@ -1053,7 +1052,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "disableTimes": disable_times,
             "actionCallBacks": action_callbacks
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body))
 
     def delete_action(self, user_id, name):
         """
@@ -1095,7 +1094,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "pageSize": page_size,
             "order": order
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body))
 
     @required(page_no=int, page_size=int, notifications=list, members=list)
     def update_action(self, user_id, name, notifications, members, alias, disable_times=None,
@@ -1134,7 +1133,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "actionCallBacks": action_callbacks,
             "source": "USER"
         }
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(body))
 
     def log_extract(self, user_id, extract_rule, log_example):
         """
@@ -1154,7 +1153,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "extractRule": extract_rule,
             "logExample": log_example
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body),
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body),
                                       body_parser=bcm_handler.parse_json_list)
 
     def query_metric_meta_for_application(self, user_id, app_name, task_name, metric_name, dimension_keys,
@@ -1295,7 +1294,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             'appName': app_name,
             "alarmName": alarm_name
         }
-        return self._send_csm_request(http_methods.DELETE, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.DELETE, path, body=self._json_dumps(body))
 
     @required(page_no=int, page_size=int)
     def list_alarm_policy_for_application(self, user_id, page_no, page_size=None, app_name=None, alarm_name=None,
@@ -1402,7 +1401,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "maxRepeatCount": max_repeat_count,
             "rules": rules
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body))
 
     @required(rules=list)
     def update_alarm_policy_for_application(self, user_id, alarm_description, alarm_name, app_name,
@@ -1472,7 +1471,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "maxRepeatCount": max_repeat_count,
             "rules": rules
         }
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(body))
 
     def create_dashboard(self, user_id=None, title=None, configure=None, dashboard_type=None, config=None):
         """
@@ -1507,7 +1506,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         user_id = compat.convert_to_bytes(user_id)
         path = b'/dashboard/products/%s/dashboards' % user_id
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def get_dashboard(self, user_id=None, dashboard_name=None, config=None):
         """
@@ -1578,7 +1577,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         user_id = compat.convert_to_bytes(user_id)
         dashboard_name = compat.convert_to_bytes(dashboard_name)
         path = b'/dashboard/products/%s/dashboards/%s' % (user_id, dashboard_name)
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(body), config=config)
 
     def delete_dashboard(self, user_id=None, dashboard_name=None, config=None):
         """
@@ -1632,7 +1631,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         user_id = compat.convert_to_bytes(user_id)
         dashboard_name = compat.convert_to_bytes(dashboard_name)
         path = b'/dashboard/products/%s/dashboards/%s/duplicate' % (user_id, dashboard_name)
-        return self._send_csm_request(http_methods.POST, path, json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, self._json_dumps(body), config=config)
 
     def create_dashboard_widget(self, user_id=None, dashboard_name=None, config=None):
         """
@@ -1660,7 +1659,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         user_id = compat.convert_to_bytes(user_id)
         dashboard_name = compat.convert_to_bytes(dashboard_name)
         path = b'/dashboard/products/%s/dashboards/%s/widgets' % (user_id, dashboard_name)
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def get_dashboard_widget(self, user_id=None, dashboard_name=None, widget_name=None, config=None):
         """
@@ -1762,7 +1761,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         widget_name = compat.convert_to_bytes(widget_name)
         path = (b'/dashboard/products/%s/dashboards/%s/widgets/%s/duplicate' %
                 (user_id, dashboard_name, widget_name))
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def update_dashboard_widget(self, user_id=None, dashboard_name=None, widget_name=None,
                                 widget_type=None, title=None, configure=None, config=None):
@@ -1809,7 +1808,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         dashboard_name = compat.convert_to_bytes(dashboard_name)
         widget_name = compat.convert_to_bytes(widget_name)
         path = b'/dashboard/products/%s/dashboards/%s/widgets/%s' % (user_id, dashboard_name, widget_name)
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(body), config=config)
 
     def get_dashboard_report_data(self, data=None, time=None, config=None):
         """
@@ -1833,7 +1832,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "time": time
         }
         path = b'/dashboard/metric/report'
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def get_dashboard_trend_data(self, data=None, time=None, config=None):
         """
@@ -1857,7 +1856,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "time": time
         }
         path = b'/dashboard/metric/trend'
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def get_dashboard_gauge_chart_data(self, data=None, time=None, config=None):
         """
@@ -1881,7 +1880,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "time": time
         }
         path = b'/dashboard/metric/gaugechart'
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def get_dashboard_billboard_data(self, data=None, time=None, config=None):
         """
@@ -1905,7 +1904,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "time": time
         }
         path = b'/dashboard/metric/billboard'
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def get_dashboard_trend_senior_data(self, data=None, time=None, config=None):
         """
@@ -1929,7 +1928,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "time": time
         }
         path = b'/dashboard/metric/trend/senior'
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def get_dashboard_dimensions(self, user_id, metric_name, region, service, show_id,
                                  dimensions=None, config=None):
@@ -2018,7 +2017,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             req["description"] = description
         user_id = compat.convert_to_bytes(user_id)
         path = b'/userId/%s/application' % user_id
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(req), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(req), config=config)
 
     def get_application_data_list(self, user_id, page_no=None, page_size=None, search_name=None, config=None):
         """
@@ -2079,7 +2078,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             req["description"] = description
         user_id = compat.convert_to_bytes(user_id)
         path = b'/userId/%s/application' % user_id
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(req), config=config)
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(req), config=config)
 
     def delete_application_data(self, user_id, name, config=None):
         """
@@ -2098,7 +2097,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         user_id = compat.convert_to_bytes(user_id)
         path = b'/userId/%s/application' % user_id
-        return self._send_csm_request(http_methods.DELETE, path, body=json.dumps(req), config=config)
+        return self._send_csm_request(http_methods.DELETE, path, body=self._json_dumps(req), config=config)
 
     def get_application_instance_list(self, user_id, region, app_name, search_name, page_no=None, page_size=None,
                                       search_value=None, config=None):
@@ -2136,7 +2135,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         if search_value is not None:
             req["searchValue"] = search_value
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(req), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(req), config=config)
 
     @required(user_id=value_type,
               app_name=value_type,
@@ -2167,7 +2166,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         user_id = compat.convert_to_bytes(user_id)
         path = b'/userId/%s/application/instance/bind' % user_id
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(req), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(req), config=config)
 
     def get_application_instance_created_list(self, user_id, app_name, region=None, config=None):
         """
@@ -2213,7 +2212,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "id": id,
             "appName": app_name
         }
-        return self._send_csm_request(http_methods.DELETE, path, body=json.dumps(req), config=config)
+        return self._send_csm_request(http_methods.DELETE, path, body=self._json_dumps(req), config=config)
 
     @required(user_id=value_type, app_name=value_type, alias_name=value_type, type=int,
               target=value_type, cycle=int, description=value_type, log_example=value_type,
@@ -2286,7 +2285,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             req["metrics"] = metrics_json
         user_id = compat.convert_to_bytes(user_id)
         path = b'/userId/%s/application/task/create' % user_id
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(req), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(req), config=config)
 
     def get_application_monitor_task_detail(self, user_id, app_name, task_name, config=None):
         """
@@ -2408,7 +2407,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             req["metrics"] = metrics_json
         user_id = compat.convert_to_bytes(user_id)
         path = b'/userId/%s/application/task/update' % user_id
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(req), config=config)
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(req), config=config)
 
     def delete_application_monitor_task(self, user_id, name, app_name, config=None):
         """
@@ -2432,7 +2431,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "name": name,
             "appName": app_name
         }
-        return self._send_csm_request(http_methods.DELETE, path, body=json.dumps(req), config=config)
+        return self._send_csm_request(http_methods.DELETE, path, body=self._json_dumps(req), config=config)
 
     def create_application_dimension_table(self, user_id, app_name, table_name, map_content_json, config=None):
         """
@@ -2461,7 +2460,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         user_id = compat.convert_to_bytes(user_id)
         path = b'/userId/%s/application/dimensionMap/create' % user_id
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(req), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(req), config=config)
 
     def get_application_dimension_table_list(self, user_id, app_name, search_name=None, config=None):
         """
@@ -2514,7 +2513,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         user_id = compat.convert_to_bytes(user_id)
         path = b'/userId/%s/application/dimensionMap/update' % user_id
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(req), config=config)
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(req), config=config)
 
     def delete_application_dimension_table(self, user_id, app_name, table_name, config=None):
         """
@@ -2539,7 +2538,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         user_id = compat.convert_to_bytes(user_id)
         path = b'/userId/%s/application/dimensionMap/delete' % user_id
-        return self._send_csm_request(http_methods.DELETE, path, body=json.dumps(req), config=config)
+        return self._send_csm_request(http_methods.DELETE, path, body=self._json_dumps(req), config=config)
 
     @required(page_no=int, page_size=int, account_id=str, start_time=str, end_time=str)
     def get_cloud_event_data(self, page_no=1, page_size=10, start_time=None, end_time=None, account_id=None,
@@ -2682,7 +2681,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "resource": resource,
             "incidentActions": incident_actions
         }
-        return self._send_event_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_event_request(http_methods.POST, path, body=self._json_dumps(body))
 
     @required(user_id=str, region=str, service_name=str, type_name=str, name=str)
     def create_instance_group(self, user_id, region, service_name, type_name, name, resource_id_list):
@@ -2709,7 +2708,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "name": name,
             "resourceIdList": resource_id_list
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body))
 
     @required(user_id=str, ig_id=str, region=str, service_name=str, type_name=str, name=str)
     def update_instance_group(self, ig_id, user_id, region, service_name, type_name, name):
@@ -2736,7 +2735,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "typeName": type_name,
             "name": name,
         }
-        return self._send_csm_request(http_methods.PATCH, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.PATCH, path, body=self._json_dumps(body))
 
     @required(user_id=str, ig_id=str)
     def delete_instance_group(self, user_id, ig_id):
@@ -2807,7 +2806,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "userId": user_id,
             "resourceIdList": resource_id_list
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body))
 
     @required(user_id=str, ig_id=str, resource_id_list=list)
     def remove_ig_instance(self, ig_id, user_id, resource_id_list):
@@ -2826,7 +2825,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "userId": user_id,
             "resourceIdList": resource_id_list
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body))
 
     @required(user_id=str, ig_id=str, service_name=str, type_name=str, region=str, view_type=str,
               page_no=int, page_size=int)
@@ -2944,7 +2943,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         return self._send_csm_request(http_methods.GET, path, params=params)
 
-    def push_metric_data(self, user_id=None, scope=None, metric_data=None, config=None):
+    def push_metric_data(self, user_id=None, scope=None, metric_data=None, config=None, use_gzip=False):
 
         """
         :param user_id: user_id
@@ -2953,6 +2952,9 @@ class BcmClient(bce_base_client.BceBaseClient):
         :type scope: string
         :param metric_data: metric_data
         :type bcm_model.MetricDatum array
+        :param config:
+        :param use_gzip: send the body gzip compressed
+        :type use_gzip: boolean
         :return:
         """
         user_id = compat.convert_to_bytes(user_id)
@@ -2961,8 +2963,13 @@ class BcmClient(bce_base_client.BceBaseClient):
         body = {
             "metricData": metric_data
         }
+        body = self._json_dumps(body)
+        headers = None
+        if use_gzip:
+            body = utils.gzip_compress(compat.convert_to_bytes(body))
+            headers = {http_headers.CONTENT_ENCODING: b'gzip'}
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.POST, path, body=body, headers=headers, config=config)
 
     def get_custom_metric_data(self, user_id=None, namespaces=None, metric_name=None,
                                dimensions=None, statistics=None, start_time=None,
@@ -3031,7 +3038,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "cycle": cycle
         }
 
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body),
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body),
                                       body_parser=bcm_handler.parse_json_list, config=config)
 
     def push_custom_metric_data(self, user_id=None, namespace=None, metric_name=None,
@@ -3065,7 +3072,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "timestamp": timestamp
         }
 
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def create_site_http_task_config(self, user_id=None, task_name=None, address=None,
                                      method=None, post_content=None,
@@ -3108,7 +3115,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "timeout": timeout,
         }
 
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def update_site_http_task_config(self, user_id=None, task_id=None, task_name=None, address=None,
                                      method=None, post_content=None,
@@ -3154,7 +3161,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "timeout": timeout,
         }
 
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(body), config=config)
 
     def get_site_http_task_config(self, user_id=None, task_id=None, config=None):
         """
@@ -3217,7 +3224,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "timeout": timeout,
         }
 
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def update_site_https_task_config(self, user_id=None, task_id=None, task_name=None, address=None,
                                       method=None, post_content=None,
@@ -3263,7 +3270,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "timeout": timeout,
         }
 
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(body), config=config)
 
     def get_site_https_task_config(self, user_id=None, task_id=None, config=None):
         """
@@ -3323,7 +3330,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "timeout": timeout,
         }
 
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def update_site_ping_task_config(self, user_id=None, task_id=None, task_name=None, address=None,
                                      packet_count=None, packet_loss_rate=None, cycle=None, idc=None,
@@ -3366,7 +3373,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "timeout": timeout,
         }
 
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(body), config=config)
 
     def get_site_ping_task_config(self, user_id=None, task_id=None, config=None):
         """
@@ -3432,7 +3439,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "timeout": timeout,
         }
 
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def update_site_tcp_task_config(self, user_id=None, task_id=None, task_name=None, address=None,
                                     port=None, advance_config=None, cycle=None, idc=None, timeout=None,
@@ -3489,7 +3496,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "timeout": timeout,
         }
 
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(body), config=config)
 
     def get_site_tcp_task_config(self, user_id=None, task_id=None, config=None):
         """
@@ -3555,7 +3562,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "timeout": timeout,
         }
 
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def update_site_udp_task_config(self, user_id=None, task_id=None, task_name=None, address=None,
                                     port=None, advance_config=None, cycle=None, idc=None, timeout=None,
@@ -3612,7 +3619,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "timeout": timeout,
         }
 
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(body), config=config)
 
     def get_site_udp_task_config(self, user_id=None, task_id=None, config=None):
         """
@@ -3680,7 +3687,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "timeout": timeout,
         }
 
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def update_site_ftp_task_config(self, user_id=None, task_id=None, task_name=None, address=None,
                                     port=None, anonymous_login=None, cycle=None, idc=None, timeout=None,
@@ -3731,7 +3738,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "timeout": timeout,
         }
 
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(body), config=config)
 
     def get_site_ftp_task_config(self, user_id=None, task_id=None, config=None):
         """
@@ -3796,7 +3803,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "timeout": timeout,
         }
 
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def update_site_dns_task_config(self, user_id=None, task_id=None, task_name=None, address=None,
                                     cycle=None, idc=None, timeout=None,
@@ -3844,7 +3851,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "timeout": timeout,
         }
 
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(body), config=config)
 
     def get_site_dns_task_config(self, user_id=None, task_id=None, config=None):
         """
@@ -4003,7 +4010,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "tag": tag
         }
 
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
 
     def delete_site_alarm_config(self, user_id=None, alarm_names=None, config=None):
 
@@ -4023,7 +4030,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "alarmNames": alarm_names
         }
 
-        return self._send_csm_request(http_methods.DELETE, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.DELETE, path, body=self._json_dumps(body), config=config)
 
     def update_site_alarm_config(self, user_id=None, task_id=None, alarm_name=None, comment=None, alias_name=None,
                                  level=None, action_enabled=None, resume_actions=None, insufficient_actions=None,
@@ -4089,7 +4096,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "tag": tag
         }
 
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(body), config=config)
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(body), config=config)
 
     def get_site_alarm_config_detail(self, user_id=None, alarm_name=None, config=None):
 
@@ -4431,7 +4438,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "callbackToken": callback_token,
             "rules": rules,
         }
-        self._send_csm_request(http_methods.POST, path, body=json.dumps(body))
+        self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body))
 
     def update_alarm_config(self, user_id, alarm_name, alias_name, scope, level, region,
                             monitor_object, alarm_actions, rules,
@@ -4549,7 +4556,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "callbackToken": callback_token,
             "rules": rules,
         }
-        self._send_csm_request(http_methods.POST, path, body=json.dumps(body))
+        self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body))
 
     def delete_alarm_config(self, user_id, alarm_name, scope, config=None):
         """
@@ -4919,7 +4926,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "targetInstances": target_instances,
             "actions": actions,
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body), config=config,
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body), config=config,
                                       version=BcmClient.version_v2)
 
     def update_alarm_config_v2(self, user_id, alarm_name, alias_name, scope, target_type, level, region,
@@ -5043,7 +5050,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "targetInstances": target_instances,
             "actions": actions,
         }
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(body), config=config,
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(body), config=config,
                                       version=BcmClient.version_v2)
 
     def block_alarm_config_v2(self, user_id, alarm_name, scope, config=None):
@@ -5213,7 +5220,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "maxRepeatCount": max_repeat_count,
             "tag": tag
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body))
 
     @required(custom_alarm_list=list)
     def delete_custom_alarm_policy(self, custom_alarm_list):
@@ -5235,7 +5242,7 @@ class BcmClient(bce_base_client.BceBaseClient):
                 "userId": custom_alarm["userId"],
                 "alarmName": custom_alarm["alarmName"]
             })
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body))
 
     @required(rules=list, insufficientActions=int, repeatAlarmCycle=int, maxRepeatCount=int)
     def update_custom_alarm_policy(self, user_id, alarm_name, namespace, level, comment="",
@@ -5313,7 +5320,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "maxRepeatCount": max_repeat_count,
             "tag": tag
         }
-        return self._send_csm_request(http_methods.PUT, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.PUT, path, body=self._json_dumps(body))
 
     def list_custom_policy(self, user_id, page_no, page_size, alarm_name=None, namespace=None, action_enabled=None):
         """
@@ -5455,7 +5462,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "advancedConfig": advanced_config,
             "groupId": group_id
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body))
 
     def list_site_once_records(self, user_id=None, url=None, page_no=1, page_size=10,
                                order=None, order_by=None, group_id=None):
@@ -5488,7 +5495,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "orderBy": order_by,
             "groupId": group_id
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body))
 
     def delete_site_once_record(self, user_id, site_id):
         """
@@ -5505,7 +5512,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "userId": user_id,
             "siteId": site_id,
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body))
 
     def detail_site_once_result(self, user_id, site_id, page_no=1, page_size=10, order=None, order_by=None,
                                 filter_area=None, filter_isp=None):
@@ -5541,7 +5548,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "filterArea": filter_area,
             "filterIsp": filter_isp
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body))
 
     def detail_site_once(self, user_id, site_id=None, site_ids=None, group_id=None, page_no=1, page_size=10,
                          order=None, order_by=None, filter_area=None, filter_isp=None):
@@ -5583,7 +5590,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "filterArea": filter_area,
             "filterIsp": filter_isp
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body))
 
     def again_exec_site_once(self, user_id, site_id):
         """
@@ -5600,7 +5607,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "userId": user_id,
             "siteId": site_id
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body))
 
     def list_site_once_history(self, user_id="", site_id="", group_id=""):
         """
@@ -5619,7 +5626,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             "groupId": group_id,
             "siteId": site_id
         }
-        return self._send_csm_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, body=self._json_dumps(body))
 
     def get_site_once_agent(self, user_id, ip_type="ipv4"):
         """
@@ -5693,7 +5700,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         user_id = compat.convert_to_bytes(user_id)
         scope = compat.convert_to_bytes(scope)
         path = b'/userId/%s/services/%s/data/metricData/latest/batch' % (user_id, scope)
-        return self._send_csm_request(http_methods.POST, path, version=b'/v2', body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, version=b'/v2', body=self._json_dumps(body))
 
 
     def get_metrics_by_partial_dimensions(self, user_id, scope, statistics, metric_name, start_time, end_time,
@@ -5755,7 +5762,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         user_id = compat.convert_to_bytes(user_id)
         scope = compat.convert_to_bytes(scope)
         path = b'/userId/%s/services/%s/data/metricData/PartialDimension' % (user_id, scope)
-        return self._send_csm_request(http_methods.POST, path, version=b'/v2', body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, version=b'/v2', body=self._json_dumps(body))
 
     def get_all_data_metrics_v2(self, user_id, scope, region, dimensions, metric_names, statistics,
                                 start_time, end_time, type="Instance", cycle=60):
@@ -5821,7 +5828,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             body["type"] = type
 
         path = b'/data/metricAllData'
-        return self._send_csm_request(http_methods.POST, path, version=b'/v2', body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, version=b'/v2', body=self._json_dumps(body))
 
     def batch_get_all_data_metrics_v2(self, user_id, scope, region, dimensions, metric_names, statistics,
                                       start_time, end_time, type="Instance", cycle=60):
@@ -5887,7 +5894,7 @@ class BcmClient(bce_base_client.BceBaseClient):
             body["type"] = type
 
         path = b'/data/metricAllData/batch'
-        return self._send_csm_request(http_methods.POST, path, version=b'/v2', body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, version=b'/v2', body=self._json_dumps(body))
 
 
     def get_metric_dimension_top(self, user_id, scope, region, dimensions, metric_name, statistics, labels,
@@ -5963,7 +5970,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
 
         path = b'/dimensions/top'
-        return self._send_csm_request(http_methods.POST, path, version=b'/v2', body=json.dumps(body))
+        return self._send_csm_request(http_methods.POST, path, version=b'/v2', body=self._json_dumps(body))
 
     # ==================== Event Bus ====================
 
@@ -6011,7 +6018,7 @@ class BcmClient(bce_base_client.BceBaseClient):
 
         path = b''
         return self._send_eb_request(http_methods.POST, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     def update_event_bus(self, event_bus_id, event_bus_name=None,
                          event_bus_alias=None, description=None, type=None, config=None):
@@ -6063,7 +6070,7 @@ class BcmClient(bce_base_client.BceBaseClient):
 
         path = b''
         return self._send_eb_request(http_methods.PUT, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     def delete_event_bus(self, event_bus_id, config=None):
         """
@@ -6089,7 +6096,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         path = b''
         return self._send_eb_request(http_methods.DELETE, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     def batch_delete_event_bus(self, event_bus_ids, config=None):
         """
@@ -6115,7 +6122,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         path = b'/batch'
         return self._send_eb_request(http_methods.DELETE, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     def get_event_bus_detail(self, event_bus_id, config=None):
         """
@@ -6349,7 +6356,7 @@ class BcmClient(bce_base_client.BceBaseClient):
 
         path = b'/source'
         return self._send_eb_request(http_methods.POST, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     def update_event_bus_source(self, event_bus_id, event_source_id,
                                 event_source_name=None, event_source_alias=None,
@@ -6403,7 +6410,7 @@ class BcmClient(bce_base_client.BceBaseClient):
 
         path = b'/source'
         return self._send_eb_request(http_methods.PUT, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     def delete_event_bus_source(self, event_source_id, config=None):
         """
@@ -6429,7 +6436,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         path = b'/source'
         return self._send_eb_request(http_methods.DELETE, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     # ==================== Event Type ====================
 
@@ -6611,7 +6618,7 @@ class BcmClient(bce_base_client.BceBaseClient):
 
         path = b'/event'
         return self._send_eb_request(http_methods.POST, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     def batch_create_event_bus_event(self, events, config=None):
         """
@@ -6637,7 +6644,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         path = b'/event/batch'
         return self._send_eb_request(http_methods.POST, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     def update_event_bus_event(self, event_source_id, event_type,
                                event_alias=None, event_alias_en=None, event_level=None,
@@ -6709,7 +6716,7 @@ class BcmClient(bce_base_client.BceBaseClient):
 
         path = b'/event'
         return self._send_eb_request(http_methods.PUT, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     def batch_delete_event_bus_event(self, events, config=None):
         """
@@ -6735,7 +6742,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         path = b'/event/batch'
         return self._send_eb_request(http_methods.DELETE, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     # ==================== Event Receive ====================
 
@@ -6763,7 +6770,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         path = b'/recv'
         return self._send_eb_request(http_methods.POST, path,
-                                     body=json.dumps(body), config=config,
+                                     body=self._json_dumps(body), config=config,
                                      body_parser=bcm_handler.parse_json_list)
 
     # ==================== Event Rule ====================
@@ -6827,7 +6834,7 @@ class BcmClient(bce_base_client.BceBaseClient):
 
         path = b'/rule'
         return self._send_eb_request(http_methods.POST, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     def update_event_bus_rule(self, event_rule_id, event_bus_id, rule_name, filter_pattern,
                               description=None, status=None, config=None):
@@ -6888,7 +6895,7 @@ class BcmClient(bce_base_client.BceBaseClient):
 
         path = b'/rule'
         return self._send_eb_request(http_methods.PUT, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     def batch_update_event_bus_rule_status(self, event_bus_id,
                                            event_rule_ids, status, config=None):
@@ -6929,7 +6936,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         path = b'/rule/status'
         return self._send_eb_request(http_methods.POST, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     def batch_delete_event_bus_rule(self, event_bus_id, event_rule_ids, config=None):
         """
@@ -6962,7 +6969,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         path = b'/rule'
         return self._send_eb_request(http_methods.DELETE, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     def list_event_bus_rule(self, event_bus_id, page_no=None, page_size=None,
                             order_by=None, order=None, status=None,
@@ -7096,7 +7103,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         path = b'/rule/target'
         return self._send_eb_request(http_methods.POST, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     def batch_update_event_bus_rule_target(self, event_rule_id,
                                            add_targets=None, edit_targets=None,
@@ -7143,7 +7150,7 @@ class BcmClient(bce_base_client.BceBaseClient):
 
         path = b'/rule/target'
         return self._send_eb_request(http_methods.PUT, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     def batch_delete_event_bus_rule_target(self, event_rule_id, target_ids, config=None):
         """
@@ -7176,7 +7183,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         path = b'/rule/target'
         return self._send_eb_request(http_methods.DELETE, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     def match_event_bus_rule(self, event, event_pattern, config=None):
         """
@@ -7203,7 +7210,7 @@ class BcmClient(bce_base_client.BceBaseClient):
         }
         path = b'/rule/match'
         return self._send_eb_request(http_methods.POST, path,
-                                     body=json.dumps(body), config=config)
+                                     body=self._json_dumps(body), config=config)
 
     # ==================== Event History ====================
 
@@ -15,13 +15,15 @@ This module provides general http handler functions for processing http response
 """
 
 import http.client
-import json
-from baidubce import compat, utils
+from baidubce import compat
+from baidubce import json_codec
 from baidubce.exception import BceClientError
 from baidubce.exception import BceServerError
+from baidubce.http import handler
 
 
-def parse_json_list(http_response, response):
+@handler.json_body_parser
+def parse_json_list(http_response, response, keep_raw_data=True, lazy=False, codec=None):
     """If the body is not empty, convert it to a python object and set as the value of
     response.body. http_response is always closed if no error occurs.
 
@@ -37,8 +39,9 @@ def parse_json_list(http_response, response):
     body = http_response.read()
     if body:
         body = compat.convert_to_string(body)
-        response.__dict__["result"] = json.loads(body, object_hook=utils.dict_to_python_object)
-        response.__dict__["raw_data"] = body
+        response.__dict__["result"] = handler.load_python_object(body, codec)
+        if keep_raw_data:
+            response.__dict__["raw_data"] = body
     http_response.close()
     return True
 
@@ -68,7 +71,7 @@ def parse_error(http_response, response):
         bse.status_code = http_response.status
         raise bse
 
-    error_dict = json.loads(compat.convert_to_string(body))
+    error_dict = json_codec.loads(compat.convert_to_string(body))
     message = str(error_dict)
     if 'message' in error_dict and error_dict['message'] is not None:
         message = error_dict['message']
@@ -0,0 +1,251 @@
+# Copyright (c) 2014 Baidu.com, Inc. All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""
+This module provides a background writer that batches metric data pushed to BCM.
+"""
+import logging
+import threading
+import time
+
+from baidubce.exception import BceClientError
+from baidubce.services.bcm import bcm_model
+
+_logger = logging.getLogger(__name__)
+
+
+class MetricDataWriter(object):
+    """
+    Buffer metric data in memory and push it to BCM in batches from a background thread.
+
+    Datapoints are grouped by (user_id, scope); a group is sent with a single
+    push_metric_data request once it holds batch_size datapoints or when
+    flush_interval seconds have passed since the last flush. When max_buffered
+    datapoints are waiting to be sent, put blocks until the writer catches up.
+
+    Datapoints of custom namespaces are buffered with put_custom and sent through
+    push_custom_metric_data, which takes one datapoint per request.
+
+    Usage::
+
+        with MetricDataWriter(bcm_client) as writer:
+            writer.put(user_id, "BCE_BCC", "pv", [], 1, "2023-12-17T08:00:00Z")
+            writer.put_custom(user_id, "my_namespace", "pv", [], 1, "2023-12-17T08:00:00Z")
+    """
+
+    def __init__(self, client, batch_size=1000, flush_interval=1.0, max_buffered=100000,
+                 use_gzip=False, error_callback=None):
+        """
+        :param client: client used to push the batches
+        :type client: baidubce.services.bcm.bcm_client.BcmClient
+        :param batch_size: max number of datapoints sent in one request
+        :type batch_size: int
+        :param flush_interval: max seconds a datapoint waits in the buffer
+        :type flush_interval: float
+        :param max_buffered: max number of datapoints buffered before put blocks
+        :type max_buffered: int
+        :param use_gzip: send the request bodies gzip compressed
+        :type use_gzip: boolean
+        :param error_callback: called as error_callback(error, user_id, scope, metric_data)
+            when a batch, or a datapoint of a custom namespace, fails to be pushed; failures
+            are logged when it is None
+        :type error_callback: callable
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size should be positive")
+        if max_buffered < batch_size:
+            raise ValueError("max_buffered should not be less than batch_size")
+        self._client = client
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_buffered = max_buffered
+        self._use_gzip = use_gzip
+        self._error_callback = error_callback
+
+        self._cond = threading.Condition()
+        self._buffers = {}
+        # datapoints that are buffered or being sent
+        self._pending = 0
+        self._flush_requested = False
+        self._closed = False
+        self.requests_sent = 0
+        self.datapoints_sent = 0
+        self.errors = 0
+
+        self._thread = threading.Thread(target=self._run, name="bcm-metric-writer")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def put(self, user_id, scope, metric_name, dimensions, value, timestamp, timeout=None):
+        """
+        Buffer one datapoint.
+
+        :param user_id: user_id
+        :type user_id: string
+        :param scope: scope of the metric
+        :type scope: string
+        :param metric_name: metric_name
+        :type metric_name: string
+        :param dimensions: dimensions
+        :type dimensions: bcm_model.Dimension array
+        :param value: value
+        :type value: double
+        :param timestamp: timestamp
+        :type timestamp: string
+        :param timeout: max seconds to wait while the buffer is full, None waits forever
+        :type timeout: float
+        """
+        self.put_datum(user_id, scope,
+                       bcm_model.MetricDatum(metric_name, dimensions, value, timestamp), timeout)
+
+    def put_custom(self, user_id, namespace, metric_name, dimensions, value, timestamp,
+                   timeout=None):
+        """
+        Buffer one datapoint of a custom namespace, the arguments are those of put.
+        """
+        self.put_datum(user_id, namespace,
+                       bcm_model.MetricDatum(metric_name, dimensions, value, timestamp), timeout,
+                       custom=True)
+
+    def put_datum(self, user_id, scope, datum, timeout=None, custom=False):
+        """
+        Buffer one bcm_model.MetricDatum.
+
+        :param custom: scope is a custom namespace
+        :type custom: boolean
+        :raises BceClientError: if the writer is closed or the buffer stays full
+            for longer than timeout
+        """
+        with self._cond:
+            if self._pending >= self._max_buffered:
+                deadline = None if timeout is None else time.time() + timeout
+                while self._pending >= self._max_buffered and not self._closed:
+                    remaining = None if deadline is None else deadline - time.time()
+                    if remaining is not None and remaining <= 0:
+                        raise BceClientError("metric buffer is full")
+                    self._cond.wait(remaining)
+            if self._closed:
+                raise BceClientError("metric writer is closed")
+            buf = self._buffers.setdefault((user_id, scope, custom), [])
+            buf.append(datum)
+            self._pending += 1
+            if len(buf) == self._batch_size:
+                self._cond.notify_all()
+
+    def flush(self, timeout=None):
+        """
+        Send everything buffered so far and wait until it has been pushed.
+
+        :return: True if the buffer was drained, False on timeout
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._pending and self._thread.is_alive():
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return not self._pending
+
+    def close(self, timeout=None):
+        """
+        Stop accepting datapoints, push the ones still buffered and stop the background thread.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _take_batches(self, flush_all):
+        batches = []
+        for key in list(self._buffers):
+            buf = self._buffers[key]
+            while len(buf) >= self._batch_size:
+                batches.append((key, buf[:self._batch_size]))
+                buf = buf[self._batch_size:]
+            if buf and flush_all:
+                batches.append((key, buf))
+                buf = []
+            if buf:
+                self._buffers[key] = buf
+            else:
+                del self._buffers[key]
+        return batches
+
+    def _ready(self):
+        return self._closed or self._flush_requested or \
+            any(len(buf) >= self._batch_size for buf in self._buffers.values())
+
+    def _run(self):
+        next_flush = time.time() + self._flush_interval
+        while True:
+            with self._cond:
+                while not self._ready():
+                    remaining = next_flush - time.time()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                flush_all = self._closed or self._flush_requested or time.time() >= next_flush
+                if flush_all:
+                    self._flush_requested = False
+                    next_flush = time.time() + self._flush_interval
+                batches = self._take_batches(flush_all)
+                if not batches and self._closed:
+                    return
+            for (user_id, scope, custom), metric_data in batches:
+                if custom:
+                    self._send_custom(user_id, scope, metric_data)
+                else:
+                    self._send(user_id, scope, metric_data)
+                with self._cond:
+                    self._pending -= len(metric_data)
+                    self._cond.notify_all()
+
+    def _send(self, user_id, scope, metric_data):
+        try:
+            self._client.push_metric_data(user_id=user_id, scope=scope, metric_data=metric_data,
+                                          use_gzip=self._use_gzip)
+            self.requests_sent += 1
+            self.datapoints_sent += len(metric_data)
+        except Exception as e:
+            self._on_error(e, user_id, scope, metric_data)
+
+    def _send_custom(self, user_id, namespace, metric_data):
+        for datum in metric_data:
+            try:
+                self._client.push_custom_metric_data(
+                    user_id=user_id, namespace=namespace, metric_name=datum["metricName"],
+                    dimensions=datum["dimensions"], value=datum["value"],
+                    timestamp=datum["timestamp"])
+                self.requests_sent += 1
+                self.datapoints_sent += 1
+            except Exception as e:
+                self._on_error(e, user_id, namespace, [datum])
+
+    def _on_error(self, error, user_id, scope, metric_data):
+        self.errors += 1
+        if self._error_callback is not None:
+            try:
+                self._error_callback(error, user_id, scope, metric_data)
+            except Exception:
+                _logger.exception("metric writer error callback failed")
+        else:
+            _logger.warning("failed to push %d datapoints to %s/%s: %s",
+                            len(metric_data), user_id, scope, error)
@@ -15,7 +15,6 @@ This module provides a client class for BES.
 """
 
 import copy
-import json
 import logging
 import sys
 
@@ -132,7 +131,7 @@ class BesClient(bce_base_client.BceBaseClient):
         region = self.config.region
         headers = {b'x-Region': region,
                    b'content-type': b'application/json;charset=UTF-8'}
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), headers=headers)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), headers=headers)
 
     @required(name=value_type,
               payment_type=value_type,
@@ -193,7 +192,7 @@ class BesClient(bce_base_client.BceBaseClient):
         region = self.config.region
         headers = {b'x-Region': region,
                    b'content-type': b'application/json;charset=UTF-8'}
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), headers=headers)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), headers=headers)
 
     @required(page_no=int,
               page_size=int)
@@ -230,7 +229,7 @@ class BesClient(bce_base_client.BceBaseClient):
         region = self.config.region
         headers = {b'x-Region': region,
                    b'content-type': b'application/json;charset=UTF-8'}
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), headers=headers)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), headers=headers)
 
     @required(cluster_id=value_type)
     def get_cluster_detail(self,
@@ -262,7 +261,7 @@ class BesClient(bce_base_client.BceBaseClient):
         region = self.config.region
         headers = {b'x-Region': region,
                    b'content-type': b'application/json;charset=UTF-8'}
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), headers=headers)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), headers=headers)
 
     @required(cluster_id=value_type)
     def start_cluster(self,
@@ -294,7 +293,7 @@ class BesClient(bce_base_client.BceBaseClient):
         region = self.config.region
         headers = {b'x-Region': region,
                    b'content-type': b'application/json;charset=UTF-8'}
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), headers=headers)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), headers=headers)
 
     @required(cluster_id=value_type)
     def stop_cluster(self,
@@ -326,7 +325,7 @@ class BesClient(bce_base_client.BceBaseClient):
         region = self.config.region
         headers = {b'x-Region': region,
                    b'content-type': b'application/json;charset=UTF-8'}
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), headers=headers)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), headers=headers)
 
     @required(cluster_id=value_type)
     def delete_cluster(self,
@@ -358,7 +357,7 @@ class BesClient(bce_base_client.BceBaseClient):
         region = self.config.region
         headers = {b'x-Region': region,
                    b'content-type': b'application/json;charset=UTF-8'}
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), headers=headers)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), headers=headers)
 
     @required(cluster_id=value_type,
               instance_id=value_type)
@@ -396,7 +395,7 @@ class BesClient(bce_base_client.BceBaseClient):
         region = self.config.region
         headers = {b'x-Region': region,
                    b'content-type': b'application/json;charset=UTF-8'}
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), headers=headers)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), headers=headers)
 
     @required(cluster_id=value_type,
               instance_id=value_type)
@@ -434,7 +433,7 @@ class BesClient(bce_base_client.BceBaseClient):
         region = self.config.region
         headers = {b'x-Region': region,
                    b'content-type': b'application/json;charset=UTF-8'}
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), headers=headers)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), headers=headers)
 
     @required(order=value_type,
               order_by=value_type,
@@ -486,7 +485,7 @@ class BesClient(bce_base_client.BceBaseClient):
         region = self.config.region
         headers = {b'x-Region': region,
                    b'content-type': b'application/json;charset=UTF-8'}
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), headers=headers)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), headers=headers)
 
     @required(order=value_type,
               cluster_id=value_type,
@@ -522,7 +521,7 @@ class BesClient(bce_base_client.BceBaseClient):
         region = self.config.region
         headers = {b'x-Region': region,
                    b'content-type': b'application/json;charset=UTF-8'}
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), headers=headers)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), headers=headers)
 
     @required(cluster_ids=list,
               user_id=value_type,
@@ -577,7 +576,7 @@ class BesClient(bce_base_client.BceBaseClient):
         region = self.config.region
         headers = {b'x-Region': region,
                    b'content-type': b'application/json;charset=UTF-8'}
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), headers=headers)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), headers=headers)
 
     def get_auto_renew_rule_list(self,
                                  client_token=None):
@@ -599,7 +598,7 @@ class BesClient(bce_base_client.BceBaseClient):
         region = self.config.region
         headers = {b'x-Region': region,
                    b'content-type': b'application/json;charset=UTF-8'}
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), headers=headers)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), headers=headers)
 
     @required(cluster_id=value_type,
               account_id=value_type,
@@ -639,7 +638,7 @@ class BesClient(bce_base_client.BceBaseClient):
         region = self.config.region
         headers = {b'x-Region': region,
                    b'content-type': b'application/json;charset=UTF-8'}
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), headers=headers)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), headers=headers)
 
     @required(cluster_id=value_type)
     def delete_auto_renew_rule(self,
@@ -666,7 +665,7 @@ class BesClient(bce_base_client.BceBaseClient):
         region = self.config.region
         headers = {b'x-Region': region,
                    b'content-type': b'application/json;charset=UTF-8'}
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), headers=headers)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), headers=headers)
 
     def _merge_config(self, config=None):
         if config is None:
@@ -17,7 +17,6 @@ This module provides a client class for APP BLB.
 """
 
 import copy
-import json
 import logging
 import uuid
 import sys
@@ -199,7 +198,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['allocateIpv6'] = allocate_ipv6
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str))
@@ -260,7 +259,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         if allocate_ipv6 is not None:
             body['allocateIpv6'] = allocate_ipv6
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     def describe_app_loadbalancers(self, address=None, name=None, blb_id=None,
@@ -449,7 +448,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['description'] = description
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -514,7 +513,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['description'] = description
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str), listener_port=int,
@@ -646,7 +645,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         if description is not None:
             body['description'] = description
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str), listener_port=int,
@@ -810,7 +809,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         if description is not None:
             body['description'] = description
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(blb_id=(bytes, str), listener_port=int,
@@ -914,7 +913,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['description'] = description
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(blb_id=(bytes, str),
@@ -979,7 +978,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['description'] = description
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -1042,7 +1041,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['description'] = description
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(blb_id=(bytes, str),
@@ -1150,7 +1149,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         if description is not None:
             body['description'] = description
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(blb_id=(bytes, str), listener_port=int)
@@ -1314,7 +1313,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         if description is not None:
             body['description'] = description
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str), listener_port=int)
@@ -1422,7 +1421,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['description'] = description
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(blb_id=(bytes, str))
@@ -1768,7 +1767,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['portTypeList'] = port_type_list
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -1829,7 +1828,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['type'] = compat.convert_to_string(listener_type)
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -1943,7 +1942,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['type'] = compat.convert_to_string(listener_type)
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str), listener_port=int, policy_list=list)
@@ -1996,7 +1995,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['type'] = compat.convert_to_string(listener_type)
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     """
@@ -2059,7 +2058,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['backendServerList'] = backend_server_list
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -2116,7 +2115,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['desc'] = compat.convert_to_string(desc)
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str))
@@ -2216,7 +2215,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         body['sgId'] = compat.convert_to_string(sg_id)
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -2349,7 +2348,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['udpHealthCheckString'] = \
                 compat.convert_to_string(udp_health_check_string)
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -2492,7 +2491,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['udpHealthCheckString'] = \
                 compat.convert_to_string(udp_health_check_string)
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -2543,7 +2542,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -2595,7 +2594,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -2647,7 +2646,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -2748,7 +2747,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -2865,7 +2864,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['memberList'] = member_list
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -2922,7 +2921,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['desc'] = compat.convert_to_string(desc)
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str))
@@ -3022,7 +3021,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         body['ipGroupId'] = compat.convert_to_string(ip_group_id)
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -3136,7 +3135,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['udpHealthCheckString'] = \
                 compat.convert_to_string(udp_health_check_string)
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -3263,7 +3262,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['udpHealthCheckString'] = \
                 compat.convert_to_string(udp_health_check_string)
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -3312,7 +3311,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(http_methods.DELETE, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -3375,7 +3374,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['desc'] = compat.convert_to_string(desc)
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -3438,7 +3437,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
             body['desc'] = compat.convert_to_string(desc)
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -3487,7 +3486,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         body['memberIdList'] = memberid_list
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -3579,7 +3578,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         body = {}
         body['securityGroupIds'] = securitygroupids
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -3620,7 +3619,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         body = {}
         body['securityGroupIds'] = securitygroupids
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str))
@@ -3681,7 +3680,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         body = {}
         body['enterpriseSecurityGroupIds'] = enterprisesecuritygroupids
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -3722,7 +3721,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         body = {}
         body['enterpriseSecurityGroupIds'] = enterprisesecuritygroupids
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str))
@@ -3793,7 +3792,7 @@ class AppBlbClient(bce_base_client.BceBaseClient):
         body['appPolicyVos'] = apppolicyvos
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str), port=int)
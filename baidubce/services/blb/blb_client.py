@@ -17,7 +17,6 @@ This module provides a client class for BLB.
 """
 
 import copy
-import json
 import logging
 import uuid
 import sys
@@ -194,7 +193,7 @@ class BlbClient(bce_base_client.BceBaseClient):
             body['allocateIpv6'] = allocate_ipv6
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     def describe_loadbalancers(self, address=None, name=None, blb_id=None,
@@ -349,7 +348,7 @@ class BlbClient(bce_base_client.BceBaseClient):
         if allocate_ipv6 is not None:
             body['allocateIpv6'] = allocate_ipv6
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(blb_id=(bytes, str))
@@ -422,7 +421,7 @@ class BlbClient(bce_base_client.BceBaseClient):
         else:
             body['supportAcl'] = True
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(vpc_id=(bytes, str),
@@ -477,7 +476,7 @@ class BlbClient(bce_base_client.BceBaseClient):
         body['type'] = compat.convert_to_string('ipv6')
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     def describe_ipv6_loadbalancers(self, address=None, name=None, blb_id=None,
@@ -653,7 +652,7 @@ class BlbClient(bce_base_client.BceBaseClient):
             body['healthyThreshold'] = healthy_threshold
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -780,7 +779,7 @@ class BlbClient(bce_base_client.BceBaseClient):
             body['udpSessionTimeout'] = udp_session_timeout
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str), listener_port=int,
@@ -953,7 +952,7 @@ class BlbClient(bce_base_client.BceBaseClient):
         if redirect_port is not None:
             body['redirectPort'] = redirect_port
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str), listener_port=int,
@@ -1169,7 +1168,7 @@ class BlbClient(bce_base_client.BceBaseClient):
         if additional_cert_domains is not None:
             body['additionalCertDomains'] = additional_cert_domains
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(blb_id=(bytes, str), listener_port=int,
@@ -1297,7 +1296,7 @@ class BlbClient(bce_base_client.BceBaseClient):
         if client_certIds is not None:
             body['clientCertIds'] = client_certIds
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(blb_id=(bytes, str))
@@ -1677,7 +1676,7 @@ class BlbClient(bce_base_client.BceBaseClient):
             body['healthyThreshold'] = health_threshold
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -1792,7 +1791,7 @@ class BlbClient(bce_base_client.BceBaseClient):
             body['udpSessionTimeout'] = udp_session_timeout
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(blb_id=(bytes, str),
@@ -1958,7 +1957,7 @@ class BlbClient(bce_base_client.BceBaseClient):
         if redirect_port is not None:
             body['redirectPort'] = redirect_port
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(blb_id=(bytes, str), listener_port=int)
@@ -2144,7 +2143,7 @@ class BlbClient(bce_base_client.BceBaseClient):
         if applied_ciphers is not None:
             body['appliedCiphers'] = compat.convert_to_string(applied_ciphers)
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str), listener_port=int)
@@ -2266,7 +2265,7 @@ class BlbClient(bce_base_client.BceBaseClient):
         if client_certIds is not None:
             body['clientCertIds'] = client_certIds
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(blb_id=(bytes, str))
@@ -2322,7 +2321,7 @@ class BlbClient(bce_base_client.BceBaseClient):
             body['portTypeList'] = port_type_list
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     """
@@ -2379,7 +2378,7 @@ class BlbClient(bce_base_client.BceBaseClient):
         body['backendServerList'] = backend_server_list
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -2524,7 +2523,7 @@ class BlbClient(bce_base_client.BceBaseClient):
         body['backendServerList'] = backend_server_list
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -2566,7 +2565,7 @@ class BlbClient(bce_base_client.BceBaseClient):
         body['backendServerList'] = backend_server_list
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -2607,7 +2606,7 @@ class BlbClient(bce_base_client.BceBaseClient):
         body = {}
         body['securityGroupIds'] = securitygroupids
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -2648,7 +2647,7 @@ class BlbClient(bce_base_client.BceBaseClient):
         body = {}
         body['securityGroupIds'] = securitygroupids
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str))
@@ -2721,7 +2720,7 @@ class BlbClient(bce_base_client.BceBaseClient):
         body = {}
         body['enterpriseSecurityGroupIds'] = enterprisesecuritygroupids
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str),
@@ -2762,7 +2761,7 @@ class BlbClient(bce_base_client.BceBaseClient):
         body = {}
         body['enterpriseSecurityGroupIds'] = enterprisesecuritygroupids
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(blb_id=(bytes, str))
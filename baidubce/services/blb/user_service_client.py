@@ -17,7 +17,6 @@ This module provides a client class for User Service.
 """
 
 import copy
-import json
 import logging
 import uuid
 import sys
@@ -154,7 +153,7 @@ class UserServiceClient(bce_base_client.BceBaseClient):
             body['authList'] = [{"uid": "*", "auth": "deny"}]
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(service=(bytes, str))
@@ -203,7 +202,7 @@ class UserServiceClient(bce_base_client.BceBaseClient):
             body["name"] = name
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(service=(bytes, str),
@@ -247,7 +246,7 @@ class UserServiceClient(bce_base_client.BceBaseClient):
         body['instanceId'] = instanceId
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(service=(bytes, str))
@@ -322,7 +321,7 @@ class UserServiceClient(bce_base_client.BceBaseClient):
         body = {}
         body['authList'] = authList
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(service=(bytes, str),
@@ -365,7 +364,7 @@ class UserServiceClient(bce_base_client.BceBaseClient):
         body['authList'] = authList
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(service=(bytes, str),
@@ -409,7 +408,7 @@ class UserServiceClient(bce_base_client.BceBaseClient):
         body['uidList'] = uidList
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     def get_user_service_list(self, marker=None, max_keys=None, config=None):
@@ -14,7 +14,6 @@
 This module provides a client class for BCM.
 """
 import copy
-import json
 import sys
 import uuid
 
@@ -22,6 +21,7 @@ from baidubce import bce_base_client, compat
 from baidubce.auth import bce_v1_signer
 from baidubce.http import handler, bce_http_client, http_methods
 from baidubce.services.bls import bls_handler
+from baidubce.services.bls.bls_model import TagModel
 
 if sys.version_info[0] == 2:
     value_type = (str, unicode)
@@ -137,7 +137,8 @@ class BlsClient(bce_base_client.BceBaseClient):
         :type type: str or None
 
         :param tags: (Optional) A list of tags associated with the push.
-                     Each tag should be an instance of `TagModel`.
+                     Each tag should be an instance of `TagModel`, a dict of tag key to
+                     value is accepted as well.
                      Example:
                      [
                          TagModel("env", "prod"),
@@ -155,7 +156,11 @@ class BlsClient(bce_base_client.BceBaseClient):
         path = b'/%s/logrecord' % log_store_name
         params = {}
 
-        tags_list = [dict(tag) for tag in tags]
+        if isinstance(tags, TagModel):
+            tags = [tags]
+        elif isinstance(tags, dict):
+            tags = [TagModel(k, v) for k, v in tags.items()]
+        tags_list = [dict(tag) for tag in tags or []]
         type = type if type is not None else 'TEXT'
         records_payload = [dict(record) for record in log_records]
         if project is not None:
@@ -166,7 +171,7 @@ class BlsClient(bce_base_client.BceBaseClient):
             "type": type,
             "logRecords": records_payload
         }
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), config=config)
 
     def query_log_records(self, log_store_name, start_time, end_time, log_stream_name, project=None, query=None,
                           sort=None, limit=None, marker=None, config=None):
@@ -15,8 +15,8 @@ This module provides general http handler functions for processing http response
 """
 
 import http.client
-import json
 from baidubce import compat, utils
+from baidubce import json_codec
 from baidubce.exception import BceClientError
 from baidubce.exception import BceServerError
 
@@ -46,7 +46,7 @@ def parse_error(http_response, response):
         bse.status_code = http_response.status
         raise bse
 
-    error_dict = json.loads(compat.convert_to_string(body))
+    error_dict = json_codec.loads(compat.convert_to_string(body))
     message = str(error_dict)
     if 'message' in error_dict and error_dict['message'] is not None:
         message = error_dict['message']
@@ -0,0 +1,298 @@
+# Copyright 2014 Baidu, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""
+This module provides a background producer that batches log records pushed to BLS.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from baidubce import compat
+from baidubce.exception import BceClientError
+
+_logger = logging.getLogger(__name__)
+
+# json of a record besides its message: {"message": "", "timestamp": 1715231012000}
+_RECORD_OVERHEAD = 48
+
+
+def _record_size(log_record):
+    """
+    size in bytes of the json of a record
+    """
+    return len(compat.convert_to_bytes(log_record.get("message") or "")) + _RECORD_OVERHEAD
+
+
+def _is_transient(error):
+    """
+    whether pushing again may succeed: network errors, throttling and server errors
+    """
+    if isinstance(error, BceClientError):
+        return False
+    status_code = getattr(error, 'status_code', None)
+    return status_code is None or status_code == 429 or status_code >= 500
+
+
+class LogProducer(object):
+    """
+    Buffer log records in memory and push them to BLS in batches from background threads.
+
+    Records are grouped by (project, log store, log stream, type); a group is sent with one
+    push_log_records request once it holds batch_size records or max_batch_bytes bytes of
+    messages, or when flush_interval seconds have passed since the last flush. Up to
+    max_workers requests are sent at the same time and requests failing with a network error,
+    throttling or a server error are sent again up to max_retries times.
+
+    Records are counted in the buffer until they are pushed. When max_buffered_bytes are
+    buffered, send blocks until the producer catches up, or drops the record if block_on_full
+    is False. A record larger than max_buffered_bytes is buffered once the buffer is empty.
+
+    Usage::
+
+        with LogProducer(bls_client) as producer:
+            producer.send("store", "stream", LogRecordModel("started", int(time.time() * 1000)))
+    """
+
+    def __init__(self, client, batch_size=1000, max_batch_bytes=3 * 1024 * 1024,
+                 flush_interval=1.0, max_buffered_bytes=64 * 1024 * 1024, block_on_full=True,
+                 max_workers=4, max_retries=3, retry_backoff=0.5, tags=None,
+                 error_callback=None):
+        """
+        :param client: client used to push the batches
+        :type client: baidubce.services.bls.bls_client.BlsClient
+        :param batch_size: max number of records sent in one request
+        :type batch_size: int
+        :param max_batch_bytes: max size in bytes of the records of one request
+        :type max_batch_bytes: int
+        :param flush_interval: max seconds a record waits in the buffer
+        :type flush_interval: float
+        :param max_buffered_bytes: max size in bytes of the records buffered or being sent
+        :type max_buffered_bytes: int
+        :param block_on_full: block send while the buffer is full, drop the records otherwise
+        :type block_on_full: boolean
+        :param max_workers: max number of requests sent at the same time
+        :type max_workers: int
+        :param max_retries: number of times a request failing transiently is sent again
+        :type max_retries: int
+        :param retry_backoff: seconds before the first retry, doubled for each retry
+        :type retry_backoff: float
+        :param tags: tags of every request, as in BlsClient.push_log_records
+        :type tags: List[TagModel]
+        :param error_callback: called as error_callback(error, project, log_store_name,
+            log_stream_name, log_records) when a batch fails to be pushed; failures are logged
+            when it is None
+        :type error_callback: callable
+        """
+        if batch_size <= 0 or max_workers <= 0:
+            raise ValueError("batch_size and max_workers should be positive")
+        if max_buffered_bytes < max_batch_bytes:
+            raise ValueError("max_buffered_bytes should not be less than max_batch_bytes")
+        self._client = client
+        self._batch_size = batch_size
+        self._max_batch_bytes = max_batch_bytes
+        self._flush_interval = flush_interval
+        self._max_buffered_bytes = max_buffered_bytes
+        self._block_on_full = block_on_full
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        self._tags = tags
+        self._error_callback = error_callback
+
+        self._cond = threading.Condition()
+        # key -> [records, size in bytes]
+        self._buffers = {}
+        # bytes of the records that are buffered or being sent
+        self._pending_bytes = 0
+        self._flush_requested = False
+        self._closed = False
+        self.requests_sent = 0
+        self.records_sent = 0
+        self.records_dropped = 0
+        self.errors = 0
+
+        self._executor = ThreadPoolExecutor(max_workers)
+        self._thread = threading.Thread(target=self._run, name="bls-log-producer")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def send(self, log_store_name, log_stream_name, log_record, project=None, type=None,
+             timeout=None):
+        """
+        Buffer one log record.
+
+        :param log_store_name: The name of the log store which will receive the log record.
+        :type log_store_name: str
+        :param log_stream_name: The name of the log stream to write to.
+        :type log_stream_name: str
+        :param log_record: the log record
+        :type log_record: LogRecordModel
+        :param project: (Optional) The project name to which the log store belongs.
+        :type project: str or None
+        :param type: (Optional) Type of logs, defaults to 'TEXT' if not specified.
+        :type type: str or None
+        :param timeout: max seconds to wait while the buffer is full, None waits forever
+        :type timeout: float
+
+        :return: False if the record was dropped because the buffer is full
+        :rtype: bool
+        :raises BceClientError: if the producer is closed or the buffer stays full
+            for longer than timeout
+        """
+        size = _record_size(log_record)
+        with self._cond:
+            if self._is_full(size) and not self._closed:
+                if not self._block_on_full:
+                    self.records_dropped += 1
+                    return False
+                deadline = None if timeout is None else time.time() + timeout
+                while self._is_full(size) and not self._closed:
+                    remaining = None if deadline is None else deadline - time.time()
+                    if remaining is not None and remaining <= 0:
+                        raise BceClientError("log buffer is full")
+                    self._cond.wait(remaining)
+            if self._closed:
+                raise BceClientError("log producer is closed")
+            key = (project, log_store_name, log_stream_name, type)
+            buf = self._buffers.get(key)
+            if buf is None:
+                buf = self._buffers[key] = [[], 0]
+            buf[0].append(log_record)
+            buf[1] += size
+            self._pending_bytes += size
+            if len(buf[0]) >= self._batch_size or buf[1] >= self._max_batch_bytes:
+                self._cond.notify_all()
+        return True
+
+    def flush(self, timeout=None):
+        """
+        Send everything buffered so far and wait until it has been pushed.
+
+        :return: True if the buffer was drained, False on timeout
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._pending_bytes and self._thread.is_alive():
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return not self._pending_bytes
+
+    def close(self, timeout=None):
+        """
+        Stop accepting records, push the ones still buffered and stop the background threads.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _is_full(self, size):
+        return self._pending_bytes > 0 and \
+            self._pending_bytes + size > self._max_buffered_bytes
+
+    def _take_batches(self, flush_all):
+        batches = []
+        for key in list(self._buffers):
+            records, size = self._buffers[key]
+            start = 0
+            batch_bytes = 0
+            for i in range(len(records)):
+                record_bytes = _record_size(records[i])
+                if i > start and (i - start == self._batch_size or
+                                  batch_bytes + record_bytes > self._max_batch_bytes):
+                    batches.append((key, records[start:i], batch_bytes))
+                    start = i
+                    batch_bytes = 0
+                batch_bytes += record_bytes
+            if start < len(records) and (flush_all or len(records) - start >= self._batch_size
+                                         or batch_bytes >= self._max_batch_bytes):
+                batches.append((key, records[start:], batch_bytes))
+                start = len(records)
+            if start < len(records):
+                self._buffers[key] = [records[start:], batch_bytes]
+            else:
+                del self._buffers[key]
+        return batches
+
+    def _ready(self):
+        return self._closed or self._flush_requested or \
+            any(len(records) >= self._batch_size or size >= self._max_batch_bytes
+                for records, size in self._buffers.values())
+
+    def _run(self):
+        next_flush = time.time() + self._flush_interval
+        while True:
+            with self._cond:
+                while not self._ready():
+                    remaining = next_flush - time.time()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                flush_all = self._closed or self._flush_requested or time.time() >= next_flush
+                if flush_all:
+                    self._flush_requested = False
+                    next_flush = time.time() + self._flush_interval
+                batches = self._take_batches(flush_all)
+                if not batches and self._closed:
+                    return
+            for key, log_records, size in batches:
+                self._executor.submit(self._send, key, log_records, size)
+
+    def _send(self, key, log_records, size):
+        project, log_store_name, log_stream_name, type = key
+        try:
+            retries = 0
+            while True:
+                try:
+                    self._client.push_log_records(log_store_name, log_stream_name, log_records,
+                                                  project=project, type=type, tags=self._tags)
+                    break
+                except Exception as e:
+                    if retries >= self._max_retries or not _is_transient(e):
+                        self._on_error(e, key, log_records)
+                        return
+                    time.sleep(self._retry_backoff * (2 ** retries))
+                    retries += 1
+            with self._cond:
+                self.requests_sent += 1
+                self.records_sent += len(log_records)
+        finally:
+            with self._cond:
+                self._pending_bytes -= size
+                self._cond.notify_all()
+
+    def _on_error(self, error, key, log_records):
+        project, log_store_name, log_stream_name, type = key
+        with self._cond:
+            self.errors += 1
+        if self._error_callback is not None:
+            try:
+                self._error_callback(error, project, log_store_name, log_stream_name,
+                                     log_records)
+            except Exception:
+                _logger.exception("log producer error callback failed")
+        else:
+            _logger.warning("failed to push %d log records to %s/%s: %s",
+                            len(log_records), log_store_name, log_stream_name, error)
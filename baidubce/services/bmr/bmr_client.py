@@ -16,7 +16,6 @@ This module provides a client class for BMR.
 
 import copy
 import logging
-import json
 import sys
 
 
@@ -123,7 +122,7 @@ class BmrClient(bce_base_client.BceBaseClient):
         if templateType is not None:
             body['templateType'] = templateType
 
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body))
 
     def list_clusters(self, marker=None, max_keys=None):
         """
@@ -227,7 +226,7 @@ class BmrClient(bce_base_client.BceBaseClient):
         body = {
             "instanceGroups": instance_group_config
         }
-        return self._send_request(http_methods.PUT, path, params=params, body=json.dumps(body))
+        return self._send_request(http_methods.PUT, path, params=params, body=self._json_dumps(body))
 
 
     @required(cluster_id=value_type, steps=list)
@@ -250,7 +249,7 @@ class BmrClient(bce_base_client.BceBaseClient):
             params = {
                 'clientToken': client_token
             }
-        body = json.dumps({'steps': steps})
+        body = self._json_dumps({'steps': steps})
         return self._send_request(http_methods.POST, path, params=params, body=body)
 
     @required(cluster_id=value_type)
@@ -357,7 +356,7 @@ class BmrClient(bce_base_client.BceBaseClient):
             'clusterId': cluster_id
         }
         path ='/cluster/detail'
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body))
 
     @required(clusterId=value_type,
               newName=value_type)
@@ -378,7 +377,7 @@ class BmrClient(bce_base_client.BceBaseClient):
             'newName': newName
         }
         path = '/cluster/rename'
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body))
 
 
     def _merge_config(self, config=None):
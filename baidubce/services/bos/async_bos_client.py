@@ -0,0 +1,887 @@
+# Copyright 2014 Baidu, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""
+This module provides an asyncio client class for BOS. Python 3.5+ is required.
+"""
+
+import asyncio
+import functools
+import io
+import logging
+import os
+import zlib
+
+import baidubce
+from baidubce import compat
+from baidubce import utils
+from baidubce.auth import bce_v1_signer
+from baidubce.exception import BceClientError
+from baidubce.exception import BceHttpClientError
+from baidubce.exception import BceServerError
+from baidubce.http import bce_async_http_client
+from baidubce.http import handler
+from baidubce.http import http_headers
+from baidubce.http import http_methods
+from baidubce.services.bos.bos_client import BosClient
+from baidubce.services.bos.bos_client import DELETE_MULTIPLE_OBJECTS_MAX_KEYS
+from baidubce.services.bos.bos_client import SelectResponse
+from baidubce.services.bos.bos_client import UploadTaskHandle
+from baidubce.utils import required
+
+import http.client
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 16
+
+
+def _run_blocking(func, *args, **kwargs):
+    """
+    run a blocking call, such as file io or hashing a file, in the default executor
+    """
+    return asyncio.get_event_loop().run_in_executor(None, functools.partial(func, *args,
+                                                                            **kwargs))
+
+
+def _get_file_crc32(file_name, offset, length, buf_size):
+    with open(file_name, 'rb') as fp:
+        return utils.get_crc32_from_fp(fp, offset, length, buf_size)
+
+
+class _AsyncIterator(object):
+    """
+    async iterator over the items of a plain iterable
+    """
+    def __init__(self, iterable):
+        self._iterator = iter(iterable)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class AsyncBosClient(BosClient):
+    """
+    asyncio sdk client
+
+    Every request method of BosClient is a coroutine function here and must be awaited, e.g.
+    ``await client.put_object(...)``. The response of get_object is streamed: read its body with
+    ``await response.data.aread(size)``. list_all_objects, list_all_parts and
+    list_all_multipart_uploads and list_all_objects_parallel are async generators.
+    put_super_object_from_file, get_super_object_to_file, copy_super_object,
+    list_all_objects_parallel and delete_objects_bulk take concurrency instead of thread_num.
+    TransferManager needs a BosClient.
+    """
+    def __init__(self, config=None):
+        BosClient.__init__(self, config)
+
+    @required(bucket_name=(bytes, str))
+    async def get_bucket_location(self, bucket_name, config=None):
+        """
+        Get the region which the bucket located in.
+
+        :param bucket_name: the name of bucket
+        :type bucket_name: string or unicode
+
+        :return: region of the bucket
+        :rtype: str
+        """
+        params = {b'location': b''}
+        response = await self._send_request(http_methods.GET, bucket_name, params=params,
+                                            config=config)
+        return response.location_constraint
+
+    @required(bucket_name=(bytes, str))
+    async def does_bucket_exist(self, bucket_name, config=None):
+        """
+        Check whether there is a bucket with specific name
+
+        :param bucket_name: None
+        :type bucket_name: str
+        :return:True or False
+        :rtype: bool
+        """
+        try:
+            await self._send_request(http_methods.HEAD, bucket_name, config=config)
+            return True
+        except BceHttpClientError as e:
+            if isinstance(e.last_error, BceServerError):
+                if e.last_error.status_code == http.client.FORBIDDEN:
+                    return True
+                if e.last_error.status_code == http.client.NOT_FOUND:
+                    return False
+            raise e
+
+    @required(bucket_name=(bytes, str))
+    async def list_all_objects(self, bucket_name, prefix=None, delimiter=None, config=None):
+        """
+        async generator of all objects in bucket
+
+        :param bucket_name:
+        :param prefix:
+        :param delimiter:
+        :param config:
+        :return:
+        """
+        marker = None
+        while True:
+            response = await self.list_objects(
+                bucket_name, marker=marker, prefix=prefix, delimiter=delimiter, config=config)
+            for item in response.contents:
+                yield item
+            if response.is_truncated:
+                marker = response.next_marker
+            else:
+                break
+
+    @required(bucket_name=(bytes, str), key=(bytes, str), upload_id=(bytes, str))
+    async def list_all_parts(self, bucket_name, key, upload_id, config=None):
+        """
+        async generator of all uploaded parts
+
+        :param bucket_name:
+        :param key:
+        :param upload_id:
+        :param config:
+        :return:
+        """
+        key = compat.convert_to_bytes(key)
+        part_number_marker = None
+        while True:
+            response = await self.list_parts(bucket_name, key, upload_id,
+                                             part_number_marker=part_number_marker,
+                                             config=config)
+            for item in response.parts:
+                yield item
+            if not response.is_truncated:
+                break
+            part_number_marker = response.next_part_number_marker
+
+    @required(bucket_name=(bytes, str))
+    async def list_all_multipart_uploads(self, bucket_name, prefix=None, delimiter=None,
+                                         config=None):
+        """
+        async generator of all multipart uploads which haven't been ended
+
+        :param bucket_name:
+        :param prefix:
+        :param delimiter:
+        :param config:
+        :return:
+        """
+        key_marker = None
+        while True:
+            response = await self.list_multipart_uploads(bucket_name,
+                                                         key_marker=key_marker,
+                                                         prefix=prefix,
+                                                         delimiter=delimiter,
+                                                         config=config)
+            for item in response.uploads:
+                yield item
+            if not response.is_truncated:
+                break
+            if response.next_key_marker is not None:
+                key_marker = response.next_key_marker
+            elif len(response.uploads) != 0:
+                key_marker = response.uploads[-1].key
+            else:
+                break
+
+    @required(bucket_name=(bytes, str))
+    async def list_all_objects_parallel(self, bucket_name, prefix=None, split_keys=None,
+                                        partitions=None, delimiter='/', concurrency=None,
+                                        ordered=True, prefetch_pages=1, config=None):
+        """
+        async generator of the objects of a bucket listed with concurrent marker chains, see
+        BosClient.list_all_objects_parallel
+
+        :param concurrency: max number of list_objects requests in flight, default is 16
+        """
+        prefix = compat.convert_to_string(prefix) if prefix else ''
+        if concurrency is None or concurrency < 1:
+            concurrency = DEFAULT_CONCURRENCY
+        segments = []
+        if split_keys is not None or partitions is not None:
+            if split_keys is None:
+                split_keys = utils.split_key_range(prefix, prefix + '\x7f', partitions)
+            segments = BosClient._key_range_chains(prefix, None, split_keys)
+        else:
+            marker = None
+            while True:
+                response = await self.list_objects(bucket_name, prefix=prefix or None,
+                                                   marker=marker, delimiter=delimiter,
+                                                   config=config)
+                contents = list(response.contents or [])
+                common_prefixes = set(p.prefix for p in response.common_prefixes or [])
+                for key in sorted([c.key for c in contents] + list(common_prefixes)):
+                    if key in common_prefixes:
+                        segments.append((key, None, None))
+                    elif segments and isinstance(segments[-1], list):
+                        segments[-1].append(contents.pop(0))
+                    else:
+                        segments.append([contents.pop(0)])
+                if not response.is_truncated:
+                    break
+                marker = response.next_marker
+                if not common_prefixes:
+                    split_keys = utils.split_key_range(marker, prefix + '\x7f', concurrency * 4)
+                    segments.extend(BosClient._key_range_chains(prefix, marker, split_keys))
+                    break
+
+        semaphore = asyncio.Semaphore(concurrency)
+        shared_pages = None if ordered else asyncio.Queue(concurrency * prefetch_pages)
+        chains = []
+        tasks = []
+        try:
+            for segment in segments:
+                if isinstance(segment, list):
+                    chains.append(segment)
+                    continue
+                pages = shared_pages or asyncio.Queue(prefetch_pages)
+                tasks.append(asyncio.ensure_future(
+                    self._list_key_range(bucket_name, segment, pages, semaphore, config)))
+                chains.append(pages)
+            if ordered:
+                for chain in chains:
+                    if isinstance(chain, list):
+                        for item in chain:
+                            yield item
+                        continue
+                    while True:
+                        page = await chain.get()
+                        if page is None:
+                            break
+                        if isinstance(page, Exception):
+                            raise page
+                        for item in page:
+                            yield item
+            else:
+                running = len(tasks)
+                for chain in chains:
+                    if isinstance(chain, list):
+                        for item in chain:
+                            yield item
+                while running:
+                    page = await shared_pages.get()
+                    if page is None:
+                        running -= 1
+                    elif isinstance(page, Exception):
+                        raise page
+                    else:
+                        for item in page:
+                            yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _list_key_range(self, bucket_name, chain, pages, semaphore, config):
+        """
+        list the keys of a chain, putting the items of each page into the pages queue then
+        None, or the error that ended the listing
+        """
+        prefix, marker, last_key = chain
+        result = None
+        try:
+            while True:
+                async with semaphore:
+                    response = await self.list_objects(bucket_name, prefix=prefix or None,
+                                                       marker=marker, config=config)
+                contents = response.contents or []
+                items = contents
+                if last_key is not None:
+                    items = [item for item in contents if item.key <= last_key]
+                if items:
+                    await pages.put(items)
+                if len(items) < len(contents) or not response.is_truncated or not contents:
+                    break
+                marker = response.next_marker or contents[-1].key
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            result = e
+        await pages.put(result)
+
+    async def delete_objects_bulk(self, bucket_name, keys, keys_per_request=None,
+                                  concurrency=None, max_retries=3, config=None):
+        """
+        Delete any number of objects with concurrent delete_multiple_objects calls, see
+        BosClient.delete_objects_bulk
+
+        :param keys: iterable or async iterable of keys, or of the items of list_all_objects
+        :param concurrency: max number of requests in flight, default is 16
+        """
+        if keys_per_request is None or keys_per_request > DELETE_MULTIPLE_OBJECTS_MAX_KEYS:
+            keys_per_request = DELETE_MULTIPLE_OBJECTS_MAX_KEYS
+        if concurrency is None or concurrency < 1:
+            concurrency = DEFAULT_CONCURRENCY
+        result = utils.Expando({'deleted': 0, 'requests': 0, 'errors': []})
+        if hasattr(keys, '__aiter__'):
+            keys = keys.__aiter__()
+        else:
+            keys = _AsyncIterator(keys)
+        exhausted = False
+        # (key, attempt) of the keys to delete again
+        retry_keys = []
+        pending = set()
+        try:
+            while True:
+                while len(pending) < concurrency:
+                    chunk = retry_keys[:keys_per_request]
+                    del retry_keys[:len(chunk)]
+                    while not exhausted and len(chunk) < keys_per_request:
+                        try:
+                            key = await keys.__anext__()
+                        except StopAsyncIteration:
+                            exhausted = True
+                            break
+                        chunk.append((compat.convert_to_string(getattr(key, 'key', key)), 0))
+                    if not chunk:
+                        break
+                    pending.add(asyncio.ensure_future(
+                        self._delete_key_chunk(bucket_name, chunk, config)))
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending,
+                                                   return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    BosClient._add_deleted_chunk(result, retry_keys, task.result(), max_retries)
+        finally:
+            for task in pending:
+                task.cancel()
+        return result
+
+    async def _delete_key_chunk(self, bucket_name, chunk, config):
+        """
+        delete the keys of chunk, a list of (key, attempt)
+
+        :return: number of deleted keys and (key, attempt, code, message) of the failed ones
+        """
+        attempts = dict(chunk)
+        retry_attempt = max(attempts.values())
+        if retry_attempt:
+            await asyncio.sleep(min(0.1 * 2 ** retry_attempt, 5))
+        response = await self.delete_multiple_objects(bucket_name, [key for key, _ in chunk],
+                                                      config=config)
+        failed = [(error.key, attempts.get(error.key, retry_attempt), error.code, error.message)
+                  for error in response.errors or []]
+        return len(chunk) - len(failed), failed
+
+    @required(bucket_name=(bytes, str), key=(bytes, str))
+    async def get_object_as_string(self, bucket_name, key, range=None, version_id=None,
+                                   cond_read_write=None, config=None):
+        """
+
+        :param bucket_name:
+        :param key:
+        :param range:
+        :param config:
+        :return:
+        """
+        key = compat.convert_to_bytes(key)
+        response = await self.get_object(bucket_name, key, range=range, version_id=version_id,
+                                         cond_read_write=cond_read_write, config=config)
+        try:
+            return await response.data.aread()
+        finally:
+            response.data.close()
+
+    @required(bucket_name=(bytes, str), key=(bytes, str), file_name=(bytes, str))
+    async def get_object_to_file(self, bucket_name, key, file_name, range=None, config=None,
+                                 progress_callback=None, traffic_limit=None,
+                                 cond_read_write=None, version_id=None):
+        """
+        Get Content of Object and Put Content to File
+
+        :type file_name: string
+        :param file_name: None
+
+        :type range: tuple
+        :param range: (0,9) represent get object contents of 0-9 in bytes. 10 bytes date in total.
+        :return:
+            **HTTP Response**
+        """
+        response = await self.get_object(bucket_name, key, range=range,
+                                         traffic_limit=traffic_limit, version_id=version_id,
+                                         cond_read_write=cond_read_write, config=config)
+        buf_size = self._get_config_parameter(config, 'recv_buf_size')
+        http_response = response.data
+        total = int(response.metadata.content_length or 0)
+        consumed = 0
+        try:
+            with open(file_name, 'wb') as f:
+                while True:
+                    buf = await http_response.aread(buf_size)
+                    if not buf:
+                        break
+                    f.write(buf)
+                    consumed += len(buf)
+                    utils._invoke_progress_callback(progress_callback, consumed, total)
+        finally:
+            http_response.close()
+        response.data = None
+        return response
+
+    @required(bucket_name=(bytes, str), key=(bytes, str), file_name=(bytes, str))
+    async def get_super_object_to_file(self, bucket_name, key, file_name, chunk_size=None,
+                                       concurrency=None,
+                                       downloadTaskHandle=None,
+                                       progress_callback=None,
+                                       traffic_limit=None,
+                                       version_id=None,
+                                       config=None):
+        """
+        Download object to file with concurrent ranged GETs, at most concurrency parts in
+        flight, see BosClient.get_super_object_to_file.
+
+        param chunk_size: part size in MB, default will be auto-calculated based on object size.
+        param concurrency: maximum number of parts in flight, default is 16.
+        :return: True if succeeded, False if canceled
+        """
+        key = compat.convert_to_bytes(key)
+        if len(key) == 0 or key.startswith(b"/"):
+            raise BceClientError("Key can not be empty or start with '/' .")
+        metadata = (await self.get_object_meta_data(bucket_name, key, version_id=version_id,
+                                                    config=config)).metadata
+        total_size = int(metadata.content_length)
+        part_size = BosClient._get_super_object_part_size(total_size, chunk_size)
+        if concurrency is None or concurrency < 1:
+            concurrency = DEFAULT_CONCURRENCY
+        if downloadTaskHandle is None:
+            downloadTaskHandle = UploadTaskHandle()
+        cond_read_write = None
+        if metadata.etag is not None:
+            cond_read_write = {
+                http_headers.BOS_IF_MATCH: compat.convert_to_bytes('"%s"' % metadata.etag)}
+        buf_size = self._get_config_parameter(config, 'recv_buf_size')
+        semaphore = asyncio.Semaphore(concurrency)
+        consumed = [0]
+
+        # pre-allocate the file so that every part can be written at its own offset
+        with open(file_name, 'wb') as fp:
+            fp.truncate(total_size)
+
+        async def download(start, size):
+            async with semaphore:
+                if downloadTaskHandle.is_cancel():
+                    return None
+                response = await self.get_object(bucket_name, key, range=(start, start + size - 1),
+                                                 traffic_limit=traffic_limit,
+                                                 version_id=version_id,
+                                                 cond_read_write=cond_read_write, config=config)
+                http_response = response.data
+                crc = 0
+                offset = start
+                try:
+                    with open(file_name, 'r+b') as fp:
+                        fp.seek(start)
+                        while offset < start + size:
+                            if downloadTaskHandle.is_cancel():
+                                return None
+                            buf = await http_response.aread(min(buf_size, start + size - offset))
+                            if not buf:
+                                raise BceClientError(
+                                    'Insufficient data, only %d bytes received in range %d-%d'
+                                    % (offset - start, start, start + size - 1))
+                            crc = zlib.crc32(buf, crc)
+                            await _run_blocking(fp.write, buf)
+                            offset += len(buf)
+                            if progress_callback is not None:
+                                consumed[0] += len(buf)
+                                utils._invoke_progress_callback(progress_callback, consumed[0],
+                                                                total_size)
+                except Exception:
+                    # stop the remaining parts on the first failure
+                    downloadTaskHandle.cancel()
+                    raise
+                finally:
+                    http_response.close()
+                return crc & 0xffffffff
+
+        tasks = []
+        lengths = []
+        offset = 0
+        while offset < total_size:
+            current_part_size = min(part_size, total_size - offset)
+            tasks.append(download(offset, current_part_size))
+            lengths.append(current_part_size)
+            offset += current_part_size
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        if downloadTaskHandle.is_cancel():
+            _logger.debug("getting super object is canceled!")
+            return False
+        final_crc32 = utils.crc32_combine_many(list(zip(results, lengths)))
+        expected_crc32 = metadata.bce_content_crc_32
+        if expected_crc32 is not None and int(expected_crc32) != final_crc32:
+            raise BceClientError('crc32 of %s is %d, but x-bce-content-crc32 of object is %s'
+                                 % (compat.convert_to_string(file_name), final_crc32,
+                                    expected_crc32))
+        return True
+
+    @required(bucket=(bytes, str), key=(bytes, str), data=(bytes, str))
+    async def put_object_from_string(self, bucket, key, data, **kwargs):
+        """
+        Create object and put content of string to the object, see BosClient.put_object for
+        the optional arguments.
+
+        :return:
+            **HTTP Response**
+        """
+        key = compat.convert_to_bytes(key)
+        if isinstance(data, str):
+            data = data.encode(baidubce.DEFAULT_ENCODING)
+        fp = io.BytesIO(data)
+        try:
+            if kwargs.get('content_crc32') is None:
+                kwargs['content_crc32'] = utils.get_crc32_from_fp(
+                    fp, buf_size=self._get_config_parameter(kwargs.get('config'),
+                                                            'recv_buf_size'))
+            return await self.put_object(bucket, key, fp, content_length=len(data), **kwargs)
+        finally:
+            fp.close()
+
+    @required(bucket=(bytes, str), key=(bytes, str), file_name=(bytes, str))
+    async def put_object_from_file(self, bucket, key, file_name, content_length=None,
+                                   content_type=None, **kwargs):
+        """
+        Put object and put content of file to the object, see BosClient.put_object for
+        the optional arguments.
+
+        :return:
+            **HttpResponse Class**
+        """
+        key = compat.convert_to_bytes(key)
+        fp = open(file_name, 'rb')
+        try:
+            if content_length is None:
+                fp.seek(0, os.SEEK_END)
+                content_length = fp.tell()
+                fp.seek(0)
+            if kwargs.get('content_crc32') is None:
+                kwargs['content_crc32'] = await _run_blocking(
+                    utils.get_crc32_from_fp, fp, length=content_length,
+                    buf_size=self._get_config_parameter(kwargs.get('config'), 'recv_buf_size'))
+            if content_type is None:
+                content_type = utils.guess_content_type_by_file_name(file_name)
+            return await self.put_object(bucket, key, fp, content_length=content_length,
+                                         content_type=content_type, **kwargs)
+        finally:
+            fp.close()
+
+    @required(bucket_name=(bytes, str), key=(bytes, str), data=(bytes, str))
+    async def append_object_from_string(self, bucket_name, key, data, **kwargs):
+        """
+        Append content of string to the object, see BosClient.append_object for
+        the optional arguments.
+
+        :return:
+            **HTTP Response**
+        """
+        key = compat.convert_to_bytes(key)
+        if isinstance(data, str):
+            data = data.encode(baidubce.DEFAULT_ENCODING)
+        fp = io.BytesIO(data)
+        try:
+            return await self.append_object(bucket_name, key, fp, content_length=len(data),
+                                            **kwargs)
+        finally:
+            fp.close()
+
+    @required(bucket_name=(bytes, str),
+              key=(bytes, str),
+              upload_id=(bytes, str),
+              part_number=(int, ),
+              part_size=(compat.integer_types, ),
+              file_name=(bytes, str),
+              offset=(compat.integer_types, ))
+    async def upload_part_from_file(self, bucket_name, key, upload_id,
+                                    part_number, part_size, file_name, offset, **kwargs):
+        """
+        Upload a part from file, see BosClient.upload_part for the optional arguments.
+
+        :return:
+            **HttpResponse**
+        """
+        key = compat.convert_to_bytes(key)
+        f = open(file_name, 'rb')
+        try:
+            f.seek(offset)
+            return await self.upload_part(bucket_name, key, upload_id, part_number, part_size, f,
+                                          **kwargs)
+        finally:
+            f.close()
+
+    @required(bucket_name=(bytes, str), key=(bytes, str), file_name=(bytes, str))
+    async def put_super_object_from_file(self, bucket_name, key, file_name, chunk_size=None,
+                                         concurrency=None,
+                                         uploadTaskHandle=None,
+                                         content_type=None,
+                                         storage_class=None,
+                                         user_headers=None,
+                                         content_crc32=None,
+                                         content_crc32c=None,
+                                         content_crc32c_flag=None,
+                                         content_crc64ecma=None,
+                                         progress_callback=None,
+                                         traffic_limit=None,
+                                         cond_read_write=None,
+                                         config=None):
+        """
+        Multipart Upload file to bos, uploading at most concurrency parts at the same time.
+
+        param chunk_size: part size in MB, default will be auto-calculated based on file size.
+        param concurrency: maximum number of parts in flight, default is 16.
+        """
+        file_size = os.path.getsize(file_name)
+        part_size = BosClient._get_super_object_part_size(file_size, chunk_size)
+        if concurrency is None or concurrency < 1:
+            concurrency = DEFAULT_CONCURRENCY
+        if uploadTaskHandle is None:
+            uploadTaskHandle = UploadTaskHandle()
+
+        upload_id = (await self.initiate_multipart_upload(bucket_name, key,
+                                                          content_type=content_type,
+                                                          storage_class=storage_class,
+                                                          user_headers=user_headers,
+                                                          config=config)).upload_id
+        semaphore = asyncio.Semaphore(concurrency)
+        buf_size = self._get_config_parameter(config, 'recv_buf_size')
+
+        async def upload(part_number, offset, current_part_size):
+            async with semaphore:
+                if uploadTaskHandle.is_cancel():
+                    return None
+                part_crc = await _run_blocking(_get_file_crc32, file_name, offset,
+                                               current_part_size, buf_size)
+                response = await self.upload_part_from_file(
+                    bucket_name, key, upload_id, part_number, current_part_size, file_name,
+                    offset, part_crc32=part_crc, progress_callback=progress_callback,
+                    traffic_limit=traffic_limit, config=config)
+                return {"partNumber": part_number, "eTag": response.metadata.etag}, \
+                    (part_crc, current_part_size)
+
+        tasks = []
+        offset = 0
+        part_number = 1
+        while offset < file_size:
+            current_part_size = min(part_size, file_size - offset)
+            tasks.append(upload(part_number, offset, current_part_size))
+            offset += current_part_size
+            part_number += 1
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        failed = [r for r in results if r is None or isinstance(r, BaseException)]
+        if uploadTaskHandle.is_cancel() or failed:
+            _logger.debug("putting super object is canceled or failed!")
+            await self.abort_multipart_upload(bucket_name, key, upload_id=upload_id,
+                                              config=config)
+            return False
+        part_list = [r[0] for r in results]
+        if content_crc32 is None and results:
+            content_crc32 = utils.crc32_combine_many([r[1] for r in results])
+        await self.complete_multipart_upload(bucket_name, key, upload_id, part_list,
+                                             content_crc32=content_crc32,
+                                             content_crc32c=content_crc32c,
+                                             content_crc32c_flag=content_crc32c_flag,
+                                             content_crc64ecma=content_crc64ecma,
+                                             cond_read_write=cond_read_write, config=config)
+        return True
+
+    @required(source_bucket_name=(bytes, str), source_key=(bytes, str),
+              target_bucket_name=(bytes, str), target_key=(bytes, str))
+    async def copy_super_object(self, source_bucket_name, source_key, target_bucket_name,
+                                target_key,
+                                chunk_size=None,
+                                concurrency=None,
+                                uploadTaskHandle=None,
+                                content_type=None,
+                                storage_class=None,
+                                user_metadata=None,
+                                user_headers=None,
+                                part_retries=3,
+                                traffic_limit=None,
+                                config=None):
+        """
+        Copy an object of any size with concurrent upload_part_copy calls, at most concurrency
+        parts in flight, see BosClient.copy_super_object. Checkpoint files are not supported.
+
+        param chunk_size: part size in MB, default will be auto-calculated based on object size.
+        param concurrency: maximum number of parts in flight, default is 16.
+        param part_retries: times a part is retried after a network or server error
+        :return: True if succeeded, False if canceled
+        """
+        source_key = compat.convert_to_bytes(source_key)
+        target_key = compat.convert_to_bytes(target_key)
+        source = await self._send_request(http_methods.HEAD, source_bucket_name, source_key,
+                                          config=config,
+                                          body_parser=BosClient._parse_object_head)
+        total_size = int(source.metadata.content_length)
+        etag = source.metadata.etag
+        part_size = BosClient._get_super_object_part_size(total_size, chunk_size)
+
+        if total_size <= part_size:
+            await self.copy_object(source_bucket_name, source_key, target_bucket_name,
+                                   target_key, etag=etag, content_type=content_type,
+                                   user_metadata=user_metadata, storage_class=storage_class,
+                                   user_headers=user_headers, traffic_limit=traffic_limit,
+                                   config=config)
+            return True
+
+        if content_type is None:
+            content_type = source.metadata.content_type
+        if user_metadata is None:
+            user_metadata = source.metadata.user_metadata or None
+        if concurrency is None or concurrency < 1:
+            concurrency = DEFAULT_CONCURRENCY
+        if uploadTaskHandle is None:
+            uploadTaskHandle = UploadTaskHandle()
+
+        upload_id = (await self.initiate_multipart_upload(target_bucket_name, target_key,
+                                                          content_type=content_type,
+                                                          storage_class=storage_class,
+                                                          user_headers=user_headers,
+                                                          config=config)).upload_id
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def copy(part_number, offset, current_part_size):
+            async with semaphore:
+                attempt = 0
+                while True:
+                    if uploadTaskHandle.is_cancel():
+                        return None
+                    try:
+                        response = await self.upload_part_copy(
+                            source_bucket_name, source_key, target_bucket_name, target_key,
+                            upload_id, part_number, current_part_size, offset, etag=etag,
+                            traffic_limit=traffic_limit, config=config)
+                        break
+                    except BceHttpClientError as e:
+                        if attempt >= part_retries or not BosClient._is_part_copy_retryable(e):
+                            raise
+                        attempt += 1
+                        _logger.warning("copy task failed with partNumber=%d, retrying "
+                                        "(attempt %d/%d): %s", part_number, attempt,
+                                        part_retries, e.last_error)
+                return {"partNumber": part_number, "eTag": response.etag}
+
+        tasks = []
+        offset = 0
+        part_number = 1
+        while offset < total_size:
+            current_part_size = min(part_size, total_size - offset)
+            tasks.append(copy(part_number, offset, current_part_size))
+            offset += current_part_size
+            part_number += 1
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if uploadTaskHandle.is_cancel() or errors or None in results:
+            await self.abort_multipart_upload(target_bucket_name, target_key,
+                                              upload_id=upload_id, config=config)
+            if errors:
+                raise errors[0]
+            _logger.debug("copying super object is canceled!")
+            return False
+        await self.complete_multipart_upload(target_bucket_name, target_key, upload_id,
+                                             results, user_metadata=user_metadata,
+                                             content_crc32=source.metadata.bce_content_crc_32,
+                                             config=config)
+        return True
+
+    @required(bucket_name=(bytes, str), key=(bytes, str), select_object_args=(dict))
+    async def select_object(self, bucket_name, key, select_object_args, headers=None,
+                            config=None):
+        """
+        Select object, the returned SelectResponse is iterated with result() as in BosClient.
+
+        :type select_object_args: dict
+        :param select_object_args: requesta parameters for select object api
+        """
+        key = compat.convert_to_bytes(key)
+        select_response = SelectResponse()
+        await self._send_request(
+            http_methods.POST,
+            bucket_name,
+            key,
+            body=self._json_dumps({'selectRequest': select_object_args},
+                            default=BosClient._dump_acl_object),
+            headers=headers or {},
+            params={b'select': b'', b'type': BosClient._get_select_type(select_object_args)},
+            config=config,
+            body_parser=lambda http_response, response: BosClient._parse_select_message(
+                http_response, response, select_response)
+            )
+        return select_response
+
+    async def _verify_response_checksums(self, response, checksum_reader, name):
+        response = await response
+        BosClient._check_response_checksums(response, checksum_reader, name)
+        return response
+
+    async def _send_request(
+            self, http_method, bucket_name=None, key=None,
+            body=None, headers=None, params=None,
+            config=None, body_parser=None):
+        config, path, headers, body_parser, body_initial_offset = self._prepare_request(
+            bucket_name, key, body, headers, config, body_parser)
+        # _parse_bos_object hands the http response over to the caller, so its body is streamed
+        stream = body_parser is BosClient._parse_bos_object
+
+        last_exception = None
+        e = None
+        try:
+            return await bce_async_http_client.send_request(
+                config, bce_v1_signer.sign, [handler.parse_error, body_parser],
+                http_method, path, body, headers, params, stream=stream)
+        except BceHttpClientError as ex:
+            last_exception = ex
+            e = ex
+
+        original_path = path
+        # retry backup endpoint
+        if e is not None and config.backup_endpoint is not None \
+                         and BosClient._need_retry_backup_endpoint(e.last_error):
+            try:
+                if body_initial_offset is not None:
+                    body.seek(body_initial_offset)
+                _logger.debug(b'Retry for backup endpoint error code: %s.', e.status_code)
+                path = BosClient._get_path(config, bucket_name, key, True)
+                return await bce_async_http_client.send_request(
+                    config, bce_v1_signer.sign, [handler.parse_error, body_parser],
+                    http_method, path, body, headers, params, True, stream=stream)
+            except BceHttpClientError as ex:
+                last_exception = ex
+                e = ex
+
+        # retry for bos error
+        if e is not None and BosClient._need_retry_for_bos(config, e.last_error):
+            try:
+                if body_initial_offset is not None:
+                    body.seek(body_initial_offset)
+                _logger.debug(b'Retry for BOS error code: %s.', e.status_code)
+                return await bce_async_http_client.send_request(
+                    config, bce_v1_signer.sign, [handler.parse_error, body_parser],
+                    http_method, original_path, body, headers, params, stream=stream)
+            except BceHttpClientError as ex:
+                last_exception = ex
+                e = ex
+
+        raise last_exception
@@ -15,7 +15,11 @@ This module provides a client class for BOS.
 """
 
 import io
+import bisect
+import binascii
 import copy
+import hashlib
+import hmac
 import http.client
 import math
 import os
@@ -23,11 +27,14 @@ import json
 import logging
 import shutil
 import struct
+import zlib
 from builtins import str
 from builtins import bytes
 from future.utils import iteritems, iterkeys, itervalues
-from concurrent.futures import ThreadPoolExecutor, wait, ALL_COMPLETED, FIRST_COMPLETED
+from concurrent.futures import Future, ThreadPoolExecutor, wait, ALL_COMPLETED, FIRST_COMPLETED
+import queue
 import threading
+import time
 import functools
 import multiprocessing
 
@@ -61,6 +68,28 @@ ENCRYPTION_ALGORITHM= "AES256"
 
 HTTP_PROTOCOL_HEAD = b'http'
 
+# max number of keys of one delete multiple objects request
+DELETE_MULTIPLE_OBJECTS_MAX_KEYS = 1000
+
+# error codes of delete multiple objects worth deleting the key again
+_DELETE_RETRYABLE_CODES = frozenset(['InternalError', 'ServiceUnavailable', 'SlowDown',
+                                     'RequestTimeout'])
+
+
+def _is_seekable(fp):
+    """
+    whether fp can be read again from its current position, to pre-compute its crc32
+    """
+    if not hasattr(fp, 'seek') or not hasattr(fp, 'tell'):
+        return False
+    seekable = getattr(fp, 'seekable', None)
+    if seekable is None:
+        return True
+    try:
+        return seekable()
+    except Exception:
+        return False
+
 
 class UploadTaskHandle:
     """
@@ -88,6 +117,102 @@ class UploadTaskHandle:
         return result
 
 
+class _UploadCheckpoint(object):
+    """
+    on-disk record of a resumable put_super_object_from_file or copy_super_object
+
+    The checkpoint is bound to the target bucket and key, to the source, its size and version
+    (mtime of a file or etag of an object) and to the part size, and is ignored if any of them
+    changed since it was written.
+
+    The file is in json lines: a header line with the identity and the upload id, followed by
+    one line per completed part, so that recording a part is a single append. It is compacted
+    to the header and the known parts when it is loaded or saved.
+    """
+    def __init__(self, checkpoint_file, bucket_name, key, source, source_size, source_version,
+                 part_size):
+        self.checkpoint_file = checkpoint_file
+        self.identity = {
+            'bucket': compat.convert_to_string(bucket_name),
+            'key': compat.convert_to_string(key),
+            'source': compat.convert_to_string(source),
+            'source_size': source_size,
+            'source_version': source_version,
+            'part_size': part_size,
+        }
+        self.upload_id = None
+        self.parts = {}
+        self._lock = threading.Lock()
+
+    def load(self):
+        """
+        load upload_id and completed parts from checkpoint_file
+
+        :return: False if there is no usable checkpoint
+        """
+        try:
+            with open(self.checkpoint_file, 'r') as f:
+                lines = f.read().splitlines()
+            header = json.loads(lines[0])
+            if header['identity'] != self.identity:
+                _logger.debug("checkpoint %s does not match current upload, ignore it",
+                              self.checkpoint_file)
+                return False
+            parts = {}
+            for line in lines[1:]:
+                try:
+                    part = json.loads(line)
+                except ValueError:
+                    # the last line may be cut short by a crash while it was appended
+                    continue
+                parts[int(part.pop('part_number'))] = part
+            self.upload_id = header['upload_id']
+            self.parts = parts
+        except (IOError, OSError, ValueError, KeyError, TypeError, IndexError, AttributeError):
+            return False
+        self.save()
+        return True
+
+    def save(self):
+        """
+        write the header and all known parts atomically
+        """
+        with self._lock:
+            lines = [json.dumps({'identity': self.identity,
+                                 'upload_id': compat.convert_to_string(self.upload_id)})]
+            for part_number in sorted(self.parts):
+                lines.append(self._part_line(part_number, self.parts[part_number]))
+            tmp_file = '%s.tmp' % self.checkpoint_file
+            with open(tmp_file, 'w') as f:
+                f.write('\n'.join(lines) + '\n')
+            getattr(os, 'replace', os.rename)(tmp_file, self.checkpoint_file)
+
+    @staticmethod
+    def _part_line(part_number, part):
+        record = {'part_number': part_number}
+        record.update(part)
+        return json.dumps(record)
+
+    def add_part(self, part_number, etag, crc32, size):
+        """
+        record a completed part
+        """
+        part = {'etag': etag, 'crc32': crc32, 'size': size}
+        with self._lock:
+            self.parts[part_number] = part
+            with open(self.checkpoint_file, 'a') as f:
+                f.write(self._part_line(part_number, part) + '\n')
+
+    def remove(self):
+        """
+        remove checkpoint_file after the upload is completed
+        """
+        try:
+            os.remove(self.checkpoint_file)
+        except OSError:
+            pass
+
+
 class BosClient(BceBaseClient):
     """
     sdk client
@@ -141,7 +266,7 @@ class BosClient(BceBaseClient):
 
         if enable_maz:
             headers[http_headers.CONTENT_TYPE] = http_content_types.JSON
-            body = json.dumps({'enableMultiAz': True})
+            body = self._json_dumps({'enableMultiAz': True})
         else:
             body = None
 
@@ -213,7 +338,7 @@ class BosClient(BceBaseClient):
         """
         return self._send_request(http_methods.PUT,
                            bucket_name,
-                           body=json.dumps({'accessControlList': acl},
+                           body=self._json_dumps({'accessControlList': acl},
                                            default=BosClient._dump_acl_object),
                            headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
                            params={b'acl': b''},
@@ -245,7 +370,7 @@ class BosClient(BceBaseClient):
         storage_class = compat.convert_to_string(storage_class)
         return self._send_request(http_methods.PUT,
                            bucket_name,
-                           body=json.dumps({'storageClass': storage_class},
+                           body=self._json_dumps({'storageClass': storage_class},
                                            default=BosClient._dump_acl_object),
                            headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
                            params={b'storageClass': b''},
@@ -302,7 +427,7 @@ class BosClient(BceBaseClient):
             body['notFound'] = not_found
         return self._send_request(http_methods.PUT,
                            bucket_name,
-                           body=json.dumps(body,
+                           body=self._json_dumps(body,
                                            default=BosClient._dump_acl_object),
                            headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
                            params={b'website': b''},
@@ -360,7 +485,7 @@ class BosClient(BceBaseClient):
         encryption_algorithm = compat.convert_to_string(encryption_algorithm)
         return self._send_request(http_methods.PUT,
                            bucket_name,
-                           body=json.dumps({"encryptionAlgorithm":encryption_algorithm},
+                           body=self._json_dumps({"encryptionAlgorithm":encryption_algorithm},
                                            default=BosClient._dump_acl_object),
                            headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
                            params={b'encryption': b''},
@@ -417,7 +542,7 @@ class BosClient(BceBaseClient):
         """
         return self._send_request(http_methods.PUT,
                            bucket_name,
-                           body=json.dumps({"resource": resource},
+                           body=self._json_dumps({"resource": resource},
                                            default=BosClient._dump_acl_object),
                            headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
                            params={b'copyrightProtection': b''},
@@ -476,7 +601,7 @@ class BosClient(BceBaseClient):
             params[b"id"] = compat.convert_to_bytes(replication["id"])
         return self._send_request(http_methods.PUT,
                            bucket_name,
-                           body=json.dumps(replication,
+                           body=self._json_dumps(replication,
                                            default=BosClient._dump_acl_object),
                            headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
                            params=params,
@@ -584,7 +709,7 @@ class BosClient(BceBaseClient):
         conf_id = compat.convert_to_bytes(inventory["id"])
         return self._send_request(http_methods.PUT,
                            bucket_name,
-                           body=json.dumps(inventory,
+                           body=self._json_dumps(inventory,
                                            default=BosClient._dump_acl_object),
                            headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
                            params={b'inventory': b'', b'id': conf_id},
@@ -656,7 +781,7 @@ class BosClient(BceBaseClient):
             trash_dir = compat.convert_to_string(trash_dir)
         return self._send_request(http_methods.PUT,
                            bucket_name,
-                           body=json.dumps({"trashDir": trash_dir},
+                           body=self._json_dumps({"trashDir": trash_dir},
                                            default=BosClient._dump_acl_object),
                            headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
                            params={b'trash': b''},
@@ -733,6 +858,33 @@ class BosClient(BceBaseClient):
         if key == b'v1':
             raise ValueError('generate url the key param error!')
 
+        config, endpoint_protocol, full_host, headers, params, headers_to_sign = \
+            self._prepare_pre_signed_url(bucket_name, headers, params, headers_to_sign, protocol,
+                                         config, httpmethod)
+        path = self._get_path(config, bucket_name, key)
+
+        params[http_headers.AUTHORIZATION.lower()] = bce_v1_signer.sign(
+            config.credentials,
+            httpmethod,
+            path,
+            headers,
+            params,
+            timestamp,
+            expiration_in_seconds,
+            headers_to_sign)
+        
+        return b"%s://%s%s?%s" % (compat.convert_to_bytes(endpoint_protocol.name),
+                                 full_host,
+                                 path,
+                                 utils.get_canonical_querystring(params, False))
+
+    def _prepare_pre_signed_url(self, bucket_name, headers, params, headers_to_sign, protocol,
+                                config, httpmethod):
+        """
+        the parts of a pre-signed url which do not depend on the key
+
+        :return: config, endpoint protocol, host, headers and params to sign, headers_to_sign
+        """
         config = self._merge_config(config, bucket_name)
         headers = dict(headers) if headers else {}
         params = dict(params) if params else {}
@@ -762,28 +914,26 @@ class BosClient(BceBaseClient):
         if config.request_payer is True:
             params[http_headers.BOS_REQUEST_PAYER] = common.REQUEST_PAYER_REQUESTER
 
-        path = self._get_path(config, bucket_name, key)
         if httpmethod != http_methods.GET and httpmethod != http_methods.HEAD:
             headers_to_sign = set([b'host'])
 
         # Compatible with STS request acquisition
         if config.security_token is not None:
             params[http_headers.STS_SECURITY_TOKEN.lower()] = config.security_token
+        return config, endpoint_protocol, full_host, headers, params, headers_to_sign
 
-        params[http_headers.AUTHORIZATION.lower()] = bce_v1_signer.sign(
-            config.credentials,
-            httpmethod,
-            path,
-            headers,
-            params,
-            timestamp,
-            expiration_in_seconds,
-            headers_to_sign)
-        
-        return b"%s://%s%s?%s" % (compat.convert_to_bytes(endpoint_protocol.name),
-                                 full_host,
-                                 path,
-                                 utils.get_canonical_querystring(params, False))
+    @required(bucket_name=(bytes, str))
+    def get_pre_signer(self, bucket_name, expiration_in_seconds=1800, timestamp=0, headers=None,
+                       params=None, headers_to_sign=None, protocol=None, config=None,
+                       httpmethod=http_methods.GET):
+        """
+        Get a PreSigner generating the pre-signed urls of many objects of a bucket, with the
+        arguments of generate_pre_signed_url except the key.
+
+        :return: PreSigner
+        """
+        return PreSigner(self, bucket_name, expiration_in_seconds, timestamp, headers, params,
+                         headers_to_sign, protocol, config, httpmethod)
 
     @required(bucket_name=(bytes, str), rules=(list, dict))
     def put_bucket_lifecycle(self, 
@@ -804,7 +954,7 @@ class BosClient(BceBaseClient):
         return self._send_request(http_methods.PUT, 
                                   bucket_name,
                                   params={b'lifecycle': b''},
-                                  body=json.dumps({'rule': rules}),
+                                  body=self._json_dumps({'rule': rules}),
                                   config=config)
 
     @required(bucket_name=(bytes, str))
@@ -855,7 +1005,7 @@ class BosClient(BceBaseClient):
         return self._send_request(http_methods.PUT,
                                   bucket_name,
                                   params={b'cors': b''},
-                                  body=json.dumps({'corsConfiguration': cors_configuration}),
+                                  body=self._json_dumps({'corsConfiguration': cors_configuration}),
                                   config=config)
 
     @required(bucket_name=(bytes, str))
@@ -946,6 +1096,150 @@ class BosClient(BceBaseClient):
             else:
                 break
 
+    @required(bucket_name=(bytes, str))
+    def list_all_objects_parallel(self, bucket_name, prefix=None, split_keys=None,
+                                  partitions=None, delimiter='/', thread_num=None, ordered=True,
+                                  prefetch_pages=1, config=None):
+        """
+        List the objects of a bucket with concurrent marker chains, yielding the items
+        list_all_objects yields
+
+        The keys under prefix are cut into ranges, each listed by its own chain of list_objects
+        calls: at split_keys if given, else into partitions ranges interpolated between the keys,
+        else at the common prefixes of a listing with delimiter, each listed on its own. When a
+        page of that listing is truncated without any common prefix, the rest of the keys is
+        interpolated into ranges. Every chain fetches up to prefetch_pages pages ahead of the
+        caller.
+
+        :param split_keys: keys cutting the range, in ascending order
+        :param partitions: number of interpolated ranges when split_keys is None
+        :param delimiter: delimiter of the listing discovering the common prefixes
+        :param thread_num: max number of chains listed at the same time
+        :param ordered: yield the objects in key order, else as soon as their page is listed
+        :return: generator of the items of response.contents of list_objects
+        """
+        prefix = compat.convert_to_string(prefix) if prefix else ''
+        if thread_num is None or thread_num <= 1:
+            thread_num = multiprocessing.cpu_count()
+        # segments in key order: a list of items already listed, or a (prefix, marker,
+        # last_key) chain listing the keys after marker up to last_key
+        segments = []
+        if split_keys is not None or partitions is not None:
+            if split_keys is None:
+                split_keys = utils.split_key_range(prefix, prefix + '\x7f', partitions)
+            segments = BosClient._key_range_chains(prefix, None, split_keys)
+        else:
+            marker = None
+            while True:
+                response = self.list_objects(bucket_name, prefix=prefix or None, marker=marker,
+                                             delimiter=delimiter, config=config)
+                contents = list(response.contents or [])
+                common_prefixes = set(p.prefix for p in response.common_prefixes or [])
+                for key in sorted([c.key for c in contents] + list(common_prefixes)):
+                    if key in common_prefixes:
+                        segments.append((key, None, None))
+                    elif segments and isinstance(segments[-1], list):
+                        segments[-1].append(contents.pop(0))
+                    else:
+                        segments.append([contents.pop(0)])
+                if not response.is_truncated:
+                    break
+                marker = response.next_marker
+                if not common_prefixes:
+                    split_keys = utils.split_key_range(marker, prefix + '\x7f', thread_num * 4)
+                    segments.extend(BosClient._key_range_chains(prefix, marker, split_keys))
+                    break
+
+        stopped = threading.Event()
+        executor = ThreadPoolExecutor(thread_num)
+        shared_pages = None if ordered else queue.Queue(thread_num * prefetch_pages)
+        chains = []
+        try:
+            for segment in segments:
+                if isinstance(segment, list):
+                    chains.append(segment)
+                    continue
+                pages = shared_pages or queue.Queue(prefetch_pages)
+                executor.submit(self._list_key_range, bucket_name, segment, pages, stopped,
+                                config)
+                chains.append(pages)
+            if ordered:
+                for chain in chains:
+                    if isinstance(chain, list):
+                        for item in chain:
+                            yield item
+                        continue
+                    while True:
+                        page = chain.get()
+                        if page is None:
+                            break
+                        if isinstance(page, Exception):
+                            raise page
+                        for item in page:
+                            yield item
+            else:
+                running = 0
+                for chain in chains:
+                    if isinstance(chain, list):
+                        for item in chain:
+                            yield item
+                    else:
+                        running += 1
+                while running:
+                    page = shared_pages.get()
+                    if page is None:
+                        running -= 1
+                    elif isinstance(page, Exception):
+                        raise page
+                    else:
+                        for item in page:
+                            yield item
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def _key_range_chains(prefix, marker, split_keys):
+        """
+        chains listing the keys under prefix after marker, cut at split_keys
+        """
+        bounds = [marker] + [key for key in split_keys if marker is None or key > marker]
+        return [(prefix, bounds[i], bounds[i + 1] if i + 1 < len(bounds) else None)
+                for i in range(len(bounds))]
+
+    def _list_key_range(self, bucket_name, chain, pages, stopped, config):
+        """
+        list the keys of a chain, putting the items of each page into the pages queue then
+        None, or the error that ended the listing
+        """
+        def put(page):
+            while not stopped.is_set():
+                try:
+                    pages.put(page, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        prefix, marker, last_key = chain
+        result = None
+        try:
+            while not stopped.is_set():
+                response = self.list_objects(bucket_name, prefix=prefix or None, marker=marker,
+                                             config=config)
+                contents = response.contents or []
+                items = contents
+                if last_key is not None:
+                    items = [item for item in contents if item.key <= last_key]
+                if items and not put(items):
+                    return
+                if len(items) < len(contents) or not response.is_truncated or not contents:
+                    break
+                marker = response.next_marker or contents[-1].key
+        except Exception as e:
+            result = e
+        put(result)
+
     @staticmethod
     def _get_range_header_dict(range):
         if range is None:
@@ -957,6 +1251,17 @@ class BosClient(BceBaseClient):
         return {http_headers.RANGE: b'bytes=%d-%d' % tuple(range)}
 
 
+    @staticmethod
+    def _parse_object_head(http_response, response):
+        """
+        Sets response.metadata.user_metadata as _parse_bos_object for a HEAD response, whose
+        empty body is consumed so that the connection is released instead of handed over.
+        """
+        BosClient._parse_bos_object(http_response, response)
+        http_response.read()
+        response.data = None
+        return True
+
     @staticmethod
     def _parse_bos_object(http_response, response):
         """Sets response.body to http_response and response.user_metadata to a dict consists of all http
@@ -1157,6 +1462,143 @@ class BosClient(BceBaseClient):
                 self._get_config_parameter(config, 'recv_buf_size'),
                 progress_callback=progress_callback))
 
+    def _download_task(self, bucket_name, key, file_name, fd, start, size, etag,
+                       downloadTaskHandle, progress=None, traffic_limit=None, version_id=None,
+                       config=None):
+        """
+        download range [start, start + size) of the object and write it at the same offset of
+        file_name, return the crc32 of the range
+        """
+        if downloadTaskHandle.is_cancel():
+            _logger.debug("download task canceled with range start={}!".format(start))
+            return None
+        cond_read_write = None
+        if etag is not None:
+            cond_read_write = {http_headers.BOS_IF_MATCH: compat.convert_to_bytes('"%s"' % etag)}
+        response = self.get_object(bucket_name, key, range=(start, start + size - 1),
+                                   traffic_limit=traffic_limit, version_id=version_id,
+                                   cond_read_write=cond_read_write, config=config)
+        buf_size = self._get_config_parameter(config, 'recv_buf_size')
+        http_response = response.data
+        fp = None
+        if fd is None:
+            fp = open(file_name, 'r+b')
+            fp.seek(start)
+        crc = 0
+        offset = start
+        try:
+            while offset < start + size:
+                if downloadTaskHandle.is_cancel():
+                    _logger.debug("download task canceled with range start={}!".format(start))
+                    return None
+                buf = http_response.read(min(buf_size, start + size - offset))
+                if not buf:
+                    raise BceClientError('Insufficient data, only %d bytes received in range %d-%d'
+                                         % (offset - start, start, start + size - 1))
+                crc = zlib.crc32(buf, crc)
+                if fp is None:
+                    written = 0
+                    while written < len(buf):
+                        written += os.pwrite(fd, buf[written:], offset + written)
+                else:
+                    fp.write(buf)
+                offset += len(buf)
+                if progress is not None:
+                    progress(len(buf))
+        finally:
+            http_response.close()
+            if fp is not None:
+                fp.close()
+        _logger.debug("download task success with range start={}!".format(start))
+        return crc & 0xffffffff
+
+    @required(bucket_name=(bytes, str), key=(bytes, str), file_name=(bytes, str))
+    def get_super_object_to_file(self, bucket_name, key, file_name, chunk_size=None,
+            thread_num=None,
+            downloadTaskHandle=None,
+            progress_callback=None,
+            traffic_limit=None,
+            version_id=None,
+            config=None):
+        """
+        Download object to file with concurrent ranged GETs
+
+        The object is split into parts of chunk_size, which are fetched by thread_num threads and
+        written in place into a pre-allocated file. All parts are read with If-Match on the etag
+        of the object, and the crc32 of the whole file is checked against x-bce-content-crc32 when
+        the object has one.
+
+        param chunk_size: part size in MB, default will be auto-calculated based on object size.
+        param downloadTaskHandle: UploadTaskHandle used to cancel the download
+        :return: True if succeeded, False if canceled
+        """
+        key = compat.convert_to_bytes(key)
+        if len(key) == 0 or key.startswith(b"/"):
+            raise BceClientError("Key can not be empty or start with '/' .")
+        metadata = self.get_object_meta_data(bucket_name, key, version_id=version_id,
+                                             config=config).metadata
+        total_size = int(metadata.content_length)
+        part_size = BosClient._get_super_object_part_size(total_size, chunk_size)
+        if thread_num is None or thread_num <= 1:
+            thread_num = multiprocessing.cpu_count()
+        if downloadTaskHandle is None:
+            downloadTaskHandle = UploadTaskHandle()
+        expected_crc32 = metadata.bce_content_crc_32
+
+        progress = None
+        if progress_callback is not None:
+            progress_lock = threading.Lock()
+            consumed = [0]
+
+            def progress(n):
+                with progress_lock:
+                    consumed[0] += n
+                    utils._invoke_progress_callback(progress_callback, consumed[0], total_size)
+
+        # pre-allocate the file so that every part can be written at its own offset
+        with open(file_name, 'wb') as fp:
+            fp.truncate(total_size)
+        fd = None
+        if hasattr(os, 'pwrite'):
+            fd = os.open(file_name, os.O_WRONLY | getattr(os, 'O_BINARY', 0))
+
+        executor = ThreadPoolExecutor(thread_num)
+        all_tasks = []
+        try:
+            offset = 0
+            while offset < total_size:
+                current_part_size = min(part_size, total_size - offset)
+                all_tasks.append((current_part_size, executor.submit(
+                    self._download_task, bucket_name, key, file_name, fd, offset,
+                    current_part_size, metadata.etag, downloadTaskHandle, progress,
+                    traffic_limit, version_id, config)))
+                offset += current_part_size
+            # stop the remaining parts on the first failure
+            pending = set(task for _, task in all_tasks)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                if any(task.exception() is not None for task in done):
+                    downloadTaskHandle.cancel()
+                    break
+        finally:
+            executor.shutdown(wait=True)
+            if fd is not None:
+                os.close(fd)
+
+        for _, task in all_tasks:
+            if task.exception() is not None:
+                raise task.exception()
+        if downloadTaskHandle.is_cancel():
+            _logger.debug("getting super object is canceled!")
+            return False
+
+        final_crc32 = utils.crc32_combine_many(
+            [(task.result(), length) for length, task in all_tasks])
+        if expected_crc32 is not None and int(expected_crc32) != final_crc32:
+            raise BceClientError('crc32 of %s is %d, but x-bce-content-crc32 of object is %s'
+                                 % (compat.convert_to_string(file_name), final_crc32,
+                                    expected_crc32))
+        return True
 
     @required(bucket_name=(bytes, str), key=(bytes, str))
     def get_object_meta_data(self, bucket_name, key, version_id=None, cond_read_write=None, config=None):
@@ -1382,8 +1824,16 @@ class BosClient(BceBaseClient):
             **HTTP Response**
         """
         key = compat.convert_to_bytes(key)
-        if content_md5 is None and content_sha256 is None and content_crc32 is None and \
-                                   content_crc32c is None and content_crc64ecma is None:
+        checksum_reader = None
+        no_checksum = content_md5 is None and content_sha256 is None and content_crc32 is None \
+            and content_crc32c is None and content_crc64ecma is None
+        if isinstance(data, utils.ChecksumReader):
+            checksum_reader = data
+        elif no_checksum and hasattr(data, 'read') and not _is_seekable(data):
+            # the crc32 of a stream can not be computed before sending it, so it is computed
+            # while sending and checked against the response instead
+            checksum_reader = data = utils.ChecksumReader(data, content_length)
+        elif no_checksum:
             max_retries = 3
             for retry_count in range(max_retries):
                 try:
@@ -1437,15 +1887,19 @@ class BosClient(BceBaseClient):
                              'Use multi-part upload instead.' % bos.MAX_PUT_OBJECT_LENGTH)
 
         if progress_callback:
-            data = utils.make_progress_adapter(data, progress_callback)
+            data = utils.make_progress_adapter(data, progress_callback, content_length)
 
-        return self._send_request(
+        response = self._send_request(
             http_methods.PUT,
             bucket_name,
             key,
             body=data,
             headers=headers,
             config=config)
+        if checksum_reader is not None:
+            return self._verify_response_checksums(response, checksum_reader,
+                                                   compat.convert_to_string(key))
+        return response
 
     @required(bucket=(bytes, str), key=(bytes, str), data=(bytes, str))
     def put_object_from_string(self, bucket, key, data,
@@ -1704,10 +2158,101 @@ class BosClient(BceBaseClient):
         key_list_json = [{'key': compat.convert_to_string(k)} for k in key_list]
         return self._send_request(http_methods.POST, 
                                   bucket_name, 
-                                  body=json.dumps({'objects': key_list_json}),
+                                  body=self._json_dumps({'objects': key_list_json}),
                                   params={b'delete': b''},
                                   config=config)
 
+    @required(bucket_name=(bytes, str))
+    def delete_objects_bulk(self, bucket_name, keys, keys_per_request=None, thread_num=None,
+                            max_retries=3, config=None):
+        """
+        Delete any number of objects with concurrent delete_multiple_objects calls
+
+        keys is consumed lazily, so it may be the generator of list_all_objects: at most
+        2 * thread_num requests worth of keys are held in memory. Keys failing with a transient
+        error code are deleted again in later requests up to max_retries times, the other
+        failures are reported in the result. Errors of whole requests, raised after the retries
+        of the retry policy, stop the deletion and are raised.
+
+        :param keys: iterable of keys, or of the items of list_all_objects
+        :param keys_per_request: max number of keys of one request, at most
+            DELETE_MULTIPLE_OBJECTS_MAX_KEYS
+        :param thread_num: max number of requests sent at the same time
+        :param max_retries: times a key failing with a transient error is deleted again
+        :return: object with the number of deleted keys as deleted, of requests sent as
+            requests, and the keys which failed as errors, a list of objects with key, code
+            and message
+        """
+        if keys_per_request is None or keys_per_request > DELETE_MULTIPLE_OBJECTS_MAX_KEYS:
+            keys_per_request = DELETE_MULTIPLE_OBJECTS_MAX_KEYS
+        if thread_num is None or thread_num <= 1:
+            thread_num = multiprocessing.cpu_count()
+        result = utils.Expando({'deleted': 0, 'requests': 0, 'errors': []})
+        keys = iter(keys)
+        exhausted = False
+        # (key, attempt) of the keys to delete again
+        retry_keys = []
+        pending = set()
+        executor = ThreadPoolExecutor(thread_num)
+        try:
+            while True:
+                while len(pending) < thread_num * 2:
+                    chunk = retry_keys[:keys_per_request]
+                    del retry_keys[:len(chunk)]
+                    while not exhausted and len(chunk) < keys_per_request:
+                        try:
+                            key = next(keys)
+                        except StopIteration:
+                            exhausted = True
+                            break
+                        chunk.append((compat.convert_to_string(getattr(key, 'key', key)), 0))
+                    if not chunk:
+                        break
+                    pending.add(executor.submit(self._delete_key_chunk, bucket_name, chunk,
+                                                config))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for task in done:
+                    BosClient._add_deleted_chunk(result, retry_keys, task.result(), max_retries)
+        finally:
+            for task in pending:
+                task.cancel()
+            executor.shutdown(wait=False)
+        return result
+
+    @staticmethod
+    def _add_deleted_chunk(result, retry_keys, chunk_result, max_retries):
+        """
+        add the result of _delete_key_chunk to result, and the keys to delete again to
+        retry_keys
+        """
+        deleted, failed = chunk_result
+        result.deleted += deleted
+        result.requests += 1
+        for key, attempt, code, message in failed:
+            if attempt < max_retries and code in _DELETE_RETRYABLE_CODES:
+                retry_keys.append((key, attempt + 1))
+            else:
+                result.errors.append(utils.Expando(
+                    {'key': key, 'code': code, 'message': message}))
+
+    def _delete_key_chunk(self, bucket_name, chunk, config):
+        """
+        delete the keys of chunk, a list of (key, attempt)
+
+        :return: number of deleted keys and (key, attempt, code, message) of the failed ones
+        """
+        attempts = dict(chunk)
+        retry_attempt = max(attempts.values())
+        if retry_attempt:
+            time.sleep(min(0.1 * 2 ** retry_attempt, 5))
+        response = self.delete_multiple_objects(bucket_name, [key for key, _ in chunk],
+                                                config=config)
+        failed = [(error.key, attempts.get(error.key, retry_attempt), error.code, error.message)
+                  for error in response.errors or []]
+        return len(chunk) - len(failed), failed
+
     @required(source_bucket=(bytes, str),
               target_bucket=(bytes, str),
               target_prefix=(bytes, str))
@@ -1734,7 +2279,7 @@ class BosClient(BceBaseClient):
         return self._send_request(http_methods.PUT, 
                                   source_bucket, 
                                   params={b'logging': b''}, 
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(bucket_name=(bytes, str))
@@ -1858,7 +2403,11 @@ class BosClient(BceBaseClient):
             raise ValueError('Single part length should be less than %d. '
                              % bos.MAX_PUT_OBJECT_LENGTH)
         
-        if part_md5 is None and part_crc32 is None and part_sha256 is None and \
+        checksum_reader = None
+        if isinstance(part_fp, utils.ChecksumReader):
+            # crc32 is computed while sending and checked against the response
+            checksum_reader = part_fp
+        elif part_md5 is None and part_crc32 is None and part_sha256 is None and \
                                 part_crc32c is None and part_crc64ecma is None:
             max_retries = 3
             for retry_count in range(max_retries):
@@ -1901,7 +2450,7 @@ class BosClient(BceBaseClient):
         if progress_callback:
             part_fp = utils.make_progress_adapter(part_fp, progress_callback, part_size)
 
-        return self._send_request(
+        response = self._send_request(
             http_methods.PUT,
             bucket_name,
             key,
@@ -1909,6 +2458,64 @@ class BosClient(BceBaseClient):
             headers=headers,
             params={b'partNumber': part_number, b'uploadId': upload_id},
             config=config)
+        if checksum_reader is not None:
+            return self._verify_response_checksums(response, checksum_reader,
+                                                   'part %d' % part_number)
+        return response
+
+    def _verify_response_checksums(self, response, checksum_reader, name):
+        """
+        check response of a body sent through checksum_reader and return it, AsyncBosClient
+        awaits the response first
+        """
+        BosClient._check_response_checksums(response, checksum_reader, name)
+        return response
+
+    @staticmethod
+    def _get_response_header(response, header):
+        """
+        value of a response header, whether or not under_line_headers renamed it
+        """
+        header = compat.convert_to_string(header).lower()
+        prefix = compat.convert_to_string(http_headers.BCE_PREFIX)
+        name = header
+        if name.startswith(prefix):
+            name = 'bce_' + name[len(prefix):]
+        value = getattr(response.metadata, utils.pythonize_name(name.replace('-', '_')), None)
+        if value is not None:
+            return value
+        for k, v in iteritems(vars(response.metadata)):
+            if k.lower() == header:
+                return v
+        return None
+
+    @staticmethod
+    def _check_response_checksums(response, checksum_reader, name):
+        """
+        compare the checksums computed by checksum_reader with the x-bce-content-crc32,
+        x-bce-content-crc32c and x-bce-content-crc64ecma headers of response
+
+        A response without any of the computed checksums can not be verified, it is logged.
+        """
+        if not checksum_reader.done:
+            raise BceClientError('only %d of %d bytes of %s were sent'
+                                 % (checksum_reader.offset, checksum_reader.size, name))
+        verified = False
+        for algorithm, header in (
+                ('crc32', http_headers.BCE_CONTENT_CRC32),
+                ('crc32c', http_headers.BCE_CONTENT_CRC32C),
+                ('crc64ecma', http_headers.BCE_CONTENT_CRC64ECMA)):
+            value = getattr(checksum_reader, algorithm)
+            server_value = BosClient._get_response_header(response, header)
+            if value is None or server_value is None:
+                continue
+            if int(server_value) != value:
+                raise BceClientError('%s of %s is %d, but server returned %s'
+                                     % (algorithm, name, value, server_value))
+            verified = True
+        if not verified:
+            _logger.warning('server returned no checksum of %s, its integrity can not be '
+                            'verified', name)
 
     @required(source_bucket_name=(bytes, str),
               source_key=(bytes, str),
@@ -2058,7 +2665,7 @@ class BosClient(BceBaseClient):
             http_methods.POST,
             bucket_name,
             key,
-            body=json.dumps({'parts': part_list}),
+            body=self._json_dumps({'parts': part_list}),
             headers=headers,
             params={b'uploadId': upload_id},
             config=config)
@@ -2209,24 +2816,62 @@ class BosClient(BceBaseClient):
     def _upload_task(self, bucket_name, object_key, upload_id,
         part_number, part_size, file_name, offset, part_list, uploadTaskHandle,
         part_crc32=None, part_crc32c=None, part_crc32c_flag=None, part_crc64ecma=None,
-        progress_callback=None, traffic_limit=None):
+        progress_callback=None, traffic_limit=None, checkpoint=None):
+        """
+        upload a part of file_name, return its crc32
+
+        If part_crc32 is None, it is computed before the part is sent.
+        """
         if uploadTaskHandle.is_cancel():
             _logger.debug("upload task canceled with partNumber={}!".format(part_number))
-            return
+            return None
         try:
+            if part_crc32 is None:
+                with open(file_name, 'rb') as fp:
+                    fp.seek(offset)
+                    part_crc32 = utils.get_crc32_from_fp(fp, length=part_size,
+                        buf_size=self._get_config_parameter(None, 'recv_buf_size'))
             response = self.upload_part_from_file(bucket_name, object_key, upload_id,
                 part_number, part_size, file_name, offset, part_crc32=part_crc32,
-                part_crc32c=part_crc32c, part_crc32c_flag=part_crc32c_flag, part_crc64ecma=part_crc64ecma,
-                progress_callback=progress_callback, traffic_limit=traffic_limit)
+                part_crc32c=part_crc32c, part_crc32c_flag=part_crc32c_flag,
+                part_crc64ecma=part_crc64ecma, progress_callback=progress_callback,
+                traffic_limit=traffic_limit)
             part_list.append({
                 "partNumber": part_number,
                 "eTag": response.metadata.etag
             })
+            if checkpoint is not None:
+                checkpoint.add_part(part_number, response.metadata.etag, part_crc32, part_size)
             _logger.debug("upload task success with partNumber={}!".format(part_number))
+            return part_crc32
         except Exception as e:
             _logger.debug("upload task failed with partNumber={}!".format(part_number))
             raise e
 
+    @staticmethod
+    def _get_super_object_part_size(file_size, chunk_size=None):
+        """
+        get part size in bytes of put_super_object_from_file
+
+        param chunk_size: part size in MB, auto-calculated based on file size if None.
+        """
+        # if file size more than 48.8TB, reject
+        if file_size > 50000 * 1024 * 1024 * 1024:
+           raise BceClientError("File size must not be more than 48.8TB!")
+
+        if chunk_size is None:
+            # auto-calculate chunk_size based on file size
+            # minimum chunk_size is 5MB, maximum parts is 10000
+            chunk_size = 5
+            min_chunk_size_mb = math.ceil(file_size / (10000 * 1024 * 1024))
+            if min_chunk_size_mb > chunk_size:
+                chunk_size = min_chunk_size_mb
+
+        # check params
+        if chunk_size > 5 * 1024 or chunk_size <= 0:
+           raise BceClientError("chunk size is invalid, it should be more than 0 and not more than 5120!")
+        return chunk_size * 1024 * 1024
+
     @required(bucket_name=(bytes, str), key=(bytes, str), file_name=(bytes, str))
     def put_super_object_from_file(self, bucket_name, key, file_name, chunk_size=None,
             thread_num=None,
@@ -2241,6 +2886,7 @@ class BosClient(BceBaseClient):
             progress_callback=None,
             traffic_limit=None,
             cond_read_write=None,
+            checkpoint_file=None,
             config=None):
         """
         Multipart Upload file to bos
@@ -2248,88 +2894,297 @@ class BosClient(BceBaseClient):
         param chunk_size: part size in MB, default will be auto-calculated based on file size.
                           Minimum is 5MB, maximum is 5120MB (5GB). Maximum 10000 parts allowed.
                           Maximum file size supported is 48.8TB.
+        param checkpoint_file: path of a file recording the upload progress. If set, a failed or
+                          canceled upload is not aborted, and calling again with the same
+                          checkpoint_file uploads only the parts which are not completed yet.
+                          The checkpoint_file is removed once the upload is completed.
         """
         left_size = os.path.getsize(file_name)
-        # if file size more than 48.8TB, reject
-        if left_size > 50000 * 1024 * 1024 * 1024:
-           raise BceClientError("File size must not be more than 48.8TB!")
-
-        if chunk_size is None:
-            # auto-calculate chunk_size based on file size
-            # minimum chunk_size is 5MB, maximum parts is 10000
-            chunk_size = 5
-            min_chunk_size_mb = math.ceil(left_size / (10000 * 1024 * 1024))
-            if min_chunk_size_mb > chunk_size:
-                chunk_size = min_chunk_size_mb
-
-        # check params
-        if chunk_size > 5 * 1024 or chunk_size <= 0:
-           raise BceClientError("chunk size is invalid, it should be more than 0 and not more than 5120!")
+        part_size = BosClient._get_super_object_part_size(left_size, chunk_size)
         if thread_num is None or thread_num <= 1:
            thread_num = multiprocessing.cpu_count()
-        part_size = chunk_size * 1024 * 1024
         total_part = left_size // part_size
         if left_size % part_size != 0:
             total_part += 1
         if uploadTaskHandle is None:
             uploadTaskHandle = UploadTaskHandle()
-        # initial
-        upload_id = self.initiate_multipart_upload(bucket_name, key,
-                content_type=content_type,
-                storage_class=storage_class,
-                user_headers=user_headers).upload_id
 
+        upload_id = None
+        checkpoint = None
+        if checkpoint_file is not None:
+            checkpoint = _UploadCheckpoint(checkpoint_file, bucket_name, key,
+                                           os.path.abspath(compat.convert_to_string(file_name)),
+                                           left_size, os.path.getmtime(file_name), part_size)
+            if checkpoint.load():
+                upload_id = self._reconcile_upload_checkpoint(bucket_name, key, checkpoint)
+        if upload_id is None:
+            # initial
+            upload_id = self.initiate_multipart_upload(bucket_name, key,
+                    content_type=content_type,
+                    storage_class=storage_class,
+                    user_headers=user_headers).upload_id
+            if checkpoint is not None:
+                checkpoint.upload_id = upload_id
+                checkpoint.parts = {}
+                checkpoint.save()
+
+        # at most max_in_flight parts are queued or uploading, the crc32 of each part is computed
+        # by the worker thread uploading it
+        max_in_flight = thread_num * 2
+        in_flight = threading.BoundedSemaphore(max_in_flight)
         executor = ThreadPoolExecutor(thread_num)
         all_tasks = []
         offset = 0
         part_number = 1
         part_list = []
-        part_crc_list = []
+        # (future of the crc32, size) of every part, in order
+        part_crc_futures = []
 
-        with open(file_name, 'rb') as fp:
+        failed = threading.Event()
+
+        def on_part_done(task):
+            if task.exception() is not None:
+                failed.set()
+            in_flight.release()
+
+        try:
             while left_size > 0:
                 current_part_size = part_size
                 if left_size < part_size:
                     current_part_size = left_size
-                part_crc = utils.get_crc32_from_fp(fp, offset, current_part_size)
-                part_crc_list.append((part_crc, current_part_size))
-
-                temp_task = executor.submit(self._upload_task, bucket_name, key, upload_id, part_number, 
-                                            current_part_size, file_name, offset, part_list, uploadTaskHandle, 
-                                            part_crc, None, None, None, progress_callback, traffic_limit)
-                all_tasks.append(temp_task)
+                completed_part = None
+                if checkpoint is not None:
+                    completed_part = checkpoint.parts.get(part_number)
+                if completed_part is not None and completed_part['size'] == current_part_size:
+                    part_list.append({
+                        "partNumber": part_number,
+                        "eTag": completed_part['etag']
+                    })
+                    completed_crc = Future()
+                    completed_crc.set_result(completed_part['crc32'])
+                    part_crc_futures.append((completed_crc, current_part_size))
+                else:
+                    # every finished task releases a slot, so this never blocks forever
+                    in_flight.acquire()
+                    if failed.is_set() or uploadTaskHandle.is_cancel():
+                        in_flight.release()
+                        break
+                    temp_task = executor.submit(self._upload_task, bucket_name, key, upload_id,
+                                                part_number, current_part_size, file_name,
+                                                offset, part_list, uploadTaskHandle, None, None,
+                                                None, None, progress_callback, traffic_limit,
+                                                checkpoint)
+                    temp_task.add_done_callback(on_part_done)
+                    all_tasks.append(temp_task)
+                    part_crc_futures.append((temp_task, current_part_size))
                 left_size -= current_part_size
                 offset += current_part_size
                 part_number += 1
 
-        # wait all upload task to exit
-        wait(all_tasks, return_when=ALL_COMPLETED)
-        if uploadTaskHandle.is_cancel():
-            _logger.debug("putting super object is canceled!")
-            self.abort_multipart_upload(bucket_name, key, upload_id=upload_id)
-            return False
-        elif len(part_list) != total_part:
-            _logger.debug("putting super object failed!")
-            self.abort_multipart_upload(bucket_name, key, upload_id=upload_id)
+            # wait all upload task to exit
+            wait(all_tasks, return_when=ALL_COMPLETED)
+        finally:
+            executor.shutdown(wait=False)
+        if uploadTaskHandle.is_cancel() or len(part_list) != total_part:
+            if uploadTaskHandle.is_cancel():
+                _logger.debug("putting super object is canceled!")
+            else:
+                _logger.debug("putting super object failed!")
+            if checkpoint is None:
+                self.abort_multipart_upload(bucket_name, key, upload_id=upload_id)
             return False
+        part_crc_list = [(crc.result(), length) for crc, length in part_crc_futures]
         # sort
         part_list.sort(key=lambda x: x["partNumber"])
-        # complete_multipart_upload
-        # Combine CRC32 values correctly: start with the first part's CRC,
-        # then combine with each subsequent part
-        if part_crc_list:
-            final_crc32 = part_crc_list[0][0]
-            for i in range(1, len(part_crc_list)):
-                crc, length = part_crc_list[i]
-                final_crc32 = utils.crc32_combine(final_crc32, crc, length)
-            final_crc32 &= 0xffffffff
-            if content_crc32 is None:
-                content_crc32 = final_crc32
+        # complete_multipart_upload with the crc32 of the whole file combined from the parts
+        if part_crc_list and content_crc32 is None:
+            content_crc32 = utils.crc32_combine_many(part_crc_list)
         self.complete_multipart_upload(bucket_name, key, upload_id, part_list, content_crc32=content_crc32,
                                        content_crc32c=content_crc32c, content_crc32c_flag=content_crc32c_flag,
                                        content_crc64ecma=content_crc64ecma, cond_read_write=cond_read_write)
+        if checkpoint is not None:
+            checkpoint.remove()
         return True
 
+    @staticmethod
+    def _is_part_copy_retryable(error):
+        """
+        client errors such as a changed source etag will not go away by retrying
+        """
+        last_error = error.last_error
+        return not (isinstance(last_error, BceServerError) and
+                    last_error.status_code is not None and last_error.status_code < 500)
+
+    def _copy_part_task(self, source_bucket_name, source_key, target_bucket_name, target_key,
+                        upload_id, part_number, part_size, offset, etag, part_list,
+                        uploadTaskHandle, part_retries, traffic_limit=None, checkpoint=None,
+                        config=None):
+        attempt = 0
+        while True:
+            if uploadTaskHandle.is_cancel():
+                _logger.debug("copy task canceled with partNumber={}!".format(part_number))
+                return
+            try:
+                response = self.upload_part_copy(source_bucket_name, source_key,
+                                                  target_bucket_name, target_key, upload_id,
+                                                  part_number, part_size, offset, etag=etag,
+                                                  traffic_limit=traffic_limit, config=config)
+                break
+            except BceHttpClientError as e:
+                if attempt >= part_retries or not BosClient._is_part_copy_retryable(e):
+                    _logger.debug("copy task failed with partNumber={}!".format(part_number))
+                    raise
+                attempt += 1
+                _logger.warning("copy task failed with partNumber=%d, retrying (attempt %d/%d): %s",
+                                part_number, attempt, part_retries, e.last_error)
+        part_list.append({
+            "partNumber": part_number,
+            "eTag": response.etag
+        })
+        if checkpoint is not None:
+            checkpoint.add_part(part_number, response.etag, None, part_size)
+        _logger.debug("copy task success with partNumber={}!".format(part_number))
+
+    @required(source_bucket_name=(bytes, str), source_key=(bytes, str),
+              target_bucket_name=(bytes, str), target_key=(bytes, str))
+    def copy_super_object(self, source_bucket_name, source_key, target_bucket_name, target_key,
+            chunk_size=None,
+            thread_num=None,
+            uploadTaskHandle=None,
+            content_type=None,
+            storage_class=None,
+            user_metadata=None,
+            user_headers=None,
+            part_retries=3,
+            traffic_limit=None,
+            checkpoint_file=None,
+            config=None):
+        """
+        Copy an object of any size with concurrent upload_part_copy calls
+
+        Objects not larger than one part are copied with copy_object. The source is pinned by its
+        etag, and content_type and user_metadata default to those of the source object. If the
+        source has x-bce-content-crc32, it is checked by the server when the upload is completed.
+
+        param chunk_size: part size in MB, default will be auto-calculated based on object size.
+        param part_retries: times a part is retried after a network or server error
+        param checkpoint_file: path of a file recording the copy progress, see
+                          put_super_object_from_file
+        :return: True if succeeded, False if canceled
+        """
+        source_key = compat.convert_to_bytes(source_key)
+        target_key = compat.convert_to_bytes(target_key)
+        source = self._send_request(http_methods.HEAD, source_bucket_name, source_key,
+                                    config=config, body_parser=BosClient._parse_object_head)
+        total_size = int(source.metadata.content_length)
+        etag = source.metadata.etag
+        part_size = BosClient._get_super_object_part_size(total_size, chunk_size)
+
+        if total_size <= part_size:
+            # copy_object keeps the metadata of the source unless it is replaced explicitly
+            self.copy_object(source_bucket_name, source_key, target_bucket_name, target_key,
+                             etag=etag, content_type=content_type, user_metadata=user_metadata,
+                             storage_class=storage_class, user_headers=user_headers,
+                             traffic_limit=traffic_limit, config=config)
+            return True
+
+        if content_type is None:
+            content_type = source.metadata.content_type
+        if user_metadata is None:
+            user_metadata = source.metadata.user_metadata or None
+
+        if thread_num is None or thread_num <= 1:
+            thread_num = multiprocessing.cpu_count()
+        if uploadTaskHandle is None:
+            uploadTaskHandle = UploadTaskHandle()
+
+        upload_id = None
+        checkpoint = None
+        if checkpoint_file is not None:
+            checkpoint = _UploadCheckpoint(checkpoint_file, target_bucket_name, target_key,
+                                           b'/%s/%s' % (compat.convert_to_bytes(source_bucket_name),
+                                                        source_key),
+                                           total_size, etag, part_size)
+            if checkpoint.load():
+                upload_id = self._reconcile_upload_checkpoint(target_bucket_name, target_key,
+                                                              checkpoint)
+        if upload_id is None:
+            upload_id = self.initiate_multipart_upload(target_bucket_name, target_key,
+                    content_type=content_type,
+                    storage_class=storage_class,
+                    user_headers=user_headers,
+                    config=config).upload_id
+            if checkpoint is not None:
+                checkpoint.upload_id = upload_id
+                checkpoint.parts = {}
+                checkpoint.save()
+
+        executor = ThreadPoolExecutor(thread_num)
+        all_tasks = []
+        part_list = []
+        total_part = 0
+        try:
+            offset = 0
+            while offset < total_size:
+                total_part += 1
+                current_part_size = min(part_size, total_size - offset)
+                completed_part = None
+                if checkpoint is not None:
+                    completed_part = checkpoint.parts.get(total_part)
+                if completed_part is not None and completed_part['size'] == current_part_size:
+                    part_list.append({
+                        "partNumber": total_part,
+                        "eTag": completed_part['etag']
+                    })
+                else:
+                    all_tasks.append(executor.submit(
+                        self._copy_part_task, source_bucket_name, source_key,
+                        target_bucket_name, target_key, upload_id, total_part,
+                        current_part_size, offset, etag, part_list, uploadTaskHandle,
+                        part_retries, traffic_limit, checkpoint, config))
+                offset += current_part_size
+            wait(all_tasks, return_when=ALL_COMPLETED)
+        finally:
+            executor.shutdown(wait=False)
+
+        errors = [task.exception() for task in all_tasks if task.exception() is not None]
+        if uploadTaskHandle.is_cancel() or errors:
+            if checkpoint is None:
+                self.abort_multipart_upload(target_bucket_name, target_key, upload_id=upload_id,
+                                            config=config)
+            if errors:
+                raise errors[0]
+            _logger.debug("copying super object is canceled!")
+            return False
+
+        part_list.sort(key=lambda x: x["partNumber"])
+        content_crc32 = source.metadata.bce_content_crc_32
+        self.complete_multipart_upload(target_bucket_name, target_key, upload_id, part_list,
+                                       user_metadata=user_metadata,
+                                       content_crc32=content_crc32, config=config)
+        if checkpoint is not None:
+            checkpoint.remove()
+        return True
+
+    def _reconcile_upload_checkpoint(self, bucket_name, key, checkpoint):
+        """
+        keep only the parts of checkpoint which are also known by the server
+
+        :return: upload_id of checkpoint, or None if the multipart upload does not exist anymore
+        """
+        try:
+            uploaded = dict((part.part_number, part.etag.strip('"')) for part in
+                            self.list_all_parts(bucket_name, key, checkpoint.upload_id))
+        except BceHttpClientError as e:
+            if isinstance(e.last_error, BceServerError) and \
+                    e.last_error.status_code == http.client.NOT_FOUND:
+                _logger.debug("upload %s of checkpoint does not exist", checkpoint.upload_id)
+                return None
+            raise
+        checkpoint.parts = dict((n, part) for n, part in iteritems(checkpoint.parts)
+                                if uploaded.get(n) == part['etag'].strip('"'))
+        return checkpoint.upload_id
+
     @required(bucket_name=(bytes, str), key=(bytes, str), acl=(list, dict))
     def set_object_acl(self, bucket_name, key, acl, config=None):
         """
@@ -2347,7 +3202,7 @@ class BosClient(BceBaseClient):
         return self._send_request(http_methods.PUT,
                            bucket_name,
                            key,
-                           body=json.dumps({'accessControlList': acl},
+                           body=self._json_dumps({'accessControlList': acl},
                                            default=BosClient._dump_acl_object),
                            headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
                            params={b'acl': b''},
@@ -2554,6 +3409,14 @@ class BosClient(BceBaseClient):
                 params={b'symlink': b''},
                 config=config)
 
+    @staticmethod
+    def _get_select_type(select_object_args):
+        if "inputSerialization" in select_object_args and "json" in select_object_args["inputSerialization"]:
+            return b"json"
+        elif "inputSerialization" in select_object_args and "csv" in select_object_args["inputSerialization"]:
+            return b"csv"
+        return b"parquet"
+
     @required(bucket_name=(bytes, str), key=(bytes, str), select_object_args=(dict))
     def select_object(self, bucket_name, key, select_object_args, headers=None, config=None):
         """
@@ -2572,18 +3435,13 @@ class BosClient(BceBaseClient):
         """
         key = compat.convert_to_bytes(key)
         headers = headers or {}
-        if "inputSerialization" in select_object_args and "json" in select_object_args["inputSerialization"]:
-            select_type = b"json"
-        elif "inputSerialization" in select_object_args and "csv" in select_object_args["inputSerialization"]:
-            select_type = b"csv"
-        else:
-            select_type = b"parquet"
+        select_type = BosClient._get_select_type(select_object_args)
         select_response = SelectResponse()
         self._send_request(
             http_methods.POST,
             bucket_name,
             key,
-            body=json.dumps({'selectRequest': select_object_args}, default=BosClient._dump_acl_object),
+            body=self._json_dumps({'selectRequest': select_object_args}, default=BosClient._dump_acl_object),
             headers=headers,
             params={b'select': b'', b'type': select_type},
             config=config,
@@ -2618,7 +3476,7 @@ class BosClient(BceBaseClient):
         """
         return self._send_request(
             http_methods.PUT,
-            body=json.dumps({'maxBucketCount': max_bucket_count, 
+            body=self._json_dumps({'maxBucketCount': max_bucket_count, 
                             'maxCapacityMegaBytes': max_capacity_mega_bytes}),
             params={b'userQuota': b''}, config=config)
 
@@ -2665,7 +3523,7 @@ class BosClient(BceBaseClient):
         """
         return self._send_request(
             http_methods.PUT, bucket_name=bucket_name,
-            body=json.dumps({'notifications': notifications}),
+            body=self._json_dumps({'notifications': notifications}),
             params={b'notification': b''}, config=config,)
 
     @required(bucket_name=(bytes, str))
@@ -2697,7 +3555,7 @@ class BosClient(BceBaseClient):
         return self._send_request(
             http_methods.PUT,
             bucket_name=bucket_name,
-            body=json.dumps({'bucketMirroringConfiguration': mirror_args}, default=BosClient._dump_acl_object),
+            body=self._json_dumps({'bucketMirroringConfiguration': mirror_args}, default=BosClient._dump_acl_object),
             params={b'mirroring': b''},
             config=config,
             )
@@ -2755,7 +3613,7 @@ class BosClient(BceBaseClient):
             http_methods.PUT,
             bucket_name=bucket_name,
             key=key,
-            body=json.dumps(obj_tag_args, default=BosClient._dump_acl_object),
+            body=self._json_dumps(obj_tag_args, default=BosClient._dump_acl_object),
             params={b'tagging': b''},
             config=config,)
 
@@ -2841,7 +3699,7 @@ class BosClient(BceBaseClient):
         return self._send_request(
             http_methods.PUT,
             bucket_name=bucket_name,
-            body=json.dumps({'status': status}, default=BosClient._dump_acl_object),
+            body=self._json_dumps({'status': status}, default=BosClient._dump_acl_object),
             params={b'versioning': b''},
             headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
             config=config,)
@@ -2919,7 +3777,7 @@ class BosClient(BceBaseClient):
         return self._send_request(http_methods.POST,
                                   bucket_name,
                                   params={b'objectlock': b''},
-                                  body=json.dumps({'retentionDays': retention_days}),
+                                  body=self._json_dumps({'retentionDays': retention_days}),
                                   config=config)
 
     @required(bucket_name=(bytes, str))
@@ -2989,7 +3847,7 @@ class BosClient(BceBaseClient):
         return self._send_request(http_methods.POST,
                                   bucket_name,
                                   params={b'extendobjectlock': b''},
-                                  body=json.dumps({'extendRetentionDays': extend_retent_days}),
+                                  body=self._json_dumps({'extendRetentionDays': extend_retent_days}),
                                   config=config)
 
     @required(bucket_name=(bytes, str))
@@ -3025,7 +3883,7 @@ class BosClient(BceBaseClient):
         """
         return self._send_request(http_methods.PUT,
                                   bucket_name,
-                                  body=json.dumps(quota_conf, default=BosClient._dump_acl_object),
+                                  body=self._json_dumps(quota_conf, default=BosClient._dump_acl_object),
                                   params={b'quota': b''},
                                   config=config)
     
@@ -3078,7 +3936,7 @@ class BosClient(BceBaseClient):
         """
         return self._send_request(http_methods.PUT,
                                   bucket_name,
-                                  body=json.dumps(tag_conf, default=BosClient._dump_acl_object),
+                                  body=self._json_dumps(tag_conf, default=BosClient._dump_acl_object),
                                   params={b'tagging': b''},
                                   config=config)
     
@@ -3357,10 +4215,7 @@ class BosClient(BceBaseClient):
                 return True
         return False
 
-    def _send_request(
-            self, http_method, bucket_name=None, key=None,
-            body=None, headers=None, params=None,
-            config=None, body_parser=None):
+    def _prepare_request(self, bucket_name, key, body, headers, config, body_parser):
         bos_handler.validate_bucket_name(bucket_name)
         if key is not None:
             bos_handler.validate_object_key(key)
@@ -3378,8 +4233,6 @@ class BosClient(BceBaseClient):
             headers = headers or {}
             headers[http_headers.BOS_REQUEST_PAYER] = common.REQUEST_PAYER_REQUESTER
 
-        last_exception = None
-        e = None
         # record the initial position of fp body before any request attempt,
         # so retries (backup endpoint or BOS error) can seek back to the correct
         # starting offset instead of blindly seeking to 0 (which would break
@@ -3387,6 +4240,17 @@ class BosClient(BceBaseClient):
         body_initial_offset = None
         if hasattr(body, 'tell') and hasattr(body, 'seek'):
             body_initial_offset = body.tell()
+        return config, path, headers, body_parser, body_initial_offset
+
+    def _send_request(
+            self, http_method, bucket_name=None, key=None,
+            body=None, headers=None, params=None,
+            config=None, body_parser=None):
+        config, path, headers, body_parser, body_initial_offset = self._prepare_request(
+            bucket_name, key, body, headers, config, body_parser)
+
+        last_exception = None
+        e = None
         try:
             return bce_http_client.send_request(
                 config, bce_v1_signer.sign, [handler.parse_error, body_parser],
@@ -3468,12 +4332,115 @@ class SelectMessage(object):
         else:
             return '{}'.format(self.headers)
 
+# prelude of a select message: total length and headers length
+_SELECT_PRELUDE = struct.Struct('>II')
+_SELECT_CRC = struct.Struct('>I')
+_SELECT_CONT_PAYLOAD = struct.Struct('>QQ')
+_SELECT_HEADER_VALUE_LEN = struct.Struct('>H')
+# the messages are read from the body in blocks of this size
+_SELECT_BLOCK_SIZE = 256 * 1024
+
+
+class _SelectMessageReader(object):
+    """
+    Read the messages of a select response from large blocks of its body.
+
+    The blocks are read into one reusable bytearray, and the payloads are returned as memoryview
+    slices of it, which are only valid until the next message is read. The buffer grows when a
+    message does not fit in it. Headers are the same for every message of a type, so they are
+    parsed once per distinct value.
+    """
+
+    def __init__(self, fp, block_size=_SELECT_BLOCK_SIZE):
+        self._fp = fp
+        self._readinto = getattr(fp, 'readinto', None)
+        self.buffer = bytearray(block_size)
+        self._view = memoryview(self.buffer)
+        self._start = 0
+        self._end = 0
+        self._headers_cache = {}
+
+    def _fill(self, n):
+        """
+        make sure n bytes from self._start are in the buffer
+
+        :return: False if the body ends before
+        """
+        if self._end - self._start >= n:
+            return True
+        size = self._end - self._start
+        if n > len(self.buffer):
+            # the payloads returned so far keep viewing the old buffer
+            buf = bytearray(max(n, 2 * len(self.buffer)))
+            buf[:size] = self._view[self._start:self._end]
+            self.buffer = buf
+            self._view = memoryview(buf)
+        elif self._start + n > len(self.buffer):
+            # copy the bytes left first, the slices may overlap
+            self.buffer[:size] = bytes(self._view[self._start:self._end])
+        else:
+            size = None
+        if size is not None:
+            self._start = 0
+            self._end = size
+        while self._end - self._start < n:
+            if self._readinto is not None:
+                count = self._readinto(self._view[self._end:])
+            else:
+                data = self._fp.read(len(self.buffer) - self._end)
+                count = len(data)
+                self.buffer[self._end:self._end + count] = data
+            if not count:
+                return False
+            self._end += count
+        return True
+
+    def _parse_headers(self, start, end):
+        raw = bytes(self._view[start:end])
+        headers = self._headers_cache.get(raw)
+        if headers is None:
+            headers = self._headers_cache[raw] = SelectResponse._parse_select_headers(raw)
+        return headers
+
+    def read_message(self):
+        """
+        read the next message
+
+        :return: (headers, payload start, payload end, crc), the payload being at
+            buffer[start:end], or None at the end of the body
+        """
+        if not self._fill(_SELECT_PRELUDE.size):
+            if self._end > self._start:
+                raise BceClientError("select response ends in a message prelude")
+            return None
+        total_len, headers_len = _SELECT_PRELUDE.unpack_from(self.buffer, self._start)
+        if total_len < _SELECT_PRELUDE.size + headers_len + _SELECT_CRC.size:
+            raise BceClientError("invalid select message of length %d" % total_len)
+        if not self._fill(total_len):
+            raise BceClientError("select response ends in a message")
+        start = self._start
+        headers_end = start + _SELECT_PRELUDE.size + headers_len
+        end = start + total_len - _SELECT_CRC.size
+        headers = self._parse_headers(start + _SELECT_PRELUDE.size, headers_end)
+        crc = _SELECT_CRC.unpack_from(self.buffer, end)[0]
+        self._start += total_len
+        return headers, headers_end, end, crc
+
+    def payload(self, start, end):
+        """
+        memoryview of buffer[start:end], valid until the next message is read
+        """
+        return self._view[start:end]
+
+
 class SelectResponse(object):
     """
     deal with message of select object api
     """
     def __init__(self):
         self.finish = False
+        self.bytes_scanned = None
+        self.bytes_returned = None
 
     def init_from_http_response(self, http_response, response):
         """
@@ -3482,68 +4449,235 @@ class SelectResponse(object):
         self.http_response = http_response
         self.response = response
 
-    def result(self):
+    def _messages(self, check_crc):
         """
-        generator for SelectMessage
+        generator of (message type, headers, reader, payload start, payload end, crc)
+
+        Cont messages update bytes_scanned and bytes_returned, and an End message with an
+        error is raised as BceServerError.
         """
-        f  = self.http_response
+        reader = _SelectMessageReader(self.http_response)
         try:
             while not self.finish:
-                prelude = f.read(8)
-                if not prelude:
-                    raise StopIteration
-                total_len = struct.unpack('>I', prelude[0:4])[0]
-                headers_len = struct.unpack('>I', prelude[4:8])[0]
-                headers = f.read(headers_len)
-                headers_map = self._parse_select_headers(headers)
-                msg = SelectMessage()
-                if headers_map['message-type'] == 'Records':
-                    payload_len = total_len - headers_len - 12
-                    payload = f.read(payload_len)
-                    crc = struct.unpack('>I', f.read(4))[0]
-                    msg.set_record_message(headers_map, compat.convert_to_string(payload), crc)
-                    yield msg
-                elif headers_map['message-type'] == 'Cont':
-                    bytes_scanned = f.read(8)
-                    bytes_returned = f.read(8)
-                    crc = struct.unpack('>I', f.read(4))[0]
-                    bytes_scanned = struct.unpack('>Q', bytes_scanned)[0]
-                    bytes_returned = struct.unpack('>Q', bytes_returned)[0]
-                    msg.set_cont_message(headers_map, bytes_scanned, bytes_returned, crc)
-                    yield msg
-                elif headers_map['message-type'] == 'End':
-                    crc = struct.unpack('>I', f.read(4))[0]
-                    if headers_map["error-code"] != "success":
-                        raise BceServerError(headers_map['error-message'], code=headers_map['error-code'],
-                                request_id=self.response.metadata.bce_request_id)
-                    msg.set_end_message(headers_map, crc)
+                message = reader.read_message()
+                if message is None:
+                    return
+                headers, start, end, crc = message
+                message_type = headers['message-type']
+                if message_type == 'Records':
+                    if check_crc and zlib.crc32(reader.payload(start, end)) & 0xffffffff != crc:
+                        raise BceClientError("crc32 of select records does not match")
+                elif message_type == 'Cont':
+                    self.bytes_scanned, self.bytes_returned = \
+                        _SELECT_CONT_PAYLOAD.unpack_from(reader.buffer, start)
+                elif message_type == 'End':
                     self.finish = True
-                    yield msg
-            return
+                    if headers["error-code"] != "success":
+                        raise BceServerError(headers['error-message'], code=headers['error-code'],
+                                             request_id=self.response.metadata.bce_request_id)
+                yield message_type, headers, reader, start, end, crc
         finally:
             self.http_response.close()
 
+    def result(self):
+        """
+        generator for SelectMessage
+        """
+        for message_type, headers, reader, start, end, crc in self._messages(False):
+            msg = SelectMessage()
+            if message_type == 'Records':
+                msg.set_record_message(headers, compat.convert_to_string(
+                    reader.payload(start, end).tobytes()), crc)
+            elif message_type == 'Cont':
+                msg.set_cont_message(headers, self.bytes_scanned, self.bytes_returned, crc)
+            elif message_type == 'End':
+                msg.set_end_message(headers, crc)
+            else:
+                continue
+            yield msg
+
+    def iter_records(self, check_crc=True):
+        """
+        generator of the payloads of the Records messages, without copying them
+
+        Each payload is a memoryview only valid until the next one is yielded; the progress of
+        Cont messages is kept in bytes_scanned and bytes_returned.
+
+        :param check_crc: check the crc32 of every payload
+        """
+        for message_type, _, reader, start, end, _ in self._messages(check_crc):
+            if message_type == 'Records':
+                yield reader.payload(start, end)
+
+    def iter_rows(self, record_delimiter=b'\n', check_crc=True):
+        """
+        generator of the rows of the Records messages, e.g. the lines of csv or json output
+
+        Rows within a payload are yielded as memoryview slices only valid until the next row is
+        yielded; only the rows split across messages are copied to join their pieces. The
+        delimiter is not included in the rows.
+
+        :param record_delimiter: the record delimiter of the output serialization
+        :param check_crc: check the crc32 of every payload
+        """
+        record_delimiter = compat.convert_to_bytes(record_delimiter)
+        step = len(record_delimiter)
+        # pieces of the row pending at the end of the last payloads, and its last step - 1
+        # bytes, where a delimiter ending in the next payloads may start
+        pieces = []
+        tail = b''
+        for message_type, _, reader, start, end, _ in self._messages(check_crc):
+            if message_type != 'Records':
+                continue
+            buf = reader.buffer
+            if tail:
+                probe = tail + bytes(buf[start:min(end, start + step - 1)])
+                index = probe.find(record_delimiter)
+                if 0 <= index < len(tail):
+                    row = b''.join(pieces)
+                    yield memoryview(row[:len(row) - len(tail) + index])
+                    start += step - (len(tail) - index)
+                    pieces = []
+                    tail = b''
+            while start < end:
+                index = buf.find(record_delimiter, start, end)
+                if index < 0:
+                    piece = bytes(buf[start:end])
+                    pieces.append(piece)
+                    if step > 1:
+                        tail = (tail + piece[-(step - 1):])[-(step - 1):]
+                    break
+                if pieces:
+                    pieces.append(bytes(buf[start:index]))
+                    row = b''.join(pieces)
+                    pieces = []
+                    tail = b''
+                    yield memoryview(row)
+                else:
+                    yield reader.payload(start, index)
+                start = index + step
+        if pieces:
+            row = b''.join(pieces)
+            if row:
+                yield memoryview(row)
+
     @staticmethod
     def _parse_select_headers(headers):
         """
         parse SELECT headers
-        :param headers: <str>
+        :param headers: <bytes>
         :return: <dict>
         """
         hm = {}
         index = 0
+        headers = bytearray(headers)
         while index < len(headers):
             # headers key length
-            key_len = struct.unpack('B', headers[index: index + 1])[0]
+            key_len = headers[index]
             index += 1
             # headers key
             key = headers[index: index + key_len]
             index += key_len
             # headers value length
-            value_len = struct.unpack('>H', headers[index: index + 2])[0]
+            value_len = _SELECT_HEADER_VALUE_LEN.unpack_from(headers, index)[0]
             index += 2
             # headers value
             value = headers[index: index + value_len]
             index += value_len
-            hm[compat.convert_to_string(key)] = compat.convert_to_string(value)
+            hm[key.decode('utf-8')] = value.decode('utf-8')
         return hm
+
+
+class PreSigner(object):
+    """
+    Generate the pre-signed urls of many objects of a bucket, for one method, expiration, and set
+    of headers and parameters.
+
+    The urls are those of BosClient.generate_pre_signed_url, but the configuration, host, path
+    prefix and canonical headers and query string are computed once, and the signing key once per
+    second of timestamp, so only the key is encoded and hashed for each url. Create it with
+    BosClient.get_pre_signer.
+
+    Usage::
+
+        signer = bos_client.get_pre_signer(b'bucket', expiration_in_seconds=3600)
+        urls = signer.sign_many(keys)
+    """
+
+    def __init__(self, client, bucket_name, expiration_in_seconds=1800, timestamp=0,
+                 headers=None, params=None, headers_to_sign=None, protocol=None, config=None,
+                 httpmethod=http_methods.GET):
+        bos_handler.validate_bucket_name(bucket_name)
+        config, endpoint_protocol, full_host, headers, params, headers_to_sign = \
+            client._prepare_pre_signed_url(bucket_name, headers, params, headers_to_sign,
+                                           protocol, config, httpmethod)
+        self._credentials = config.credentials
+        self._expiration_in_seconds = expiration_in_seconds
+        self._timestamp = timestamp
+        self._url_prefix = b"%s://%s" % (compat.convert_to_bytes(endpoint_protocol.name),
+                                         full_host)
+        self._path_prefix = BosClient._get_path(config, bucket_name).rstrip(b'/') + b'/'
+        self._method_line = httpmethod + b'\n'
+        # the string to sign after the path
+        self._sign_suffix = b'\n' + (b'\n').join([
+            utils.get_canonical_querystring(params, True),
+            bce_v1_signer._get_canonical_headers(headers, headers_to_sign)])
+        self._headers_to_sign = (b';').join(headers_to_sign) if headers_to_sign else b''
+        self._query = sorted(b'%s=%s' % (utils.normalize_string(k),
+                                         utils.normalize_string(b'' if v is None else v))
+                             for k, v in iteritems(params))
+        self._state = None
+
+    def _get_state(self):
+        """
+        (second, hmac keyed with the signing key, query before and after the authorization)
+        of the current second, or of timestamp if it is set
+        """
+        second = self._timestamp or int(time.time())
+        state = self._state
+        if state is not None and state[0] == second:
+            return state
+        sign_key_info = b'bce-auth-v1/%s/%s/%d' % (self._credentials.access_key_id,
+                                                   utils.get_canonical_time(second),
+                                                   self._expiration_in_seconds)
+        sign_key = compat.convert_to_bytes(hmac.new(self._credentials.secret_access_key,
+                                                    sign_key_info, hashlib.sha256).hexdigest())
+        authorization = b'%s=%s' % (
+            http_headers.AUTHORIZATION.lower(),
+            utils.normalize_string(b'%s/%s/' % (sign_key_info, self._headers_to_sign)))
+        index = bisect.bisect(self._query, authorization)
+        before = b''.join(q + b'&' for q in self._query[:index])
+        after = b''.join(b'&' + q for q in self._query[index:])
+        state = self._state = (second, hmac.new(sign_key, digestmod=hashlib.sha256),
+                               b'?' + before + authorization, after)
+        return state
+
+    def sign(self, key):
+        """
+        Get the pre-signed url of an object
+
+        :type key: string
+        :param key: object name
+        :return:
+            **URL string**
+        """
+        key = compat.convert_to_string(key)
+        key = (key or "").strip('/')
+        bos_handler.validate_object_key(key)
+        # keys are rarely signed twice, keep them out of the cache of normalize_string
+        path = self._path_prefix + utils._normalize_string_uncached(compat.convert_to_bytes(key),
+                                                                    False)
+        _, base_hmac, query_head, query_tail = self._get_state()
+        signature = base_hmac.copy()
+        signature.update(self._method_line + path + self._sign_suffix)
+        return b'%s%s%s%s%s' % (self._url_prefix, path, query_head,
+                                binascii.hexlify(signature.digest()), query_tail)
+
+    def sign_many(self, keys):
+        """
+        Get the pre-signed urls of objects
+
+        :param keys: iterable of object names
+        :return: list of URL strings, in the order of keys
+        """
+        return [self.sign(key) for key in keys]
@@ -14,10 +14,9 @@
 This module provides general http handler functions for processing http responses from bos services.
 """
 
-import json
 import re
 from baidubce import compat
-from baidubce import utils
+from baidubce import json_codec
 from baidubce.exception import BceServerError
 from baidubce.http import handler
 from builtins import str
@@ -54,7 +53,8 @@ def validate_bucket_name(bucket_name):
             "start and end with letter or digit)" % bucket_name
         )
 
-def parse_copy_object_response(http_response, response):
+@handler.json_body_parser
+def parse_copy_object_response(http_response, response, keep_raw_data=True, lazy=False, codec=None):
     """
     response parser for copy object
     """
@@ -67,13 +67,12 @@ def parse_copy_object_response(http_response, response):
         if body:
             # json.loads always returns str keys on both Py2 (unicode) and Py3 (str).
             body_str = compat.convert_to_string(body)
-            d = json.loads(body_str)
+            d = json_codec.loads(body_str, codec)
             if 'code' in d:
                 http_response.close()
                 raise BceServerError(d['message'], code=d['code'], request_id=d['requestId'])
             else:
-                response.__dict__.update(
-                    json.loads(body_str, object_hook=utils.dict_to_python_object).__dict__)
+                response.__dict__.update(handler.load_python_object(body_str, codec).__dict__)
                 http_response.close()
         else:
             e = BceServerError(http_response.reason, request_id=response.metadata.bce_request_id)
@@ -81,7 +80,7 @@ def parse_copy_object_response(http_response, response):
             raise e
         return True
     else:
-        return handler.parse_json(http_response, response)
+        return handler.parse_json(http_response, response, keep_raw_data, lazy, codec)
 
 def validate_object_key(key):
     """
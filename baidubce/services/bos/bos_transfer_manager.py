@@ -0,0 +1,459 @@
+# Copyright 2014 Baidu, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""
+This module provides a transfer manager mirroring directory trees to and from BOS.
+"""
+import base64
+import binascii
+import calendar
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from future.utils import iteritems
+
+from baidubce import compat
+from baidubce import utils
+from baidubce.exception import BceClientError
+
+_logger = logging.getLogger(__name__)
+
+BOS_URL_PREFIX = 'bos://'
+
+COMPARE_MODES = (None, 'size', 'size_mtime', 'etag', 'crc32')
+
+
+def _parse_last_modified(last_modified):
+    """
+    seconds since the epoch of a last modified time of list_objects, e.g. 2020-01-01T00:00:00Z
+    """
+    return calendar.timegm(time.strptime(last_modified[:19], '%Y-%m-%dT%H:%M:%S'))
+
+
+def _file_md5_hex(file_name):
+    with open(file_name, 'rb') as fp:
+        md5 = utils.get_md5_from_fp(fp, buf_size=1024 * 1024)
+    return compat.convert_to_string(binascii.hexlify(base64.b64decode(md5)))
+
+
+def _file_crc32(file_name):
+    with open(file_name, 'rb') as fp:
+        return utils.get_crc32_from_fp(fp, buf_size=1024 * 1024)
+
+
+def _local_path(local_dir, rel):
+    """
+    path of the file of a key relative to local_dir, or None if the key is not a path under
+    local_dir, e.g. it has empty, '.' or '..' segments, or a symbolic link leads outside of it
+    """
+    segments = rel.split('/')
+    for segment in segments:
+        if segment in ('', '.', '..') or os.sep in segment or \
+                (os.altsep and os.altsep in segment) or os.path.splitdrive(segment)[0]:
+            return None
+    file_name = os.path.join(local_dir, *segments)
+    root = os.path.realpath(local_dir)
+    if not os.path.realpath(file_name).startswith(os.path.join(root, '')):
+        return None
+    return file_name
+
+
+class _Throttle(object):
+    """
+    token bucket shared by all the transfers, allowing a burst of one second of budget
+    """
+
+    def __init__(self, bytes_per_second):
+        self._rate = float(bytes_per_second)
+        self._lock = threading.Lock()
+        self._available_at = 0.0
+
+    def consume(self, n):
+        with self._lock:
+            now = time.time()
+            self._available_at = max(self._available_at, now - 1.0) + n / self._rate
+            delay = self._available_at - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class _Progress(object):
+    """
+    aggregate progress of the transfers of one call
+    """
+
+    def __init__(self, total_bytes, progress_callback, throttle):
+        self.total_bytes = total_bytes
+        self.consumed_bytes = 0
+        self._progress_callback = progress_callback
+        self._throttle = throttle
+        self._lock = threading.Lock()
+
+    def advance(self, n):
+        if n <= 0:
+            return
+        if self._throttle is not None:
+            self._throttle.consume(n)
+        with self._lock:
+            self.consumed_bytes += n
+            utils._invoke_progress_callback(self._progress_callback, self.consumed_bytes,
+                                            self.total_bytes)
+
+    def skip(self, n):
+        """
+        remove a file found unchanged by its transfer from the total
+        """
+        with self._lock:
+            self.total_bytes -= n
+            utils._invoke_progress_callback(self._progress_callback, self.consumed_bytes,
+                                            self.total_bytes)
+
+    def file_callback(self, per_thread=False):
+        """
+        progress_callback of one transfer, turning its (consumed, total) calls into increments
+
+        Every part of a multipart upload reports its own consumed bytes from the thread
+        uploading it, so these are tracked per thread when per_thread is True.
+        """
+        consumed = {}
+
+        def callback(consumed_bytes, total_bytes):
+            key = threading.current_thread().ident if per_thread else None
+            last = consumed.get(key, 0)
+            if consumed_bytes < last:
+                last = 0
+            consumed[key] = consumed_bytes
+            self.advance(consumed_bytes - last)
+        return callback
+
+
+class TransferManager(object):
+    """
+    Upload, download and synchronize directory trees with BOS.
+
+    Files are mapped to the keys of their path relative to the directory, with '/' separators,
+    appended to a prefix. Unchanged files are skipped by comparing them with the objects listed
+    by list_all_objects, according to compare:
+
+    * None: transfer every file
+    * 'size': skip files of the same size
+    * 'size_mtime': skip files of the same size, unless the source was modified after the
+      target. Downloaded files get the last modified time of their object.
+    * 'etag': skip files of the same size whose md5 is the etag of the object
+    * 'crc32': skip files of the same size whose crc32 is the x-bce-content-crc32 of the object
+
+    Files larger than multipart_threshold are transferred with put_super_object_from_file and
+    get_super_object_to_file, the others with put_object_from_file and get_object_to_file. All
+    transfers run on one pool of max_workers threads, and their bytes are throttled together to
+    max_bandwidth bytes per second.
+
+    Usage::
+
+        with TransferManager(bos_client, max_bandwidth=50 * 1024 * 1024) as manager:
+            result = manager.upload_dir("data", "bucket", "backup/data/")
+    """
+
+    def __init__(self, client, max_workers=None, multipart_threshold=64 * 1024 * 1024,
+                 part_size=None, part_thread_num=4, max_bandwidth=None, compare='size_mtime',
+                 config=None):
+        """
+        :param client: client used for the transfers
+        :type client: baidubce.services.bos.bos_client.BosClient
+        :param max_workers: max number of files transferred at the same time
+        :type max_workers: int
+        :param multipart_threshold: min size in bytes of the files transferred in parts
+        :type multipart_threshold: int
+        :param part_size: part size in MB of the files transferred in parts, default will be
+            auto-calculated based on file size
+        :type part_size: int
+        :param part_thread_num: number of threads transferring the parts of one file
+        :type part_thread_num: int
+        :param max_bandwidth: max bytes per second of all the transfers, None for no limit
+        :type max_bandwidth: int
+        :param compare: how files are compared with objects to skip the unchanged ones
+        :type compare: str
+        """
+        if compare not in COMPARE_MODES:
+            raise ValueError("compare should be one of %s" % (COMPARE_MODES,))
+        if compat.PY3:
+            from baidubce.services.bos.async_bos_client import AsyncBosClient
+            if isinstance(client, AsyncBosClient):
+                raise BceClientError("TransferManager transfers files in threads, it needs "
+                                     "a BosClient instead of an AsyncBosClient")
+        if max_workers is None or max_workers <= 0:
+            max_workers = multiprocessing.cpu_count()
+        self._client = client
+        self._multipart_threshold = multipart_threshold
+        self._part_size = part_size
+        self._part_thread_num = part_thread_num
+        self._compare = compare
+        self._config = config
+        self._throttle = _Throttle(max_bandwidth) if max_bandwidth else None
+        self._executor = ThreadPoolExecutor(max_workers)
+
+    def close(self):
+        """
+        Stop the worker threads once the transfers in progress are done.
+        """
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def upload_dir(self, local_dir, bucket_name, prefix='', delete=False, progress_callback=None):
+        """
+        Upload the files of a local directory tree which differ from their objects.
+
+        :param local_dir: the directory to upload
+        :param bucket_name: the target bucket
+        :param prefix: prefix of the keys, usually ending with '/'
+        :param delete: delete the objects under prefix which have no file in local_dir
+        :param progress_callback: called as progress_callback(consumed_bytes, total_bytes)
+            with the bytes transferred by the whole call
+        :return: object with the numbers of transferred, skipped and deleted files, the number
+            of transferred_bytes, and the files which failed as errors, a list of objects with
+            file_name, key and error
+        """
+        prefix = compat.convert_to_string(prefix or '')
+        objects = self._list_objects(bucket_name, prefix)
+        files = self._walk(local_dir)
+        tasks = []
+        for rel, (file_name, size, mtime) in sorted(files.items()):
+            item = objects.get(rel)
+            if item is not None and \
+                    self._is_unchanged(item, size, mtime, item.last_modified_time):
+                tasks.append(None)
+            else:
+                tasks.append((self._upload, bucket_name, prefix + rel, file_name, size, item))
+        result = self._run(tasks, progress_callback)
+        if delete:
+            extra = [prefix + rel for rel in sorted(objects) if rel not in files]
+            if extra:
+                deleted = self._client.delete_objects_bulk(bucket_name, extra,
+                                                           config=self._config)
+                result.deleted = deleted.deleted
+                for error in deleted.errors:
+                    result.errors.append(utils.Expando({
+                        'file_name': None, 'key': error.key,
+                        'error': BceClientError('%s: %s' % (error.code, error.message))}))
+        return result
+
+    def download_dir(self, bucket_name, prefix, local_dir, delete=False,
+                     progress_callback=None):
+        """
+        Download the objects under a prefix which differ from their files in a local directory.
+
+        Objects whose key ends with '/' are directory markers and are not downloaded. Objects
+        whose key relative to prefix is not a path under local_dir, such as a/../../b, are
+        reported in errors and not downloaded.
+
+        :param bucket_name: the source bucket
+        :param prefix: prefix of the keys, usually ending with '/'
+        :param local_dir: the target directory, created if missing
+        :param delete: delete the files of local_dir which have no object under prefix
+        :param progress_callback: called as progress_callback(consumed_bytes, total_bytes)
+            with the bytes transferred by the whole call
+        :return: same as upload_dir
+        """
+        prefix = compat.convert_to_string(prefix or '')
+        objects = self._list_objects(bucket_name, prefix)
+        files = self._walk(local_dir)
+        unsafe = []
+        for rel in sorted(objects):
+            if _local_path(local_dir, rel) is None:
+                unsafe.append(prefix + rel)
+                del objects[rel]
+        tasks = []
+        for rel, item in sorted(objects.items()):
+            file_name, size, mtime = files.get(rel, (None, None, None))
+            if file_name is not None and self._is_unchanged(item, size, item.last_modified_time,
+                                                            mtime):
+                tasks.append(None)
+                continue
+            file_name = _local_path(local_dir, rel)
+            tasks.append((self._download, bucket_name, prefix + rel, file_name, int(item.size),
+                          item))
+        result = self._run(tasks, progress_callback)
+        for key in unsafe:
+            _logger.warning("skip object %s whose key is not a path under %s", key, local_dir)
+            result.errors.append(utils.Expando({
+                'file_name': None, 'key': key,
+                'error': BceClientError("key %s is not a path under %s" % (key, local_dir))}))
+        if delete:
+            for rel in sorted(files):
+                if rel not in objects and _local_path(local_dir, rel) is not None:
+                    os.remove(files[rel][0])
+                    result.deleted += 1
+        return result
+
+    def sync(self, source, target, delete=False, progress_callback=None):
+        """
+        Mirror source to target, one being a local directory and the other a BOS url such as
+        bos://bucket/prefix/
+
+        :return: same as upload_dir
+        """
+        if source.startswith(BOS_URL_PREFIX) == target.startswith(BOS_URL_PREFIX):
+            raise ValueError("exactly one of source and target should start with %s"
+                             % BOS_URL_PREFIX)
+        if target.startswith(BOS_URL_PREFIX):
+            bucket_name, _, prefix = target[len(BOS_URL_PREFIX):].partition('/')
+            return self.upload_dir(source, bucket_name, prefix, delete=delete,
+                                   progress_callback=progress_callback)
+        bucket_name, _, prefix = source[len(BOS_URL_PREFIX):].partition('/')
+        return self.download_dir(bucket_name, prefix, target, delete=delete,
+                                 progress_callback=progress_callback)
+
+    def _list_objects(self, bucket_name, prefix):
+        """
+        objects under prefix by key relative to prefix, with their last_modified_time
+        """
+        objects = {}
+        for item in self._client.list_all_objects(bucket_name, prefix=prefix or None,
+                                                  config=self._config):
+            key = compat.convert_to_string(item.key)
+            if key.endswith('/'):
+                continue
+            item.last_modified_time = _parse_last_modified(item.last_modified)
+            objects[key[len(prefix):]] = item
+        return objects
+
+    @staticmethod
+    def _walk(local_dir):
+        """
+        files of a directory tree by path relative to local_dir, as (file_name, size, mtime)
+        """
+        files = {}
+        for root, _, names in os.walk(local_dir):
+            for name in names:
+                file_name = os.path.join(root, name)
+                st = os.stat(file_name)
+                rel = os.path.relpath(file_name, local_dir).replace(os.sep, '/')
+                files[rel] = (file_name, st.st_size, st.st_mtime)
+        return files
+
+    def _is_unchanged(self, item, file_size, source_mtime, target_mtime):
+        """
+        the checks of compare not reading the file; etag and crc32 are checked by the task
+        """
+        if self._compare is None or int(item.size) != file_size:
+            return False
+        if self._compare == 'size_mtime':
+            return int(source_mtime) <= int(target_mtime)
+        return self._compare == 'size'
+
+    def _is_same_content(self, bucket_name, key, file_name, item):
+        """
+        the checks of compare reading the file
+        """
+        if self._compare == 'etag':
+            return item.etag is not None and \
+                item.etag.strip('"').lower() == _file_md5_hex(file_name)
+        if self._compare == 'crc32':
+            metadata = self._client.get_object_meta_data(bucket_name, key,
+                                                         config=self._config).metadata
+            return metadata.bce_content_crc_32 is not None and \
+                int(metadata.bce_content_crc_32) == _file_crc32(file_name)
+        return False
+
+    def _run(self, tasks, progress_callback):
+        """
+        run the transfers of tasks, None for skipped files, on the shared pool
+        """
+        result = utils.Expando({'transferred': 0, 'skipped': 0, 'deleted': 0,
+                                'transferred_bytes': 0, 'errors': []})
+        progress = _Progress(sum(task[4] for task in tasks if task is not None),
+                             progress_callback, self._throttle)
+        futures = {}
+        for task in tasks:
+            if task is None:
+                result.skipped += 1
+            else:
+                futures[self._executor.submit(*(task + (progress,)))] = task
+        wait(futures)
+        for future, task in iteritems(futures):
+            _, bucket_name, key, file_name, size, _ = task
+            error = future.exception()
+            if error is not None:
+                _logger.warning("failed to transfer %s to %s: %s", file_name, key, error)
+                result.errors.append(utils.Expando({'file_name': file_name, 'key': key,
+                                                    'error': error}))
+            elif future.result():
+                result.transferred += 1
+                result.transferred_bytes += size
+            else:
+                result.skipped += 1
+        return result
+
+    def _upload(self, bucket_name, key, file_name, size, item, progress):
+        """
+        :return: False if the file was skipped because it has the content of the object
+        """
+        if item is not None and int(item.size) == size and \
+                self._is_same_content(bucket_name, key, file_name, item):
+            progress.skip(size)
+            return False
+        key = compat.convert_to_bytes(key)
+        if size < self._multipart_threshold:
+            self._client.put_object_from_file(bucket_name, key, file_name,
+                                              progress_callback=progress.file_callback(),
+                                              config=self._config)
+        elif not self._client.put_super_object_from_file(
+                bucket_name, key, file_name, chunk_size=self._part_size,
+                thread_num=self._part_thread_num,
+                progress_callback=progress.file_callback(per_thread=True),
+                config=self._config):
+            raise BceClientError("multipart upload of %s failed" % file_name)
+        return True
+
+    def _download(self, bucket_name, key, file_name, size, item, progress):
+        """
+        download to a temporary file renamed to file_name once complete, so that a failed
+        download is never mistaken for an unchanged file
+
+        :return: False if the file was skipped because it has the content of the object
+        """
+        if os.path.isfile(file_name) and os.path.getsize(file_name) == size and \
+                self._is_same_content(bucket_name, key, file_name, item):
+            progress.skip(size)
+            return False
+        directory = os.path.dirname(file_name)
+        if directory and not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+        tmp_file = file_name + '.bos-tmp'
+        key = compat.convert_to_bytes(key)
+        try:
+            if size < self._multipart_threshold:
+                self._client.get_object_to_file(bucket_name, key, tmp_file,
+                                                progress_callback=progress.file_callback(),
+                                                config=self._config)
+            elif not self._client.get_super_object_to_file(
+                    bucket_name, key, tmp_file, chunk_size=self._part_size,
+                    thread_num=self._part_thread_num,
+                    progress_callback=progress.file_callback(), config=self._config):
+                raise BceClientError("multipart download of %s failed" % file_name)
+            os.utime(tmp_file, (item.last_modified_time, item.last_modified_time))
+            getattr(os, 'replace', os.rename)(tmp_file, file_name)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+        return True
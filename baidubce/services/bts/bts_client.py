@@ -14,13 +14,20 @@
 This module provides a client class for BTS.
 """
 
+import collections
 import copy
-import json
 import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+from baidubce import compat
+from baidubce import json_codec
+from baidubce import utils
 from baidubce.auth import bce_v1_signer
 from baidubce.bce_base_client import BceBaseClient
 from baidubce.exception import BceClientError
+from baidubce.exception import BceError
 from baidubce.http import bce_http_client
 from baidubce.http import handler
 from baidubce.http import http_content_types
@@ -43,6 +50,76 @@ from baidubce.services.bts.util import _encode
 
 _logger = logging.getLogger(__name__)
 
+_ROWS_PREFIX = '{"rows":['
+_ROWS_SUFFIX = ']}'
+
+# error codes of a 400 rejecting a batch put for the content of some of its rows
+_ROW_ERROR_CODES = frozenset(['InvalidArgument', 'InvalidParameter'])
+# times a rejected batch put is split in halves before all of its rows are reported
+_MAX_SPLIT_DEPTH = 10
+
+
+def _encode_row(row):
+    """
+    build the request dict of a Row or a row dict, with the rowkey and the cell values encoded;
+    the row and its cells are left untouched
+
+    :param row: row to put
+    :type row: Row or dict
+
+    :return: the row dict to send
+    :rtype dict
+    """
+    if isinstance(row, Row):
+        row = row.to_dict()
+    elif not isinstance(row, dict):
+        raise BceClientError(INVALID_ARGS_ERROR)
+    if row.get("rowkey") == "":
+        raise BceClientError(INVALID_ARGS_ERROR)
+    row_data = dict(row)
+    row_data["rowkey"] = _encode(row["rowkey"])
+    if "cells" in row:
+        row_data["cells"] = [dict(cell, value=_encode(cell["value"])) for cell in row["cells"]]
+    return row_data
+
+
+def _decode_row(row):
+    """
+    decode the rowkey and the cell values of a row of a scan page
+    """
+    row = dict(row)
+    row["rowkey"] = _decode(str(row["rowkey"]))
+    if "cells" in row:
+        row["cells"] = [dict(cell, value=_decode(str(cell["value"]))) for cell in row["cells"]]
+    return row
+
+
+@handler.json_body_parser
+def _parse_scan_page(http_response, response, keep_raw_data=True, lazy=False, codec=None):
+    """
+    set response.result to the rows of a scan response as decoded json, without building
+    python objects
+    """
+    body = http_response.read()
+    if codec is None:
+        codec = json_codec.STDLIB_CODEC
+    response.result = (codec.loads(body).get("result") or []) if body else []
+    http_response.close()
+    return True
+
+
+def _put_page(pages, page, stopped):
+    """
+    put a page into the queue unless the scan is stopped, return whether it was put
+    """
+    while not stopped.is_set():
+        try:
+            pages.put(page, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
 
 class BtsClient(BceBaseClient):
     """
@@ -70,7 +147,7 @@ class BtsClient(BceBaseClient):
         if create_instance_args is None:
             create_instance_args = CreateInstanceArgs()
         return self._send_request(http_methods.PUT, path=path, config=config,
-                                  body=json.dumps(create_instance_args, default=create_instance_args_2_dict),
+                                  body=self._json_dumps(create_instance_args, default=create_instance_args_2_dict),
                                   headers={http_headers.CONTENT_TYPE: http_content_types.JSON})
 
     def drop_instance(self, instance_name, config=None):
@@ -135,7 +212,7 @@ class BtsClient(BceBaseClient):
         """
         path = bts.URL_PREFIX + b"/" + instance_name + b"/table/" + table_name
         return self._send_request(http_methods.PUT, path=path, config=config,
-                                  body=json.dumps(create_table_args, default=create_table_args_2_dict),
+                                  body=self._json_dumps(create_table_args, default=create_table_args_2_dict),
                                   headers={http_headers.CONTENT_TYPE: http_content_types.JSON})
 
     def update_table(self, instance_name, table_name, update_table_args, config=None):
@@ -156,7 +233,7 @@ class BtsClient(BceBaseClient):
         """
         path = bts.URL_PREFIX + b"/" + instance_name + b"/table/" + table_name
         return self._send_request(http_methods.PUT, path=path, config=config,
-                                  body=json.dumps(update_table_args, default=update_table_args_2_dict),
+                                  body=self._json_dumps(update_table_args, default=update_table_args_2_dict),
                                   headers={http_headers.CONTENT_TYPE: http_content_types.JSON})
 
     def drop_table(self, instance_name, table_name, config=None):
@@ -247,7 +324,7 @@ class BtsClient(BceBaseClient):
         except Exception as ex:
             raise ex
 
-        body = json.dumps(row_data)
+        body = self._json_dumps(row_data)
         path = bts.URL_PREFIX + b"/" + instance_name + b"/table/" + table_name + b"/row"
         return self._send_request(http_methods.PUT, path=path, config=config,
                                   body=body,
@@ -274,32 +351,118 @@ class BtsClient(BceBaseClient):
             _logger.debug(ex)
             raise ex
 
-        rows_data = []
-        for row in batch_put_row_args.rows:
-            try:
-                if isinstance(row, Row):
-                    row_data = row.to_dict()
-                    if row_data["rowkey"] == "":
-                        raise BceClientError(INVALID_ARGS_ERROR)
-                elif isinstance(row, dict):
-                    row_data = copy.deepcopy(row)
-                    if row_data.get("rowkey") == "":
-                        raise BceClientError(INVALID_ARGS_ERROR)
-                else:
-                    raise BceClientError(INVALID_ARGS_ERROR)
-                row_data["rowkey"] = _encode(row_data["rowkey"])
-                for cell in row_data.get("cells", []):
-                    cell["value"] = _encode(cell["value"])
-                rows_data.append(row_data)
-            except Exception as ex:
-                raise ex
+        rows_data = [_encode_row(row) for row in batch_put_row_args.rows]
 
-        body = json.dumps({'rows': rows_data})
+        body = self._json_dumps({'rows': rows_data})
         path = bts.URL_PREFIX + b"/" + instance_name + b"/table/" + table_name + b"/rows"
         return self._send_request(http_methods.PUT, path=path, config=config,
                                   body=body,
                                   headers={http_headers.CONTENT_TYPE: http_content_types.JSON})
 
+    def bulk_put_rows(self, instance_name, table_name, rows, max_rows_per_request=1000,
+                      max_bytes_per_request=4 * 1024 * 1024, max_workers=4, max_retries=1,
+                      config=None):
+        """
+        put rows with concurrent batch put requests
+
+        The rows are consumed incrementally and cut into requests of at most
+        max_rows_per_request rows and max_bytes_per_request bytes of json, at most max_workers
+        requests are sent at the same time. A request rejected as too large (413) or for the
+        content of some of its rows is split in halves until the rejected rows are isolated,
+        at most 10 times. Other invalid requests are reported at once, other failures are
+        retried up to max_retries times on top of the retry policy of the configuration, so
+        only the rows that could not be put are reported.
+
+        :param instance_name: instance name
+        :type instance_name: string
+        :param table_name: table name
+        :type table_name: string
+        :param rows: Row or row dict, as in BatchPutRowArgs.rows
+        :type rows: iterable
+        :param max_rows_per_request: max number of rows of a request
+        :type max_rows_per_request: int
+        :param max_bytes_per_request: max size in bytes of the body of a request
+        :type max_bytes_per_request: int
+        :param max_workers: max number of requests sent at the same time
+        :type max_workers: int
+        :param max_retries: number of times a failed request is sent again
+        :type max_retries: int
+        :param config: None
+        :type config: BceClientConfiguration
+
+        :return: the rows that could not be put, as (row, error) tuples
+        :rtype list
+        """
+        if max_rows_per_request <= 0 or max_workers <= 0:
+            raise ValueError("max_rows_per_request and max_workers should be positive")
+        path = bts.URL_PREFIX + b"/" + instance_name + b"/table/" + table_name + b"/rows"
+        failures = []
+        executor = ThreadPoolExecutor(max_workers)
+        pending = collections.deque()
+        try:
+            for chunk_rows, chunk_encoded in self._chunk_rows(rows, max_rows_per_request,
+                                                               max_bytes_per_request):
+                if len(pending) >= 2 * max_workers:
+                    failures.extend(pending.popleft().result())
+                pending.append(executor.submit(self._put_chunk, path, chunk_rows,
+                                               chunk_encoded, max_retries, config))
+            while pending:
+                failures.extend(pending.popleft().result())
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+        return failures
+
+    def _chunk_rows(self, rows, max_rows, max_bytes):
+        """
+        yield the rows of each request with the json of their encoded rows
+        """
+        chunk_rows = []
+        chunk_encoded = []
+        size = len(_ROWS_PREFIX) + len(_ROWS_SUFFIX)
+        for row in rows:
+            encoded = self._json_dumps(_encode_row(row))
+            encoded_size = len(compat.convert_to_bytes(encoded))
+            if chunk_rows and (len(chunk_rows) >= max_rows
+                               or size + encoded_size + 1 > max_bytes):
+                yield chunk_rows, chunk_encoded
+                chunk_rows = []
+                chunk_encoded = []
+                size = len(_ROWS_PREFIX) + len(_ROWS_SUFFIX)
+            chunk_rows.append(row)
+            chunk_encoded.append(encoded)
+            size += encoded_size + 1
+        if chunk_rows:
+            yield chunk_rows, chunk_encoded
+
+    def _put_chunk(self, path, rows, encoded, max_retries, config, depth=0):
+        """
+        send the rows of a request, return the (row, error) of those that were not put
+        """
+        retries = 0
+        while True:
+            try:
+                self._send_request(http_methods.PUT, path=path, config=config,
+                                   body=_ROWS_PREFIX + ','.join(encoded) + _ROWS_SUFFIX,
+                                   headers={http_headers.CONTENT_TYPE: http_content_types.JSON})
+                return []
+            except BceError as e:
+                status_code = getattr(e, 'status_code', None)
+                if status_code == 413 or (status_code == 400
+                                          and getattr(e, 'code', None) in _ROW_ERROR_CODES):
+                    if len(rows) == 1 or depth >= _MAX_SPLIT_DEPTH:
+                        return [(row, e) for row in rows]
+                    half = len(rows) // 2
+                    return self._put_chunk(path, rows[:half], encoded[:half], max_retries,
+                                           config, depth + 1) + \
+                        self._put_chunk(path, rows[half:], encoded[half:], max_retries, config,
+                                        depth + 1)
+                if status_code == 400 or retries >= max_retries:
+                    return [(row, e) for row in rows]
+                retries += 1
+                _logger.debug("retry a batch put of %d rows: %s", len(rows), e)
+
     def delete_row(self, instance_name, table_name, delete_row_args, config=None):
         """
         delete row
@@ -336,7 +499,7 @@ class BtsClient(BceBaseClient):
         except Exception as ex:
             raise ex
 
-        body = json.dumps(delete_row_data)
+        body = self._json_dumps(delete_row_data)
         path = bts.URL_PREFIX + b"/" + instance_name + b"/table/" + table_name + b"/row"
         return self._send_request(http_methods.DELETE, path=path, config=config,
                               body=body,
@@ -379,7 +542,7 @@ class BtsClient(BceBaseClient):
             raise ex
 
         batch_delete_row_data = {'rows': rows_data}
-        body = json.dumps(batch_delete_row_data)
+        body = self._json_dumps(batch_delete_row_data)
         path = bts.URL_PREFIX + b"/" + instance_name + b"/table/" + table_name + b"/rows"
         return self._send_request(http_methods.DELETE, path=path, config=config,
                                 body=body,
@@ -425,7 +588,7 @@ class BtsClient(BceBaseClient):
                 else:
                     raise BceClientError(INVALID_ARGS_ERROR)
 
-        body = json.dumps(get_row_data)
+        body = self._json_dumps(get_row_data)
         path = bts.URL_PREFIX + b"/" + instance_name + b"/table/" + table_name + b"/row"
         response = self._send_request(http_methods.POST, path=path, config=config,
                                     body=body,
@@ -482,7 +645,7 @@ class BtsClient(BceBaseClient):
         else:
             raise BceClientError(INVALID_ARGS_ERROR)
 
-        body = json.dumps(batch_get_row_data)
+        body = self._json_dumps(batch_get_row_data)
         path = bts.URL_PREFIX + b"/" + instance_name + b"/table/" + table_name + b"/rows"
         response = self._send_request(http_methods.POST, path=path, config=config,
                                     body=body,
@@ -528,7 +691,7 @@ class BtsClient(BceBaseClient):
         if "stopRowkey" in scan_args_dict and scan_args_dict["stopRowkey"]:
             scan_args_dict["stopRowkey"] = _encode(scan_args_dict["stopRowkey"])
 
-        body = json.dumps(scan_args_dict)
+        body = self._json_dumps(scan_args_dict)
         path = bts.URL_PREFIX + b"/" + instance_name + b"/table/" + table_name + b"/rows"
         response = self._send_request(http_methods.GET, path=path, config=config,
                                     body=body,
@@ -544,6 +707,122 @@ class BtsClient(BceBaseClient):
             raise ex
         return response
 
+    def scan_iter(self, instance_name, table_name, scan_args, page_size=1000, segments=1,
+                  split_keys=None, prefetch_pages=1, config=None):
+        """
+        scan rows page by page and yield them one at a time
+
+        Each page is requested from the last rowkey of the previous one, the next page is
+        fetched on a background thread while the rows of the current one are consumed. The key
+        range can be cut at split_keys, or into segments ranges of about the same width, which
+        are scanned at the same time and yielded in key order. At most prefetch_pages pages per
+        range are held besides the one being yielded, and the rowkeys and values are decoded as
+        the rows are yielded.
+
+        :param instance_name: instance name
+        :type instance_name: string
+        :param table_name: table name
+        :type table_name: string
+        :param scan_args: arguments for scan, limit is the total number of rows to yield
+        :type scan_args: ScanArgs
+        :param page_size: max number of rows of a request
+        :type page_size: int
+        :param segments: number of ranges scanned at the same time when split_keys is None
+        :type segments: int
+        :param split_keys: rowkeys cutting the range, in ascending order
+        :type split_keys: list
+        :param prefetch_pages: max number of pages fetched ahead per range
+        :type prefetch_pages: int
+        :param config: None
+        :type config: BceClientConfiguration
+
+        :return: rows as {"rowkey": rowkey, "cells": [{"column": column, "value": value, ...}]}
+        :rtype generator
+        """
+        if isinstance(scan_args, ScanArgs):
+            args = scan_args.to_dict()
+        elif isinstance(scan_args, dict):
+            args = dict(scan_args)
+        else:
+            raise BceClientError(INVALID_ARGS_ERROR)
+        if page_size <= 0 or segments <= 0 or prefetch_pages <= 0:
+            raise ValueError("page_size, segments and prefetch_pages should be positive")
+        # the range is cut between rowkeys as sent, the table is in the order of encoded rowkeys
+        start = _encode(args["startRowkey"]) if args.get("startRowkey") else ""
+        stop = _encode(args["stopRowkey"]) if args.get("stopRowkey") else ""
+        if split_keys is not None:
+            split_keys = [_encode(key) for key in split_keys]
+        elif segments > 1:
+            split_keys = utils.split_key_range(start, stop, segments)
+        else:
+            split_keys = []
+        bounds = [start] + split_keys + [stop]
+        limit = args.get("limit") or 0
+        path = bts.URL_PREFIX + b"/" + instance_name + b"/table/" + table_name + b"/rows"
+
+        stopped = threading.Event()
+        ranges = []
+        for i in range(len(bounds) - 1):
+            range_args = dict(args)
+            range_args["startRowkey"] = bounds[i]
+            range_args["stopRowkey"] = bounds[i + 1]
+            if i > 0:
+                range_args["includeStart"] = True
+            if i < len(bounds) - 2:
+                range_args["includeStop"] = False
+            pages = queue.Queue(prefetch_pages)
+            thread = threading.Thread(target=self._scan_pages, args=(
+                path, range_args, page_size, limit, pages, stopped, config))
+            thread.daemon = True
+            thread.start()
+            ranges.append(pages)
+
+        count = 0
+        try:
+            for pages in ranges:
+                while True:
+                    rows = pages.get()
+                    if rows is None:
+                        break
+                    if isinstance(rows, Exception):
+                        raise rows
+                    for row in rows:
+                        yield _decode_row(row)
+                        count += 1
+                        if count == limit:
+                            return
+        finally:
+            stopped.set()
+
+    def _scan_pages(self, path, args, page_size, limit, pages, stopped, config):
+        """
+        scan one key range, putting the rows of each page into the pages queue then None, or
+        the error that ended the scan
+        """
+        result = None
+        scanned = 0
+        try:
+            while not stopped.is_set():
+                args["limit"] = min(page_size, limit - scanned) if limit else page_size
+                response = self._send_request(
+                        http_methods.GET, path=path, config=config, body=self._json_dumps(args),
+                        headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
+                        body_parser=_parse_scan_page)
+                rows = response.result
+                if not rows:
+                    break
+                if not _put_page(pages, rows, stopped):
+                    return
+                scanned += len(rows)
+                if limit and scanned >= limit:
+                    break
+                # rowkeys are returned encoded, as sent
+                args["startRowkey"] = rows[-1]["rowkey"]
+                args["includeStart"] = False
+        except Exception as e:
+            result = e
+        _put_page(pages, result, stopped)
+
     def _merge_config(self, config):
         if config is None:
             return self.config
@@ -2,7 +2,6 @@
 This module provides a client class for CA.
 """
 import copy
-import json
 import uuid
 
 from baidubce import bce_base_client, compat
@@ -61,7 +60,7 @@ class CaClient(bce_base_client.BceBaseClient):
         body = {
             "hosts": instance_list
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body))
 
     def create_action(self, execution=None, user_id=None, action=None, targets=None,
                       parameters=None, target_selector=None, target_selector_type=None):
@@ -106,7 +105,7 @@ class CaClient(bce_base_client.BceBaseClient):
             "targetSelector": target_selector,
             "targetSelectorType": target_selector_type
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body))
 
     def delete_action(self, id):
         """
@@ -151,7 +150,7 @@ class CaClient(bce_base_client.BceBaseClient):
             "action": action,
             "execution": execution,
         }
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body))
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body))
 
     def action_list(self, action=None, page_no=None, page_size=None, sort=None, ascending=None, user_id=None):
         """
@@ -187,7 +186,7 @@ class CaClient(bce_base_client.BceBaseClient):
             "ascending": ascending,
             "userId": user_id
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body))
 
     def action_run(self, action=None, parameters=None, user_id=None,
                    target_selector_type=None, targets=None, target_selector=None):
@@ -221,7 +220,7 @@ class CaClient(bce_base_client.BceBaseClient):
             "userId": user_id,
             "execution": "RUN"
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body))
 
     def get_action_run(self, id=None, user_id=None):
         """
@@ -304,7 +303,7 @@ class CaClient(bce_base_client.BceBaseClient):
             "isInited": is_inited
         }
         path = b'/ca/actionRun/list'
-        return self._send_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body))
 
     def action_log(self, run_id=None, child_id=None, cursor=None):
         """
@@ -323,4 +322,4 @@ class CaClient(bce_base_client.BceBaseClient):
             "cursor": cursor
         }
         path = b'/ca/log'
-        return self._send_request(http_methods.POST, path, body=json.dumps(body))
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body))
@@ -15,7 +15,6 @@ This module provides a client class for CDN.
 """
 
 import copy
-import json
 import logging
 import baidubce
 
@@ -135,7 +134,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'cacheShare': ''},
-            body=json.dumps({'cacheShare': cache_share}),
+            body=self._json_dumps({'cacheShare': cache_share}),
             config=config)
 
 
@@ -173,7 +172,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'trafficLimit': ''},
-            body=json.dumps({'trafficLimit': traffic_limit}),
+            body=self._json_dumps({'trafficLimit': traffic_limit}),
             config=config)
 
 
@@ -211,7 +210,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'uaAcl': ''},
-            body=json.dumps({'uaAcl': ua_acl}),
+            body=self._json_dumps({'uaAcl': ua_acl}),
             config=config)
 
 
@@ -249,7 +248,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'originProtocol': ''},
-            body=json.dumps({'originProtocol': origin_protocol}),
+            body=self._json_dumps({'originProtocol': origin_protocol}),
             config=config)
 
 
@@ -287,7 +286,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'retryOrigin': ''},
-            body=json.dumps({'retryOrigin': retry_origin}),
+            body=self._json_dumps({'retryOrigin': retry_origin}),
             config=config)
 
 
@@ -325,7 +324,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'ipv6Dispatch': ''},
-            body=json.dumps({'ipv6Dispatch': ipv6_dispatch}),
+            body=self._json_dumps({'ipv6Dispatch': ipv6_dispatch}),
             config=config)
 
 
@@ -363,7 +362,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'quic': ''},
-            body=json.dumps({'quic': quic}),
+            body=self._json_dumps({'quic': quic}),
             config=config)
 
 
@@ -401,7 +400,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'offlineMode': ''},
-            body=json.dumps({'offlineMode': offline_mode}),
+            body=self._json_dumps({'offlineMode': offline_mode}),
             config=config)
 
 
@@ -439,7 +438,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'ocsp': ''},
-            body=json.dumps({'ocsp': ocsp}),
+            body=self._json_dumps({'ocsp': ocsp}),
             config=config)
 
 
@@ -477,7 +476,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'errorPage': ''},
-            body=json.dumps({'errorPage': error_page}),
+            body=self._json_dumps({'errorPage': error_page}),
             config=config)
 
     def get_domain_error_page(self, domain, config=None):
@@ -548,7 +547,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'cors': ''},
-            body=json.dumps({'cors': cors}),
+            body=self._json_dumps({'cors': cors}),
             config=config)
 
     def get_domain_cors(self, domain, config=None):
@@ -584,7 +583,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'accessLimit': ''},
-            body=json.dumps({'accessLimit': access_limit}),
+            body=self._json_dumps({'accessLimit': access_limit}),
             config=config)
 
     def get_domain_access_limit(self, domain, config=None):
@@ -620,7 +619,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'clientIp': ''},
-            body=json.dumps({'clientIp': client_ip}),
+            body=self._json_dumps({'clientIp': client_ip}),
             config=config)
 
     def get_domain_client_ip(self, domain, config=None):
@@ -656,7 +655,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'rangeSwitch': ''},
-            body=json.dumps({'rangeSwitch': range_switch}),
+            body=self._json_dumps({'rangeSwitch': range_switch}),
             config=config)
 
     def get_domain_range_switch(self, domain, config=None):
@@ -692,7 +691,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'mobileAccess': ''},
-            body=json.dumps({'mobileAccess': mobile_access}),
+            body=self._json_dumps({'mobileAccess': mobile_access}),
             config=config)
 
     def get_domain_mobile_access(self, domain, config=None):
@@ -728,7 +727,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'httpHeader': ''},
-            body=json.dumps({'httpHeader': http_header}),
+            body=self._json_dumps({'httpHeader': http_header}),
             config=config)
 
     def get_domain_http_header(self, domain, config=None):
@@ -764,7 +763,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'fileTrim': ''},
-            body=json.dumps({'fileTrim': file_trim}),
+            body=self._json_dumps({'fileTrim': file_trim}),
             config=config)
 
     def get_domain_file_trim(self, domain, config=None):
@@ -800,7 +799,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'mediaDrag': ''},
-            body=json.dumps({'mediaDragConf': media_drag}),
+            body=self._json_dumps({'mediaDragConf': media_drag}),
             config=config)
 
     def get_domain_media_drag(self, domain, config=None):
@@ -836,7 +835,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'compress': ''},
-            body=json.dumps({'compress': compress}),
+            body=self._json_dumps({'compress': compress}),
             config=config)
 
     def get_domain_compress(self, domain, config=None):
@@ -915,7 +914,7 @@ class CdnClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.PUT,
             '/dsa',
-            body=json.dumps({'action': action}),
+            body=self._json_dumps({'action': action}),
             config=config)
 
     def set_domain_dsa(self, domain, dsa, config=None):
@@ -935,7 +934,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'dsa': ''},
-            body=json.dumps({'dsa': dsa}),
+            body=self._json_dumps({'dsa': dsa}),
             config=config)
 
     def get_dsa_domains(self, config=None):
@@ -964,7 +963,7 @@ class CdnClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.POST,
             '/log/list',
-            body=json.dumps(log),
+            body=self._json_dumps(log),
             config=config)
 
     def create_domain(self, domain, origin, other=None, config=None):
@@ -989,7 +988,7 @@ class CdnClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.PUT,
             '/domain/' + domain,
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             config=config)
 
     def delete_domain(self, domain, config=None):
@@ -1078,7 +1077,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'multiConfigs': ''},
-            body=json.dumps({'multiConfigs': multi_configs}),
+            body=self._json_dumps({'multiConfigs': multi_configs}),
             config=config)
 
     def set_domain_origin(self, domain, origin, other=None, config=None):
@@ -1104,7 +1103,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'origin': ''},
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             config=config)
 
     def get_domain_cache_ttl(self, domain, config=None):
@@ -1141,7 +1140,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'cacheTTL': ''},
-            body=json.dumps({'cacheTTL': rules}),
+            body=self._json_dumps({'cacheTTL': rules}),
             config=config)
 
     def set_domain_cache_full_url(self, domain, flag, config=None):
@@ -1161,7 +1160,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'cacheFullUrl': ''},
-            body=json.dumps({'cacheFullUrl': flag}),
+            body=self._json_dumps({'cacheFullUrl': flag}),
             config=config)
 
     @required(domain=str)
@@ -1195,7 +1194,7 @@ class CdnClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.PUT, '/domain/' + domain + '/config',
             params={'refererACL': ''},
-            body=json.dumps({'refererACL': acl}),
+            body=self._json_dumps({'refererACL': acl}),
             config=config)
 
     @required(domain=str)
@@ -1224,7 +1223,7 @@ class CdnClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.PUT, '/domain/' + domain + '/config',
             params={'ipACL': ''},
-            body=json.dumps({'ipACL': acl}),
+            body=self._json_dumps({'ipACL': acl}),
             config=config)
 
     @required(domain=str, https=dict)
@@ -1245,7 +1244,7 @@ class CdnClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.PUT, '/domain/' + domain + '/config',
             params={'https': ''},
-            body=json.dumps({'https': https}),
+            body=self._json_dumps({'https': https}),
             config=config)
 
     @required(domain=str, limitRate=int)
@@ -1265,7 +1264,7 @@ class CdnClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.PUT, '/domain/' + domain + '/config',
             params={'limitRate': ''},
-            body=json.dumps({'limitRate': limitRate}),
+            body=self._json_dumps({'limitRate': limitRate}),
             config=config)
 
     @required(domain=str, request_auth=dict)
@@ -1285,7 +1284,7 @@ class CdnClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.PUT, '/domain/' + domain + '/config',
             params={'requestAuth': ''},
-            body=json.dumps({'requestAuth': requestAuth}),
+            body=self._json_dumps({'requestAuth': requestAuth}),
             config=config)
 
     @required(param=CdnStatsParam)
@@ -1303,7 +1302,7 @@ class CdnClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.POST,
             '/stat/query',
-            body=json.dumps(param.__dict__),
+            body=self._json_dumps(param.__dict__),
             config=config)
 
     def get_domain_pv_stat(self, domain=None,
@@ -1634,7 +1633,7 @@ class CdnClient(bce_base_client.BceBaseClient):
         body['tasks'] = tasks
         return self._send_request(
             http_methods.POST, '/cache/purge',
-            config=config, body=json.dumps(body))
+            config=config, body=self._json_dumps(body))
 
     def list_purge_tasks(self, id=None, url=None,
                         startTime=None, endTime=None,
@@ -1690,7 +1689,7 @@ class CdnClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.POST,
             '/cache/prefetch',
-            config=config, body=json.dumps(body))
+            config=config, body=self._json_dumps(body))
 
     def list_prefetch_tasks(self, id=None, url=None,
                             startTime=None, endTime=None,
@@ -1823,7 +1822,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'seoSwitch': ''},
-            body=json.dumps({'seoSwitch': body}),
+            body=self._json_dumps({'seoSwitch': body}),
             config=config)
 
     @required(domain=str)
@@ -1858,7 +1857,7 @@ class CdnClient(bce_base_client.BceBaseClient):
             http_methods.PUT,
             '/domain/' + domain + '/config',
             params={'followProtocol': ''},
-            body=json.dumps({'followProtocol': follow}),
+            body=self._json_dumps({'followProtocol': follow}),
             config=config)
 
     @staticmethod
@@ -17,7 +17,6 @@ This module provides a client class for CERT.
 from __future__ import unicode_literals
 
 import copy
-import json
 import logging
 
 from baidubce import bce_base_client
@@ -80,7 +79,7 @@ class CertClient(bce_base_client.BceBaseClient):
         :rtype: baidubce.bce_response.BceResponse
         """
         return self._send_request(
-            http_methods.POST, '', body=json.dumps(cert_create_request.__dict__),
+            http_methods.POST, '', body=self._json_dumps(cert_create_request.__dict__),
             config=config)
 
     def list_user_certs(self, config=None):
@@ -146,6 +145,6 @@ class CertClient(bce_base_client.BceBaseClient):
         """
         return self._send_request(
             http_methods.PUT, '/' + cert_id,
-            body=json.dumps(cert_create_request.__dict__),
+            body=self._json_dumps(cert_create_request.__dict__),
             params={'certData': ''},
             config=config)
@@ -15,7 +15,6 @@ API Reference: https://cloud.baidu.com/doc/CFC/index.html
 """
 
 import copy
-import json
 import logging
 import baidubce
 import sys
@@ -99,7 +98,7 @@ class CfcClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.POST,
             '/functions/' + function_name + '/invocations',
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params=params,
             config=config, special=True)
 
@@ -216,7 +215,7 @@ class CfcClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.POST,
             '/functions',
-            body=json.dumps(data),
+            body=self._json_dumps(data),
             params=params,
             config=config)
 
@@ -369,7 +368,7 @@ class CfcClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.PUT,
             '/functions/' + function_name + '/code',
-            body=json.dumps(body),
+            body=self._json_dumps(body),
             params={},
             config=config)
 
@@ -447,7 +446,7 @@ class CfcClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.PUT,
             '/functions/' + function_name + '/configuration',
-            body=json.dumps(data),
+            body=self._json_dumps(data),
             params={},
             config=config)
 
@@ -594,7 +593,7 @@ class CfcClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.POST,
             '/functions/' + function_name + "/aliases",
-            body=json.dumps(data),
+            body=self._json_dumps(data),
             params={},
             config=config)
 
@@ -659,7 +658,7 @@ class CfcClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.PUT,
             '/functions/' + function_name + "/aliases/" + alias_name,
-            body=json.dumps(data),
+            body=self._json_dumps(data),
             params={},
             config=config)
 
@@ -788,7 +787,7 @@ class CfcClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.POST,
             '/relation',
-            body=json.dumps(data),
+            body=self._json_dumps(data),
             params={},
             config=config)
 
@@ -845,7 +844,7 @@ class CfcClient(bce_base_client.BceBaseClient):
         return self._send_request(
             http_methods.PUT,
             '/relation',
-            body=json.dumps(data),
+            body=self._json_dumps(data),
             params={},
             config=config)
 
@@ -15,13 +15,15 @@ This module provides general http handler functions for processing http response
 """
 
 import http.client
-import json
 from baidubce.exception import BceClientError
+from baidubce import json_codec
 from baidubce.exception import BceServerError
+from baidubce.http import handler
 from baidubce import utils
 
 
-def parse_json(http_response, response):
+@handler.json_body_parser
+def parse_json(http_response, response, keep_raw_data=True, lazy=False, codec=None):
     """If the body is not empty, convert it to a python object and set as the value of
     response.body. http_response is always closed if no error occurs.
 
@@ -36,7 +38,7 @@ def parse_json(http_response, response):
     """
     body = http_response.read()
     if body:
-        response.__dict__.update(json.loads(body, object_hook=dict_to_python_object).__dict__)
+        response.__dict__.update(handler.load_python_object(body, codec, dict_to_python_object).__dict__)
     http_response.close()
     return True
 
@@ -63,7 +65,7 @@ def parse_error(http_response, response):
     bse = None
     body = http_response.read()
     if body:
-        d = json.loads(body)
+        d = json_codec.loads(body)
         if 'code' in d:
             bse = BceServerError(d['message'], code=d['code'], request_id=d['requestId'])
         else:
@@ -13,7 +13,7 @@
 This module provides models for CFC-SDK.
 """
 
-import json
+from baidubce import json_codec
 
 DUEDGE_TRIGGER = 'duedge'
 
@@ -55,7 +55,7 @@ class AbstractTriggerDataModel(object):
         return ''
 
     def __repr__(self):
-        return '%s' % json.dumps(self.serialize())
+        return '%s' % json_codec.dumps(self.serialize())
 
 
 class CrontabTriggerData(AbstractTriggerDataModel):
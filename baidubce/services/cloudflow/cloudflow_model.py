@@ -5,12 +5,12 @@ cloudflow model module.
 This module defines data structures and enumerations for CloudFlow OpenAPI.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
-import json
 import six
 import base64
 from Crypto.PublicKey import RSA
 from Crypto.Cipher import PKCS1_v1_5
 from baidubce import compat
+from baidubce import json_codec
 
 public_key_pem = b"""-----BEGIN PUBLIC KEY-----
 MIGfMA0GCSqGSIb3DQEBAQUAA4GNADCBiQKBgQChKcFfV3FEDaOv2gTOOlRYm+Yk
@@ -452,7 +452,7 @@ class CreateTaskInfo(object):
         """
         Convert object to json string
         """
-        return json.dumps(self._to_dict())
+        return json_codec.dumps(self._to_dict())
     
 class CreateTaskListInfo(object):
     """
@@ -521,4 +521,4 @@ class CreateTaskListInfo(object):
         """
         Convert object to json string
         """
-        return json.dumps(self._to_dict())
+        return json_codec.dumps(self._to_dict())
@@ -15,7 +15,6 @@
 This module provides a client class for csn.
 """
 
-import json
 import logging
 from urllib.parse import quote
 
@@ -78,7 +77,7 @@ class CsnClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(body))
+                                  api_config["queries"], self._json_dumps(body))
 
     def bind_csn_bp(self, csn_bp_id, csn_id, client_token=None):
         """
@@ -109,7 +108,7 @@ class CsnClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(body))
+                                  api_config["queries"], self._json_dumps(body))
 
     def create_association(self, csn_rt_id, attach_id, description=None, client_token=None):
         """
@@ -144,7 +143,7 @@ class CsnClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(body))
+                                  api_config["queries"], self._json_dumps(body))
 
     def create_csn(self, name, description=None, tags=None, client_token=None):
         """
@@ -180,7 +179,7 @@ class CsnClient(bce_base_client.BceBaseClient):
             tag_list = [tag.__dict__ for tag in tags]
             body['tags'] = tag_list
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(body))
+                                  api_config["queries"], self._json_dumps(body))
 
     def create_csn_bp(self, name, bandwidth, geographic_a, geographic_b, billing,
                       interwork_type=None, tags=None, client_token=None):
@@ -238,7 +237,7 @@ class CsnClient(bce_base_client.BceBaseClient):
             body['tags'] = tag_list
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(body))
+                                  api_config["queries"], self._json_dumps(body))
 
     def create_csn_bp_limit(self, csn_bp_id, local_region, peer_region, bandwidth, client_token=None):
         """
@@ -274,7 +273,7 @@ class CsnClient(bce_base_client.BceBaseClient):
         }
         
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(body))
+                                  api_config["queries"], self._json_dumps(body))
 
     def create_propagation(self, csn_rt_id, attach_id, description=None, client_token=None):
         """
@@ -306,7 +305,7 @@ class CsnClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(body))
+                                  api_config["queries"], self._json_dumps(body))
 
     def create_route_rule(self, csn_rt_id, attach_id, destAddress, routeType="custom", client_token=None):
         """
@@ -347,7 +346,7 @@ class CsnClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(body))
+                                  api_config["queries"], self._json_dumps(body))
 
     def delete_association(self, csn_rt_id=None, attach_id=None, client_token=None):
         """
@@ -456,7 +455,7 @@ class CsnClient(bce_base_client.BceBaseClient):
         }
         
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(body))
+                                  api_config["queries"], self._json_dumps(body))
 
     def delete_propagation(self, csn_rt_id, attach_id, client_token=None):
         """
@@ -559,7 +558,7 @@ class CsnClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(body))
+                                  api_config["queries"], self._json_dumps(body))
 
     def get_csn(self, csn_id):
         """
@@ -634,7 +633,7 @@ class CsnClient(bce_base_client.BceBaseClient):
         if bandwidth is not None:
             body['bandwidth'] = bandwidth
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(body))
+                                  api_config["queries"], self._json_dumps(body))
 
     def list_association(self, csn_rt_id=None):
         """
@@ -928,7 +927,7 @@ class CsnClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(body))
+                                  api_config["queries"], self._json_dumps(body))
 
     def unbind_csn_bp(self, csn_bp_id, csn_id, client_token=None):
         """
@@ -959,7 +958,7 @@ class CsnClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(body))
+                                  api_config["queries"], self._json_dumps(body))
 
     def update_csn(self, csn_id, name=None, description=None, client_token=None):
         """
@@ -993,7 +992,7 @@ class CsnClient(bce_base_client.BceBaseClient):
             "description": description
         }
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(body))
+                                  api_config["queries"], self._json_dumps(body))
 
     def update_csn_bp(self, csn_bp_id, name=None, client_token=None):
         """
@@ -1023,7 +1022,7 @@ class CsnClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(body))
+                                  api_config["queries"], self._json_dumps(body))
 
     def update_csn_bp_limit(self, csn_bp_id, local_region, peer_region, bandwidth, client_token=None):
         """
@@ -1063,7 +1062,7 @@ class CsnClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(body))
+                                  api_config["queries"], self._json_dumps(body))
 
     def update_tgw(self, csn_id=None, tgw_id=None, update_tgw_request=None):
         """
@@ -1090,5 +1089,5 @@ class CsnClient(bce_base_client.BceBaseClient):
         self._add_path_param(api_config, "tgwId", tgw_id)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(update_tgw_request))
+                                  api_config["queries"], self._json_dumps(update_tgw_request))
 
@@ -17,7 +17,6 @@ This module provides a client class for DDC.
 """
 
 import copy
-import json
 
 from baidubce import utils
 from baidubce.auth import bce_v1_signer
@@ -72,7 +71,7 @@ class DdcClient(BceBaseClient):
         if table_name is not None:
             body['tableName'] = table_name
         
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), config=config)
     
     @required(instance_id=(str), db_name=(str), table_name=(str))
     def lazydrop_delete_hard_link(self, instance_id=None, db_name=None, table_name=None, config=None):
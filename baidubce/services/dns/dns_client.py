@@ -15,7 +15,6 @@
 This module provides a client class for dns.
 """
 
-import json
 import logging
 from urllib.parse import quote
 
@@ -53,7 +52,7 @@ class DnsClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "clientToken", client_token)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(add_line_group_request))
+                                  api_config["queries"], self._json_dumps(add_line_group_request))
 
     def create_paid_zone(self, create_paid_zone_request=None, client_token=None):
         """
@@ -75,7 +74,7 @@ class DnsClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "clientToken", client_token)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(create_paid_zone_request))
+                                  api_config["queries"], self._json_dumps(create_paid_zone_request))
 
     def create_record(self, zone_name=None, create_record_request=None, client_token=None):
         """
@@ -102,7 +101,7 @@ class DnsClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "clientToken", client_token)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(create_record_request))
+                                  api_config["queries"], self._json_dumps(create_record_request))
 
     def create_zone(self, create_zone_request=None, client_token=None):
         """
@@ -124,7 +123,7 @@ class DnsClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "clientToken", client_token)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(create_zone_request))
+                                  api_config["queries"], self._json_dumps(create_zone_request))
 
     def delete_line_group(self, line_id=None, client_token=None):
         """
@@ -202,7 +201,7 @@ class DnsClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "clientToken", client_token)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(delete_zone_request))
+                                  api_config["queries"], self._json_dumps(delete_zone_request))
 
     def list_line_group(self, list_line_group_request=None, marker=None, max_keys=None):
         """
@@ -229,7 +228,7 @@ class DnsClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "maxKeys", max_keys)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(list_line_group_request))
+                                  api_config["queries"], self._json_dumps(list_line_group_request))
 
     def list_record(self, zone_name=None, list_record_request=None, rr=None, id=None, marker=None, max_keys=None):
         """
@@ -271,7 +270,7 @@ class DnsClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "maxKeys", max_keys)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(list_record_request))
+                                  api_config["queries"], self._json_dumps(list_record_request))
 
     def list_zone(self, list_zone_request=None, name=None, marker=None, max_keys=None):
         """
@@ -303,7 +302,7 @@ class DnsClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "maxKeys", max_keys)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(list_zone_request))
+                                  api_config["queries"], self._json_dumps(list_zone_request))
 
     def renew_zone(self, name=None, renew_zone_request=None, client_token=None):
         """
@@ -330,7 +329,7 @@ class DnsClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "clientToken", client_token)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(renew_zone_request))
+                                  api_config["queries"], self._json_dumps(renew_zone_request))
 
     def update_line_group(self, line_id=None, update_line_group_request=None, client_token=None):
         """
@@ -357,7 +356,7 @@ class DnsClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "clientToken", client_token)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(update_line_group_request))
+                                  api_config["queries"], self._json_dumps(update_line_group_request))
 
     def update_record(self, zone_name=None, record_id=None, update_record_request=None, client_token=None):
         """
@@ -389,7 +388,7 @@ class DnsClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "clientToken", client_token)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(update_record_request))
+                                  api_config["queries"], self._json_dumps(update_record_request))
 
     def update_record_disable(self, zone_name=None, record_id=None, client_token=None):
         """
@@ -467,5 +466,5 @@ class DnsClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "clientToken", client_token)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(upgrade_zone_request))
+                                  api_config["queries"], self._json_dumps(upgrade_zone_request))
 
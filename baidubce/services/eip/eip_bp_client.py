@@ -19,7 +19,6 @@ This module provides a client class for EIP.
 """
 
 import copy
-import json
 import logging
 import uuid
 
@@ -110,7 +109,7 @@ class EipBpClient(BceBaseClient):
         }
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(id=str, new_bandwidth_in_mbps=int)
@@ -145,7 +144,7 @@ class EipBpClient(BceBaseClient):
             b'clientToken': client_token
         }
         return self._send_request(http_methods.PUT, path, params=params,
-                                  body=json.dumps(body), config=config)
+                                  body=self._json_dumps(body), config=config)
 
     @required(id=str)
     def get_eip_bp_detail(self, id, config=None):
@@ -277,7 +276,7 @@ class EipBpClient(BceBaseClient):
             b'clientToken': client_token
         }
         return self._send_request(http_methods.PUT, path, params=params,
-                                  body=json.dumps(body), config=config)
+                                  body=self._json_dumps(body), config=config)
 
     @required(id=str, name=str)
     def rename_eip_bp(self, id, name, client_token=None,
@@ -311,7 +310,7 @@ class EipBpClient(BceBaseClient):
             b'clientToken': client_token
         }
         return self._send_request(http_methods.PUT, path, params=params,
-                                  body=json.dumps(body), config=config)
+                                  body=self._json_dumps(body), config=config)
 
     @required(id=str)
     def release_eip_bp(self, id, client_token=None, config=None):
@@ -19,7 +19,6 @@ This module provides a client class for EIP.
 """
 
 import copy
-import json
 import logging
 import uuid
 
@@ -137,7 +136,7 @@ class EipClient(BceBaseClient):
         }
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     def resize_eip(self, eip, new_bandwidth_in_mbps, client_token=None,
@@ -171,7 +170,7 @@ class EipClient(BceBaseClient):
             b'clientToken': client_token
         }
         return self._send_request(http_methods.PUT, path, params=params,
-                                  body=json.dumps(body), config=config)
+                                  body=self._json_dumps(body), config=config)
 
     def purchase_reserved_eip(self, eip, billing=None, client_token=None,
                               config=None):
@@ -220,7 +219,7 @@ class EipClient(BceBaseClient):
             b'clientToken': client_token
         }
         return self._send_request(http_methods.PUT, path, params=params,
-                                  body=json.dumps(body), config=config)
+                                  body=self._json_dumps(body), config=config)
     
     def start_auto_renew_eip(self, eip, auto_renew_time_unit=None, auto_renew_time=None, 
                              client_token=None, config=None):
@@ -262,7 +261,7 @@ class EipClient(BceBaseClient):
             b'clientToken': client_token
         }
         return self._send_request(http_methods.PUT, path, params=params,
-                                  body=json.dumps(body), config=config)
+                                  body=self._json_dumps(body), config=config)
     
     def stop_auto_renew_eip(self, eip, client_token=None, config=None):
         """
@@ -334,7 +333,7 @@ class EipClient(BceBaseClient):
             b'clientToken': client_token
         }
         return self._send_request(http_methods.PUT, path, params=params,
-                                  body=json.dumps(body), config=config)
+                                  body=self._json_dumps(body), config=config)
 
     def unbind_eip(self, eip, client_token=None, config=None):
         """
@@ -721,7 +720,7 @@ class EipClient(BceBaseClient):
             b'clientToken': client_token
         }
         return self._send_request(http_methods.PUT, path, params=params,
-                                  body=json.dumps(body), config=config)
+                                  body=self._json_dumps(body), config=config)
 
     def refund_prepay_eip(self, eip, client_token=None, config=None):
         """
@@ -777,7 +776,7 @@ class EipClient(BceBaseClient):
             b'clientToken': client_token
         }
         return self._send_request(http_methods.PUT, path, params=params,
-                                  body=json.dumps(body), config=config)
+                                  body=self._json_dumps(body), config=config)
 
     def create_eip_transfer(self, transfer_type, transfer_resource_list, to_user_id,
                             client_token=None, config=None):
@@ -816,7 +815,7 @@ class EipClient(BceBaseClient):
         }
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   params=params,
                                   config=config)
 
@@ -849,7 +848,7 @@ class EipClient(BceBaseClient):
         }
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   params=params,
                                   config=config)
 
@@ -882,7 +881,7 @@ class EipClient(BceBaseClient):
         }
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   params=params,
                                   config=config)
 
@@ -915,7 +914,7 @@ class EipClient(BceBaseClient):
         }
 
         return self._send_request(http_methods.PUT, path,
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   params=params,
                                   config=config)
 
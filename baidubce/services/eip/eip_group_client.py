@@ -19,7 +19,6 @@ This module provides a client class for EIP group.
 """
 
 import copy
-import json
 import logging
 import uuid
 
@@ -152,7 +151,7 @@ class EipGroupClient(bce_base_client.BceBaseClient):
         if resource_group_id is not None:
             body['resourceGroupId'] = resource_group_id
         return self._send_request(http_methods.POST,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     def list_eip_groups(self, id=None, name=None, status=None,
@@ -264,7 +263,7 @@ class EipGroupClient(bce_base_client.BceBaseClient):
             'name': name
         }
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(id=(bytes, str), bandwidth_in_mbps=int)
@@ -307,7 +306,7 @@ class EipGroupClient(bce_base_client.BceBaseClient):
             'bandwidthInMbps': bandwidth_in_mbps
         }
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(id=(bytes, str))
@@ -355,7 +354,7 @@ class EipGroupClient(bce_base_client.BceBaseClient):
             body['eipv6AddCount'] = eipv6_add_count
 
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(id=(bytes, str))
@@ -402,7 +401,7 @@ class EipGroupClient(bce_base_client.BceBaseClient):
         if eipv6_add_count is not None:
             body['eipv6AddCount'] = eipv6_add_count
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(id=(bytes, str))
@@ -446,7 +445,7 @@ class EipGroupClient(bce_base_client.BceBaseClient):
             'billing': billing.__dict__
         }
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(id=(bytes, str))
@@ -514,7 +513,7 @@ class EipGroupClient(bce_base_client.BceBaseClient):
         body = {
             "moveOutEips": move_out_eips
         }
-        json_body = json.dumps(body)
+        json_body = self._json_dumps(body)
 
         return self._send_request(http_methods.PUT, path, params=params, body=json_body, config=config)
 
@@ -547,7 +546,7 @@ class EipGroupClient(bce_base_client.BceBaseClient):
         body = {
             "eips": eips
         }
-        json_body = json.dumps(body)
+        json_body = self._json_dumps(body)
 
         return self._send_request(http_methods.PUT, path, params=params, body=json_body, config=config)
 
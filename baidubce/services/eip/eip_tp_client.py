@@ -19,7 +19,6 @@ This module provides a client class for EIP TP.
 """
 
 import copy
-import json
 import logging
 import uuid
 
@@ -97,7 +96,7 @@ class EipTpClient(BceBaseClient):
             b'clientToken': client_token
         }
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(reservation_length=int, capacity=str)
@@ -151,7 +150,7 @@ class EipTpClient(BceBaseClient):
         }
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(id=str)
@@ -16,7 +16,6 @@
 This module provides a client class for ENDPOINT.
 """
 import copy
-import json
 import logging
 import uuid
 
@@ -181,7 +180,7 @@ class EndpointClient(BceBaseClient):
             body['tags'] = tags
         if resource_group_id is not None:
             body['resourceGroupId'] = resource_group_id
-        return self._send_request(http_methods.POST, EndpointClient.path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.POST, EndpointClient.path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     def delete_endpoint(self, endpoint_id, client_token=None, config=None):
@@ -342,7 +341,7 @@ class EndpointClient(BceBaseClient):
         if name is not None:
             body['name'] = name
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     def update_endpoint_sg(self, endpoint_id, security_group_list, action=b'bindSg', client_token=None, config=None):
@@ -386,7 +385,7 @@ class EndpointClient(BceBaseClient):
             "securityGroupIds": security_group_list
         }
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     def update_endpoint_enterprise_sg(self, endpoint_id, enterprise_sg_list,
@@ -431,5 +430,5 @@ class EndpointClient(BceBaseClient):
             'enterpriseSecurityGroupIds': enterprise_sg_list
         }
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params,
                                   config=config)
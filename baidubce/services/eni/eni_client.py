@@ -18,7 +18,6 @@ This module provides a client class for ENI.
 """
 
 import copy
-import json
 import logging
 import uuid
 
@@ -152,7 +151,7 @@ class EniClient(bce_base_client.BceBaseClient):
         if network_interface_traffic_mode is not None:
             body['networkInterfaceTrafficMode'] = compat.convert_to_string(network_interface_traffic_mode)
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params,
                                   config=config)
     
     @required(eni_id=(bytes, str))
@@ -221,7 +220,7 @@ class EniClient(bce_base_client.BceBaseClient):
             body['name'] = compat.convert_to_string(name)
         if description is not None:
             body['description'] = compat.convert_to_string(description)
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(vpc_id=(bytes, str), instance_id=(bytes, str), name=(bytes, str), private_ip_address_list=list, 
@@ -310,7 +309,7 @@ class EniClient(bce_base_client.BceBaseClient):
         body['privateIpAddress'] = compat.convert_to_string(private_ip_address)
         if is_ipv6 is not None:
             body['isIpv6'] = is_ipv6
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(eni_id=(bytes, str), private_ip_address=(bytes, str))
@@ -394,7 +393,7 @@ class EniClient(bce_base_client.BceBaseClient):
             body['instanceId'] = compat.convert_to_string(instance_id)
         if instance_type is not None:
             body['instanceType'] = compat.convert_to_string(instance_type)
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(eni_id=(bytes, str), instance_id=(bytes, str))
@@ -427,7 +426,7 @@ class EniClient(bce_base_client.BceBaseClient):
         body = {}
         if instance_id is not None:
             body['instanceId'] = compat.convert_to_string(instance_id)
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(eni_id=(bytes, str), security_group_ids=list)
@@ -459,7 +458,7 @@ class EniClient(bce_base_client.BceBaseClient):
         }
         body = {}
         body['securityGroupIds'] = security_group_ids
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(eni_id=(bytes, str), enterprise_security_group_ids=list)
@@ -492,7 +491,7 @@ class EniClient(bce_base_client.BceBaseClient):
         }
         body = {}
         body['enterpriseSecurityGroupIds'] = enterprise_security_group_ids
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(eni_id=(bytes, str), is_ipv6=bool, private_ip_address_list=list, private_ip_address_count=int)
@@ -534,7 +533,7 @@ class EniClient(bce_base_client.BceBaseClient):
             body['isIpv6'] = is_ipv6
         if private_ip_address_count is not None:
             body['privateIpAddressCount'] = private_ip_address_count
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(eni_id=(bytes, str), private_ip_address_list=list)
@@ -567,7 +566,7 @@ class EniClient(bce_base_client.BceBaseClient):
         }
         body = {}
         body['privateIpAddresses'] = private_ip_address_list
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(eni_id=(bytes, str))
@@ -620,7 +619,7 @@ class EniClient(bce_base_client.BceBaseClient):
         body = {}
         body['privateIpAddress'] = compat.convert_to_string(private_ip_address)
         body['publicIpAddress'] = compat.convert_to_string(public_ip_address)
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(eni_id=(bytes, str), public_ip_address=(bytes, str))
@@ -654,7 +653,7 @@ class EniClient(bce_base_client.BceBaseClient):
 
         body = {}
         body['publicIpAddress'] = compat.convert_to_string(public_ip_address)
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
 
@@ -16,7 +16,6 @@ This module provides a client class for esg.
 from __future__ import unicode_literals
 
 import copy
-import json
 import uuid
 
 from baidubce import bce_base_client
@@ -114,7 +113,7 @@ class EsgClient(bce_base_client.BceBaseClient):
         if tags is not None:
             tag_list = [tag.__dict__ for tag in tags]
             body['tags'] = tag_list
-        return self._send_request(http_methods.POST, path, json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, self._json_dumps(body), params=params, config=config)
 
     def list_enterprise_security_groups(self, instance_id=None, marker=None, max_keys=None, config=None):
         """
@@ -222,7 +221,7 @@ class EsgClient(bce_base_client.BceBaseClient):
         body = {
             'rules': rule_list
         }
-        return self._send_request(http_methods.PUT, path, json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body), params=params, config=config)
 
     @required(enterprise_security_group_rule_id=(bytes, str))  # ***Unicode***
     def update_enterprise_security_group_rule(self, enterprise_security_group_rule_id,
@@ -317,9 +316,9 @@ class EsgClient(bce_base_client.BceBaseClient):
             body['remoteIpGroup'] = remote_ip_group
         print("request path =", path)
         print("params =", params)
-        print("body =", json.dumps(body, ensure_ascii=False))
+        print("body =", self._json_dumps(body, ensure_ascii=False))
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body), params=params, config=config)
 
     @required(enterprise_security_group_rule_id=(bytes, str))  # ***Unicode***
     def delete_enterprise_security_group_rule(self, enterprise_security_group_rule_id, client_token=None, config=None):
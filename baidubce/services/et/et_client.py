@@ -17,7 +17,6 @@ This module provides a client class for Et Channel IPv6.
 """
 
 import copy
-import json
 import uuid
 
 from baidubce import bce_base_client
@@ -171,7 +170,7 @@ class EtClient(bce_base_client.BceBaseClient):
         if link_delay is not None:
             body['linkDelay'] = link_delay
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     def update_et_dcphy(self, et_id, name=None, description=None, user_name=None,
                         user_phone=None, user_email=None, link_delay=None,
@@ -229,7 +228,7 @@ class EtClient(bce_base_client.BceBaseClient):
         if link_delay is not None:
             body['linkDelay'] = link_delay
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body),
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     def list_et_dcphy(self, status=None, marker=None, max_keys=1000, config=None):
@@ -425,7 +424,7 @@ class EtClient(bce_base_client.BceBaseClient):
         if bgp_key is not None:
             body['bgpKey'] = compat.convert_to_string(bgp_key)
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(et_id=(bytes, str))
     def get_et_channel(self, et_id, et_channel_id=None, client_token=None, config=None):
@@ -576,7 +575,7 @@ class EtClient(bce_base_client.BceBaseClient):
         if ipv6_networks is not None:
             body['ipv6Networks'] = ipv6_networks
 
-        return self._send_request(http_methods.PUT, path, params=params, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.PUT, path, params=params, body=self._json_dumps(body), config=config)
 
     @required(et_id=(bytes, str), et_channel_id=(bytes, str))
     def update_et_channel(self, et_id, et_channel_id, name=None, description=None, client_token=None, config=None):
@@ -626,7 +625,7 @@ class EtClient(bce_base_client.BceBaseClient):
         if description is not None:
             body['description'] = compat.convert_to_string(description)
 
-        return self._send_request(http_methods.PUT, path, params=params, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.PUT, path, params=params, body=self._json_dumps(body), config=config)
 
     @required(et_id=(bytes, str), et_channel_id=(bytes, str))
     def delete_et_channel(self, et_id, et_channel_id, client_token=None, config=None):
@@ -716,7 +715,7 @@ class EtClient(bce_base_client.BceBaseClient):
         if ipv6_networks is not None:
             body['ipv6Networks'] = ipv6_networks
 
-        return self._send_request(http_methods.PUT, path, params=params, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.PUT, path, params=params, body=self._json_dumps(body), config=config)
 
     @required(et_id=(bytes, str), et_channel_id=(bytes, str))
     def disable_et_channel_ipv6(self, et_id, et_channel_id, client_token=None, config=None):
@@ -820,7 +819,7 @@ class EtClient(bce_base_client.BceBaseClient):
         if description is not None:
             body['description'] = compat.convert_to_string(description)
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(et_id=(bytes, str), et_channel_id=(bytes, str),
@@ -920,7 +919,7 @@ class EtClient(bce_base_client.BceBaseClient):
         else:
             params[b'clientToken'] = client_token
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(et_id=(bytes, str), et_channel_id=(bytes, str), et_channel_route_rule_id=(bytes, str))
@@ -1005,7 +1004,7 @@ class EtClient(bce_base_client.BceBaseClient):
             'extraChannelId': compat.convert_to_string(extra_channel_id),
         }
 
-        return self._send_request(http_methods.PUT, path, params=params, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.PUT, path, params=params, body=self._json_dumps(body), config=config)
 
     @required(et_id=(bytes, str), et_channel_id=(bytes, str), extra_channel_id=(bytes, str))
     def disassociate_et_channel(self, et_id, et_channel_id, extra_channel_id, client_token=None, config=None):
@@ -1048,7 +1047,7 @@ class EtClient(bce_base_client.BceBaseClient):
             'extraChannelId': compat.convert_to_string(extra_channel_id),
         }
 
-        return self._send_request(http_methods.PUT, path, params=params, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.PUT, path, params=params, body=self._json_dumps(body), config=config)
 
     @required(et_id=(bytes, str), et_channel_id=(bytes, str),
               detect_multiplier=int, send_interval=int, receive_interval=int)
@@ -1103,7 +1102,7 @@ class EtClient(bce_base_client.BceBaseClient):
             'sendInterval': send_interval,
             'receivInterval': receive_interval
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(et_id=(bytes, str), et_channel_id=(bytes, str))
     def delete_et_channel_bfd(self, et_id, et_channel_id, client_token=None, config=None):
@@ -1194,7 +1193,7 @@ class EtClient(bce_base_client.BceBaseClient):
             'sendInterval': send_interval,
             'receivInterval': receive_interval
         }
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
 def generate_client_token_by_uuid():
     """
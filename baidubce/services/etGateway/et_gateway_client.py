@@ -17,7 +17,6 @@ This module provides a client class for Et Gateway.
 """
 
 import copy
-import json
 import uuid
 
 from baidubce import bce_base_client
@@ -165,7 +164,7 @@ class EtGatewayClient(bce_base_client.BceBaseClient):
             body['tags'] = tags
         if resource_group_id is not None:
             body['resourceGroupId'] = resource_group_id
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(et_gateway_id=(bytes, str))
     def update_et_gateway(self, et_gateway_id, name=None, description=None,
@@ -230,7 +229,7 @@ class EtGatewayClient(bce_base_client.BceBaseClient):
         if ipv6_local_cidrs is not None:
             body['ipv6LocalCidrs'] = ipv6_local_cidrs
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(et_gateway_id=(bytes, str))
@@ -300,7 +299,7 @@ class EtGatewayClient(bce_base_client.BceBaseClient):
         }
         if local_cidrs is not None:
             body['localCidrs'] = local_cidrs
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(et_gateway_id=(bytes, str))
     def unbind_et(self, et_gateway_id, client_token=None, config=None):
@@ -461,7 +460,7 @@ class EtGatewayClient(bce_base_client.BceBaseClient):
             body['healthCheckPort'] = health_check_port
         if auto_generate_route_rule is not None:
             body['autoGenerateRouteRule'] = auto_generate_route_rule
-        return self._send_request(http_methods.POST, path, params=param, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.POST, path, params=param, body=self._json_dumps(body), config=config)
 
     @staticmethod
     def _get_path(prefix=None):
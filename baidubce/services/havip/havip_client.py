@@ -15,7 +15,6 @@ This module provides a client class for HAVIP.
 """
 
 import copy
-import json
 import logging
 import uuid
 
@@ -116,7 +115,7 @@ class HavipClient(bce_base_client.BceBaseClient):
             'description': compat.convert_to_string(description)
         }
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     def get_havip_detail_list(self, vpc_id=None, marker=None, max_keys=None, config=None):
@@ -234,7 +233,7 @@ class HavipClient(bce_base_client.BceBaseClient):
             'description': compat.convert_to_string(description)
         }
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(havip_id=(bytes, str))
     def get_havip_detail(self, havip_id, config=None):
@@ -301,7 +300,7 @@ class HavipClient(bce_base_client.BceBaseClient):
             'instanceType': compat.convert_to_string(instance_type)
         }
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(instance_ids=list,
               instance_type=(bytes, str),
@@ -347,7 +346,7 @@ class HavipClient(bce_base_client.BceBaseClient):
             'instanceType': compat.convert_to_string(instance_type)
         }
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(havip_id=(bytes, str),
               public_ip_address=(bytes, str))
@@ -388,7 +387,7 @@ class HavipClient(bce_base_client.BceBaseClient):
             'publicIpAddress': compat.convert_to_string(public_ip_address)
         }
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(havip_id=(bytes, str))
     def havip_unbind_public_ip(self, havip_id, client_token=None, config=None):
@@ -15,7 +15,6 @@ This module provides a client for IAM.
 """
 
 import copy
-import json
 import logging
 
 from future.utils import iteritems
@@ -96,7 +95,7 @@ class IamClient(BceBaseClient):
             if not isinstance(create_role_request, dict):
                 raise TypeError(b'create_role_request should be dict')
             else:
-                body = json.dumps(create_role_request)
+                body = self._json_dumps(create_role_request)
 
         path = b"/role"
         return self._send_iam_request(
@@ -120,7 +119,7 @@ class IamClient(BceBaseClient):
             if not isinstance(update_role_request, dict):
                 raise TypeError(b'update_role_request should be dict')
             else:
-                body = json.dumps(update_role_request)
+                body = self._json_dumps(update_role_request)
 
         path = b"/role/" + role_name
         return self._send_iam_request(
@@ -171,7 +170,7 @@ class IamClient(BceBaseClient):
             if not isinstance(create_policy_request, dict):
                 raise TypeError(b'create_policy_request should be dict')
             else:
-                body = json.dumps(create_policy_request)
+                body = self._json_dumps(create_policy_request)
 
         path = b"/policy"
         return self._send_iam_request(
@@ -214,7 +213,7 @@ class IamClient(BceBaseClient):
             if not isinstance(update_policy_request, dict):
                 raise TypeError(b'update_policy_request should be dict')
             else:
-                body = json.dumps(update_policy_request)
+                body = self._json_dumps(update_policy_request)
 
         path = b"/policy/" + policy_name_bytes
         return self._send_iam_request(
@@ -459,7 +458,7 @@ class IamClient(BceBaseClient):
             if not isinstance(create_user_request, dict):
                 raise TypeError(b'create_user_request should be dict')
             else:
-                body = json.dumps(create_user_request)
+                body = self._json_dumps(create_user_request)
 
         path = b'/user'
         return self._send_iam_request(
@@ -497,7 +496,7 @@ class IamClient(BceBaseClient):
             if not isinstance(update_user_request, dict):
                 raise TypeError(b'update_user_request should be dict')
             else:
-                body = json.dumps(update_user_request)
+                body = self._json_dumps(update_user_request)
 
         path = b"/user/" + user_name
         return self._send_iam_request(
@@ -547,7 +546,7 @@ class IamClient(BceBaseClient):
             if not isinstance(update_user_login_profile_request, dict):
                 raise TypeError(b'update_user_login_profile_request should be dict')
             else:
-                body = json.dumps(update_user_login_profile_request)
+                body = self._json_dumps(update_user_login_profile_request)
 
         path = b"/user/" + user_name + b"/loginProfile"
         return self._send_iam_request(
@@ -702,7 +701,7 @@ class IamClient(BceBaseClient):
             if not isinstance(create_group_request, dict):
                 raise TypeError(b'create_group_request should be dict')
             else:
-                body = json.dumps(create_group_request)
+                body = self._json_dumps(create_group_request)
 
         path = b"/group"
         return self._send_iam_request(
@@ -740,7 +739,7 @@ class IamClient(BceBaseClient):
             if not isinstance(update_group_request, dict):
                 raise TypeError(b'update_group_request should be dict')
             else:
-                body = json.dumps(update_group_request)
+                body = self._json_dumps(update_group_request)
 
         path = b"/group/" + group_name
         return self._send_iam_request(
@@ -17,7 +17,6 @@ This module provides a client class for IPv6Gateway.
 """
 
 import copy
-import json
 import logging
 import uuid
 import sys
@@ -143,7 +142,7 @@ class IPv6GatewayClient(bce_base_client.BceBaseClient):
         if delete_protect is not None:
             body['deleteProtect'] = delete_protect
         return self._send_request(http_methods.POST,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(vpc_id=(bytes, str))
@@ -238,7 +237,7 @@ class IPv6GatewayClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body), params=params, config=config)
+                                  path, body=self._json_dumps(body), params=params, config=config)
 
     @required(gateway_id=(bytes, str),
               cidr=(bytes, str))
@@ -274,7 +273,7 @@ class IPv6GatewayClient(bce_base_client.BceBaseClient):
             'cidr': compat.convert_to_string(cidr),
         }
         return self._send_request(http_methods.POST,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(gateway_id=(bytes, str))
@@ -400,7 +399,7 @@ class IPv6GatewayClient(bce_base_client.BceBaseClient):
             'egressBandwidthInMbps': compat.convert_to_string(egress_bandwidthInMbps),
         }
         return self._send_request(http_methods.POST,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(gateway_id=(bytes, str))
@@ -530,7 +529,7 @@ class IPv6GatewayClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(http_methods.PUT,
-                              path, body=json.dumps(body),
+                              path, body=self._json_dumps(body),
                               params=params, config=config)
 
     @required(gateway_id=(bytes, str),
@@ -572,7 +571,7 @@ class IPv6GatewayClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body), 
+                                  path, body=self._json_dumps(body), 
                                   params=params, config=config)
 
 
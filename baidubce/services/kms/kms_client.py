@@ -15,7 +15,6 @@ This module provides a client class for KMS.
 """
 
 import copy
-import json
 import logging
 import random
 import string
@@ -96,7 +95,7 @@ class KmsClient(BceBaseClient):
         body['origin'] = origin
         body['keyUsage'] = keyUsage
         body['rotateCycle'] = rotateCycle
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(limit=int)
@@ -115,7 +114,7 @@ class KmsClient(BceBaseClient):
         body={}
         body['limit'] = limit
         body['marker'] = marker
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keyId=(str, bytes), plaintext=(str, bytes))
@@ -138,7 +137,7 @@ class KmsClient(BceBaseClient):
             base64.b64decode(plaintext)
         except TypeError:
             raise TypeError("please input base64 string")
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keyId=(str, bytes), ciphertext=(str, bytes))
@@ -161,7 +160,7 @@ class KmsClient(BceBaseClient):
             base64.b64decode(ciphertext)
         except TypeError:
             raise TypeError("please input base64 string")
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keyId=(str, bytes), algorithm=(str, bytes), message=(str, bytes))
@@ -210,7 +209,7 @@ class KmsClient(BceBaseClient):
         if keyVersion:
             body['keyVersion'] = keyVersion
 
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keyId=(str, bytes), algorithm=(str, bytes), signature=(str, bytes), message=(str, bytes))
@@ -276,7 +275,7 @@ class KmsClient(BceBaseClient):
         except (binascii.Error, TypeError):
             raise ValueError("message and signature must be base64 encoded")
 
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keyId=(str, bytes), keySpec=(str, bytes))
@@ -301,7 +300,7 @@ class KmsClient(BceBaseClient):
             raise ValueError("only support AES_128 and AES_256")
         body['keySpec'] = keySpec
         body['numberOfBytes'] = numberOfBytes
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
     
     @required(keyId=(str, bytes), rotateCycle=(int))
@@ -319,7 +318,7 @@ class KmsClient(BceBaseClient):
         body={}
         body['keyId'] = keyId
         body['rotateCycle'] = rotateCycle
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keyId=(str, bytes))
@@ -334,7 +333,7 @@ class KmsClient(BceBaseClient):
         params['action'] = b'EnableKey'
         body={}
         body['keyId'] = keyId
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keyId=(str, bytes))
@@ -349,7 +348,7 @@ class KmsClient(BceBaseClient):
         params['action'] = b'DisableKey'
         body={}
         body['keyId'] = keyId
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keyId=(str, bytes), pendingWindowInDays=int)
@@ -370,7 +369,7 @@ class KmsClient(BceBaseClient):
         if pendingWindowInDays > 30 or pendingWindowInDays < 7:
             raise ValueError("please input pendingWindowInDays >=7 and <=30")
         body['pendingWindowInDays'] = pendingWindowInDays
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keyId=(str, bytes))
@@ -385,7 +384,7 @@ class KmsClient(BceBaseClient):
         params['action'] = b'CancelKeyDeletion'
         body={}
         body['keyId'] = keyId
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keyId=(str, bytes))
@@ -400,7 +399,7 @@ class KmsClient(BceBaseClient):
         params['action'] = b'DescribeKey'
         body={}
         body['keyId'] = keyId
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keyId=(str, bytes))
@@ -431,7 +430,7 @@ class KmsClient(BceBaseClient):
         if publicKeyEncoding != "RAW_HEX" and publicKeyEncoding != "BASE64" and publicKeyEncoding != "PEM":
             raise ValueError("only support RAW_HEX or BASE64 or PEM")
         body['publicKeyEncoding'] = publicKeyEncoding
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keyId=(str, bytes), importToken=(str, bytes), encryptedKey=(str, bytes), keySpec=(str, bytes))
@@ -463,7 +462,7 @@ class KmsClient(BceBaseClient):
         body['encryptedKey'] = encryptedKey
         body['keySpec'] = keySpec
         body['keyUsage'] = keyUsage
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keyId=(str, bytes),
@@ -522,7 +521,7 @@ class KmsClient(BceBaseClient):
         if kwargs['encryptedQinv'] is None:
             raise ValueError('arg "encryptedQinv" should not be None')
         body['encryptedRsaKey']['encryptedQinv'] = kwargs['encryptedQinv']
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(keyId=(str, bytes),
@@ -566,7 +565,7 @@ class KmsClient(BceBaseClient):
         if kwargs['encryptedPrivateKey'] is None:
             raise ValueError('arg "encryptedPrivateKey" should not be None')
         body['encryptedSm2Key']['encryptedPrivateKey'] = kwargs['encryptedPrivateKey']
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   params=params, config=config)
 
 
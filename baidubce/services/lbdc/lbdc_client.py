@@ -16,7 +16,6 @@
 This module provides a client class for LBDC.
 """
 import copy
-import json
 import logging
 import uuid
 
@@ -163,7 +162,7 @@ class LbdcClient(BceBaseClient):
             body['renewReservation'] = {
                 'reservationLength': billing.reservation_length
             }
-        return self._send_request(http_methods.POST, LbdcClient.path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.POST, LbdcClient.path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     def upgrade_lbdc(self, lbdc_id, ccu_count, action=b'resize', client_token=None, config=None):
@@ -206,7 +205,7 @@ class LbdcClient(BceBaseClient):
             'ccuCount': ccu_count,
         }
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     def renew_lbdc(self, lbdc_id, billing, action=b'purchaseReserved', client_token=None, config=None):
@@ -252,7 +251,7 @@ class LbdcClient(BceBaseClient):
                 }
             }
         }
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     def list_lbdc(self, lbdc_id=None, name=None, config=None):
@@ -340,7 +339,7 @@ class LbdcClient(BceBaseClient):
             body['name'] = name
         if desc is not None:
             body['desc'] = desc
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     def list_lbdc_blb(self, lbdc_id, config=None):
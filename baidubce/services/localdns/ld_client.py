@@ -15,7 +15,6 @@
 This module provides a client class for ld.
 """
 
-import json
 import logging
 from urllib.parse import quote
 
@@ -57,7 +56,7 @@ class LdClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "clientToken", client_token)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(add_record_request))
+                                  api_config["queries"], self._json_dumps(add_record_request))
 
     def bind_vpc(self, zone_id=None, bind_vpc_request=None, client_token=None):
         """
@@ -83,7 +82,7 @@ class LdClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "clientToken", client_token)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(bind_vpc_request))
+                                  api_config["queries"], self._json_dumps(bind_vpc_request))
 
     def create_private_zone(self, create_private_zone_request=None, client_token=None):
         """
@@ -105,7 +104,7 @@ class LdClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "clientToken", client_token)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(create_private_zone_request))
+                                  api_config["queries"], self._json_dumps(create_private_zone_request))
 
     def delete_private_zone(self, zone_id=None, client_token=None):
         """
@@ -155,7 +154,7 @@ class LdClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "clientToken", client_token)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(delete_record_request))
+                                  api_config["queries"], self._json_dumps(delete_record_request))
 
     def disable_record(self, record_id=None, client_token=None):
         """
@@ -314,7 +313,7 @@ class LdClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "clientToken", client_token)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(unbind_vpc_request))
+                                  api_config["queries"], self._json_dumps(unbind_vpc_request))
 
     def update_record(self, record_id=None, update_record_request=None, client_token=None):
         """
@@ -341,5 +340,5 @@ class LdClient(bce_base_client.BceBaseClient):
         self._add_query(api_config, "clientToken", client_token)
 
         return self._send_request(api_config["method"], quote(api_config["path"]).encode("utf8"), api_config["headers"],
-                                  api_config["queries"], json.dumps(update_record_request))
+                                  api_config["queries"], self._json_dumps(update_record_request))
 
@@ -15,7 +15,6 @@ This module provides a client class for Media.
 """
 
 import copy
-import json
 import logging
 #from baidubce import bce_base_client
 from baidubce.bce_base_client import BceBaseClient
@@ -105,7 +104,7 @@ class MediaClient(BceBaseClient):
         return self._send_request(
             http_methods.POST,
             '/job/transcoding',
-            body=json.dumps({
+            body=self._json_dumps({
                 'pipelineName': pipeline_name,
                 'source': source,
                 'target': target}),
@@ -229,7 +228,7 @@ class MediaClient(BceBaseClient):
         return self._send_request(
             http_methods.POST,
             '/pipeline',
-            body=json.dumps(body_content),
+            body=self._json_dumps(body_content),
             headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
             config=config)
 
@@ -255,7 +254,7 @@ class MediaClient(BceBaseClient):
         return self._send_request(
             http_methods.PUT,
             '/pipeline/' + pipeline_name,
-            body=json.dumps(pipeline, default=lambda o: o.__dict__),
+            body=self._json_dumps(pipeline, default=lambda o: o.__dict__),
             headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
             config=config)
 
@@ -373,7 +372,7 @@ class MediaClient(BceBaseClient):
         return self._send_request(
             http_methods.POST,
             '/preset',
-            body=json.dumps(body_content),
+            body=self._json_dumps(body_content),
             headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
             config=config)
 
@@ -399,7 +398,7 @@ class MediaClient(BceBaseClient):
         return self._send_request(
             http_methods.PUT,
             '/preset/' + preset_name,
-            body=json.dumps(preset, default=lambda o: o.__dict__),
+            body=self._json_dumps(preset, default=lambda o: o.__dict__),
             headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
             config=config)
 
@@ -476,7 +475,7 @@ class MediaClient(BceBaseClient):
         return self._send_request(
             http_methods.POST,
             '/job/thumbnail',
-            body=json.dumps(body_content),
+            body=self._json_dumps(body_content),
             headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
             config=config)
 
@@ -579,7 +578,7 @@ class MediaClient(BceBaseClient):
         return self._send_request(
             http_methods.POST,
             '/watermark',
-            body=json.dumps(body_content),
+            body=self._json_dumps(body_content),
             headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
             config=config)
 
@@ -668,7 +667,7 @@ class MediaClient(BceBaseClient):
         return self._send_request(
             http_methods.POST,
             '/notification',
-            body=json.dumps(body_content),
+            body=self._json_dumps(body_content),
             headers={http_headers.CONTENT_TYPE: http_content_types.JSON},
             config=config)
 
@@ -14,8 +14,8 @@
 This module provides general http handler functions for processing http responses from media services.
 """
 
-import json
 from baidubce import utils
+from baidubce.http import handler
 
 
 def dict_to_python_object(d):
@@ -33,7 +33,8 @@ def dict_to_python_object(d):
     return utils.Expando(attr)
 
 
-def parse_json(http_response, response):
+@handler.json_body_parser
+def parse_json(http_response, response, keep_raw_data=True, lazy=False, codec=None):
     """If the body is not empty, convert it to a python object and set as the value of
     response.body. http_response is always closed if no error occurs.
 
@@ -49,7 +50,7 @@ def parse_json(http_response, response):
     body = http_response.read()
     if body:
         body = utils.compat.convert_to_string(body)
-        response.__dict__.update(json.loads(body, object_hook=dict_to_python_object).__dict__)
+        response.__dict__.update(handler.load_python_object(body, codec, dict_to_python_object).__dict__)
     http_response.close()
     return True
 
@@ -15,7 +15,6 @@ This module provides a client class for MMS.
 """
 
 import copy
-import json
 import logging
 from builtins import str
 from builtins import bytes
@@ -67,7 +66,7 @@ class MmsClient(BceBaseClient):
                                   b'/v2/videolib',
                                   headers={
                                       b'Content-Type': b'application/json'},
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(lib_id=(bytes, str))
@@ -109,7 +108,7 @@ class MmsClient(BceBaseClient):
                                   b'/v2/imagelib',
                                   headers={
                                       b'Content-Type': b'application/json'},
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(lib_id=(bytes, str))
@@ -141,7 +140,7 @@ class MmsClient(BceBaseClient):
                                   b'/v2/lib/list',
                                   headers={
                                       b'Content-Type': b'application/json'},
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(params=dict)
@@ -165,7 +164,7 @@ class MmsClient(BceBaseClient):
                                   b'/v2/lib/item/list',
                                   headers={
                                       b'Content-Type': b'application/json'},
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(video_lib=(bytes, str), source=(bytes, str))
@@ -194,7 +193,7 @@ class MmsClient(BceBaseClient):
                                       video_lib),
                                   headers={
                                       b'Content-Type': b'application/json'},
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(video_lib=(bytes, str), source=(bytes, str))
@@ -299,7 +298,7 @@ class MmsClient(BceBaseClient):
                                   headers={
                                       b'Content-Type': b'application/json'},
                                   params={b'searchByVideo': b''},
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(video_lib=(bytes, str), source=(bytes, str))
@@ -365,7 +364,7 @@ class MmsClient(BceBaseClient):
                                   headers={
                                       b'Content-Type': b'application/json'},
                                   params={b'searchByImage': b''},
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(image_lib=(bytes, str), source=(bytes, str))
@@ -390,7 +389,7 @@ class MmsClient(BceBaseClient):
                                       image_lib),
                                   headers={
                                       b'Content-Type': b'application/json'},
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(image_lib=(bytes, str), source=(bytes, str))
@@ -454,7 +453,7 @@ class MmsClient(BceBaseClient):
                                   headers={
                                       b'Content-Type': b'application/json'},
                                   params={b'searchByImage': b''},
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @staticmethod
@@ -19,7 +19,6 @@ This module provides a client class for MVS.
 # from baidubce.services.vcr.vcr_client import VcrClient
 
 import copy
-import json
 import logging
 from builtins import str
 from builtins import bytes
@@ -64,7 +63,7 @@ class MvsClient(BceBaseClient):
             body['description'] = description
         return self._send_request(http_methods.PUT, str.encode('/v2/videolib/' + video_lib),
                                   headers={b'Content-Type': b'application/json'},
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(source=(bytes, str))
@@ -90,7 +89,7 @@ class MvsClient(BceBaseClient):
         return self._send_request(http_methods.POST, str.encode('/v2/videolib/' + video_lib),
                                   headers={b'Content-Type': b'application/json'},
                                   params={b'searchByVideo': b''},
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(source=(bytes, str))
@@ -112,7 +111,7 @@ class MvsClient(BceBaseClient):
             body['description'] = description
         return self._send_request(http_methods.PUT, str.encode('/v2/imagelib/' + image_lib),
                                   headers={b'Content-Type': b'application/json'},
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(source=(bytes, str))
@@ -135,7 +134,7 @@ class MvsClient(BceBaseClient):
         return self._send_request(http_methods.POST, str.encode('/v2/imagelib/' + image_lib),
                                   headers={b'Content-Type': b'application/json'},
                                   params={b'searchByImage': b''},
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @staticmethod
@@ -15,7 +15,6 @@ This module provides a client class for OOS.
 """
 
 import copy
-import json
 import uuid
 
 from baidubce.auth import bce_v1_signer
@@ -92,7 +91,7 @@ class OosClient(bce_base_client.BceBaseClient):
             "operators": operators,
             "linear": linear
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body),
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body),
                                   headers=OosClient.headers, config=config)
 
     def check_template(self, name, operators, description="", linear=True, config=None):
@@ -130,7 +129,7 @@ class OosClient(bce_base_client.BceBaseClient):
             "operators": operators,
             "linear": linear
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body),
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body),
                                   headers=OosClient.headers, config=config)
 
     def update_template(self, template_id, name, operators, description="", linear=True, config=None):
@@ -173,7 +172,7 @@ class OosClient(bce_base_client.BceBaseClient):
             "operators": operators,
             "linear": linear
         }
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body),
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body),
                                   headers=OosClient.headers, config=config)
 
     def delete_template(self, template_id, config=None):
@@ -255,7 +254,7 @@ class OosClient(bce_base_client.BceBaseClient):
             "pageNo": page_no,
             "pageSize": page_size
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body),
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body),
                                   headers=OosClient.headers, config=config)
 
     def get_operator_list(self, page_no, page_size, config=None):
@@ -283,7 +282,7 @@ class OosClient(bce_base_client.BceBaseClient):
             "pageNo": page_no,
             "pageSize": page_size
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body),
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body),
                                   headers=OosClient.headers, config=config)
 
     def create_execution(self, template, properties={}, description="", tags=[], config=None):
@@ -321,7 +320,7 @@ class OosClient(bce_base_client.BceBaseClient):
             "description": description,
             "tags": tags
         }
-        return self._send_request(http_methods.POST, path, body=json.dumps(body),
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body),
                                   headers=OosClient.headers, config=config)
 
     def get_execution_detail(self, execution_id, config=None):
@@ -17,7 +17,6 @@ This module provides a client class for probe.
 """
 
 import copy
-import json
 import logging
 import uuid
 import sys
@@ -174,7 +173,7 @@ class ProbeClient(bce_base_client.BceBaseClient):
         if payload is not None:
             body['payload'] = payload
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     def list_probes(self, marker=None, max_keys=None, config=None):
@@ -290,7 +289,7 @@ class ProbeClient(bce_base_client.BceBaseClient):
             body['frequency'] = frequency
         if payload is not None:
             body['payload'] = payload
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body),
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(probe_id=(bytes, str))
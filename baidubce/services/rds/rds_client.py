@@ -17,7 +17,6 @@ This module provides a client class for RDS.
 from __future__ import unicode_literals
 
 import copy
-import json
 import logging
 import random
 import string
@@ -257,7 +256,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         else:
             params['clientToken'] = client_token
         headers = {b'Content-Type': b'application/json'}
-        return self._send_request(http_methods.POST, path, json.dumps(body),
+        return self._send_request(http_methods.POST, path, self._json_dumps(body),
                                   headers=headers, params=params, config=config)
 
     @required(instance_name=(str), source_instance_id=(str), zone_names=list, vpc_id=(str),
@@ -355,7 +354,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_methods.POST, path,
                                params={"clientToken": uuid.uuid4(), "readReplica": ""},
                                headers=headers,
-                               body=json.dumps(data, cls=rds_model.JsonWrapper, indent=4),
+                               body=self._json_dumps(data, cls=rds_model.JsonWrapper, indent=4),
                                config=config)
 
     @required(instance_name=(str), source_instance_id=(str), node_amount=int, zone_names=list,
@@ -439,7 +438,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_methods.POST,
                                b'/instance',
                                params={"clientToken": uuid.uuid4(), "rdsproxy": ""}, headers=headers,
-                               body=json.dumps(data, cls=rds_model.JsonWrapper, indent=4),
+                               body=self._json_dumps(data, cls=rds_model.JsonWrapper, indent=4),
                                config=config)
 
     @required(instance_id=(str))
@@ -636,7 +635,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return rds_model.CreateInstanceResponse(
             self._send_request(http_methods.PUT,
                                path=formatted_url,
-                               body=json.dumps(data),
+                               body=self._json_dumps(data),
                                headers=headers,
                                params={"resize": ""},
                                config=config))
@@ -714,7 +713,7 @@ class RDSClient(bce_base_client.BceBaseClient):
                                   path=formatted_url,
                                   params={"rename": ""},
                                   headers=headers,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   config=config)
 
     @required(instance_id=(str), sync_mode=(str))
@@ -745,7 +744,7 @@ class RDSClient(bce_base_client.BceBaseClient):
                                   path=formatted_url,
                                   params={"modifySyncMode": ""},
                                   headers=headers,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   config=config)
 
     @required(instance_id=(str), sync_mode=(str))
@@ -777,7 +776,7 @@ class RDSClient(bce_base_client.BceBaseClient):
                                   path=formatted_url,
                                   params={"modifyEndpoint": ""},
                                   headers=headers,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   config=config)
 
     @required(instance_id=(str), public_access=bool)
@@ -809,7 +808,7 @@ class RDSClient(bce_base_client.BceBaseClient):
                                   path=formatted_url,
                                   params={"modifyPublicAccess": ""},
                                   headers=headers,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   config=config)
 
     @required(instance_ids=list, auto_renew_time_unit=(str), auto_renew_time=int)
@@ -846,7 +845,7 @@ class RDSClient(bce_base_client.BceBaseClient):
                                   path=b'/instance',
                                   params={"autoRenew": ""},
                                   headers=headers,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   config=config)
 
     def zone(self, config=None):
@@ -913,7 +912,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_methods.POST,
                                path=b'/instance/price',
                                headers=headers,
-                               body=json.dumps(data, cls=rds_model.JsonWrapper, indent=4),
+                               body=self._json_dumps(data, cls=rds_model.JsonWrapper, indent=4),
                                config=config)
 
     @required(order_id=(str))
@@ -963,7 +962,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_method=http_methods.POST,
                                path=b'/instance/renew',
                                headers=headers,
-                               body=json.dumps(data),
+                               body=self._json_dumps(data),
                                config=config)
 
     @required(instance_id=(str), maintain_start_time=(str), maintain_duration=int)
@@ -1003,7 +1002,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_method=http_methods.PUT,
                                   path=formatted_url,
                                   headers=headers,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   config=config)
     # 2. database manager
     @required(instance_id=(str), data=(dict))
@@ -1032,7 +1031,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_method=http_methods.POST,
                                   path=formatted_url,
                                   headers=headers,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   config=config)
 
     @required(instance_id=(str))
@@ -1085,7 +1084,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_method=http_methods.PUT,
                                   path=formatted_url,
                                   headers=headers,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   config=config)
 
     @required(instance_id=(str), db_port=(int))
@@ -1113,7 +1112,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         formatted_url = path.decode().format(instance_id=instance_id).encode()
         return self._send_request(http_method=http_methods.PUT,
                                   path=formatted_url,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   headers=headers,
                                   config=config)
 
@@ -1255,7 +1254,7 @@ class RDSClient(bce_base_client.BceBaseClient):
                                   path=formatted_url,
                                   headers = headers,
                                   params={"modifyBackupPolicy": ""},
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   config=config)
 
     @required(instance_id=(str), effective_time=(str), data_backup_type=(str),
@@ -1305,7 +1304,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_method=http_methods.POST,
                                   path=formatted_url,
                                   headers=headers,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   config=config)
 
     @required(instance_id=(str), snapsho_id=(str))
@@ -1430,7 +1429,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         headers = {b'Content-Type': b'application/json'}
         return self._send_request(http_method=http_methods.PUT,
                                path=formatted_url,
-                               body=json.dumps(data),
+                               body=self._json_dumps(data),
                                headers=headers,
                                config=config)
 
@@ -1483,7 +1482,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_method=http_methods.POST,
                                   path=b'/instance/group/batchjoin',
                                   headers=headers,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   config=config)
 
     def create_group(self, name, leader_id, config=None):
@@ -1513,7 +1512,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_method=http_methods.POST,
                                   path=b'/instance/group',
                                   headers=headers,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   config=config)
 
     def group_list(self, order=None, order_by=None, page_no=None, page_size=None, filter_map_str=None,
@@ -1612,7 +1611,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_method=http_methods.POST,
                                path=b'/instance/group/checkGtid',
                                headers=headers,
-                               body=json.dumps(data),
+                               body=self._json_dumps(data),
                                config=config)
 
     def check_ping_group(self, source_id, target_id, config=None):
@@ -1645,7 +1644,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_method=http_methods.POST,
                                path=b'/instance/group/checkPing',
                                headers=headers,
-                               body=json.dumps(data),
+                               body=self._json_dumps(data),
                                config=config)
 
     def check_data_group(self, instance_id, config=None):
@@ -1674,7 +1673,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_method=http_methods.POST,
                                path=b'/instance/group/checkData',
                                headers=headers,
-                               body=json.dumps(data),
+                               body=self._json_dumps(data),
                                config=config)
 
     def add_instance_to_group(self, group_id, follower_id, config=None):
@@ -1706,7 +1705,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         headers = {b'Content-Type': b'application/json'}
         return self._send_request(http_method=http_methods.POST,
                                   path=formatted_url,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   headers=headers,
                                   config=config)
 
@@ -1735,7 +1734,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         headers = {b'Content-Type': b'application/json'}
         return self._send_request(http_method=http_methods.POST,
                                   path=formatted_url,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   headers=headers,
                                   config=config)
 
@@ -1785,7 +1784,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         headers = {b'Content-Type': b'application/json'}
         return self._send_request(http_method=http_methods.PUT,
                                   path=formatted_url,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   headers=headers,
                                   config=config)
 
@@ -1845,7 +1844,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_method=http_methods.POST,
                                   path=b'/instance/group/checkVersion',
                                   headers=headers,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   config=config)
 
     # 5. log manager
@@ -1917,7 +1916,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_method=http_methods.POST,
                                path=formatted_url,
                                headers=headers,
-                               body=json.dumps(data),
+                               body=self._json_dumps(data),
                                config=config)
 
     @required(instance_id=(str))
@@ -1975,7 +1974,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         headers = {b'Content-Type': b'application/json'}
         return self._send_request(http_method=http_methods.POST,
                                path=formatted_url,
-                               body=json.dumps(data),
+                               body=self._json_dumps(data),
                                headers=headers,
                                config=config)
 
@@ -2082,7 +2081,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         headers={b'Content-Type': b'application/json'}
         return self._send_request(http_method=http_methods.PUT,
                                   path=b'/instance/recycler/recover',
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   headers=headers,
                                   config=config)
 
@@ -2165,7 +2164,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_method=http_methods.POST,
                                path=b'/instance/task',
                                headers=headers,
-                               body=json.dumps(data),
+                               body=self._json_dumps(data),
                                config=config)
 
     # 8.param manager
@@ -2233,7 +2232,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         formatted_url = path.decode().format(instanceId=instance_id).encode()
         return self._send_request(http_method=http_methods.PUT,
                                   path=formatted_url,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   headers=headers,
                                   config=config)
 
@@ -2360,7 +2359,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_method=http_methods.POST,
                                   path=b'/instance/paraTemplate/duplicate/template',
                                   headers=headers,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   config=config)
 
     # security manager
@@ -2411,7 +2410,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         return self._send_request(http_method=http_methods.PUT,
                                   path=formatted_url,
                                   headers=headers,
-                                  body=json.dumps(data),
+                                  body=self._json_dumps(data),
                                   config=config)
 
     @required(instance_id=(str))
@@ -2562,7 +2561,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         headers = {b'Content-Type': b'application/json'}
         return self._send_request(http_method=http_methods.POST,
                                path=formatted_url,
-                               body=json.dumps(data),
+                               body=self._json_dumps(data),
                                headers=headers,
                                config=config)
 
@@ -2643,7 +2642,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         self._send_request(http_method=http_methods.PUT,
                            path=formatted_url,
                            headers=headers,
-                           body=json.dumps(data),
+                           body=self._json_dumps(data),
                            config=config)
 
     @required(instance_id=(str), ro_group_id=(str))
@@ -2743,7 +2742,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         headers = {b'Content-Type': b'application/json'}
         self._send_request(http_method=http_methods.PUT,
                            path=formatted_url,
-                           body=json.dumps(data),
+                           body=self._json_dumps(data),
                            headers=headers,
                            config=config)
 
@@ -2776,7 +2775,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         headers = {b'Content-Type': b'application/json'}
         self._send_request(http_method=http_methods.PUT,
                            path=formatted_url,
-                           body=json.dumps(data),
+                           body=self._json_dumps(data),
                            headers=headers,
                            config=config)
 
@@ -2831,7 +2830,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         self._send_request(http_method=http_methods.PUT,
                            path=formatted_url,
                            headers=headers,
-                           body=json.dumps(data),
+                           body=self._json_dumps(data),
                            config=config)
 
     @required(source_app_id=(str), ro_group_id=(str), read_replica_list=(list))
@@ -2863,7 +2862,7 @@ class RDSClient(bce_base_client.BceBaseClient):
         self._send_request(http_method=http_methods.PUT,
                            path=formatted_url,
                            headers=headers,
-                           body=json.dumps(data),
+                           body=self._json_dumps(data),
                            config=config)
 
     @required(source_app_id=(str), ro_group_id=(str))
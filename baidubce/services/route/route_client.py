@@ -15,7 +15,6 @@ This module provides a client class for ROUTE.
 """
 
 import copy
-import json
 import logging
 import uuid
 
@@ -158,7 +157,7 @@ class RouteClient(bce_base_client.BceBaseClient):
             next_hop_list = [next_hop.__dict__ for next_hop in next_hops]
             body['nextHopList'] = next_hop_list
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(vpc_id=(bytes, str), route_table_id=(bytes, str))
@@ -372,7 +371,7 @@ class RouteClient(bce_base_client.BceBaseClient):
         if source_address is not None:
             body['sourceAddress'] = compat.convert_to_string(source_address)
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
  
 
 def generate_client_token_by_uuid():
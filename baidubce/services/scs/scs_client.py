@@ -19,7 +19,6 @@ This module provides a client class for SCS.
 from __future__ import unicode_literals
 
 import copy
-import json
 import logging
 import uuid
 
@@ -27,12 +26,14 @@ import http.client
 
 import baidubce.services.scs.model as model
 from baidubce import utils
+from baidubce import json_codec
 from baidubce.auth import bce_v1_signer
 from baidubce.bce_base_client import BceBaseClient
 from baidubce.bce_client_configuration import BceClientConfiguration
 from baidubce.exception import BceClientError
 from baidubce.exception import BceServerError
 from baidubce.http import bce_http_client
+from baidubce.http import handler
 from baidubce.http import http_headers
 from baidubce.http import http_methods
 from baidubce.services import scs
@@ -41,13 +42,14 @@ from baidubce.utils import required
 _logger = logging.getLogger(__name__)
 
 
-def _parse_result(http_response, response):
+@handler.json_body_parser
+def _parse_result(http_response, response, keep_raw_data=True, lazy=False, codec=None):
     if http_response.status / 100 == http.client.CONTINUE / 100:
         raise BceClientError('Can not handle 1xx http status code')
     bse = None
     body = http_response.read()
     if body:
-        d = json.loads(body)
+        d = json_codec.loads(body, codec)
 
         if 'message' in d and 'code' in d and 'requestId' in d:
             r_code = d['code']
@@ -57,13 +59,11 @@ def _parse_result(http_response, response):
                                      code=d['code'],
                                      request_id=d['requestId'])
             else:
-                response.__dict__.update(
-                    json.loads(body, object_hook=utils.dict_to_python_object).__dict__)
+                response.__dict__.update(handler.load_python_object(body, codec).__dict__)
                 http_response.close()
                 return True
         elif http_response.status / 100 == http.client.OK / 100:
-            response.__dict__.update(
-                json.loads(body, object_hook=utils.dict_to_python_object).__dict__)
+            response.__dict__.update(handler.load_python_object(body, codec).__dict__)
             http_response.close()
             return True
     elif http_response.status / 100 == http.client.OK / 100:
@@ -172,7 +172,7 @@ class ScsClient(BceBaseClient):
 
         return model.CreateInstanceResponse(self._send_request(http_methods.POST, 'instance',
                                                                params={"clientToken": uuid.uuid4()},
-                                                               body=json.dumps(data, cls=model.JsonWrapper, indent=4),
+                                                               body=self._json_dumps(data, cls=model.JsonWrapper, indent=4),
                                                                config=config,
                                                                api_version=2))
 
@@ -217,7 +217,7 @@ class ScsClient(BceBaseClient):
         }
         key = instance_id + '/resize'
         return model.CreateInstanceResponse(self._send_request(http_methods.PUT, 'instance', key=key,
-                                                               body=json.dumps(data), config=config))
+                                                               body=self._json_dumps(data), config=config))
 
     @required(instance_id=(str))
     def delete_instance(self, instance_id, config=None):
@@ -320,7 +320,7 @@ class ScsClient(BceBaseClient):
         data = {'instanceName': instance_name}
         key = instance_id + '/rename'
         return self._send_request(http_method=http_methods.PUT, function_name='instance', key=key,
-                                  body=json.dumps(data), config=config, api_version=1)
+                                  body=self._json_dumps(data), config=config, api_version=1)
 
     @required(instance_id=(str))
     def restart_instance(self, instance_id, config=None):
@@ -363,7 +363,7 @@ class ScsClient(BceBaseClient):
         data = {'domain': domain}
         key = instance_id + '/renameDomain'
         return self._send_request(http_method=http_methods.PUT, function_name='instance', key=key,
-                                  body=json.dumps(data), config=config, api_version=1)
+                                  body=self._json_dumps(data), config=config, api_version=1)
 
     @required(instance_id=(str), password=(str))
     def flush_instance(self, instance_id, password='', config=None):
@@ -392,7 +392,7 @@ class ScsClient(BceBaseClient):
         }
         key = instance_id + '/flush'
         return self._send_request(http_method=http_methods.PUT, function_name='instance', key=key,
-                                  body=json.dumps(data), config=config, api_version=1)
+                                  body=self._json_dumps(data), config=config, api_version=1)
 
     def list_available_zones(self, config=None):
         """
@@ -452,7 +452,7 @@ class ScsClient(BceBaseClient):
         }
         key = instance_id + '/bindTag'
         return self._send_request(http_method=http_methods.PUT, function_name='instance',
-                                  key=key, body=json.dumps(data, cls=model.JsonWrapper, indent=4), config=config)
+                                  key=key, body=self._json_dumps(data, cls=model.JsonWrapper, indent=4), config=config)
 
     @required(instance_id=(str), change_tags=list)
     def unbind_tags(self, instance_id, change_tags, config=None):
@@ -474,7 +474,7 @@ class ScsClient(BceBaseClient):
         }
         key = instance_id + '/unBindTag'
         return self._send_request(http_method=http_methods.PUT, function_name='instance',
-                                  key=key, body=json.dumps(data, cls=model.JsonWrapper, indent=4), config=config)
+                                  key=key, body=self._json_dumps(data, cls=model.JsonWrapper, indent=4), config=config)
 
     @required(instance_id=(str))
     def set_as_master(self, instance_id, config=None):
@@ -519,7 +519,7 @@ class ScsClient(BceBaseClient):
         }
         key = instance_id + '/setAsSlave'
         return self._send_request(http_method=http_methods.PUT, function_name='instance',
-                                  key=key, body=json.dumps(data), config=config)
+                                  key=key, body=self._json_dumps(data), config=config)
 
     @required(instance_id=(str))
     def list_security_ip(self, instance_id, config=None):
@@ -553,7 +553,7 @@ class ScsClient(BceBaseClient):
         }
         key = instance_id + '/securityIp'
         return self._send_request(http_method=http_methods.PUT, function_name='instance',
-                                  key=key, body=json.dumps(data), config=config)
+                                  key=key, body=self._json_dumps(data), config=config)
 
     @required(instance_id=(str), security_ips=list)
     def delete_security_ips(self, instance_id, security_ips, config=None):
@@ -575,7 +575,7 @@ class ScsClient(BceBaseClient):
         }
         key = instance_id + '/securityIp'
         return self._send_request(http_method=http_methods.DELETE, function_name='instance',
-                                  key=key, body=json.dumps(data), config=config)
+                                  key=key, body=self._json_dumps(data), config=config)
 
     @required(instance_id=(str), password=(str))
     def modify_password(self, instance_id, password, config=None):
@@ -599,7 +599,7 @@ class ScsClient(BceBaseClient):
         }
         key = instance_id + '/modifyPassword'
         return self._send_request(http_method=http_methods.PUT, function_name='instance',
-                                  key=key, body=json.dumps(data), config=config)
+                                  key=key, body=self._json_dumps(data), config=config)
 
     @required(instance_id=(str))
     def list_parameters(self, instance_id, config=None):
@@ -635,7 +635,7 @@ class ScsClient(BceBaseClient):
         }
         key = instance_id + '/parameter'
         return self._send_request(http_method=http_methods.PUT, function_name='instance',
-                                  key=key, body=json.dumps(data), config=config)
+                                  key=key, body=self._json_dumps(data), config=config)
 
     @required(instance_id=(str))
     def list_backups(self, instance_id, config=None):
@@ -688,7 +688,7 @@ class ScsClient(BceBaseClient):
         }
         key = instance_id + '/modifyBackupPolicy'
         return self._send_request(http_method=http_methods.PUT, function_name='instance', key=key,
-                                  body=json.dumps(data), config=config)
+                                  body=self._json_dumps(data), config=config)
 
     @staticmethod
     def _get_path_v1(config, function_name=None, key=None):
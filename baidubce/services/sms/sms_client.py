@@ -19,7 +19,6 @@ This module provides a client class for SMS.
 """
 
 import copy
-import json
 import logging
 import uuid
 
@@ -27,12 +26,14 @@ import http.client
 
 import baidubce.services.sms.model as model
 from baidubce import utils
+from baidubce import json_codec
 from baidubce.auth import bce_v1_signer
 from baidubce.bce_base_client import BceBaseClient
 from baidubce.bce_client_configuration import BceClientConfiguration
 from baidubce.exception import BceClientError
 from baidubce.exception import BceServerError
 from baidubce.http import bce_http_client
+from baidubce.http import handler
 from baidubce.http import http_headers
 from baidubce.http import http_methods
 from baidubce.services import sms
@@ -41,13 +42,14 @@ from baidubce.utils import required
 _logger = logging.getLogger(__name__)
 
 
-def _parse_result(http_response, response):
+@handler.json_body_parser
+def _parse_result(http_response, response, keep_raw_data=True, lazy=False, codec=None):
     if http_response.status / 100 == http.client.CONTINUE / 100:
         raise BceClientError('Can not handle 1xx http status code')
     bse = None
     body = http_response.read()
     if body:
-        d = json.loads(body)
+        d = json_codec.loads(body, codec)
 
         if 'message' in d and 'code' in d and 'requestId' in d:
             r_code = d['code']
@@ -57,13 +59,11 @@ def _parse_result(http_response, response):
                                      code=d['code'],
                                      request_id=d['requestId'])
             else:
-                response.__dict__.update(
-                    json.loads(body, object_hook=utils.dict_to_python_object).__dict__)
+                response.__dict__.update(handler.load_python_object(body, codec).__dict__)
                 http_response.close()
                 return True
         elif http_response.status / 100 == http.client.OK / 100:
-            response.__dict__.update(
-                json.loads(body, object_hook=utils.dict_to_python_object).__dict__)
+            response.__dict__.update(handler.load_python_object(body, codec).__dict__)
             http_response.close()
             return True
     elif http_response.status / 100 == http.client.OK / 100:
@@ -144,7 +144,7 @@ class SmsClient(BceBaseClient):
             'merchantUrlId': merchant_url_id
         }
 
-        return self._send_request(http_methods.POST, 'sendSms', body=json.dumps(data), config=config, api_version=1)
+        return self._send_request(http_methods.POST, 'sendSms', body=self._json_dumps(data), config=config, api_version=1)
 
     @required(content=str, content_type=str, country_type=str)
     def create_signature(self, content, content_type, description=None, country_type="DOMESTIC",
@@ -196,7 +196,7 @@ class SmsClient(BceBaseClient):
             data["signatureFileFormat"] = signature_file_format
         return model.CreateSignatureResponse(self._send_request(http_methods.POST, 'signatureApply',
                                                                 params={"clientToken": uuid.uuid4()},
-                                                                body=json.dumps(data), config=config, api_version=2))
+                                                                body=self._json_dumps(data), config=config, api_version=2))
 
     @required(content=str, content_type=str, country_type=str, signature_id=str)
     def update_signature(self, content, content_type, country_type, signature_id, description=None,
@@ -254,7 +254,7 @@ class SmsClient(BceBaseClient):
         if signature_file_format:
             data["signatureFileFormat"] = signature_file_format
         return self._send_request(http_methods.PUT, 'signatureApply', key=signature_id,
-                                  body=json.dumps(data), config=config, api_version=2)
+                                  body=self._json_dumps(data), config=config, api_version=2)
 
     @required(signature_id=str)
     def get_signature_detail(self, signature_id, config=None):
@@ -338,7 +338,7 @@ class SmsClient(BceBaseClient):
 
         return model.CreateTemplateResponse(self._send_request(http_methods.POST, 'template',
                                                                params={"clientToken": uuid.uuid4()},
-                                                               body=json.dumps(data), config=config, api_version=2))
+                                                               body=self._json_dumps(data), config=config, api_version=2))
 
     @required(template_id=str, name=str, content=str, sms_type=str, country_type=str)
     def update_template(self, template_id, name, content, sms_type, country_type, description=None, config=None):
@@ -378,7 +378,7 @@ class SmsClient(BceBaseClient):
         if description:
             data["description"] = description
         return self._send_request(http_method=http_methods.PUT, function_name='template', key=template_id,
-                                  body=json.dumps(data), config=config, api_version=2)
+                                  body=self._json_dumps(data), config=config, api_version=2)
 
     @required(template_id=str)
     def get_template_detail(self, template_id, config=None):
@@ -479,7 +479,7 @@ class SmsClient(BceBaseClient):
             "rateLimitPerMobilePerSignByHour": rate_limit_per_mobile_per_sign_by_hour,
             "rateLimitPerMobilePerSignByDay": rate_limit_per_mobile_per_sign_by_day
         }
-        return self._send_request(http_methods.PUT, function_name="quota", body=json.dumps(data),
+        return self._send_request(http_methods.PUT, function_name="quota", body=self._json_dumps(data),
                                   config=config, api_version=2)
 
     @staticmethod
@@ -582,7 +582,7 @@ class SmsClient(BceBaseClient):
         if signature_id_str:
             data["signatureIdStr"] = signature_id_str
 
-        return self._send_request(http_methods.POST, function_name="blacklist", body=json.dumps(data),
+        return self._send_request(http_methods.POST, function_name="blacklist", body=self._json_dumps(data),
                                   config=config, api_version=2)
 
     def get_mobile_black(self, phone=None, country_type=None, sms_type=None, signature_id_str=None, start_time=None,
@@ -18,7 +18,6 @@ from future.utils import iteritems
 import copy
 import http.client
 import os
-import json
 import logging
 import shutil
 from builtins import str
@@ -81,9 +80,9 @@ class StsClient(BceBaseClient):
             if not isinstance(acl, dict):
                 raise TypeError(b'acl should be dict')
             if 'id' in acl:
-                body = json.dumps(acl)
+                body = self._json_dumps(acl)
             else:
-                body = json.dumps(acl, default=self._dump_acl_object)
+                body = self._json_dumps(acl, default=self._dump_acl_object)
 
         return self._send_request(
             http_methods.POST,
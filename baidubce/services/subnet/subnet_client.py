@@ -15,7 +15,6 @@ This module provides a client class for SUBNET.
 """
 
 import copy
-import json
 import logging
 import uuid
 
@@ -154,7 +153,7 @@ class SubnetClient(bce_base_client.BceBaseClient):
         if vpc_secondary_cidr is not None:
             body['vpcSecondaryCidr'] = compat.convert_to_string(vpc_secondary_cidr)
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(marker=(bytes, str),
@@ -322,7 +321,7 @@ class SubnetClient(bce_base_client.BceBaseClient):
         if enable_ipv6 is not None:
             body['enableIpv6'] = enable_ipv6
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(subnet_id=(bytes, str),
@@ -375,7 +374,7 @@ class SubnetClient(bce_base_client.BceBaseClient):
         if description is not None:
             body['description'] = compat.convert_to_string(description)
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(subnet_id=(bytes, str),
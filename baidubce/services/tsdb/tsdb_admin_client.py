@@ -15,7 +15,6 @@ This module provides a client class for TSDB.
 """
 
 import copy
-import json
 import logging
 
 from baidubce.auth import bce_v1_signer
@@ -71,7 +70,7 @@ class TsdbAdminClient(BceBaseClient):
 
         path = b"/v1/database"
         params = {"clientToken": client_token}
-        body = json.dumps({
+        body = self._json_dumps({
             "databaseName": database_name.decode(),
             "description": description.decode(),
             "ingestDataPointsMonthly": ingest_datapoints_monthly,
@@ -14,16 +14,15 @@
 This module provides a client class for TSDB.
 """
 
-import io
+import collections
 import copy
-import json
 import logging
-import gzip
 
 from baidubce import bce_client_configuration
 from baidubce import utils
 from baidubce.auth import bce_v1_signer
 from baidubce.bce_base_client import BceBaseClient
+from baidubce.exception import BceClientError
 from baidubce.http import bce_http_client
 from baidubce.http import handler
 from baidubce.http import http_content_types
@@ -54,11 +53,25 @@ class TsdbClient(BceBaseClient):
         :type use_gzip: boolean
         """
 
+        body = self._json_dumps({"datapoints": datapoints}).encode('utf-8')
+        if use_gzip:
+            body = utils.gzip_compress(body)
+        return self.write_encoded_datapoints(body, use_gzip)
+
+    def write_encoded_datapoints(self, body, use_gzip=False):
+        """
+        write datapoints from an already serialized request body, as built by
+        tsdb_datapoint_writer.DatapointWriter
+
+        :param body: json of {"datapoints": [...]}, gzip compressed if use_gzip
+        :type body: bytes
+        :param use_gzip: body is gzip compressed
+        :type use_gzip: boolean
+        """
+
         path = b'/v1/datapoint'
-        body = json.dumps({"datapoints": datapoints}).encode('utf-8')
         headers={http_headers.CONTENT_TYPE: http_content_types.JSON}
         if use_gzip:
-            body = self._gzip_compress(body)
             headers[http_headers.CONTENT_ENCODING] = b'gzip'
         return self._send_request(
                 http_methods.POST,
@@ -122,10 +135,24 @@ class TsdbClient(BceBaseClient):
 
         path = b'/v1/datapoint'
         params = {'query': '', 'disablePresampling': disable_presampling}
-        body = json.dumps({"queries": query_list})
+        body = self._json_dumps({"queries": query_list})
         return self._send_request(http_methods.PUT, path=path, params=params,
                 body=body, body_parser=tsdb_handler.parse_json)
 
+    def _get_datapoint_results(self, query_list, disable_presampling=False):
+        """
+        query datapoints like get_datapoints, the results are left as decoded json
+
+        :return: response whose results is a list of result dicts
+        :rtype: baidubce.bce_response.BceResponse
+        """
+
+        path = b'/v1/datapoint'
+        params = {'query': '', 'disablePresampling': disable_presampling}
+        body = self._json_dumps({"queries": query_list})
+        return self._send_request(http_methods.PUT, path=path, params=params,
+                body=body, body_parser=tsdb_handler.parse_results)
+
     def get_rows_with_sql(self, statement):
         """
         get_rows_with_sql
@@ -142,6 +169,49 @@ class TsdbClient(BceBaseClient):
         return self._send_request(http_methods.GET, path=path, params=params,
                 body_parser=tsdb_handler.parse_json)
 
+    def get_columns_with_sql(self, statement, output_format='array'):
+        """
+        run a sql statement like get_rows_with_sql, decoding the rows straight into columns
+
+        :param statement: sql statement
+        :type statement: string
+        :param output_format: 'array' for the columns of tsdb_handler.decode_columns, 'numpy'
+            for a numpy array per column, int64 or float64 (null is NaN) when the values are
+            numbers and object otherwise, 'pandas' for a pandas.DataFrame of these arrays
+        :type output_format: string
+
+        :return: response whose columns is the list of column names and data is an
+            OrderedDict of column name to values, or a DataFrame
+        :rtype: baidubce.bce_response.BceResponse
+        """
+
+        if output_format not in ('array', 'numpy', 'pandas'):
+            raise ValueError("output_format should be 'array', 'numpy' or 'pandas'")
+        numpy = utils._get_numpy() if output_format != 'array' else None
+        if numpy is False:
+            raise BceClientError("numpy is not installed. Install it with: pip install numpy")
+        pandas = None
+        if output_format == 'pandas':
+            try:
+                import pandas
+            except ImportError:
+                raise BceClientError(
+                        "pandas is not installed. Install it with: pip install pandas")
+
+        path = b'/v1/row'
+        params = {'sql': statement}
+        response = self._send_request(http_methods.GET, path=path, params=params,
+                body_parser=tsdb_handler.parse_columns)
+        if numpy is not None and hasattr(response, 'data'):
+            dtypes = {'q': numpy.int64, 'd': numpy.float64}
+            response.data = collections.OrderedDict(
+                (name, numpy.array(values, dtype=object) if isinstance(values, list)
+                 else numpy.frombuffer(values, dtype=dtypes[values.typecode]))
+                for name, values in response.data.items())
+            if pandas is not None:
+                response.data = pandas.DataFrame(response.data, columns=response.columns)
+        return response
+
     def generate_pre_signed_url(self,
                                 query_list,
                                 timestamp=0,
@@ -169,7 +239,7 @@ class TsdbClient(BceBaseClient):
 
         path = b'/v1/datapoint'
         params = {
-            'query': json.dumps({"queries": query_list}),
+            'query': self._json_dumps({"queries": query_list}),
             'disablePresampling': disable_presampling
         }
         return self._generate_pre_signed_url(path, timestamp, expiration_in_seconds,
@@ -255,12 +325,6 @@ class TsdbClient(BceBaseClient):
                                  full_host.decode(),
                                  path.decode(),
                                  utils.get_canonical_querystring(params, False).decode())
-    def _gzip_compress(self, str):
-        out = io.BytesIO()
-        with gzip.GzipFile(fileobj=out, mode="w") as f:
-            f.write(str)
-        return out.getvalue()
-
     def _merge_config(self, config):
         if config is None:
             return self.config
@@ -0,0 +1,259 @@
+# Copyright 2014 Baidu, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""
+This module provides a writer that streams datapoints to TSDB in bounded, compressed batches.
+"""
+import logging
+import queue
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from baidubce.exception import BceClientError
+
+_logger = logging.getLogger(__name__)
+
+_BODY_PREFIX = b'{"datapoints":['
+_BODY_SUFFIX = b']}'
+
+
+class _Batch(object):
+    """
+    request body being built: datapoints are serialized and compressed as they are added
+    """
+
+    def __init__(self, use_gzip, compress_level):
+        # wbits 31 writes the gzip container
+        self.compressor = zlib.compressobj(compress_level, zlib.DEFLATED, 31) \
+            if use_gzip else None
+        self.chunks = []
+        self.datapoints = []
+        self.raw_size = 0
+        self._write(_BODY_PREFIX)
+
+    def _write(self, data):
+        self.raw_size += len(data)
+        if self.compressor is not None:
+            data = self.compressor.compress(data)
+            if not data:
+                return
+        self.chunks.append(data)
+
+    def add(self, datapoint, encoded):
+        if self.datapoints:
+            self._write(b',')
+        self._write(encoded)
+        self.datapoints.append(datapoint)
+
+    def finish(self):
+        self._write(_BODY_SUFFIX)
+        if self.compressor is not None:
+            self.chunks.append(self.compressor.flush())
+            self.compressor = None
+        body = b''.join(self.chunks)
+        self.chunks = None
+        return body
+
+
+class DatapointWriter(object):
+    """
+    Serialize and compress datapoints as they are put, and write them to TSDB in batches.
+
+    A batch is sent with one request once it holds batch_size datapoints or max_batch_bytes
+    bytes of json, and on flush or close. At most max_in_flight batches are being sent at the
+    same time, put blocks while they are, so the memory used does not grow with the number of
+    datapoints written. Only the compressed body and references to the datapoints of a batch
+    are kept, the datapoints are handed to error_callback when the batch fails so that they
+    can be put again.
+
+    Usage::
+
+        with DatapointWriter(tsdb_client) as writer:
+            for datapoint in datapoints:
+                writer.put(datapoint)
+    """
+
+    def __init__(self, client, batch_size=5000, max_batch_bytes=4 * 1024 * 1024,
+                 max_in_flight=4, use_gzip=True, compress_level=6, error_callback=None):
+        """
+        :param client: client used to write the batches
+        :type client: baidubce.services.tsdb.tsdb_client.TsdbClient
+        :param batch_size: max number of datapoints sent in one request
+        :type batch_size: int
+        :param max_batch_bytes: max size in bytes of the json of one request, before compression
+        :type max_batch_bytes: int
+        :param max_in_flight: max number of requests sent at the same time
+        :type max_in_flight: int
+        :param use_gzip: send the request bodies gzip compressed
+        :type use_gzip: boolean
+        :param compress_level: zlib compression level, from 1 (fastest) to 9 (smallest)
+        :type compress_level: int
+        :param error_callback: called as error_callback(error, datapoints) from a thread of the
+            writer when a batch fails to be written, it may put the datapoints again; failures
+            are logged when it is None
+        :type error_callback: callable
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size should be positive")
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight should be positive")
+        self._client = client
+        self._batch_size = batch_size
+        self._max_batch_bytes = max_batch_bytes
+        self._use_gzip = use_gzip
+        self._compress_level = compress_level
+        self._error_callback = error_callback
+
+        self._lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._idle = threading.Condition()
+        self._sending = 0
+        self._executor = ThreadPoolExecutor(max_in_flight)
+        self._callbacks = queue.Queue()
+        self._callback_thread = threading.Thread(target=self._run_callbacks,
+                                                 name="tsdb-datapoint-writer-callback")
+        self._callback_thread.daemon = True
+        self._callback_thread.start()
+        self._batch = None
+        self._closed = False
+        self.requests_sent = 0
+        self.datapoints_sent = 0
+        self.bytes_sent = 0
+        self.errors = 0
+
+    def put(self, datapoint):
+        """
+        Add one datapoint, a dict as in TsdbClient.write_datapoints.
+
+        :raises BceClientError: if the writer is closed
+        """
+        encoded = self._client._json_dumps(datapoint).encode('utf-8')
+        full = []
+        with self._lock:
+            # error_callback may put the datapoints of a failed batch again while closing
+            if self._closed and threading.current_thread() is not self._callback_thread:
+                raise BceClientError("datapoint writer is closed")
+            batch = self._batch
+            if batch is not None and batch.datapoints and \
+                    batch.raw_size + len(encoded) + len(_BODY_SUFFIX) + 1 > self._max_batch_bytes:
+                full.append(self._take_batch())
+                batch = None
+            if batch is None:
+                batch = self._batch = _Batch(self._use_gzip, self._compress_level)
+            batch.add(datapoint, encoded)
+            if len(batch.datapoints) >= self._batch_size:
+                full.append(self._take_batch())
+        for batch in full:
+            self._submit(batch)
+
+    def put_all(self, datapoints):
+        """
+        Add datapoints from any iterable, which is consumed incrementally.
+        """
+        for datapoint in datapoints:
+            self.put(datapoint)
+
+    def flush(self):
+        """
+        Send the datapoints put so far and wait until all of the batches are written, including
+        the datapoints put again by error_callback.
+        """
+        while True:
+            with self._lock:
+                batch = self._take_batch() if self._batch is not None else None
+            if batch is not None:
+                self._submit(batch)
+            with self._idle:
+                while self._sending:
+                    self._idle.wait()
+            with self._lock:
+                if self._batch is None:
+                    return
+
+    def close(self):
+        """
+        Send the remaining datapoints, wait for them and stop accepting new ones.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self.flush()
+        self._executor.shutdown(wait=True)
+        self._callbacks.put(None)
+        self._callback_thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _take_batch(self):
+        """
+        finish the current batch, must be called with _lock held
+        """
+        batch = self._batch
+        self._batch = None
+        return batch.finish(), batch.datapoints
+
+    def _submit(self, batch):
+        """
+        hand a finished batch to the executor, must be called without _lock held as it blocks
+        while max_in_flight batches are being sent
+        """
+        self._in_flight.acquire()
+        with self._idle:
+            self._sending += 1
+        self._executor.submit(self._send, batch[0], batch[1])
+
+    def _send(self, body, datapoints):
+        error = None
+        try:
+            self._client.write_encoded_datapoints(body, self._use_gzip)
+        except Exception as e:
+            error = e
+        finally:
+            self._in_flight.release()
+        if error is None:
+            with self._idle:
+                self.requests_sent += 1
+                self.datapoints_sent += len(datapoints)
+                self.bytes_sent += len(body)
+                self._sending -= 1
+                self._idle.notify_all()
+            return
+        with self._idle:
+            self.errors += 1
+        # error_callback may put the datapoints again, which blocks while max_in_flight batches
+        # are being sent, so it runs on its own thread to keep the workers sending them
+        self._callbacks.put((error, datapoints))
+
+    def _run_callbacks(self):
+        while True:
+            item = self._callbacks.get()
+            if item is None:
+                return
+            error, datapoints = item
+            try:
+                if self._error_callback is not None:
+                    try:
+                        self._error_callback(error, datapoints)
+                    except Exception:
+                        _logger.exception("datapoint writer error callback failed")
+                else:
+                    _logger.warning("failed to write %d datapoints: %s", len(datapoints), error)
+            finally:
+                with self._idle:
+                    self._sending -= 1
+                    self._idle.notify_all()
@@ -14,14 +14,20 @@
 This module provides general http handler functions for processing http responses from TSDB services.
 """
 
+import array
+import collections
 import http.client
 import json
+from baidubce import compat
+from baidubce import json_codec
 from baidubce import utils
 from baidubce.exception import BceClientError
 from baidubce.exception import BceServerError
+from baidubce.http import handler
 from baidubce.utils import Expando
 
-def parse_json(http_response, response):
+@handler.json_body_parser
+def parse_json(http_response, response, keep_raw_data=True, lazy=False, codec=None):
     """If the body is not empty, convert it to a python object and set as the value of
     response.body. http_response is always closed if no error occurs.
 
@@ -36,7 +42,244 @@ def parse_json(http_response, response):
     """
     body = http_response.read()
     if body:
-        response.__dict__.update(json.loads(body, object_hook=dict_to_python_object).__dict__)
+        response.__dict__.update(handler.load_python_object(body, codec, dict_to_python_object).__dict__)
+    http_response.close()
+    return True
+
+
+@handler.json_body_parser
+def parse_results(http_response, response, keep_raw_data=True, lazy=False, codec=None):
+    """Decode a datapoint query response without building python objects: response.results
+    is the list of result dicts as decoded by the codec. http_response is always closed if no
+    error occurs.
+
+    :param http_response: the http_response object returned by HTTPConnection.getresponse()
+    :type http_response: httplib.HTTPResponse
+
+    :param response: general response object which will be returned to the caller
+    :type response: baidubce.BceResponse
+
+    :return: always true
+    :rtype bool
+    """
+    body = http_response.read()
+    if codec is None:
+        codec = json_codec.STDLIB_CODEC
+    response.results = codec.loads(body).get('results', []) if body else []
+    http_response.close()
+    return True
+
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = json.decoder.WHITESPACE
+_NAN = float('nan')
+
+
+_BLOCK_SIZE = 256 * 1024
+
+
+class _Column(object):
+    """
+    values of one sql result column, kept in a typed array while they are numbers: 'q' while
+    they are 64 bits integers, 'd' once a float or null (stored as NaN) is seen, and a list
+    once any other value is seen
+    """
+
+    def __init__(self):
+        self.values = array.array('q')
+        self.has_null = False
+
+    def append(self, value):
+        values = self.values
+        if isinstance(values, list):
+            values.append(value)
+        elif isinstance(value, float) or value is None:
+            if values.typecode == 'q':
+                values = self.values = array.array('d', values)
+            if value is None:
+                self.has_null = True
+                value = _NAN
+            values.append(value)
+        elif isinstance(value, compat.integer_types) and not isinstance(value, bool):
+            try:
+                values.append(value)
+            except OverflowError:
+                self._to_list().append(value)
+        else:
+            self._to_list().append(value)
+
+    def extend(self, values, has_bool):
+        """
+        append a tuple of values, in bulk unless has_bool or they do not fit the array
+        """
+        column = self.values
+        if isinstance(column, list):
+            column.extend(values)
+            return
+        if not has_bool:
+            size = len(column)
+            try:
+                column.extend(values)
+                return
+            except (TypeError, OverflowError):
+                del column[size:]
+            has_null = None in values
+            try:
+                floats = array.array('d', [_NAN if v is None else v for v in values]
+                                     if has_null else values)
+            except (TypeError, OverflowError):
+                pass
+            else:
+                if column.typecode == 'q':
+                    column = self.values = array.array('d', column)
+                column.extend(floats)
+                self.has_null = self.has_null or has_null
+                return
+        for value in values:
+            self.append(value)
+
+    def _to_list(self):
+        values = self.values.tolist()
+        if self.has_null:
+            values = [None if v != v else v for v in values]
+        self.values = values
+        return values
+
+
+def _skip(body, idx, expected=None):
+    """skip the whitespaces from idx and check the next character is expected"""
+    idx = _WHITESPACE.match(body, idx).end()
+    if expected is not None and body[idx:idx + 1] != expected:
+        raise ValueError("malformed sql result, expecting '%s' at %d" % (expected, idx))
+    return idx
+
+
+def _decode_block(body, idx, codec):
+    """
+    decode the rows of about _BLOCK_SIZE characters from idx with one call of the codec.
+
+    The block is cut after a ']', it decodes as a list of rows only if that ']' closes a row:
+    a cut inside a string leaves it open and a cut inside a row leaves a bracket open. The
+    first ']' after _BLOCK_SIZE characters, or the last ones of the body, are tried.
+
+    :return: the rows and the index after them, or None and the index of the last cut tried
+    """
+    if idx + _BLOCK_SIZE < len(body):
+        cut = body.find(']', idx + _BLOCK_SIZE)
+        cuts = [cut, body.rfind(']', idx, cut)]
+    else:
+        cut = body.rfind(']', idx)
+        cuts = [cut, body.rfind(']', idx, cut)]
+        cuts.append(body.rfind(']', idx, cuts[-1]))
+    for cut in cuts:
+        if cut <= idx:
+            break
+        try:
+            rows = codec.loads('[' + body[idx:cut + 1] + ']')
+        except ValueError:
+            continue
+        return rows, cut + 1
+    return None, max(cuts)
+
+
+def _decode_rows(body, idx, codec):
+    """decode the rows array starting at idx into columns, a block of rows at a time"""
+    columns = None
+    idx = _skip(body, idx, '[') + 1
+    idx = _skip(body, idx)
+    while body[idx:idx + 1] != ']':
+        start = idx
+        rows, end = _decode_block(body, idx, codec)
+        if rows is None:
+            # no cut closes a row, decode them one by one up to the cut
+            rows = []
+            while not rows or idx < end and body[idx:idx + 1] != ']':
+                row, idx = _DECODER.raw_decode(body, idx)
+                rows.append(row)
+                idx = _skip(body, idx)
+                if body[idx:idx + 1] == ',':
+                    idx = _skip(body, idx + 1)
+        else:
+            idx = _skip(body, end)
+            if body[idx:idx + 1] == ',':
+                idx = _skip(body, idx + 1)
+        if columns is None:
+            columns = [_Column() for _ in rows[0]]
+        if set(map(len, rows)) != set([len(columns)]):
+            raise ValueError("malformed sql result, rows of different lengths")
+        # True and False would pass as integers in the arrays
+        has_bool = body.find('true', start, idx) >= 0 or body.find('false', start, idx) >= 0
+        for column, values in zip(columns, zip(*rows)):
+            column.extend(values, has_bool)
+    return columns or [], idx + 1
+
+
+def decode_columns(body, codec=None):
+    """Decode a sql result {"columns": [...], "rows": [[...], ...]} into columns without
+    building all of the rows: blocks of rows are decoded and their values are appended to
+    typed arrays.
+
+    :param body: json text
+    :type body: str or bytes
+    :param codec: a codec of baidubce.json_codec decoding the blocks of rows, None for the
+        json module
+    :type codec: baidubce.json_codec.JsonCodec
+
+    :return: the column names, an OrderedDict of column name to values and a dict of the other
+        keys of the result. The values of a column are an array.array of typecode 'q' if they
+        are all integers, of typecode 'd' if they are numbers or null, where null is NaN, and
+        a list otherwise.
+    :rtype: tuple
+    """
+    body = compat.convert_to_string(body)
+    others = {}
+    columns = []
+    idx = _skip(body, 0, '{') + 1
+    idx = _skip(body, idx)
+    while body[idx:idx + 1] != '}':
+        key, idx = _DECODER.raw_decode(body, idx)
+        idx = _skip(body, idx, ':') + 1
+        idx = _skip(body, idx)
+        if key == 'rows':
+            columns, idx = _decode_rows(body, idx, codec or json_codec.STDLIB_CODEC)
+        else:
+            others[key], idx = _DECODER.raw_decode(body, idx)
+        idx = _skip(body, idx)
+        if body[idx:idx + 1] == ',':
+            idx = _skip(body, idx + 1)
+    names = [c.get('name') if isinstance(c, dict) else c for c in others.pop('columns', [])]
+    if not columns:
+        columns = [_Column() for _ in names]
+    if len(columns) != len(names):
+        raise ValueError("malformed sql result, %d columns for rows of %d values"
+                         % (len(names), len(columns)))
+    data = collections.OrderedDict(
+        (name, column.values) for name, column in zip(names, columns))
+    return names, data, others
+
+
+@handler.json_body_parser
+def parse_columns(http_response, response, keep_raw_data=True, lazy=False, codec=None):
+    """Decode a sql result with decode_columns, set response.columns to the column names and
+    response.data to the OrderedDict of column name to values. The other keys of the result
+    are set as attributes. http_response is always closed if no error occurs.
+
+    :param http_response: the http_response object returned by HTTPConnection.getresponse()
+    :type http_response: httplib.HTTPResponse
+
+    :param response: general response object which will be returned to the caller
+    :type response: baidubce.BceResponse
+
+    :return: always true
+    :rtype bool
+    """
+    body = http_response.read()
+    if body:
+        names, data, others = decode_columns(body, codec)
+        for k, v in others.items():
+            setattr(response, str(k), v)
+        response.columns = names
+        response.data = data
     http_response.close()
     return True
 
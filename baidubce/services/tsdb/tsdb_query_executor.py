@@ -0,0 +1,178 @@
+# Copyright 2014 Baidu, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""
+This module provides an executor that splits datapoint queries and runs them concurrently.
+"""
+import collections
+import copy
+from concurrent.futures import ThreadPoolExecutor
+
+from baidubce import compat
+from baidubce import utils
+from baidubce.exception import BceClientError
+
+
+class QueryExecutor(object):
+    """
+    Run datapoint queries as concurrent sub-queries and stream the series they return.
+
+    The query list is cut into requests of at most max_queries_per_request queries, and the
+    queries with an absolute start and end and neither aggregators nor fill are further cut
+    into time slices of time_slice milliseconds. Truncated results are followed by marker.
+    Rows are yielded in the order of query_list, then of time, as (metric, tags, timestamps,
+    values), one row per series and sub-query, so a series spanning several time slices is
+    yielded as several consecutive rows. For queries of several fields each value is the list
+    of the field values of the datapoint.
+
+    Usage::
+
+        executor = QueryExecutor(tsdb_client, time_slice=3600 * 1000, use_numpy=True)
+        for metric, tags, timestamps, values in executor.iter_rows(query_list):
+            print(metric, tags, values.mean())
+    """
+
+    def __init__(self, client, max_queries_per_request=10, time_slice=None, max_workers=4,
+                 disable_presampling=False, use_numpy=False):
+        """
+        :param client: client used to send the queries
+        :type client: baidubce.services.tsdb.tsdb_client.TsdbClient
+        :param max_queries_per_request: max number of queries sent in one request
+        :type max_queries_per_request: int
+        :param time_slice: length in milliseconds of the time slices, None to not cut time
+        :type time_slice: int
+        :param max_workers: max number of requests sent at the same time
+        :type max_workers: int
+        :param disable_presampling: as in TsdbClient.get_datapoints
+        :type disable_presampling: boolean
+        :param use_numpy: yield timestamps and values as numpy arrays
+        :type use_numpy: boolean
+        """
+        if max_queries_per_request <= 0:
+            raise ValueError("max_queries_per_request should be positive")
+        if max_workers <= 0:
+            raise ValueError("max_workers should be positive")
+        if time_slice is not None and time_slice <= 0:
+            raise ValueError("time_slice should be positive")
+        if use_numpy and not utils._get_numpy():
+            raise BceClientError("numpy is not installed. Install it with: pip install numpy")
+        self._client = client
+        self._max_queries_per_request = max_queries_per_request
+        self._time_slice = time_slice
+        self._max_workers = max_workers
+        self._disable_presampling = disable_presampling
+        self._use_numpy = use_numpy
+
+    def iter_rows(self, query_list):
+        """
+        Run the queries and yield (metric, tags, timestamps, values) rows.
+
+        Results are kept for at most two sub-queries per worker ahead of the one being yielded.
+
+        :param query_list: a list of query dict, as in TsdbClient.get_datapoints
+        :type query_list: list
+        """
+        executor = ThreadPoolExecutor(self._max_workers)
+        pending = collections.deque()
+        try:
+            for queries in self._split(query_list):
+                if len(pending) >= 2 * self._max_workers:
+                    for row in pending.popleft().result():
+                        yield row
+                pending.append(executor.submit(self._run, queries))
+            while pending:
+                for row in pending.popleft().result():
+                    yield row
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _split(self, query_list):
+        """
+        yield the lists of sub-queries sent in one request
+        """
+        queries = []
+        for query in query_list:
+            for sub_query in self._slice(query):
+                queries.append(sub_query)
+                if len(queries) == self._max_queries_per_request:
+                    yield queries
+                    queries = []
+        if queries:
+            yield queries
+
+    def _slice(self, query):
+        filters = query.get('filters') or {}
+        start = filters.get('start')
+        end = filters.get('end')
+        if self._time_slice is None or 'aggregators' in query or 'fill' in query \
+                or not isinstance(start, compat.integer_types) \
+                or not isinstance(end, compat.integer_types) \
+                or end - start < self._time_slice:
+            return [query]
+        slices = []
+        for slice_start in range(start, end + 1, self._time_slice):
+            sub_query = copy.copy(query)
+            sub_query['filters'] = dict(filters, start=slice_start,
+                                        end=min(slice_start + self._time_slice - 1, end))
+            slices.append(sub_query)
+        if str(query.get('order', '')).lower() == 'desc':
+            slices.reverse()
+        return slices
+
+    def _run(self, queries):
+        """
+        send the queries, following the markers of truncated results, and return their rows
+        """
+        queries = [copy.copy(query) for query in queries]
+        series = [collections.OrderedDict() for _ in queries]
+        indexes = list(range(len(queries)))
+        while indexes:
+            response = self._client._get_datapoint_results(
+                    [queries[i] for i in indexes], self._disable_presampling)
+            truncated = []
+            for i, result in zip(indexes, response.results):
+                self._add_result(series[i], result)
+                if result.get('truncated') and result.get('nextMarker'):
+                    queries[i]['marker'] = result['nextMarker']
+                    truncated.append(i)
+            indexes = truncated
+        rows = []
+        for query_series in series:
+            for metric, tags, timestamps, values in query_series.values():
+                if self._use_numpy:
+                    numpy = utils._get_numpy()
+                    timestamps = numpy.array(timestamps, dtype=numpy.int64)
+                    values = numpy.array(values)
+                rows.append((metric, tags, timestamps, values))
+        return rows
+
+    @staticmethod
+    def _add_result(series, result):
+        """
+        append the groups of one result page to the series of its query
+        """
+        metric = result.get('metric')
+        multiple_fields = 'fields' in result
+        for group in result.get('groups') or []:
+            tags = {}
+            for info in group.get('groupInfos') or []:
+                if info.get('name') == 'Tag':
+                    tags.update(info.get('tags') or {})
+            key = tuple(sorted(tags.items()))
+            row = series.get(key)
+            if row is None:
+                row = series[key] = (metric, tags, [], [])
+            for point in group.get('values') or []:
+                row[2].append(point[0])
+                row[3].append(point[1:] if multiple_fields else point[1])
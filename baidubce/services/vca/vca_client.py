@@ -15,7 +15,6 @@ This module provides a client class for VCA.
 """
 
 import copy
-import json
 import logging
 from builtins import str
 from builtins import bytes
@@ -63,7 +62,7 @@ class VcaClient(BceBaseClient):
         body = {
             'source': source
         }
-        return self._send_request(http_methods.PUT, b'/v1/abstract', body=json.dumps(body))
+        return self._send_request(http_methods.PUT, b'/v1/abstract', body=self._json_dumps(body))
 
     @required(source=(bytes, str))
     def put_image(self, source, preset=None):
@@ -80,7 +79,7 @@ class VcaClient(BceBaseClient):
         }
         if preset is not None:
             body['preset'] = preset
-        return self._send_request(http_methods.PUT, b'/v2/image', body=json.dumps(body), params={b'sync': ''})
+        return self._send_request(http_methods.PUT, b'/v2/image', body=self._json_dumps(body), params={b'sync': ''})
 
     @required(source=(bytes, str))
     def cancel(self, source):
@@ -134,7 +133,7 @@ class VcaClient(BceBaseClient):
         if description is not None:
             body['description'] = description
         return self._send_request(http_methods.PUT, b'/v2/media',
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(source=(bytes, str))
@@ -15,7 +15,6 @@ This module provides a client class for VCR.
 """
 
 import copy
-import json
 import logging
 from builtins import str
 from builtins import bytes
@@ -69,7 +68,7 @@ class VcrClient(BceBaseClient):
         if notification is not None:
             body['notification'] = notification
         return self._send_request(http_methods.PUT, b'/v1/media',
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(source=(bytes, str))
@@ -112,7 +111,7 @@ class VcrClient(BceBaseClient):
         if notification is not None:
             body['notification'] = notification
         return self._send_request(http_methods.PUT, b'/v2/audio',
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(source=(bytes, str))
@@ -141,7 +140,7 @@ class VcrClient(BceBaseClient):
         if preset is not None:
             body['preset'] = preset
         return self._send_request(http_methods.PUT, b'/v1/image',
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(source=(bytes, str))
@@ -168,7 +167,7 @@ class VcrClient(BceBaseClient):
         if notification is not None:
             body['notification'] = notification
         return self._send_request(http_methods.PUT, b'/v2/image',
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(source=(bytes, str))
@@ -202,7 +201,7 @@ class VcrClient(BceBaseClient):
         if preset is not None:
             body['preset'] = preset
         return self._send_request(http_methods.PUT, b'/v1/text',
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(lib=(bytes, str), brief=(bytes, str), image=(bytes, str))
@@ -219,7 +218,7 @@ class VcrClient(BceBaseClient):
         }
         return self._send_request(http_methods.POST,
                                   b'/v1/face/lib/%s' % compat.convert_to_bytes(lib),
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(lib=(bytes, str), brief=(bytes, str))
@@ -293,7 +292,7 @@ class VcrClient(BceBaseClient):
         }
         return self._send_request(http_methods.POST,
                                   b'/v1/logo/lib/%s' % compat.convert_to_bytes(lib),
-                                  body=json.dumps(body),
+                                  body=self._json_dumps(body),
                                   config=config)
 
     @required(lib=(bytes, str), brief=(bytes, str))
@@ -17,7 +17,6 @@ This module provides a client class for ACL.
 """
 
 import copy
-import json
 import logging
 import uuid
 import sys
@@ -179,7 +178,7 @@ class AclClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(http_methods.POST, path,
-                                  body=json.dumps(body), params=params,
+                                  body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(subnet_id=(bytes, str))
@@ -350,7 +349,7 @@ class AclClient(bce_base_client.BceBaseClient):
         if action is not None:
             body['action'] = compat.convert_to_string(action)
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
 
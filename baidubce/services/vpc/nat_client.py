@@ -20,7 +20,6 @@ This module provides a client class for NAT.
 """
 
 import copy
-import json
 import logging
 import uuid
 import sys
@@ -176,7 +175,7 @@ class NatClient(bce_base_client.BceBaseClient):
         if resource_group_id is not None:
             body['resourceGroupId'] = resource_group_id
         return self._send_request(http_methods.POST,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(vpc_id=(bytes, str))
@@ -295,7 +294,7 @@ class NatClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(nat_id=(bytes, str), eips=list)
@@ -339,7 +338,7 @@ class NatClient(bce_base_client.BceBaseClient):
             'eips': eips
         }
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(nat_id=(bytes, str), eips=list)
@@ -379,7 +378,7 @@ class NatClient(bce_base_client.BceBaseClient):
             'eips': eips
         }
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(nat_id=(bytes, str))
@@ -454,7 +453,7 @@ class NatClient(bce_base_client.BceBaseClient):
             'billing': billing.__dict__
         }
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(nat_id=(bytes, str), cu_num=int)
@@ -495,7 +494,7 @@ class NatClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(nat_id=(bytes, str), delete_protect=bool)
@@ -523,7 +522,7 @@ class NatClient(bce_base_client.BceBaseClient):
         }
 
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(nat_id=(bytes, str), eips=list)
@@ -567,7 +566,7 @@ class NatClient(bce_base_client.BceBaseClient):
             'dnatEips': eips
         }
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
     
     @required(nat_id=(bytes, str), eips=list)
@@ -607,7 +606,7 @@ class NatClient(bce_base_client.BceBaseClient):
             'dnatEips': eips
         }
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(nat_id=(bytes, str), eips=list)
@@ -648,7 +647,7 @@ class NatClient(bce_base_client.BceBaseClient):
             'bindEips': bind_eips
         }
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(nat_id=(bytes, str), eips=list)
@@ -688,7 +687,7 @@ class NatClient(bce_base_client.BceBaseClient):
             'bindEips': bind_eips
         }
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(nat_id=(bytes, str),
@@ -740,7 +739,7 @@ class NatClient(bce_base_client.BceBaseClient):
             'sourceCIDR': compat.convert_to_string(source_cidr),
         }
         return self._send_request(http_methods.POST,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(nat_id=(bytes, str), snat_rules=list)
@@ -780,7 +779,7 @@ class NatClient(bce_base_client.BceBaseClient):
             "snatRules": snat_rules
         }
         return self._send_request(http_methods.POST,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
     
     @required(nat_id=(bytes, str), snat_rule_id=(bytes, str))
@@ -873,7 +872,7 @@ class NatClient(bce_base_client.BceBaseClient):
         if source_cidr is not None:
             body['sourceCIDR'] = compat.convert_to_string(source_cidr)
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
         
     @required(nat_id=(bytes, str))
@@ -993,7 +992,7 @@ class NatClient(bce_base_client.BceBaseClient):
         if private_port is not None:
             body['privatePort'] = compat.convert_to_string(private_port)
         return self._send_request(http_methods.POST,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(nat_id=(bytes, str), dnat_rules=list)
@@ -1032,7 +1031,7 @@ class NatClient(bce_base_client.BceBaseClient):
             "rules": dnat_rules
         }
         return self._send_request(http_methods.POST,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
     
     @required(nat_id=(bytes, str), snat_rule_id=(bytes, str))
@@ -1146,7 +1145,7 @@ class NatClient(bce_base_client.BceBaseClient):
             body['privatePort'] = compat.convert_to_string(private_port)
         
         return self._send_request(http_methods.POST,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
         
     @required(nat_id=(bytes, str))
@@ -17,7 +17,6 @@ This module provides a client class for peer connection.
 """
 
 import copy
-import json
 import logging
 import uuid
 
@@ -187,7 +186,7 @@ class PeerConnClient(bce_base_client.BceBaseClient):
         if resourceGroupId is not None:
             body['resourceGroupId'] = resourceGroupId
         return self._send_request(http_methods.POST,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(vpc_id=(bytes, str))
@@ -307,7 +306,7 @@ class PeerConnClient(bce_base_client.BceBaseClient):
         if local_if_name is not None:
             body['localIfName'] = local_if_name
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(peer_conn_id=(bytes, str), action=(bytes, str))
@@ -429,7 +428,7 @@ class PeerConnClient(bce_base_client.BceBaseClient):
             'newBandwidthInMbps': new_bandwidth_in_mbps
         }
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(peer_conn_id=(bytes, str))
@@ -475,7 +474,7 @@ class PeerConnClient(bce_base_client.BceBaseClient):
             'billing': billing.__dict__
         }
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body),
+                                  path, body=self._json_dumps(body),
                                   params=params, config=config)
 
     @required(peer_conn_id=(bytes, str), role=(bytes, str))
@@ -600,7 +599,7 @@ class PeerConnClient(bce_base_client.BceBaseClient):
             'deleteProtect': delete_protect,
         }
         return self._send_request(http_methods.PUT,
-                                  path, body=json.dumps(body), params=params, config=config)
+                                  path, body=self._json_dumps(body), params=params, config=config)
 
     @required(peer_conn_id=(bytes, str))
     def refund_peerconn(self, peer_conn_id, client_token=None, config=None):
@@ -17,7 +17,6 @@ This module provides a client class for parameter template.
 """
 
 import copy
-import json
 import logging
 import uuid
 
@@ -148,7 +147,7 @@ class TemplateClient(bce_base_client.BceBaseClient):
         if description is not None:
             body['description'] = compat.convert_to_string(description)
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(ip_set_id=(bytes, str), ip_address_info=list)
@@ -192,7 +191,7 @@ class TemplateClient(bce_base_client.BceBaseClient):
                 body["ipAddressInfo"].append({"ipAddress": ip_address.ip_address, 
                                               "description": ip_address.description})
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     
     @required(ip_set_id=(bytes, str), ip_address=list)
@@ -234,7 +233,7 @@ class TemplateClient(bce_base_client.BceBaseClient):
             for address in ip_address:
                 body["ipAddressInfo"].append(address)
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config = config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config = config)
 
     @required(ip_set_id=(bytes, str))
     def update_ip_set(self, ip_set_id, name=None, description=None, client_token=None, config=None):
@@ -279,7 +278,7 @@ class TemplateClient(bce_base_client.BceBaseClient):
         if description is not None:
             body['description'] = description
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(ip_set_id=(bytes, str))
     def delete_ip_set(self, ip_set_id, client_token=None, config=None):
@@ -417,7 +416,7 @@ class TemplateClient(bce_base_client.BceBaseClient):
         if description is not None:
             body["description"] = description
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(ip_group_id=(bytes, str), ip_set_ids=list)
     def bind_ip_set(self, ip_group_id, ip_set_ids, client_token=None, config=None):
@@ -455,7 +454,7 @@ class TemplateClient(bce_base_client.BceBaseClient):
             "ipSetIds": ip_set_ids
         }
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(ip_group_id=(bytes, str), ip_set_ids=list)
     def unbind_ip_set(self, ip_group_id, ip_set_ids, client_token=None, config=None):
@@ -493,7 +492,7 @@ class TemplateClient(bce_base_client.BceBaseClient):
             "ipSetIds": ip_set_ids
         }
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params, config=config)
         
     @required(ip_group_id=(bytes, str))
     def update_ip_group(self, ip_group_id, name=None, description=None, client_token=None, config=None):
@@ -538,7 +537,7 @@ class TemplateClient(bce_base_client.BceBaseClient):
         if description is not None:
             body['description'] = description
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params, config=config)
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params, config=config)
 
     @required(ip_group_id=(bytes, str))
     def delete_ip_group(self, ip_group_id, client_token=None, config=None):
@@ -15,7 +15,6 @@ This module provides a client class for VPC.
 """
 
 import copy
-import json
 import logging
 import uuid
 
@@ -123,7 +122,7 @@ class VpcClient(bce_base_client.BceBaseClient):
         if enable_ipv6 is not None:
             body['enableIpv6'] = enable_ipv6
 
-        return self._send_request(http_methods.POST, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.POST, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     @required(marker=(bytes, str), max_keys=int, is_default=bool)
@@ -284,7 +283,7 @@ class VpcClient(bce_base_client.BceBaseClient):
         if secondaryCidr is not None:
             body['secondaryCidr'] = secondaryCidr
 
-        return self._send_request(http_methods.PUT, path, json.dumps(body),
+        return self._send_request(http_methods.PUT, path, self._json_dumps(body),
                                   params=params, config=config)
 
     @required(vpc_id=(bytes, str))
@@ -3,7 +3,6 @@ This module provides a client class for VPN.
 """
 
 import copy
-import json
 import logging
 import uuid
 
@@ -193,7 +192,7 @@ class VpnClient(bce_base_client.BceBaseClient):
         if resourceGroupId is not None:
             body['resourceGroupId'] = resourceGroupId
 
-        return self._send_request(http_methods.POST, VpnClient.path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.POST, VpnClient.path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     def update_vpn(self, vpn_id, vpn_name=None, description=None, client_token=None, config=None):
@@ -236,7 +235,7 @@ class VpnClient(bce_base_client.BceBaseClient):
         if vpn_name is not None:
             body['vpnName'] = vpn_name
 
-        return self._send_request(http_methods.PUT, path, body=json.dumps(body), params=params,
+        return self._send_request(http_methods.PUT, path, body=self._json_dumps(body), params=params,
                                   config=config)
 
     def get_vpn(self, vpn_id, config=None):
@@ -323,7 +322,7 @@ class VpnClient(bce_base_client.BceBaseClient):
 
         body = {'eip': eip}
 
-        return self._send_request(http_methods.PUT, path, params=params, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.PUT, path, params=params, body=self._json_dumps(body), config=config)
 
     def unbind_eip(self, vpn_id, client_token=None, config=None):
         """
@@ -398,7 +397,7 @@ class VpnClient(bce_base_client.BceBaseClient):
             }
         }}
 
-        return self._send_request(http_methods.PUT, path, params=params, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.PUT, path, params=params, body=self._json_dumps(body), config=config)
 
     def create_vpn_conn(self, vpn_id, secret_key, local_subnets, cgwId, remote_ip, remote_subnets, vpn_conn_name,
                         ike_config, ipsec_config, description=None, client_token=None, config=None):
@@ -481,7 +480,7 @@ class VpnClient(bce_base_client.BceBaseClient):
             'description': description,
         }
 
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), config=config)
 
     def update_vpn_conn(self, vpn_conn_id, vpn_id, secret_key, local_subnets, cgwId, remote_ip, remote_subnets,
                         vpn_conn_name, ike_config, ipsec_config, description=None, client_token=None, config=None):
@@ -568,7 +567,7 @@ class VpnClient(bce_base_client.BceBaseClient):
             'description': description,
         }
 
-        return self._send_request(http_methods.PUT, path, params=params, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.PUT, path, params=params, body=self._json_dumps(body), config=config)
 
     def get_vpn_conn(self, vpn_id, client_token=None, config=None):
         """
@@ -672,7 +671,7 @@ class VpnClient(bce_base_client.BceBaseClient):
         if client_dns is not None:
             body['clientDns'] = client_dns
 
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), config=config)
 
     def update_vpn_sslservice(self, vpn_id=None, sslservice_id=None, sslservice_name=None, local_routes=None,
                               address_pool=None, client_dns=None, client_token=None, config=None):
@@ -718,7 +717,7 @@ class VpnClient(bce_base_client.BceBaseClient):
         if client_dns is not None:
             body['clientDns'] = client_dns
 
-        return self._send_request(http_methods.PUT, path, params=params, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.PUT, path, params=params, body=self._json_dumps(body), config=config)
 
     def get_vpn_sslservice(self, vpn_id, client_token=None, config=None):
         """
@@ -793,7 +792,7 @@ class VpnClient(bce_base_client.BceBaseClient):
                 'description': ssluser.description
             })
 
-        return self._send_request(http_methods.POST, path, params=params, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.POST, path, params=params, body=self._json_dumps(body), config=config)
 
     def update_vpn_ssl_user(self, vpn_id, ssluser_id, password=None, description=None, client_token=None, config=None):
         """
@@ -828,7 +827,7 @@ class VpnClient(bce_base_client.BceBaseClient):
         if description is not None:
             body['description'] = description
 
-        return self._send_request(http_methods.PUT, path, params=params, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.PUT, path, params=params, body=self._json_dumps(body), config=config)
 
     def get_vpn_ssl_user(self, vpn_id, client_token=None, config=None, marker=None, max_keys=None, user_name=None):
         """
@@ -909,7 +908,7 @@ class VpnClient(bce_base_client.BceBaseClient):
             "deleteProtect": delete_protect
         }
 
-        return self._send_request(http_methods.PUT, path, params=params, body=json.dumps(body), config=config)
+        return self._send_request(http_methods.PUT, path, params=params, body=self._json_dumps(body), config=config)
 
 
 def generate_client_token_by_uuid():
@@ -23,26 +23,40 @@ from baidubce import compat
 import os
 import re
 import datetime
+import functools
 import hashlib
 import base64
 import string
 import sys
 try:
     from urllib.parse import urlparse
+    from urllib.parse import quote as _quote
 except ImportError:
     from urlparse import urlparse
+    from urllib import quote as _quote
 from Crypto.Cipher import AES
 import baidubce
 from baidubce.http import http_headers
 
 import codecs
+import gzip
+import io
 import struct
+import threading
 try:
     import crc32c
     _has_crc32c = True
 except ImportError:
     _has_crc32c = False
     crc32c = None
+try:
+    import crcmod
+    # crcmod falls back to pure python without its C extension, which is not faster than ours
+    import crcmod._crcfunext
+    _crc64_ext = crcmod.mkCrcFun(0x142F0E1EBA9EA3693, initCrc=0, rev=True,
+                                 xorOut=0xFFFFFFFFFFFFFFFF)
+except ImportError:
+    _crc64_ext = None
 import zlib
 
 DEFAULT_CNAME_LIKE_LIST = [b".cdn.bcebos.com"]
@@ -173,11 +187,90 @@ def _gf2_matrix_times(mat, vec):
         idx += 1
     return sum
 
-def _gf2_matrix_square(square, mat):
-    n = 0
-    while n < 32:
-        square[n] = _gf2_matrix_times(mat, mat[n])
-        n += 1
+def _gf2_matrix_compose(mat1, mat2):
+    """operator applying mat2 then mat1"""
+    return [_gf2_matrix_times(mat1, v) for v in mat2]
+
+def _gf2_byte_tables(mat, width):
+    """
+    split the operator mat into width / 8 tables of 256 entries, one per byte of the input
+    """
+    tables = []
+    for k in range(width // 8):
+        table = [0] * 256
+        for b in range(1, 256):
+            low = b & -b
+            table[b] = table[b ^ low] ^ mat[8 * k + low.bit_length() - 1]
+        tables.append(table)
+    return tables
+
+def _gf2_apply_byte_tables(tables, vec):
+    result = 0
+    for table in tables:
+        result ^= table[vec & 0xff]
+        vec >>= 8
+    return result
+
+
+class _CrcShifter(object):
+    """
+    Advance a reflected crc over n zero bytes without reading them, which is the core of
+    crc combination: crc(A + B) == shift(crc(A), len(B)) ^ crc(B).
+
+    Operators for power-of-two lengths are built on first use and cached as byte tables, so a
+    shift costs at most width / 8 table lookups per set bit of n.
+    """
+    def __init__(self, poly, width):
+        self._width = width
+        # operator for one zero bit, squared three times to get the operator for one zero byte
+        mat = [poly] + [1 << (n - 1) for n in range(1, width)]
+        for _ in range(3):
+            mat = _gf2_matrix_compose(mat, mat)
+        self._matrices = [mat]
+        self._tables = [_gf2_byte_tables(mat, width)]
+        self._lock = threading.Lock()
+
+    def operator(self, power):
+        """byte tables of the operator for 2 ** power zero bytes"""
+        if power >= len(self._tables):
+            with self._lock:
+                while power >= len(self._tables):
+                    mat = self._matrices[-1]
+                    mat = _gf2_matrix_compose(mat, mat)
+                    self._matrices.append(mat)
+                    self._tables.append(_gf2_byte_tables(mat, self._width))
+        return self._tables[power]
+
+    def operator_for_length(self, length):
+        """byte tables of the operator for length zero bytes"""
+        mat = None
+        power = 0
+        while length:
+            if length & 1:
+                self.operator(power)
+                if mat is None:
+                    mat = self._matrices[power]
+                else:
+                    mat = _gf2_matrix_compose(self._matrices[power], mat)
+            length >>= 1
+            power += 1
+        if mat is None:
+            # identity
+            mat = [1 << n for n in range(self._width)]
+        return _gf2_byte_tables(mat, self._width)
+
+    def shift(self, crc, length):
+        """advance crc over length zero bytes"""
+        power = 0
+        while length:
+            if length & 1:
+                crc = _gf2_apply_byte_tables(self.operator(power), crc)
+            length >>= 1
+            power += 1
+        return crc
+
+
+_crc32_shifter = _CrcShifter(0xedb88320, 32)
 
 def crc32_combine(crc1, crc2, len2):
     """
@@ -191,46 +284,32 @@ def crc32_combine(crc1, crc2, len2):
     :param len2: length of the second part in bytes
     :return: combined CRC32 value
     """
-    # Use zlib's built-in CRC combination by simulating the continuation
-    # This is equivalent to computing CRC of data2 starting with crc1 as initial value
-    # The trick is that we need to "undo" the initial XOR of crc2 (which is the CRC of data2)
-    # and then apply it with crc1
-
-    if len2 == 0:
-        return crc1
-
-    # The correct way to combine CRC32 is to use the GF(2) matrix approach
-    # which handles the fact that CRC is a linear operation over GF(2)
-    odd = [0] * 32
-    even = [0] * 32
-    odd[0] = 0xedb88320  # CRC32 polynomial
-    row = 1
-    n = 1
-    while n < 32:
-        odd[n] = row
-        row <<= 1
-        n += 1
-    _gf2_matrix_square(even, odd)
-    _gf2_matrix_square(odd, even)
-
-    # Apply the matrix transformation to crc1 for len2 bytes
-    # This effectively "shifts" crc1 forward by len2 positions
-    while True:
-        _gf2_matrix_square(even, odd)
-        if len2 & 1:
-            crc1 = _gf2_matrix_times(even, crc1)
-        len2 >>= 1
-        if len2 == 0:
-            break
-        _gf2_matrix_square(odd, even)
-        if len2 & 1:
-            crc1 = _gf2_matrix_times(odd, crc1)
-        len2 >>= 1
-        if len2 == 0:
-            break
+    # crc32 is linear over GF(2), so crc1 only has to be advanced over len2 zero bytes, which
+    # is done with cached operators for power-of-two lengths
+    return (_crc32_shifter.shift(crc1 & 0xffffffff, len2) ^ crc2) & 0xffffffff
+
+def crc32_combine_many(crc_list):
+    """
+    combine the crc32 values of consecutive parts
+
+    crc32_combine_many([(crc32(data1), len(data1)), (crc32(data2), len(data2)), ...])
+    == crc32(data1 + data2 + ...)
 
-    crc1 ^= crc2
-    return crc1 & 0xffffffff
+    The operator of each distinct part length is built once, so combining the parts of a
+    multipart upload, which all have the same size but the last one, costs a few table
+    lookups per part.
+
+    :param crc_list: list of (crc32, length) of the parts, in order
+    :return: combined CRC32 value, 0 for an empty list
+    """
+    operators = {}
+    result = 0
+    for crc, length in crc_list:
+        operator = operators.get(length)
+        if operator is None:
+            operator = operators[length] = _crc32_shifter.operator_for_length(length)
+        result = _gf2_apply_byte_tables(operator, result) ^ (crc & 0xffffffff)
+    return result
 
 def get_crc32c_from_fp(fp, offset=0, length=-1, buf_size=8192):
     """
@@ -294,58 +373,104 @@ def _generate_crc64_tables():
 
 CRC64_TABLE = _generate_crc64_tables()
 
+_crc64_shifter = _CrcShifter(CRC64_POLY, 64)
+
+def crc64_combine(crc1, crc2, len2):
+    """
+    combine two crc64ecma values
+
+    crc64_combine(crc64(data1), crc64(data2), len(data2)) == crc64(data1 + data2)
+
+    :param crc1: CRC64 of the first part
+    :param crc2: CRC64 of the second part
+    :param len2: length of the second part in bytes
+    :return: combined CRC64 value
+    """
+    return _crc64_shifter.shift(crc1, len2) ^ crc2
+
+def _crc64_update_python(crc, data):
+    """
+    CRC64 update using slice-by-8 on little endian words
+    """
+    t0, t1, t2, t3, t4, t5, t6, t7 = CRC64_TABLE
+    crc = ~crc & 0xFFFFFFFFFFFFFFFF
+    length = len(data)
+    words = length // 8
+    # unpack the words in blocks to bound the size of the temporary tuple
+    block = 8192
+    for start in range(0, words, block):
+        count = min(block, words - start)
+        for word in struct.unpack_from('<%dQ' % count, data, start * 8):
+            crc ^= word
+            crc = (t7[crc & 0xff] ^ t6[(crc >> 8) & 0xff] ^
+                   t5[(crc >> 16) & 0xff] ^ t4[(crc >> 24) & 0xff] ^
+                   t3[(crc >> 32) & 0xff] ^ t2[(crc >> 40) & 0xff] ^
+                   t1[(crc >> 48) & 0xff] ^ t0[crc >> 56])
+    for b in bytearray(data[words * 8:]):
+        crc = t0[(crc ^ b) & 0xff] ^ (crc >> 8)
+    return ~crc & 0xFFFFFFFFFFFFFFFF
+
+_CRC64_NUMPY_MIN_SIZE = 16 * 1024
+_numpy = None
+_numpy_tables = None
+
+def _get_numpy():
+    """import numpy on first use, it is optional and slow to import"""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy
+
+def _crc64_update_numpy(crc, data):
+    """
+    CRC64 update splitting data into lanes whose crc are computed side by side with numpy,
+    then combined in order
+    """
+    global _numpy_tables
+    np = _numpy
+    if _numpy_tables is None:
+        _numpy_tables = np.array(CRC64_TABLE, dtype=np.uint64)
+    t0, t1, t2, t3, t4, t5, t6, t7 = _numpy_tables
+    # the cost is about one numpy step per 8 bytes of a lane plus one combination per lane,
+    # which is minimal for lanes of about sqrt(len(data) / 2) bytes
+    lane_power = max(6, (len(data).bit_length() - 2) // 2)
+    lane_size = 1 << lane_power
+    lanes = len(data) // lane_size
+    # words[j] holds the j-th 8 bytes of every lane
+    words = np.frombuffer(data, dtype='<u8', count=lanes * lane_size // 8)
+    words = words.reshape(lanes, lane_size // 8).T.copy()
+    mask = np.uint64(0xff)
+    shifts = [np.uint64(n) for n in (8, 16, 24, 32, 40, 48, 56)]
+    lane_crc = np.full(lanes, 0xFFFFFFFFFFFFFFFF, dtype=np.uint64)
+    for word in words:
+        c = lane_crc ^ word
+        lane_crc = (t7[c & mask] ^ t6[(c >> shifts[0]) & mask] ^
+                    t5[(c >> shifts[1]) & mask] ^ t4[(c >> shifts[2]) & mask] ^
+                    t3[(c >> shifts[3]) & mask] ^ t2[(c >> shifts[4]) & mask] ^
+                    t1[(c >> shifts[5]) & mask] ^ t0[c >> shifts[6]])
+    lane_crc ^= np.uint64(0xFFFFFFFFFFFFFFFF)
+
+    operator = _crc64_shifter.operator(lane_power)
+    for value in lane_crc.tolist():
+        crc = _gf2_apply_byte_tables(operator, crc) ^ value
+    return _crc64_update_python(crc, data[lanes * lane_size:])
+
 def _crc64_update(crc, data):
     """
-    Fast CRC64 update using slice-by-8
+    CRC64 update with the fastest available backend: the C extension of crcmod if installed,
+    numpy for large buffers if installed, pure python otherwise
     """
     if isinstance(data, str):
         data = data.encode("utf-8")
-    mv = memoryview(data)
-    table = CRC64_TABLE
-    crc = ~crc & 0xFFFFFFFFFFFFFFFF
-    length = len(mv)
-    i = 0
-    # slice-by-8 loop
-    while i + 8 <= length:
-        b0 = mv[i]
-        b1 = mv[i + 1]
-        b2 = mv[i + 2]
-        b3 = mv[i + 3]
-        b4 = mv[i + 4]
-        b5 = mv[i + 5]
-        b6 = mv[i + 6]
-        b7 = mv[i + 7]
-        if not isinstance(b0, int):  # python2
-            b0 = ord(b0); b1 = ord(b1); b2 = ord(b2); b3 = ord(b3)
-            b4 = ord(b4); b5 = ord(b5); b6 = ord(b6); b7 = ord(b7)
-        crc ^= (
-            b0
-            | (b1 << 8)
-            | (b2 << 16)
-            | (b3 << 24)
-            | (b4 << 32)
-            | (b5 << 40)
-            | (b6 << 48)
-            | (b7 << 56)
-        )
-        crc = (
-            table[7][crc & 0xff] ^
-            table[6][(crc >> 8) & 0xff] ^
-            table[5][(crc >> 16) & 0xff] ^
-            table[4][(crc >> 24) & 0xff] ^
-            table[3][(crc >> 32) & 0xff] ^
-            table[2][(crc >> 40) & 0xff] ^
-            table[1][(crc >> 48) & 0xff] ^
-            table[0][(crc >> 56) & 0xff]
-        )
-        i += 8
-    while i < length:
-        b = mv[i]
-        if not isinstance(b, int):
-            b = ord(b)
-        crc = CRC64_TABLE[0][(crc ^ b) & 0xff] ^ (crc >> 8)
-        i += 1
-    return ~crc & 0xFFFFFFFFFFFFFFFF
+    if _crc64_ext is not None:
+        return _crc64_ext(data, crc)
+    if len(data) >= _CRC64_NUMPY_MIN_SIZE and _get_numpy():
+        return _crc64_update_numpy(crc, data)
+    return _crc64_update_python(crc, data)
 
 class CRC64ECMA(object):
     """
@@ -367,10 +492,11 @@ class CRC64ECMA(object):
         """
         return self.crc
 
-def get_crc64_ecma_from_fp(fp, offset=0, length=-1, buf_size=8192):
+def get_crc64_ecma_from_fp(fp, offset=0, length=-1, buf_size=1024 * 1024):
     """
     Get CRC64 from file pointer
-    Compatible with get_crc32_from_fp
+    Compatible with get_crc32_from_fp, the larger default buf_size lets the accelerated
+    backends work on big blocks
     """
 
     origin_offset = fp.tell()
@@ -392,6 +518,21 @@ def get_crc64_ecma_from_fp(fp, offset=0, length=-1, buf_size=8192):
     fp.seek(origin_offset)
     return crc.value()
 
+def gzip_compress(data):
+    """
+    Compress a request body with gzip, to be sent with Content-Encoding: gzip.
+
+    :type data: bytes
+    :param data: body to compress
+
+    :return:
+        **gzip compressed bytes**
+    """
+    out = io.BytesIO()
+    with gzip.GzipFile(fileobj=out, mode="wb") as f:
+        f.write(data)
+    return out.getvalue()
+
 def get_canonical_time(timestamp=0):
     """
     Get cannonical time.
@@ -528,6 +669,30 @@ def _get_normalized_char_list():
 _NORMALIZED_CHAR_LIST = _get_normalized_char_list()
 
 
+# letters, digits and "_.-" are never quoted, "~" is unreserved too
+_NORMALIZE_SAFE = '~'
+_NORMALIZE_SAFE_KEEP_SLASH = '~/'
+_NORMALIZE_CACHE_SIZE = 4096
+
+
+def _normalize_bytes(in_bytes, encoding_slash):
+    if encoding_slash:
+        return compat.convert_to_bytes(_quote(in_bytes, _NORMALIZE_SAFE))
+    return compat.convert_to_bytes(_quote(in_bytes, _NORMALIZE_SAFE_KEEP_SLASH))
+
+
+def _normalize_string_uncached(in_str, encoding_slash=True):
+    return _normalize_bytes(convert_to_standard_string(in_str), encoding_slash)
+
+
+if hasattr(functools, 'lru_cache'):
+    # object keys, bucket names and header values repeat a lot; typed keeps True apart from 1
+    _normalize_string_cached = functools.lru_cache(
+        maxsize=_NORMALIZE_CACHE_SIZE, typed=True)(_normalize_string_uncached)
+else:
+    _normalize_string_cached = _normalize_string_uncached
+
+
 def normalize_string(in_str, encoding_slash=True):
     """
     Encode in_str.
@@ -542,23 +707,11 @@ def normalize_string(in_str, encoding_slash=True):
     :return:
         **ASCII  string**
     """
-    tmp = []
-    for ch in convert_to_standard_string(in_str):
-        # on python3, ch is int type
-        sep = ''
-        index = -1
-        if isinstance(ch, int):
-            # on py3
-            sep = chr(ch).encode("utf-8")
-            index = ch
-        else:
-            sep = ch
-            index = ord(ch)
-        if sep == b'/' and not encoding_slash:
-            tmp.append(b'/')
-        else:
-            tmp.append(_NORMALIZED_CHAR_LIST[index])
-    return (b'').join(tmp)
+    try:
+        return _normalize_string_cached(in_str, encoding_slash)
+    except TypeError:
+        # unhashable input
+        return _normalize_string_uncached(in_str, encoding_slash)
 
 
 def append_uri(base_uri, *path_components):
@@ -736,11 +889,173 @@ def dict_to_python_object(d):
     for k, v in iteritems(d):
         if not isinstance(k, compat.string_types):
             k = compat.convert_to_string(k)
-        k = pythonize_name(k)
+        k = pythonize_name_cached(k)
         attr[k] = v
     return Expando(attr)
 
 
+_PYTHONIZED_NAMES = {}
+_PYTHONIZED_NAMES_MAX_SIZE = 4096
+
+
+def pythonize_name_cached(name):
+    """
+    pythonize_name with a translation table of the names seen so far.
+
+    :param name: camel case name
+    :type name: string
+    :return: pythonic name
+    """
+    python_name = _PYTHONIZED_NAMES.get(name)
+    if python_name is None:
+        if not isinstance(name, compat.string_types):
+            python_name = pythonize_name(compat.convert_to_string(name))
+        else:
+            python_name = pythonize_name(name)
+        if len(_PYTHONIZED_NAMES) >= _PYTHONIZED_NAMES_MAX_SIZE:
+            _PYTHONIZED_NAMES.clear()
+        _PYTHONIZED_NAMES[name] = python_name
+    return python_name
+
+
+# the descriptor of the instance dict, which LazyExpando.__dict__ wraps
+_expando_dict = Expando.__dict__['__dict__']
+
+
+class LazyExpando(Expando):
+    """
+    Expando backed by a parsed json dict.
+
+    The attributes are the pythonized keys of the dict, as with dict_to_python_object, but a
+    key is translated and its value converted only when the attribute is first read. Values
+    read once are kept in __dict__. Reading __dict__ itself, as vars() and the serializers of
+    the clients do, converts all of the remaining keys first, so that it is the same as the
+    __dict__ of an Expando built by dict_to_python_object.
+    """
+    __slots__ = ('_json_dict', '_json_names')
+
+    def __init__(self, json_dict):
+        self._json_dict = json_dict
+        self._json_names = None
+
+    @property
+    def __dict__(self):
+        attrs = _expando_dict.__get__(self)
+        json_dict = self._json_dict
+        if json_dict is not None:
+            for k, v in iteritems(json_dict):
+                name = pythonize_name_cached(k)
+                if name not in attrs:
+                    attrs[name] = lazy_json_value(v)
+            self._json_dict = None
+            self._json_names = None
+        return attrs
+
+    def __getattr__(self, item):
+        if item.startswith('__') or item in LazyExpando.__slots__:
+            raise AttributeError(item)
+        json_dict = self._json_dict
+        if json_dict is None:
+            return None
+        names = self._json_names
+        if names is None:
+            names = self._json_names = dict((pythonize_name_cached(k), k) for k in json_dict)
+        key = names.get(item)
+        if key is None:
+            return None
+        value = lazy_json_value(json_dict[key])
+        _expando_dict.__get__(self)[item] = value
+        return value
+
+    def __reduce_ex__(self, protocol):
+        # copies and pickles are plain Expando objects
+        return Expando, (dict(self.__dict__),)
+
+
+def lazy_json_value(value):
+    """
+    Wrap a value decoded by json.loads without an object_hook, dicts become LazyExpando.
+
+    :param value: decoded json value
+    :return: value with the same attribute interface as dict_to_python_object produces
+    """
+    if isinstance(value, dict):
+        return LazyExpando(value)
+    if isinstance(value, list):
+        return [lazy_json_value(v) for v in value]
+    return value
+
+
+def json_to_python_object(value):
+    """
+    Convert a value decoded by json.loads without an object_hook to what
+    json.loads(object_hook=dict_to_python_object) returns.
+
+    :param value: decoded json value
+    :return: value with every dict converted to Expando
+    """
+    if isinstance(value, dict):
+        obj = Expando()
+        attr = obj.__dict__
+        for k, v in iteritems(value):
+            if isinstance(v, (dict, list)):
+                v = json_to_python_object(v)
+            attr[pythonize_name_cached(k)] = v
+        return obj
+    if isinstance(value, list):
+        return [json_to_python_object(v) if isinstance(v, (dict, list)) else v for v in value]
+    return value
+
+
+def apply_object_hook(value, object_hook):
+    """
+    Apply object_hook to every dict of a decoded json value, innermost first, the same as
+    json.loads(object_hook=object_hook) does.
+
+    :param value: decoded json value
+    :param object_hook: function converting a dict
+    :return: the converted value
+    """
+    if isinstance(value, dict):
+        return object_hook(dict((k, apply_object_hook(v, object_hook)) for k, v in iteritems(value)))
+    if isinstance(value, list):
+        return [apply_object_hook(v, object_hook) for v in value]
+    return value
+
+
+def split_key_range(start, stop, segments):
+    """
+    Cut the range of keys [start, stop) into segments ranges of about the same width, by
+    interpolating the keys as base 128 numbers, characters above 0x7f count as 0x7f.
+
+    :param start: first key of the range
+    :type start: str
+    :param stop: key after the range, an empty stop is the end of the key space
+    :type stop: str
+    :param segments: number of ranges
+    :type segments: int
+
+    :return: the ascii keys cutting the range, in ascending order, fewer than segments - 1 if
+        the range is too narrow
+    :rtype: list
+    """
+    digits = max(len(start), len(stop)) + 2
+
+    def to_number(key):
+        return sum(min(ord(c), 0x7f) << (7 * (digits - 1 - i)) for i, c in enumerate(key))
+
+    low = to_number(start)
+    high = to_number(stop) if stop else 1 << (7 * digits)
+    split_keys = []
+    for i in range(1, segments):
+        value = low + (high - low) * i // segments
+        key = ''.join(chr((value >> (7 * (digits - 1 - j))) & 0x7f) for j in range(digits))
+        key = key.rstrip('\x00')
+        if key > (split_keys[-1] if split_keys else start) and (not stop or key < stop):
+            split_keys.append(key)
+    return split_keys
+
+
 def required(**types):
     """
     decorator of input param check
@@ -1008,6 +1323,96 @@ class _BytesAndFileAdapter(object):
 
         return content
 
+class ChecksumReader(object):
+    """Read at most size bytes of a file object, computing their checksums on the fly.
+
+    This lets a body be checksummed while it is being sent instead of reading it twice.
+    seek() back to the start position restarts the checksums, as bce_http_client does before
+    retrying a request.
+
+    :param fp: file object positioned at the start of the data
+    :param int size: number of bytes to read
+    :param algorithms: checksums to compute, any of 'crc32', 'crc32c', 'crc64ecma' and 'md5'
+    """
+    ALGORITHMS = ('crc32', 'crc32c', 'crc64ecma', 'md5')
+
+    def __init__(self, fp, size, algorithms=('crc32',)):
+        for algorithm in algorithms:
+            if algorithm not in ChecksumReader.ALGORITHMS:
+                raise ValueError('unsupported checksum algorithm %s' % algorithm)
+        if 'crc32c' in algorithms and not _has_crc32c:
+            raise ImportError("crc32c module is not installed. Install it with: pip install crc32c")
+        self.fp = fp
+        self.size = size
+        self.algorithms = tuple(algorithms)
+        try:
+            self._start = fp.tell()
+        except (AttributeError, IOError, OSError):
+            # a pipe or a socket, it can not be sent again
+            self._start = 0
+        self._reset()
+
+    def _reset(self):
+        self.offset = 0
+        self.crc32 = 0 if 'crc32' in self.algorithms else None
+        self.crc32c = 0 if 'crc32c' in self.algorithms else None
+        self._crc64 = CRC64ECMA(0) if 'crc64ecma' in self.algorithms else None
+        self._md5 = hashlib.md5() if 'md5' in self.algorithms else None
+
+    @property
+    def len(self):
+        return self.size - self.offset
+
+    def __bool__(self):
+        return True
+    __nonzero__ = __bool__
+
+    @property
+    def done(self):
+        """True if all of the size bytes have been read"""
+        return self.offset >= self.size
+
+    @property
+    def crc64ecma(self):
+        """CRC64-ECMA of the bytes read so far, None if not computed"""
+        if self._crc64 is None:
+            return None
+        return self._crc64.value()
+
+    @property
+    def md5(self):
+        """base64 encoded MD5 of the bytes read so far, as get_md5_from_fp, None if not computed"""
+        if self._md5 is None:
+            return None
+        return base64.standard_b64encode(self._md5.digest())
+
+    def read(self, amt=None):
+        if amt is None or amt < 0 or amt > self.size - self.offset:
+            amt = self.size - self.offset
+        if amt <= 0:
+            return b''
+        content = self.fp.read(amt)
+        if self.crc32 is not None:
+            self.crc32 = zlib.crc32(content, self.crc32) & 0xffffffff
+        if self.crc32c is not None:
+            self.crc32c = crc32c.crc32c(content, self.crc32c) & 0xffffffff
+        if self._crc64 is not None:
+            self._crc64.update(content)
+        if self._md5 is not None:
+            self._md5.update(content)
+        self.offset += len(content)
+        return content
+
+    def tell(self):
+        return self._start + self.offset
+
+    def seek(self, pos, whence=os.SEEK_SET):
+        if whence != os.SEEK_SET or pos != self._start:
+            raise IOError('ChecksumReader can only seek back to its start position')
+        self.fp.seek(pos)
+        self._reset()
+
+
 def default_progress_callback(consumed_bytes, total_bytes):
     """Progress bar callback function that calculates the percentage of current completion
     
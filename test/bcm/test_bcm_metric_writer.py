@@ -0,0 +1,155 @@
+#-*- coding: UTF-8 -*-
+# Copyright (c) 2014 Baidu.com, Inc. All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""
+Unit tests for bcm metric writer.
+"""
+import gzip
+import io
+import json
+import threading
+import unittest
+
+from baidubce import utils
+from baidubce.exception import BceClientError
+from baidubce.services.bcm.bcm_metric_writer import MetricDataWriter
+
+
+class RecordingClient(object):
+    """
+    stands in for BcmClient and records the pushed batches
+    """
+
+    def __init__(self, gate=None, fail=False):
+        self.calls = []
+        self.custom_calls = []
+        self.gate = gate
+        self.fail = fail
+
+    def push_metric_data(self, user_id=None, scope=None, metric_data=None, config=None, use_gzip=False):
+        if self.gate is not None:
+            self.gate.wait()
+        if self.fail:
+            raise IOError("push failed")
+        self.calls.append((user_id, scope, list(metric_data), use_gzip))
+
+    def push_custom_metric_data(self, user_id=None, namespace=None, metric_name=None,
+                                dimensions=None, value=None, timestamp=None, config=None):
+        if self.fail:
+            raise IOError("push failed")
+        self.custom_calls.append((user_id, namespace, metric_name, value))
+
+
+class TestMetricDataWriter(unittest.TestCase):
+    """
+    Test class for MetricDataWriter
+    """
+
+    def test_batches_by_size_and_key(self):
+        """
+        test datapoints are grouped per user and scope and cut at batch_size
+        """
+        client = RecordingClient()
+        with MetricDataWriter(client, batch_size=10, flush_interval=60) as writer:
+            for i in range(25):
+                writer.put("u1", "ns1", "pv", [], i, "2023-12-17T08:00:00Z")
+            for i in range(3):
+                writer.put("u1", "ns2", "pv", [], i, "2023-12-17T08:00:00Z")
+        sizes = sorted((scope, len(data)) for _, scope, data, _ in client.calls)
+        self.assertEqual(sizes, [("ns1", 5), ("ns1", 10), ("ns1", 10), ("ns2", 3)])
+        values = [d["value"] for _, scope, data, _ in client.calls if scope == "ns1" for d in data]
+        self.assertEqual(sorted(values), list(range(25)))
+        self.assertEqual(writer.requests_sent, 4)
+        self.assertEqual(writer.datapoints_sent, 28)
+        self.assertFalse(any(use_gzip for _, _, _, use_gzip in client.calls))
+
+    def test_use_gzip(self):
+        """
+        test batches are pushed gzip compressed when asked to
+        """
+        client = RecordingClient()
+        with MetricDataWriter(client, use_gzip=True) as writer:
+            writer.put("u1", "ns1", "pv", [], 1, "2023-12-17T08:00:00Z")
+        self.assertTrue(all(use_gzip for _, _, _, use_gzip in client.calls))
+
+    def test_custom_namespace(self):
+        """
+        test datapoints of custom namespaces are pushed through push_custom_metric_data
+        """
+        client = RecordingClient()
+        with MetricDataWriter(client, batch_size=10, flush_interval=60) as writer:
+            for i in range(3):
+                writer.put_custom("u1", "my_ns", "pv", [], i, "2023-12-17T08:00:00Z")
+            writer.put("u1", "my_ns", "pv", [], 9, "2023-12-17T08:00:00Z")
+        self.assertEqual(client.custom_calls, [("u1", "my_ns", "pv", i) for i in range(3)])
+        self.assertEqual(len(client.calls), 1)
+        self.assertEqual(writer.requests_sent, 4)
+        self.assertEqual(writer.datapoints_sent, 4)
+
+    def test_flush_interval(self):
+        """
+        test partial batches are sent after flush_interval
+        """
+        client = RecordingClient()
+        writer = MetricDataWriter(client, batch_size=100, flush_interval=0.05)
+        writer.put("u1", "ns1", "pv", [], 1, "2023-12-17T08:00:00Z")
+        deadline = threading.Event()
+        for _ in range(100):
+            if client.calls:
+                break
+            deadline.wait(0.02)
+        self.assertEqual(len(client.calls), 1)
+        writer.close()
+
+    def test_back_pressure(self):
+        """
+        test put blocks, and times out, while the buffer is full
+        """
+        gate = threading.Event()
+        client = RecordingClient(gate=gate)
+        writer = MetricDataWriter(client, batch_size=2, flush_interval=60, max_buffered=4)
+        for i in range(4):
+            writer.put("u1", "ns1", "pv", [], i, "t")
+        self.assertRaises(BceClientError, writer.put, "u1", "ns1", "pv", [], 4, "t", 0.05)
+        gate.set()
+        writer.put("u1", "ns1", "pv", [], 4, "t", 5)
+        self.assertTrue(writer.flush(5))
+        self.assertEqual(writer.datapoints_sent, 5)
+        writer.close()
+        self.assertRaises(BceClientError, writer.put, "u1", "ns1", "pv", [], 5, "t")
+
+    def test_error_callback(self):
+        """
+        test failed batches are handed to error_callback
+        """
+        failed = []
+        writer = MetricDataWriter(RecordingClient(fail=True), batch_size=2, flush_interval=60,
+                                  error_callback=lambda e, u, s, data: failed.append((u, s, len(data))))
+        for i in range(3):
+            writer.put("u1", "ns1", "pv", [], i, "t")
+        writer.close()
+        self.assertEqual(sorted(failed), [("u1", "ns1", 1), ("u1", "ns1", 2)])
+        self.assertEqual(writer.errors, 2)
+
+    def test_gzip_compress(self):
+        """
+        test the gzip helper used for compressed push bodies
+        """
+        body = json.dumps({"metricData": [{"value": 1}] * 100}).encode("utf-8")
+        compressed = utils.gzip_compress(body)
+        self.assertLess(len(compressed), len(body))
+        self.assertEqual(gzip.GzipFile(fileobj=io.BytesIO(compressed)).read(), body)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+# Copyright 2014 Baidu, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+"""
+Benchmark of the CRC64-ECMA backends of baidubce.utils.
+
+usage: python crc64_benchmark.py [size_in_mb]
+"""
+from __future__ import print_function
+import io
+import os
+import sys
+import time
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../'))
+
+from baidubce import utils
+
+
+def _crc64_update_baseline(crc, data):
+    """the byte-indexing slice-by-8 loop used before the backends were added"""
+    mv = memoryview(data)
+    table = utils.CRC64_TABLE
+    crc = ~crc & 0xFFFFFFFFFFFFFFFF
+    length = len(mv)
+    i = 0
+    while i + 8 <= length:
+        crc ^= (mv[i] | (mv[i + 1] << 8) | (mv[i + 2] << 16) | (mv[i + 3] << 24) |
+                (mv[i + 4] << 32) | (mv[i + 5] << 40) | (mv[i + 6] << 48) | (mv[i + 7] << 56))
+        crc = (table[7][crc & 0xff] ^ table[6][(crc >> 8) & 0xff] ^
+               table[5][(crc >> 16) & 0xff] ^ table[4][(crc >> 24) & 0xff] ^
+               table[3][(crc >> 32) & 0xff] ^ table[2][(crc >> 40) & 0xff] ^
+               table[1][(crc >> 48) & 0xff] ^ table[0][(crc >> 56) & 0xff])
+        i += 8
+    while i < length:
+        crc = table[0][(crc ^ mv[i]) & 0xff] ^ (crc >> 8)
+        i += 1
+    return ~crc & 0xFFFFFFFFFFFFFFFF
+
+
+def _measure(name, func, data, expected=None):
+    start = time.time()
+    value = func(data)
+    elapsed = time.time() - start
+    status = ''
+    if expected is not None and value != expected:
+        status = '  MISMATCH'
+    print('%-24s %10.1f MB/s%s' % (name, len(data) / elapsed / 1024 / 1024, status))
+    return value
+
+
+def main():
+    """run the benchmark"""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    data = os.urandom(size * 1024 * 1024)
+    print('CRC64-ECMA of %d MB' % size)
+
+    # the baseline is slow, measure it on a smaller buffer
+    expected = utils._crc64_update_python(0, data[:4 * 1024 * 1024])
+    _measure('baseline (4MB)', lambda d: _crc64_update_baseline(0, d),
+             data[:4 * 1024 * 1024], expected)
+    expected = _measure('python', lambda d: utils._crc64_update_python(0, d), data)
+    if utils._get_numpy():
+        _measure('numpy', lambda d: utils._crc64_update_numpy(0, d), data, expected)
+    else:
+        print('numpy                    not installed')
+    if utils._crc64_ext is not None:
+        _measure('crcmod extension', lambda d: utils._crc64_ext(d, 0), data, expected)
+    else:
+        print('crcmod extension         not installed')
+    _measure('get_crc64_ecma_from_fp', lambda d: utils.get_crc64_ecma_from_fp(io.BytesIO(d)),
+             data, expected)
+    _measure('zlib.crc32 (reference)', zlib.crc32, data)
+
+    start = time.time()
+    parts = 10000
+    for i in range(parts):
+        utils.crc64_combine(expected, expected, 5 * 1024 * 1024 + i)
+    print('%-24s %10.1f us/call' % ('crc64_combine', (time.time() - start) * 1e6 / parts))
+
+
+if __name__ == '__main__':
+    main()
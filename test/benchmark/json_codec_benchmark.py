@@ -0,0 +1,83 @@
+# Copyright 2014 Baidu, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+"""
+Benchmark of the json codecs of baidubce.json_codec on batch writes and list responses.
+
+Every installed codec serializes a 1000 datapoint BCM push, a 1000 row BTS batch put and
+parses a 1000 entry BOS list_objects page through handler.parse_json.
+
+usage: python json_codec_benchmark.py [repeat]
+"""
+from __future__ import print_function
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../'))
+
+from baidubce import json_codec
+from baidubce.bce_response import BceResponse
+from baidubce.exception import BceClientError
+from baidubce.http import handler
+from baidubce.services.bcm import bcm_model
+
+
+class _Response(object):
+    status = 200
+
+    def __init__(self, body):
+        self.body = body
+
+    def read(self):
+        return self.body
+
+    def close(self):
+        pass
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    metric_data = {"metricData": [
+        bcm_model.MetricDatum("cpu_usage", [{"name": "InstanceId", "value": "i-%06d" % i}],
+                              i * 0.5, "2024-01-01T00:00:%02dZ" % (i % 60))
+        for i in range(1000)]}
+    rows = {"rows": [{"rowkey": "user%08d" % i,
+                      "cells": [{"column": "c%d" % c, "value": "v%d" % (i * c)} for c in range(5)]}
+                     for i in range(1000)]}
+    list_body = json.dumps({
+        "name": "bucket", "prefix": "", "marker": "", "maxKeys": 1000, "isTruncated": True,
+        "nextMarker": "dir/object-000999",
+        "contents": [{"key": "dir/object-%06d" % i, "lastModified": "2024-01-01T00:00:00Z",
+                      "eTag": "%032x" % i, "size": i, "storageClass": "STANDARD",
+                      "owner": {"id": "owner", "displayName": "owner"}} for i in range(1000)]
+    }).encode('utf-8')
+
+    print('%-8s %16s %16s %16s' % ('codec', 'bcm push (ms)', 'bts put (ms)', 'list parse (ms)'))
+    for name in ('json', 'orjson', 'ujson'):
+        try:
+            codec = json_codec.get_codec(name)
+        except BceClientError:
+            print('%-8s not installed' % name)
+            continue
+        parser = handler.get_json_parser(codec=None if codec is json_codec.STDLIB_CODEC else codec)
+
+        def parse():
+            parser(_Response(list_body), BceResponse())
+
+        results = [timeit.timeit(f, number=repeat) / repeat * 1000 for f in (
+            lambda: codec.dumps(metric_data), lambda: codec.dumps(rows), parse)]
+        print('%-8s %16.2f %16.2f %16.2f' % tuple([name] + results))
+
+
+if __name__ == '__main__':
+    main()
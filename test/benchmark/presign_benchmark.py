@@ -0,0 +1,62 @@
+# Copyright 2014 Baidu, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+"""
+Benchmark of BosClient.generate_pre_signed_url and PreSigner.sign_many.
+
+usage: python presign_benchmark.py [number_of_keys]
+"""
+from __future__ import print_function
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../'))
+
+from baidubce.auth import bce_credentials
+from baidubce.bce_client_configuration import BceClientConfiguration
+from baidubce.services.bos import bos_client
+
+
+def _measure(name, func, keys, baseline=None):
+    start = time.time()
+    urls = func(keys)
+    rate = len(keys) / (time.time() - start)
+    speedup = '' if baseline is None else '  (x%.1f)' % (rate / baseline)
+    print('%-28s %10.0f%s' % (name, rate, speedup))
+    return rate, urls
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    client = bos_client.BosClient(BceClientConfiguration(
+        credentials=bce_credentials.BceCredentials(b'0123456789abcdef0123456789abcdef',
+                                                   b'fedcba9876543210fedcba9876543210'),
+        endpoint=b'bj.bcebos.com'))
+    keys = [b'videos/2024/%08d/clip-%d.mp4' % (i, i % 7) for i in range(count)]
+    timestamp = int(time.time())
+
+    print('urls per second')
+    baseline, expected = _measure(
+        'generate_pre_signed_url',
+        lambda keys: [client.generate_pre_signed_url(b'bucket', key, timestamp=timestamp,
+                                                     expiration_in_seconds=3600)
+                      for key in keys],
+        keys)
+    signer = client.get_pre_signer(b'bucket', expiration_in_seconds=3600, timestamp=timestamp)
+    _, urls = _measure('PreSigner.sign_many', signer.sign_many, keys, baseline)
+    if urls != expected:
+        print('MISMATCH')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
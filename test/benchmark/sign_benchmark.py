@@ -0,0 +1,166 @@
+# Copyright 2014 Baidu, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+"""
+Benchmark of bce_v1_signer.sign and of small BOS GETs against a local HTTP server.
+
+The baseline is the signer used before bce_v1_signer.Signer was added. It derived the signing
+key on every call and send_request called it twice per request, so the baseline GET run signs
+twice per request.
+
+usage: python sign_benchmark.py [seconds_per_case]
+"""
+from __future__ import print_function
+import hashlib
+import hmac
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../'))
+
+from baidubce import compat
+from baidubce import utils
+from baidubce.auth import bce_credentials
+from baidubce.auth import bce_v1_signer
+from baidubce.bce_client_configuration import BceClientConfiguration
+from baidubce.http import http_headers
+from baidubce.services.bos import bos_client
+
+if compat.PY3:
+    import http.server as http_server
+    import socketserver
+else:
+    import BaseHTTPServer as http_server
+    import SocketServer as socketserver
+
+
+def _get_canonical_headers_baseline(headers, headers_to_sign=None):
+    headers = headers or {}
+    if headers_to_sign is None or len(headers_to_sign) == 0:
+        headers_to_sign = set([b"host", b"content-md5", b"content-length", b"content-type"])
+    result = []
+    for k in headers:
+        k_lower = k.strip().lower()
+        value = utils.convert_to_standard_string(headers[k]).strip()
+        if not value:
+            continue
+        if k_lower.startswith(http_headers.BCE_PREFIX) or k_lower in headers_to_sign:
+            result.append(b"%s:%s" % (utils.normalize_string(k_lower), utils.normalize_string(value)))
+    result.sort()
+    return b'\n'.join(result)
+
+
+def sign_baseline(credentials, http_method, path, headers, params,
+                  timestamp=0, expiration_in_seconds=1800, headers_to_sign=None):
+    """the signer before the signing key cache"""
+    headers = headers or {}
+    params = params or {}
+    sign_key_info = b'bce-auth-v1/%s/%s/%d' % (
+        credentials.access_key_id, utils.get_canonical_time(timestamp), expiration_in_seconds)
+    sign_key = hmac.new(credentials.secret_access_key, sign_key_info, hashlib.sha256).hexdigest()
+    string_to_sign = b'\n'.join([http_method, path, utils.get_canonical_querystring(params, True),
+                                 _get_canonical_headers_baseline(headers, headers_to_sign)])
+    sign_result = compat.convert_to_bytes(
+        hmac.new(compat.convert_to_bytes(sign_key), string_to_sign, hashlib.sha256).hexdigest())
+    if headers_to_sign:
+        return b'%s/%s/%s' % (sign_key_info, b';'.join(headers_to_sign), sign_result)
+    return b'%s//%s' % (sign_key_info, sign_result)
+
+
+def sign_baseline_twice(*args, **kwargs):
+    """send_request used to sign once before its retry loop and once inside it"""
+    sign_baseline(*args, **kwargs)
+    return sign_baseline(*args, **kwargs)
+
+
+class _Handler(http_server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    body = b'x' * 128
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(self.body)))
+        self.send_header('ETag', '"abc"')
+        self.end_headers()
+        self.wfile.write(self.body)
+
+
+class _Server(socketserver.ThreadingMixIn, http_server.HTTPServer):
+    daemon_threads = True
+
+
+def _rate(func, seconds):
+    count = 0
+    start = time.time()
+    while True:
+        for _ in range(50):
+            func()
+        count += 50
+        elapsed = time.time() - start
+        if elapsed >= seconds:
+            return count / elapsed
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    credentials = bce_credentials.BceCredentials(b'0123456789abcdef0123456789abcdef',
+                                                 b'fedcba9876543210fedcba9876543210')
+    headers = {
+        http_headers.HOST: b'bj.bcebos.com',
+        http_headers.CONTENT_LENGTH: 0,
+        http_headers.BCE_DATE: utils.get_canonical_time(),
+        http_headers.USER_AGENT: b'bce-sdk-python',
+        b'x-bce-meta-owner': b'benchmark',
+    }
+    path = b'/bucket/object/key.txt'
+    params = {b'versionId': b'v1'}
+    signer = bce_v1_signer.Signer()
+    assert signer(credentials, b'GET', path, headers, params, 1) == \
+        sign_baseline(credentials, b'GET', path, headers, params, 1)
+
+    print('sign() calls per second')
+    print('%-24s %10.0f' % ('baseline', _rate(
+        lambda: sign_baseline(credentials, b'GET', path, headers, params), seconds)))
+    print('%-24s %10.0f' % ('Signer', _rate(
+        lambda: signer(credentials, b'GET', path, headers, params), seconds)))
+
+    server = _Server(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    config = BceClientConfiguration(credentials=credentials,
+                                    endpoint=compat.convert_to_bytes(
+                                        '127.0.0.1:%d' % server.server_address[1]))
+    client = bos_client.BosClient(config)
+
+    def get():
+        client.get_object_as_string(b'bucket', b'key.txt')
+
+    print('small GETs per second')
+    original_sign = bce_v1_signer.sign
+    try:
+        bce_v1_signer.sign = sign_baseline_twice
+        baseline = _rate(get, seconds)
+    finally:
+        bce_v1_signer.sign = original_sign
+    current = _rate(get, seconds)
+    print('%-24s %10.0f' % ('baseline', baseline))
+    print('%-24s %10.0f  (%+.1f%%)' % ('Signer', current, (current / baseline - 1) * 100))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+# Copyright (c) 2014 Baidu.com, Inc. All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""
+Unit tests for bls log producer.
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+
+file_path = os.path.normpath(os.path.dirname(__file__))
+sys.path.append(file_path + '/../../')
+
+from baidubce.exception import BceClientError
+from baidubce.exception import BceHttpClientError
+from baidubce.services.bls.bls_log_producer import LogProducer
+from baidubce.services.bls.bls_model import LogRecordModel
+from baidubce.services.bls.bls_model import TagModel
+
+
+class RecordingClient(object):
+    """
+    records the pushes instead of sending them
+    """
+
+    def __init__(self, gate=None, failures=None):
+        self.pushes = []
+        self.attempts = 0
+        self.gate = gate
+        self.failures = list(failures or [])
+        self.lock = threading.Lock()
+
+    def push_log_records(self, log_store_name, log_stream_name, log_records, project=None,
+                         type=None, tags=None, config=None):
+        if self.gate is not None:
+            self.gate.wait()
+        with self.lock:
+            self.attempts += 1
+            if self.failures:
+                raise self.failures.pop(0)
+            self.pushes.append((project, log_store_name, log_stream_name, type,
+                                [r["message"] for r in log_records], tags))
+
+
+def _record(i, size=10):
+    return LogRecordModel(("%d:" % i).ljust(size, "x"), 1715231012000 + i)
+
+
+class TestLogProducer(unittest.TestCase):
+    """
+    Test class for LogProducer
+    """
+
+    def test_batches(self):
+        """
+        test records are grouped per stream and cut by count and bytes
+        """
+        client = RecordingClient()
+        tags = [TagModel("env", "test")]
+        with LogProducer(client, batch_size=10, max_batch_bytes=1000, tags=tags) as producer:
+            for i in range(25):
+                producer.send("store", "stream1", _record(i))
+            producer.send("store", "stream2", _record(0), project="p", type="JSON")
+            for i in range(3):
+                producer.send("store", "stream3", _record(i, 400))
+        batches = sorted((p[2], len(p[4])) for p in client.pushes)
+        self.assertEqual(batches, [("stream1", 5), ("stream1", 10), ("stream1", 10),
+                                   ("stream2", 1), ("stream3", 1), ("stream3", 2)])
+        self.assertIn(("p", "store", "stream2", "JSON", ["0:xxxxxxxx"], tags), client.pushes)
+        self.assertEqual(producer.records_sent, 29)
+        self.assertEqual(producer.requests_sent, 6)
+        self.assertRaises(BceClientError, producer.send, "store", "stream1", _record(0))
+
+    def test_flush_interval(self):
+        """
+        test buffered records are pushed after flush_interval
+        """
+        client = RecordingClient()
+        producer = LogProducer(client, flush_interval=0.05)
+        producer.send("store", "stream", _record(1))
+        deadline = time.time() + 5
+        while not client.pushes and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(client.pushes), 1)
+        producer.close()
+
+    def test_full_buffer(self):
+        """
+        test send drops records or blocks while the buffer is full
+        """
+        gate = threading.Event()
+        self.addCleanup(gate.set)
+        client = RecordingClient(gate=gate)
+        producer = LogProducer(client, batch_size=1, max_batch_bytes=100,
+                               max_buffered_bytes=250, block_on_full=False)
+        self.assertTrue(producer.send("store", "stream", _record(0, 60)))
+        self.assertTrue(producer.send("store", "stream", _record(1, 60)))
+        self.assertFalse(producer.send("store", "stream", _record(2, 60)))
+        self.assertEqual(producer.records_dropped, 1)
+        gate.set()
+        producer.close()
+        self.assertEqual(producer.records_sent, 2)
+
+        gate = threading.Event()
+        self.addCleanup(gate.set)
+        producer = LogProducer(RecordingClient(gate=gate), batch_size=1, max_batch_bytes=100,
+                               max_buffered_bytes=250)
+        producer.send("store", "stream", _record(0, 60))
+        producer.send("store", "stream", _record(1, 60))
+        self.assertRaises(BceClientError, producer.send, "store", "stream", _record(2, 60),
+                          timeout=0.05)
+        blocked = threading.Thread(target=producer.send, args=("store", "stream", _record(3)))
+        blocked.start()
+        blocked.join(0.05)
+        self.assertTrue(blocked.is_alive())
+        gate.set()
+        blocked.join(5)
+        producer.close()
+        self.assertEqual(producer.records_sent, 3)
+
+    def test_oversized_record(self):
+        """
+        test a record larger than max_buffered_bytes is buffered once the buffer is empty
+        """
+        gate = threading.Event()
+        self.addCleanup(gate.set)
+        client = RecordingClient(gate=gate)
+        producer = LogProducer(client, batch_size=10, max_batch_bytes=100,
+                               max_buffered_bytes=200, flush_interval=0.01)
+        producer.send("store", "stream", _record(0))
+        blocked = threading.Thread(target=producer.send,
+                                   args=("store", "stream", _record(1, 500)))
+        blocked.start()
+        blocked.join(0.05)
+        self.assertTrue(blocked.is_alive())
+        gate.set()
+        blocked.join(5)
+        self.assertFalse(blocked.is_alive())
+        producer.close()
+        self.assertEqual(producer.records_sent, 2)
+        self.assertEqual([len(p[4]) for p in client.pushes], [1, 1])
+
+    def test_utf8_size(self):
+        """
+        test records are measured in utf-8 bytes
+        """
+        client = RecordingClient()
+        message = u"\u65e5\u5fd7" * 20
+        with LogProducer(client, batch_size=10, max_batch_bytes=2 * (120 + 48)) as producer:
+            for i in range(4):
+                producer.send("store", "stream", LogRecordModel(message, 1715231012000 + i))
+        self.assertEqual([len(p[4]) for p in client.pushes], [2, 2])
+
+    def test_retries(self):
+        """
+        test transient failures are retried and the others are reported
+        """
+        client = RecordingClient(failures=[
+            BceHttpClientError("unavailable", None, status_code=503),
+            BceHttpClientError("timeout", None)])
+        with LogProducer(client, retry_backoff=0.01) as producer:
+            producer.send("store", "stream", _record(0))
+        self.assertEqual(client.attempts, 3)
+        self.assertEqual(producer.records_sent, 1)
+
+        failed = []
+        client = RecordingClient(failures=[
+            BceHttpClientError("denied", None, status_code=403)])
+        with LogProducer(client, retry_backoff=0.01,
+                         error_callback=lambda e, *args: failed.append(args)) as producer:
+            producer.send("store", "stream", _record(0))
+        self.assertEqual(client.attempts, 1)
+        self.assertEqual(failed, [(None, "store", "stream", [_record(0)])])
+        self.assertEqual(producer.errors, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
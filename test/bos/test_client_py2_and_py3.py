@@ -22,20 +22,30 @@ from builtins import bytes
 # from future.utils import iterkeys
 # from future.utils import itervalues
 
+import asyncio
 import base64
+import hashlib
+import hmac
 import multiprocessing
 import os
 import sys
 import random
+import shutil
+import tempfile
 import unittest
+import zlib
 import http.client
 import io
 import json
 import socket
+import socketserver
+import struct
 import threading
 import time
 import pprint
 from datetime import datetime
+from http import server as http_server
+from urllib.parse import parse_qs, unquote, urlparse
 
 import math
 from unittest.mock import patch, MagicMock
@@ -46,7 +56,9 @@ from baidubce.auth import bce_v1_signer
 from baidubce.auth import bce_credentials
 from baidubce import utils
 from baidubce import compat
+from baidubce import json_codec
 from baidubce.services.bos import bos_client
+from baidubce.services.bos import bos_transfer_manager
 from baidubce.services.bos import storage_class
 from baidubce.services.bos.bos_client import UploadTaskHandle
 from baidubce.exception import BceHttpClientError
@@ -600,6 +612,47 @@ class TestGeneratePreSignedUrlUnit(unittest.TestCase):
         self.assertNotIn(b'host%3Bx-bce-request-payer', url.lower())
 
 
+class TestPreSigner(unittest.TestCase):
+    """unit tests for PreSigner"""
+
+    def _client(self, endpoint, **kwargs):
+        return bos_client.BosClient(BceClientConfiguration(
+            credentials=bce_credentials.BceCredentials(b'ak', b'sk'), endpoint=endpoint,
+            **kwargs))
+
+    def test_same_urls(self):
+        """test the urls are those of generate_pre_signed_url"""
+        cases = [{}, {'params': {b'responseContentType': b'text/a b', b'z': None}},
+                 {'httpmethod': http_methods.PUT},
+                 {'headers': {b'x-bce-meta-a': b'1'}, 'protocol': 'https'},
+                 {'headers_to_sign': [b'host', b'x-bce-meta-a']}]
+        clients = [self._client(b'bj.bcebos.com'),
+                   self._client(b'https://test-bucket.bj.bcebos.com:8443'),
+                   self._client(b'127.0.0.1:8080', security_token=b'token'),
+                   self._client(b'cdn.example.com', request_payer=True)]
+        keys = [b'a/b c.txt', u'/x/\u4e2d\u6587', 'k']
+        for client in clients:
+            for kwargs in cases:
+                signer = client.get_pre_signer(b'test-bucket', expiration_in_seconds=60,
+                                               timestamp=1700000000, **kwargs)
+                self.assertEqual(signer.sign_many(keys), [
+                    client.generate_pre_signed_url(b'test-bucket', key, timestamp=1700000000,
+                                                   expiration_in_seconds=60, **kwargs)
+                    for key in keys])
+
+    def test_current_time(self):
+        """test urls without timestamp are signed at the current second"""
+        client = self._client(b'bj.bcebos.com')
+        signer = client.get_pre_signer(b'test-bucket')
+        with patch('time.time', return_value=1700000000.5):
+            url = signer.sign(b'key')
+        self.assertEqual(url, client.generate_pre_signed_url(b'test-bucket', b'key',
+                                                             timestamp=1700000000))
+        self.assertNotEqual(signer.sign(b'key'), url)
+        self.assertRaises(ValueError, signer.sign, b'a/../b')
+        self.assertRaises(ValueError, client.get_pre_signer, b'Bad_Bucket')
+
+
 class TestGeneratePreSignedUrl(TestClient):
     """test generate_pre_signed_url function"""
 
@@ -2585,6 +2638,39 @@ class TestPutSuperObejctFromFile(TestClient):
         t.join()
         self.assertFalse(result['success'], "Upload should have been canceled and returned False")
 
+    def test_put_super_object_resume_from_checkpoint(self):
+        """test put_super_object_from_file() resumes a failed upload from checkpoint_file"""
+        self.get_file(12)
+        checkpoint_file = self.FILENAME + '.checkpoint'
+        old_func = self.bos.upload_part_from_file
+        uploaded_parts = []
+
+        def upload_part_from_file(bucket_name, key, upload_id, part_number, *args, **kwargs):
+            if part_number == 2 and not uploaded_parts:
+                uploaded_parts.append(None)
+                raise BceClientError('injected failure')
+            uploaded_parts.append(part_number)
+            return old_func(bucket_name, key, upload_id, part_number, *args, **kwargs)
+        self.bos.upload_part_from_file = upload_part_from_file
+        try:
+            result = self.bos.put_super_object_from_file(self.BUCKET, self.KEY, self.FILENAME,
+                chunk_size=5, thread_num=2, checkpoint_file=checkpoint_file)
+            self.assertFalse(result)
+            self.assertTrue(os.path.exists(checkpoint_file))
+
+            del uploaded_parts[1:]
+            result = self.bos.put_super_object_from_file(self.BUCKET, self.KEY, self.FILENAME,
+                chunk_size=5, thread_num=2, checkpoint_file=checkpoint_file)
+            self.assertTrue(result)
+            self.assertEqual(uploaded_parts[1:], [2])
+            self.assertFalse(os.path.exists(checkpoint_file))
+        finally:
+            self.bos.upload_part_from_file = old_func
+            if os.path.exists(checkpoint_file):
+                os.remove(checkpoint_file)
+        response = self.bos.get_object_meta_data(self.BUCKET, self.KEY)
+        self.assertEqual(int(response.metadata.content_length), os.path.getsize(self.FILENAME))
+
     def test_put_super_object_invalid_chunk_size_zero(self):
         """put_super_object_from_file with chunk_size=0 should raise BceClientError"""
         self.get_file(1)
@@ -2604,6 +2690,134 @@ class TestPutSuperObejctFromFile(TestClient):
             self.bos.put_super_object_from_file(self.BUCKET, self.KEY, self.FILENAME, chunk_size=5121)
 
 
+class TestGetSuperObjectToFile(TestClient):
+    """test get_super_object_to_file"""
+    def test_get_super_object_to_file(self):
+        """test get_super_object_to_file()"""
+        self.get_file(12)
+        result = self.bos.put_super_object_from_file(self.BUCKET, self.KEY, self.FILENAME,
+            chunk_size=5, thread_num=multiprocessing.cpu_count())
+        self.assertTrue(result)
+        with open(self.FILENAME, 'rb') as f:
+            expected = f.read()
+        os.remove(self.FILENAME)
+
+        result = self.bos.get_super_object_to_file(self.BUCKET, self.KEY, self.FILENAME,
+            chunk_size=5, thread_num=multiprocessing.cpu_count())
+        self.assertTrue(result)
+        with open(self.FILENAME, 'rb') as f:
+            self.assertEqual(f.read(), expected)
+
+    def test_get_super_object_to_file_crc32_mismatch(self):
+        """test get_super_object_to_file() with wrong x-bce-content-crc32"""
+        self.get_file(1)
+        self.bos.put_object_from_file(self.BUCKET, self.KEY, self.FILENAME)
+        old_func = self.bos.get_object_meta_data
+
+        def get_object_meta_data(*args, **kwargs):
+            response = old_func(*args, **kwargs)
+            response.metadata.bce_content_crc_32 = '1'
+            return response
+        self.bos.get_object_meta_data = get_object_meta_data
+        try:
+            self.assertRaises(BceClientError, self.bos.get_super_object_to_file,
+                              self.BUCKET, self.KEY, self.FILENAME, thread_num=2)
+        finally:
+            self.bos.get_object_meta_data = old_func
+
+
+class TestUploadCheckpoint(unittest.TestCase):
+    """test checkpoint of put_super_object_from_file"""
+    def setUp(self):
+        """Start test"""
+        self.checkpoint_file = 'test_upload_checkpoint'
+
+    def tearDown(self):
+        """End test"""
+        for f in (self.checkpoint_file, self.checkpoint_file + '.tmp'):
+            if os.path.exists(f):
+                os.remove(f)
+
+    def _new_checkpoint(self, file_mtime=1.0):
+        return bos_client._UploadCheckpoint(self.checkpoint_file, b'bucket', b'key', 'file',
+                                            100, file_mtime, 10)
+
+    def test_save_and_load(self):
+        """test completed parts survive a reload"""
+        checkpoint = self._new_checkpoint()
+        self.assertFalse(checkpoint.load())
+        checkpoint.upload_id = 'upload_id'
+        checkpoint.save()
+        checkpoint.add_part(1, 'etag1', 123, 10)
+        checkpoint.add_part(3, 'etag3', 456, 10)
+
+        loaded = self._new_checkpoint()
+        self.assertTrue(loaded.load())
+        self.assertEqual(loaded.upload_id, 'upload_id')
+        self.assertEqual(loaded.parts, {1: {'etag': 'etag1', 'crc32': 123, 'size': 10},
+                                        3: {'etag': 'etag3', 'crc32': 456, 'size': 10}})
+        loaded.remove()
+        self.assertFalse(os.path.exists(self.checkpoint_file))
+
+    def test_ignore_modified_file(self):
+        """test checkpoint of a modified file is not used"""
+        checkpoint = self._new_checkpoint()
+        checkpoint.upload_id = 'upload_id'
+        checkpoint.add_part(1, 'etag1', 123, 10)
+        self.assertFalse(self._new_checkpoint(file_mtime=2.0).load())
+
+    def test_ignore_corrupted_file(self):
+        """test corrupted checkpoint is not used"""
+        with open(self.checkpoint_file, 'w') as f:
+            f.write('{"identity"')
+        self.assertFalse(self._new_checkpoint().load())
+
+    def test_append_and_compact(self):
+        """test parts are appended one line each and a torn last line is dropped on load"""
+        checkpoint = self._new_checkpoint()
+        checkpoint.upload_id = 'upload_id'
+        checkpoint.save()
+        for part_number in range(1, 5):
+            checkpoint.add_part(part_number, 'etag%d' % part_number, part_number, 10)
+        checkpoint.add_part(2, 'etag2b', 2, 10)
+        with open(self.checkpoint_file, 'a') as f:
+            f.write('{"part_number": 5, "et')
+        with open(self.checkpoint_file) as f:
+            self.assertEqual(len(f.read().splitlines()), 7)
+
+        loaded = self._new_checkpoint()
+        self.assertTrue(loaded.load())
+        self.assertEqual(sorted(loaded.parts), [1, 2, 3, 4])
+        self.assertEqual(loaded.parts[2]['etag'], 'etag2b')
+        with open(self.checkpoint_file) as f:
+            self.assertEqual(len(f.read().splitlines()), 5)
+
+
+class TestCopySuperObject(TestClient):
+    """test copy_super_object"""
+    def test_copy_super_object(self):
+        """test copy_super_object() with multiple parts"""
+        self.get_file(12)
+        self.bos.put_object_from_file(self.BUCKET, self.KEY, self.FILENAME,
+                                      user_metadata={'owner': 'test'})
+        result = self.bos.copy_super_object(self.BUCKET, self.KEY, self.BUCKET, b'copy_super',
+                                            chunk_size=5, thread_num=2)
+        self.assertTrue(result)
+        source = self.bos.get_object_meta_data(self.BUCKET, self.KEY)
+        response = self.bos.get_object_meta_data(self.BUCKET, b'copy_super')
+        self.assertEqual(response.metadata.content_length, source.metadata.content_length)
+        self.assertEqual(response.metadata.bce_content_crc_32, source.metadata.bce_content_crc_32)
+        self.assertEqual(response.metadata.bce_meta_owner, 'test')
+
+    def test_copy_super_object_small(self):
+        """test copy_super_object() of an object smaller than one part"""
+        self.bos.put_object_from_string(self.BUCKET, self.KEY, 'small object')
+        result = self.bos.copy_super_object(self.BUCKET, self.KEY, self.BUCKET, b'copy_small')
+        self.assertTrue(result)
+        self.assertEqual(self.bos.get_object_as_string(self.BUCKET, b'copy_small'),
+                         b'small object')
+
+
 class TestPutSuperObjectAutoChunkSize(unittest.TestCase):
     """test put_super_object_from_file auto chunk_size calculation"""
 
@@ -2993,6 +3207,39 @@ class TestAuthorization(unittest.TestCase):
         #                                    1402639056,
         #                                    1800))
 
+    def test_signer_cache(self):
+        """test Signer reuses signing keys and header names without changing the result"""
+        credentials = bce_credentials.BceCredentials(b"my_ak", b"my_sk")
+        headers = {
+            b"Host": b"bce.baidu.com",
+            b"Content-Type": b"text/plain",
+            b"x-bce-meta-key1": b"ABC"
+        }
+        params = {b"partNumber": b"1", b"uploadId": b"a/b"}
+        sign_key_info = b'bce-auth-v1/my_ak/1970-01-01T00:00:01Z/1800'
+        sign_key = hmac.new(b"my_sk", sign_key_info, hashlib.sha256).hexdigest()
+        string_to_sign = b"PUT\n/bucket/object1\npartNumber=1&uploadId=a%2Fb\n" \
+                         b"content-type:text%2Fplain\nhost:bce.baidu.com\nx-bce-meta-key1:ABC"
+        expected = sign_key_info + b'//' + compat.convert_to_bytes(
+            hmac.new(compat.convert_to_bytes(sign_key), string_to_sign, hashlib.sha256).hexdigest())
+
+        signer = bce_v1_signer.Signer(max_cached_keys=2)
+        for _ in range(2):
+            self.assertEqual(expected, signer(credentials, b"PUT", b"/bucket/object1",
+                                              headers, params, 1))
+        self.assertEqual(1, len(signer._sign_keys))
+        self.assertEqual(3, len(signer._header_names))
+        self.assertEqual(expected, bce_v1_signer.sign(credentials, b"PUT", b"/bucket/object1",
+                                                      headers, params, 1))
+        # a new secret key for the same access key must not hit the cache
+        self.assertNotEqual(expected, signer(bce_credentials.BceCredentials(b"my_ak", b"sk2"),
+                                             b"PUT", b"/bucket/object1", headers, params, 1))
+        signer(credentials, b"PUT", b"/bucket/object1", headers, params, 2)
+        self.assertEqual(1, len(signer._sign_keys))
+        self.assertEqual(b'bce-auth-v1/my_ak/1970-01-01T00:00:01Z/1800/host;x-bce-meta-key1/',
+                         signer(credentials, b"PUT", b"/bucket/object1", headers, params, 1,
+                                headers_to_sign=[b"host", b"x-bce-meta-key1"])[:-64])
+
 
 class TestUtil(unittest.TestCase):
     """TestUtil"""
@@ -3014,6 +3261,67 @@ class TestUtil(unittest.TestCase):
         self.assertEqual(b"J1OsDoUaJj/azvjYRAHgwA==", utils.get_md5_from_fp(fp, 10, 10))
         self.assertEqual(b"6JmFCETYQztJTRLQhmQi2w==", utils.get_md5_from_fp(fp, 10, 100))
 
+    def test_crc32_combine(self):
+        """test crc32_combine and crc32_combine_many"""
+        parts = [os.urandom(n) for n in (0, 1, 1000, 1000, 1000, 4097, 0, 3)]
+        whole = b"".join(parts)
+        self.assertEqual(utils.crc32_combine(zlib.crc32(parts[2]), zlib.crc32(parts[5]),
+                                             len(parts[5])),
+                         zlib.crc32(parts[2] + parts[5]) & 0xffffffff)
+        self.assertEqual(utils.crc32_combine_many([(zlib.crc32(p), len(p)) for p in parts]),
+                         zlib.crc32(whole) & 0xffffffff)
+        self.assertEqual(utils.crc32_combine_many([]), 0)
+
+    def test_crc64_ecma(self):
+        """test every crc64 backend against the check value of CRC-64/XZ"""
+        self.assertEqual(utils.get_crc64_ecma_from_fp(io.BytesIO(b"123456789")),
+                         0x995DC9BBDF1939FA)
+        data = os.urandom(100 * 1024 + 3)
+        expected = utils._crc64_update_python(0, data)
+        self.assertEqual(utils._crc64_update(0, data), expected)
+        if utils._get_numpy():
+            self.assertEqual(utils._crc64_update_numpy(0, data), expected)
+        self.assertEqual(utils._crc64_update_python(utils._crc64_update_python(0, data[:7]),
+                                                    data[7:]), expected)
+
+    def test_crc64_combine(self):
+        """test crc64_combine"""
+        data = os.urandom(10000)
+        for split in (0, 1, 4096, 9999, 10000):
+            crc1 = utils.get_crc64_ecma_from_fp(io.BytesIO(data[:split]))
+            crc2 = utils.get_crc64_ecma_from_fp(io.BytesIO(data[split:]))
+            self.assertEqual(utils.crc64_combine(crc1, crc2, len(data) - split),
+                             utils.get_crc64_ecma_from_fp(io.BytesIO(data)))
+
+    def test_checksum_reader(self):
+        """test ChecksumReader computes crc32 of the read bytes and restarts on seek"""
+        fp = io.BytesIO(b"0123456789abcdefghijklmnopqrstuvwxyz")
+        fp.seek(10)
+        reader = utils.ChecksumReader(fp, 20)
+        self.assertEqual(reader.len, 20)
+        self.assertEqual(reader.read(7), b"abcdefg")
+        self.assertFalse(reader.done)
+        reader.seek(10)
+        self.assertEqual(reader.read(100), b"abcdefghijklmnopqrst")
+        self.assertEqual(reader.read(), b"")
+        self.assertTrue(reader.done)
+        self.assertEqual(reader.crc32, zlib.crc32(b"abcdefghijklmnopqrst") & 0xffffffff)
+        self.assertRaises(IOError, reader.seek, 0)
+
+    def test_checksum_reader_algorithms(self):
+        """test ChecksumReader computes the same checksums as the *_from_fp functions"""
+        data = b"abcdefghijklmnopqrstuvwxyz" * 100
+        reader = utils.ChecksumReader(io.BytesIO(data), len(data),
+                                      algorithms=('crc32', 'crc32c', 'crc64ecma', 'md5'))
+        while reader.read(1000):
+            pass
+        fp = io.BytesIO(data)
+        self.assertEqual(reader.crc32, utils.get_crc32_from_fp(fp))
+        self.assertEqual(reader.crc32c, utils.get_crc32c_from_fp(fp))
+        self.assertEqual(reader.crc64ecma, utils.get_crc64_ecma_from_fp(fp))
+        self.assertEqual(reader.md5, utils.get_md5_from_fp(fp))
+        self.assertRaises(ValueError, utils.ChecksumReader, fp, 1, algorithms=('sha1',))
+
     def test_is_ip(self):
         """test_is_ip"""
         self.assertEqual(True, utils.is_ip(b"192.168.0.1"))
@@ -3055,6 +3363,75 @@ class TestUtil(unittest.TestCase):
         self.assertEqual(b"www.bai%5E%26%2A.com", utils.normalize_string("www.bai^&*.com"))
         self.assertEqual(b"www.baidu.com", utils.normalize_string("www.baidu.com", True))
 
+    def test_json_codec(self):
+        """test json codec selection and the stdlib fallback of accelerated codecs"""
+        self.assertIs(json_codec.get_codec(), json_codec.STDLIB_CODEC)
+        self.assertIs(json_codec.get_codec('json'), json_codec.STDLIB_CODEC)
+        self.assertIn(json_codec.get_codec('auto').name, ('json', 'orjson', 'ujson'))
+        self.assertRaises(BceClientError, json_codec.get_codec, 'no-such-codec')
+        custom = json_codec.JsonCodec()
+        self.assertIs(json_codec.get_codec(custom), custom)
+
+        data = {"name": u"\u4e2d/a", "values": [1, 2.5, None, True], "big": 2 ** 70}
+        for name in ('json', 'orjson', 'ujson'):
+            try:
+                codec = json_codec.get_codec(name)
+            except BceClientError:
+                continue
+            text = codec.dumps(data)
+            self.assertIsInstance(text, str)
+            self.assertEqual(json.loads(text), data)
+            self.assertEqual(codec.loads(text), data)
+            self.assertEqual(codec.loads(compat.convert_to_bytes(text)), data)
+            # non string keys and json.dumps options are handed to the json module
+            self.assertEqual(codec.dumps({1: 2}), json.dumps({1: 2}))
+            self.assertEqual(codec.dumps(data, sort_keys=True, indent=1),
+                             json.dumps(data, sort_keys=True, indent=1))
+            self.assertEqual(json.loads(codec.dumps(object(), default=lambda o: "x")), "x")
+            self.assertRaises(ValueError, codec.loads, "{bad")
+
+    def test_json_to_python_object(self):
+        """test decoding without object_hook builds the same objects as with it"""
+        body = json.dumps({"aB": [{"cD": {"eTag": "x"}}, 1, [{"fG": None}]], "hI": {}})
+        eager = json.loads(body, object_hook=utils.dict_to_python_object)
+        converted = utils.json_to_python_object(json.loads(body))
+        self.assertEqual(repr(eager), repr(converted))
+        self.assertEqual(converted.a_b[0].c_d.etag, "x")
+        self.assertIsNone(converted.a_b[2][0].f_g)
+        hook = lambda d: sorted(d.items())
+        self.assertEqual(json.loads(body, object_hook=hook),
+                         utils.apply_object_hook(json.loads(body), hook))
+
+    def test_normalize_string_matches_per_byte_encoding(self):
+        """test normalize_string against the per-byte table encoding on random input"""
+        def reference(in_str, encoding_slash=True):
+            tmp = []
+            for ch in bytearray(utils.convert_to_standard_string(in_str)):
+                if ch == ord('/') and not encoding_slash:
+                    tmp.append(b'/')
+                else:
+                    tmp.append(utils._NORMALIZED_CHAR_LIST[ch])
+            return b''.join(tmp)
+
+        rand = random.Random(20240501)
+        alphabet = u'aZ09._-~/ %+&=?#:;@!*\'()[]\\\x00\x7fé中\U0001f600'
+        samples = [b'', u'', 0, 1, -1, True, False, None, 1.5, b'\xff\xfe\x80/~', bytes(bytearray(range(256)))]
+        for _ in range(500):
+            samples.append(bytes(bytearray(rand.randint(0, 255) for _ in range(rand.randint(0, 40)))))
+            samples.append(u''.join(rand.choice(alphabet) for _ in range(rand.randint(0, 40))))
+        for sample in samples:
+            for encoding_slash in (True, False):
+                # twice to compare both the fresh and the cached result
+                for _ in range(2):
+                    self.assertEqual(reference(sample, encoding_slash),
+                                     utils.normalize_string(sample, encoding_slash),
+                                     repr((sample, encoding_slash)))
+        self.assertEqual(b"True", utils.normalize_string(True))
+        self.assertEqual(b"1", utils.normalize_string(1))
+        self.assertEqual(b"%5B1%2C%202%5D", utils.normalize_string([1, 2]))
+        self.assertEqual(b"a/b%20c", utils.normalize_string(u"a/b c", False))
+        self.assertEqual(b"a%2Fb%20c", utils.normalize_string(u"a/b c"))
+
     #def test_append_param
     def test_check_bucket_valid(self):
         """test_check_bucket_valid"""
@@ -3167,6 +3544,82 @@ class TestHandler(TestClient):
         self.assertTrue(handler.parse_json(http_response, response))
         self.assertEqual(len(response.__dict__), old_len)
 
+    def test_parse_json_codec(self):
+        """test parse_json decodes with the codec from the client configuration"""
+        class CountingCodec(json_codec.JsonCodec):
+            """counts the calls"""
+            calls = 0
+
+            def loads(self, data):
+                CountingCodec.calls += 1
+                return json.loads(compat.convert_to_string(data))
+
+        body = json.dumps({"contents": [{"key": "a", "eTag": "e"}], "isTruncated": False})
+        config = BceClientConfiguration(json_codec=CountingCodec())
+        handlers = bce_http_client._get_response_handler_functions(
+            config, [handler.parse_error, handler.parse_json])
+        response = BceResponse()
+        self.assertFalse(handlers[0](MockHttpResponse(status=200, content=body), response))
+        self.assertTrue(handlers[1](MockHttpResponse(status=200, content=body), response))
+        self.assertEqual(CountingCodec.calls, 1)
+        self.assertEqual(response.contents[0].etag, "e")
+        self.assertFalse(response.is_truncated)
+        self.assertEqual(response.raw_data, body)
+
+    def test_parse_json_lazy(self):
+        """test parse_json_lazy exposes the same attributes as parse_json"""
+        json_content = {"name": "bucket",
+                        "isTruncated": False,
+                        "nextMarker": None,
+                        "commonPrefixes": [{"prefix": "a/"}],
+                        "contents": [{"key": "k%d" % i, "eTag": "e%d" % i, "size": i,
+                                      "owner": {"id": "o", "displayName": "d"}}
+                                     for i in range(3)]}
+        body = json.dumps(json_content)
+        eager = BceResponse()
+        handler.parse_json(MockHttpResponse(status=200, content=body), eager)
+        lazy = BceResponse()
+        self.assertTrue(handler.parse_json_lazy(MockHttpResponse(status=200, content=body), lazy))
+        self.assertEqual(lazy.name, eager.name)
+        self.assertFalse(lazy.is_truncated)
+        self.assertIsNone(lazy.next_marker)
+        self.assertEqual(lazy.common_prefixes[0].prefix, "a/")
+        self.assertEqual(len(lazy.contents), 3)
+        self.assertIsInstance(lazy.contents[0], utils.Expando)
+        self.assertEqual(utils._expando_dict.__get__(lazy.contents[0]), {})
+        for e, l in zip(eager.contents, lazy.contents):
+            self.assertEqual(e.key, l.key)
+            self.assertEqual(e.etag, l.etag)
+            self.assertEqual(e.size, l.size)
+            self.assertEqual(e.owner.display_name, l.owner.display_name)
+        self.assertIsNone(lazy.contents[0].missing)
+        self.assertIn("display_name", repr(lazy.contents[1].owner))
+        # __dict__ is complete, as clients serialize objects with default=lambda o: o.__dict__
+        self.assertEqual(sorted(vars(lazy.contents[2])), sorted(vars(eager.contents[2])))
+        self.assertEqual(json.dumps(lazy.contents, default=lambda o: o.__dict__, sort_keys=True),
+                         json.dumps(eager.contents, default=lambda o: o.__dict__,
+                                    sort_keys=True))
+        self.assertEqual(lazy.raw_data, body)
+        self.assertEqual(lazy.status_code, 200)
+        self.assertEqual(lazy.get_body_map(), eager.get_body_map())
+
+        for lazy_mode in (True, False):
+            response = BceResponse()
+            parser = handler.get_json_parser(lazy=lazy_mode, keep_raw_data=False)
+            self.assertTrue(parser(MockHttpResponse(status=200, content=body), response))
+            self.assertEqual(response.contents[2].key, "k2")
+            self.assertNotIn("raw_data", response.__dict__)
+            self.assertEqual(response.get_body_map(), {})
+        self.assertIs(handler.get_json_parser(), handler.parse_json)
+
+        config = baidubce.bce_client_configuration.BceClientConfiguration(lazy_json_response=True)
+        handlers = bce_http_client._get_response_handler_functions(
+            config, [handler.parse_error, handler.parse_json])
+        self.assertEqual(handlers, [handler.parse_error, handler.parse_json_lazy])
+        handlers = [handler.parse_error, handler.parse_json]
+        self.assertIs(bce_http_client._get_response_handler_functions(
+            baidubce.bce_client_configuration.BceClientConfiguration(), handlers), handlers)
+
 
 class TestBceHttpClient(TestClient):
     """test abort bce_http_client"""
@@ -3405,6 +3858,778 @@ class TestBceHttpClient(TestClient):
         bce_http_client._send_http_request = old_send_http_request
 
 
+class TestConnectionPool(unittest.TestCase):
+    """test keep-alive connection pool of bce_http_client"""
+    def setUp(self):
+        """create pool"""
+        from baidubce.http.connection_pool import ConnectionPool
+        self.pool = ConnectionPool()
+        self.key = ('http', '1.2.3.4', 80, None, None)
+
+    def _make_connection(self):
+        conn = MagicMock()
+        conn.sock = MagicMock()
+        return conn
+
+    def test_release_and_acquire(self):
+        """released connection is reused"""
+        conn = self._make_connection()
+        with patch('baidubce.http.connection_pool.is_connection_dropped', return_value=False):
+            self.pool.release(self.key, conn, 2)
+            self.assertEqual(self.pool.size(self.key), 1)
+            self.assertIs(self.pool.acquire(self.key, 1000), conn)
+            self.assertIsNone(self.pool.acquire(self.key, 1000))
+
+    def test_max_connections_per_host(self):
+        """connections over max_connections_per_host are closed"""
+        conns = [self._make_connection() for _ in range(3)]
+        for conn in conns:
+            self.pool.release(self.key, conn, 2)
+        self.assertEqual(self.pool.size(self.key), 2)
+        self.assertEqual(conns[2].close.call_count, 1)
+
+    def test_dropped_and_idle_connection_discarded(self):
+        """half-closed or idle-expired connections are never returned"""
+        conn = self._make_connection()
+        self.pool.release(self.key, conn, 2)
+        with patch('baidubce.http.connection_pool.is_connection_dropped', return_value=True):
+            self.assertIsNone(self.pool.acquire(self.key, 1000))
+        self.assertEqual(conn.close.call_count, 1)
+
+        conn = self._make_connection()
+        self.pool.release(self.key, conn, 2)
+        self.pool.evict_idle(-1)
+        self.assertEqual(self.pool.size(), 0)
+        self.assertEqual(conn.close.call_count, 1)
+
+    def test_response_reusable(self):
+        """only fully read responses keep their connection"""
+        self.assertFalse(bce_http_client._is_response_reusable(MockHttpResponse(200)))
+        response = MagicMock(spec=http.client.HTTPResponse)
+        response.will_close = False
+        response.chunked = False
+        response.length = 0
+        response.isclosed.return_value = True
+        self.assertTrue(bce_http_client._is_response_reusable(response))
+        response.length = 10
+        self.assertFalse(bce_http_client._is_response_reusable(response))
+        response.length = 0
+        response.will_close = True
+        self.assertFalse(bce_http_client._is_response_reusable(response))
+
+    def test_stale_connection_retry(self):
+        """only a reset of a reused connection before any response byte is retried for free"""
+        from baidubce.retry.retry_policy import NoRetryPolicy
+        config = BceClientConfiguration()
+        should_retry = bce_http_client._should_retry_stale_connection
+        reset = http.client.RemoteDisconnected('closed')
+        self.assertTrue(should_retry(config, reset, True, False, b'body', None))
+        self.assertTrue(should_retry(config, BrokenPipeError(), True, False, None, None))
+        self.assertTrue(should_retry(config, ConnectionResetError(), True, False, None, None))
+        self.assertFalse(should_retry(config, reset, False, False, None, None))
+        self.assertFalse(should_retry(config, reset, True, True, None, None))
+        self.assertFalse(should_retry(config, socket.timeout(), True, False, None, None))
+        self.assertFalse(should_retry(config, asyncio.TimeoutError(), True, False, None, None))
+        self.assertFalse(should_retry(config, reset, True, False, io.BytesIO(b'x'), None))
+        config.retry_policy = NoRetryPolicy()
+        self.assertFalse(should_retry(config, reset, True, False, None, None))
+
+
+class TestAsyncHttpClient(unittest.TestCase):
+    """test asyncio response parsing in bce_async_http_client"""
+    def _run(self, coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    def _read_response(self, raw, amt=None):
+        from baidubce.http import bce_async_http_client
+        completed = []
+
+        async def read():
+            reader = asyncio.StreamReader()
+            reader.feed_data(raw)
+            status, reason, headers = await bce_async_http_client._read_response_head(reader)
+            header_map = dict((k.lower(), v) for k, v in headers)
+            chunked = 'chunked' in header_map.get('transfer-encoding', '')
+            length = None if chunked else int(header_map['content-length'])
+            conn = bce_async_http_client.AsyncConnection(reader, MagicMock())
+            response = bce_async_http_client.AsyncHttpResponse(
+                status, reason, headers, conn, length, chunked, False, 5,
+                completed.append)
+            data = []
+            while True:
+                buf = await response.aread(amt)
+                if not buf:
+                    break
+                data.append(buf)
+            return response, b''.join(data)
+        response, data = self._run(read())
+        return response, data, completed
+
+    def test_content_length_body(self):
+        """test body delimited by content-length"""
+        response, data, completed = self._read_response(
+            b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\nx-bce-request-id: r\r\n\r\nhello', 2)
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader('X-Bce-Request-Id'), 'r')
+        self.assertEqual(data, b'hello')
+        self.assertEqual(completed, [response])
+
+    def test_chunked_body(self):
+        """test chunked body with trailers"""
+        response, data, completed = self._read_response(
+            b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+            b'3\r\nabc\r\n4;ext=1\r\ndefg\r\n0\r\nx-trailer: 1\r\n\r\n', 2)
+        self.assertEqual(data, b'abcdefg')
+        self.assertEqual(completed, [response])
+        self.assertEqual(response.read(), b'')
+
+    def test_bad_status_line(self):
+        """test malformed status line"""
+        self.assertRaises(http.client.BadStatusLine, self._read_response, b'garbage\r\n\r\n')
+
+
+class _FakeBosHandler(http_server.BaseHTTPRequestHandler):
+    """in-memory BOS serving objects, ranged GETs and multipart uploads with path style urls"""
+    protocol_version = 'HTTP/1.1'
+    objects = {}
+    uploads = {}
+    list_requests = []
+    list_max_keys = 1000
+    # name -> time the object was written, 2020-01-01 for the objects set by the tests
+    modified = {}
+    # key -> error codes returned by the next delete multiple objects requests of the key
+    delete_failures = {}
+    delete_sizes = []
+    put_returns_crc32 = True
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body=b'', headers=None):
+        self.send_response(status)
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _reply_json(self, status, value):
+        self._reply(status, json.dumps(value).encode('utf-8'))
+
+    def _parse(self):
+        url = urlparse(self.path)
+        bucket, _, key = unquote(url.path).lstrip('/').partition('/')
+        query = dict((k, v[0]) for k, v in parse_qs(url.query, keep_blank_values=True).items())
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        return (bucket, key), query, body
+
+    def _object_headers(self, data):
+        return {'ETag': '"%x"' % zlib.crc32(data), 'x-bce-content-crc32': str(zlib.crc32(data)),
+                'Last-Modified': 'Wed, 01 Jan 2020 00:00:00 GMT'}
+
+    def _not_found(self):
+        self._reply_json(404, {'code': 'NoSuchKey', 'message': 'not found', 'requestId': 'r'})
+
+    def do_PUT(self):
+        name, query, data = self._parse()
+        _FakeBosHandler.last_put_headers = self.headers
+        source = self.headers.get('x-bce-copy-source')
+        if source is not None:
+            source_bucket, _, source_key = unquote(source).lstrip('/').partition('/')
+            data = self.objects[(source_bucket, source_key)]
+            copy_range = self.headers.get('x-bce-copy-source-range')
+            if copy_range:
+                first, last = copy_range.split('=')[1].split('-')
+                data = data[int(first):int(last) + 1]
+        crc = self.headers.get('x-bce-content-crc32')
+        if crc is not None and int(crc) != zlib.crc32(data):
+            return self._reply_json(400, {'code': 'BadDigest', 'message': 'crc32',
+                                          'requestId': 'r'})
+        if 'partNumber' in query:
+            self.uploads[query['uploadId']][int(query['partNumber'])] = data
+        else:
+            self.objects[name] = data
+            self.modified[name] = time.time()
+        headers = self._object_headers(data)
+        if source is not None:
+            return self._reply_json(200, {'eTag': headers['ETag'].strip('"'),
+                                          'lastModified': '2020-01-01T00:00:00Z'})
+        if not self.put_returns_crc32:
+            del headers['x-bce-content-crc32']
+        self._reply(200, headers=headers)
+
+    def do_POST(self):
+        name, query, data = self._parse()
+        if 'delete' in query:
+            return self._delete_objects(name[0], json.loads(data)['objects'])
+        if 'uploads' in query:
+            upload_id = 'upload-%d' % len(self.uploads)
+            self.uploads[upload_id] = {}
+            return self._reply_json(200, {'bucket': name[0], 'key': name[1],
+                                          'uploadId': upload_id})
+        parts = self.uploads.pop(query['uploadId'])
+        data = b''.join(parts[part['partNumber']] for part in json.loads(data)['parts'])
+        crc = self.headers.get('x-bce-content-crc32')
+        if crc is not None and int(crc) != zlib.crc32(data):
+            return self._reply_json(400, {'code': 'BadDigest', 'message': 'crc32',
+                                          'requestId': 'r'})
+        self.objects[name] = data
+        self.modified[name] = time.time()
+        self._reply_json(200, {'bucket': name[0], 'key': name[1], 'eTag': 'multipart'})
+
+    def _delete_objects(self, bucket, objects):
+        self.delete_sizes.append(len(objects))
+        if len(objects) > 1000:
+            return self._reply_json(400, {'code': 'MalformedJSON', 'message': 'too many keys',
+                                          'requestId': 'r'})
+        errors = []
+        for obj in objects:
+            codes = self.delete_failures.get(obj['key'])
+            if codes:
+                errors.append({'key': obj['key'], 'code': codes.pop(0), 'message': 'failed'})
+            elif self.objects.pop((bucket, obj['key']), None) is None:
+                errors.append({'key': obj['key'], 'code': 'NoSuchKey', 'message': 'not found'})
+        if errors:
+            return self._reply_json(200, {'errors': errors})
+        self._reply(200)
+
+    def do_DELETE(self):
+        name, query, _ = self._parse()
+        if 'uploadId' in query:
+            self.uploads.pop(query['uploadId'], None)
+        else:
+            self.objects.pop(name, None)
+        self._reply(204)
+
+    def do_HEAD(self):
+        name, _, _ = self._parse()
+        if name not in self.objects:
+            return self._reply(404)
+        data = self.objects[name]
+        self.send_response(200)
+        for k, v in self._object_headers(data).items():
+            self.send_header(k, v)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+
+    def _list_objects(self, bucket, query):
+        self.list_requests.append(query)
+        prefix = query.get('prefix', '')
+        marker = query.get('marker', '')
+        delimiter = query.get('delimiter')
+        max_keys = min(int(query.get('maxKeys', 1000)), self.list_max_keys)
+        contents = []
+        common_prefixes = []
+        truncated = False
+        for key in sorted(k for b, k in self.objects if b == bucket):
+            if not key.startswith(prefix) or key <= marker:
+                continue
+            if delimiter and delimiter in key[len(prefix):]:
+                common = key[:key.index(delimiter, len(prefix)) + 1]
+                if common <= marker or common_prefixes and common_prefixes[-1] == common:
+                    continue
+                entry = common
+            else:
+                entry = key
+            if len(contents) + len(common_prefixes) == max_keys:
+                truncated = True
+                break
+            if entry is key:
+                contents.append(key)
+            else:
+                common_prefixes.append(entry)
+        result = {'name': bucket, 'prefix': prefix, 'marker': marker, 'maxKeys': max_keys,
+                  'isTruncated': truncated,
+                  'contents': [{'key': k, 'size': len(self.objects[(bucket, k)]),
+                                'eTag': hashlib.md5(self.objects[(bucket, k)]).hexdigest(),
+                                'lastModified': time.strftime(
+                                    '%Y-%m-%dT%H:%M:%SZ',
+                                    time.gmtime(self.modified.get((bucket, k), 1577836800)))}
+                               for k in contents],
+                  'commonPrefixes': [{'prefix': p} for p in common_prefixes]}
+        if truncated:
+            result['nextMarker'] = max(contents + common_prefixes)
+        self._reply_json(200, result)
+
+    def do_GET(self):
+        name, query, _ = self._parse()
+        if not name[1]:
+            return self._list_objects(name[0], query)
+        if name not in self.objects:
+            return self._not_found()
+        data = self.objects[name]
+        headers = self._object_headers(data)
+        byte_range = self.headers.get('Range')
+        if byte_range:
+            first, last = byte_range.split('=')[1].split('-')
+            return self._reply(206, data[int(first):int(last) + 1],
+                               {'ETag': headers['ETag']})
+        self._reply(200, data, headers)
+
+
+class _ReadOnlyStream(object):
+    """a stream that can be read only once, like a pipe"""
+    def __init__(self, data):
+        self._fp = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self._fp.read(size)
+
+    def seekable(self):
+        return False
+
+
+def _corrupted_object_headers(handler, data):
+    """object headers of the fake BOS as if data was corrupted on its way"""
+    return {'ETag': '"%x"' % zlib.crc32(data),
+            'x-bce-content-crc32': str((zlib.crc32(data) ^ 1) & 0xffffffff),
+            'Last-Modified': 'Wed, 01 Jan 2020 00:00:00 GMT'}
+
+
+class _FakeBosServer(socketserver.ThreadingMixIn, http_server.HTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        http_server.HTTPServer.__init__(self, ('127.0.0.1', 0), _FakeBosHandler)
+        _FakeBosHandler.objects.clear()
+        _FakeBosHandler.uploads.clear()
+        del _FakeBosHandler.list_requests[:]
+        _FakeBosHandler.list_max_keys = 1000
+        _FakeBosHandler.modified.clear()
+        _FakeBosHandler.delete_failures = {}
+        del _FakeBosHandler.delete_sizes[:]
+        _FakeBosHandler.put_returns_crc32 = True
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    @property
+    def objects(self):
+        return _FakeBosHandler.objects
+
+    def config(self):
+        return BceClientConfiguration(
+            credentials=bce_credentials.BceCredentials(b'ak', b'sk'),
+            endpoint=compat.convert_to_bytes('127.0.0.1:%d' % self.server_address[1]),
+            path_style_enable=True)
+
+
+class TestAsyncBosClientLocal(unittest.TestCase):
+    """test AsyncBosClient end to end against a local fake BOS"""
+    def setUp(self):
+        from baidubce.services.bos.async_bos_client import AsyncBosClient
+        self.server = _FakeBosServer()
+        self.client = AsyncBosClient(self.server.config())
+        self.file_name = 'async_local_test.bin'
+        self.data = os.urandom(11 * 1024 * 1024 + 7)
+        with open(self.file_name, 'wb') as fp:
+            fp.write(self.data)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        for name in (self.file_name, self.file_name + '.out'):
+            if os.path.exists(name):
+                os.remove(name)
+
+    def _run(self, coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    def test_put_get_and_error(self):
+        """test objects round trip and a server error is raised"""
+        async def run():
+            await self.client.put_object_from_string(b'bkt', b'small', b'hello')
+            self.assertEqual(await self.client.get_object_as_string(b'bkt', b'small'), b'hello')
+            await self.client.put_object_from_file(b'bkt', b'file', self.file_name)
+            response = await self.client.get_object_meta_data(b'bkt', b'file')
+            self.assertEqual(int(response.metadata.content_length), len(self.data))
+            with self.assertRaises(BceHttpClientError):
+                await self.client.get_object_as_string(b'bkt', b'missing')
+        self._run(run())
+        self.assertEqual(self.server.objects[('bkt', 'file')], self.data)
+
+    def test_super_object_helpers(self):
+        """test the multipart upload, ranged download and server side copy coroutines"""
+        async def run():
+            self.assertTrue(await self.client.put_super_object_from_file(
+                b'bkt', b'big', self.file_name, chunk_size=5, concurrency=2))
+            self.assertTrue(await self.client.get_super_object_to_file(
+                b'bkt', b'big', self.file_name + '.out', chunk_size=5, concurrency=2))
+            self.assertTrue(await self.client.copy_super_object(
+                b'bkt', b'big', b'bkt', b'copy', chunk_size=5, concurrency=2))
+        self._run(run())
+        self.assertEqual(self.server.objects[('bkt', 'big')], self.data)
+        self.assertEqual(self.server.objects[('bkt', 'copy')], self.data)
+        with open(self.file_name + '.out', 'rb') as fp:
+            self.assertEqual(fp.read(), self.data)
+
+    def test_put_object_checksum(self):
+        """test put_object of a stream awaits the response before checking its crc32"""
+        async def put(data):
+            return await self.client.put_object(b'bkt', b'fp', _ReadOnlyStream(data),
+                                                len(self.data))
+        response = self._run(put(self.data))
+        self.assertEqual(int(response.metadata.bce_content_crc_32), zlib.crc32(self.data))
+        with patch.object(_FakeBosHandler, '_object_headers', _corrupted_object_headers):
+            self.assertRaises(BceClientError, self._run, put(self.data))
+
+    def test_bulk_helpers(self):
+        """test the parallel listing and bulk deletion coroutines"""
+        _FakeBosHandler.list_max_keys = 7
+        keys = ['d%d/k%03d' % (i % 3, i) for i in range(60)] + ['top%d' % i for i in range(5)]
+        for key in keys:
+            self.server.objects[('bkt', key)] = b'x'
+        _FakeBosHandler.delete_failures = {'d0/k000': ['SlowDown']}
+
+        async def run():
+            ordered = [item.key async for item in self.client.list_all_objects_parallel(
+                b'bkt', concurrency=2)]
+            unordered = [item.key async for item in self.client.list_all_objects_parallel(
+                b'bkt', partitions=4, ordered=False)]
+            result = await self.client.delete_objects_bulk(
+                b'bkt', self.client.list_all_objects(b'bkt', prefix='d'), keys_per_request=10,
+                concurrency=2)
+            return ordered, unordered, result
+        ordered, unordered, result = self._run(run())
+        self.assertEqual(ordered, sorted(keys))
+        self.assertEqual(sorted(unordered), sorted(keys))
+        self.assertEqual((result.deleted, result.errors), (60, []))
+        self.assertEqual(sorted(k for _, k in self.server.objects), sorted(keys[60:]))
+
+    def test_transfer_manager_rejected(self):
+        """test TransferManager refuses an AsyncBosClient"""
+        self.assertRaises(BceClientError, bos_transfer_manager.TransferManager, self.client)
+
+
+class TestCopySuperObjectLocal(unittest.TestCase):
+    """test copy_super_object against a local fake BOS"""
+    def setUp(self):
+        self.server = _FakeBosServer()
+        self.client = bos_client.BosClient(self.server.config())
+        self.data = os.urandom(11 * 1024 * 1024 + 7)
+        self.server.objects[('bkt', 'source')] = self.data
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_head_connection_released(self):
+        """test the HEAD of the source hands its connection back to the pool"""
+        response = self.client._send_request(http_methods.HEAD, b'bkt', b'source',
+                                             body_parser=bos_client.BosClient._parse_object_head)
+        self.assertIsNone(response.data)
+        self.assertEqual(response.metadata.user_metadata, {})
+        key = bce_http_client._get_pool_key(protocol.HTTP, b'127.0.0.1',
+                                            self.server.server_address[1], None, None)
+        self.assertEqual(bce_http_client._connection_pool.size(key), 1)
+
+    def test_copy(self):
+        """test a multipart copy"""
+        self.assertTrue(self.client.copy_super_object(b'bkt', b'source', b'bkt', b'target',
+                                                      chunk_size=5, thread_num=2))
+        self.assertEqual(self.server.objects[('bkt', 'target')], self.data)
+
+
+class TestListAllObjectsParallel(unittest.TestCase):
+    """test list_all_objects_parallel against a local fake BOS"""
+    def setUp(self):
+        self.server = _FakeBosServer()
+        self.client = bos_client.BosClient(self.server.config())
+        _FakeBosHandler.list_max_keys = 7
+        self.keys = ['a%02d' % i for i in range(5)]
+        self.keys += ['dir%d/obj%03d' % (i, j) for i in range(4) for j in range(20)]
+        self.keys += ['z%03d' % i for i in range(30)]
+        for key in self.keys:
+            self.server.objects[('bkt', key)] = b'x'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _keys(self, **kwargs):
+        return [item.key for item in self.client.list_all_objects_parallel(b'bkt', **kwargs)]
+
+    def test_common_prefixes(self):
+        """test the ranges discovered from the common prefixes and the interpolated tail"""
+        self.assertEqual(self._keys(thread_num=3), sorted(self.keys))
+        chains = [q for q in _FakeBosHandler.list_requests if 'delimiter' not in q]
+        self.assertIn('dir2/', [q['prefix'] for q in chains if 'marker' not in q])
+        self.assertTrue([q for q in chains if q.get('marker', '') > 'z011'])
+        self.assertEqual(self._keys(prefix='dir1/', thread_num=2),
+                         ['dir1/obj%03d' % j for j in range(20)])
+
+    def test_split_keys_and_partitions(self):
+        """test explicit split keys and interpolated partitions"""
+        self.assertEqual(self._keys(split_keys=['b', 'dir2/obj010', 'y'], thread_num=2),
+                         sorted(self.keys))
+        self.assertEqual(self._keys(partitions=5, thread_num=2), sorted(self.keys))
+        self.assertEqual(self._keys(prefix='dir', partitions=3, thread_num=2),
+                         sorted(k for k in self.keys if k.startswith('dir')))
+
+    def test_unordered(self):
+        """test the unordered listing yields every object once"""
+        keys = self._keys(ordered=False, thread_num=4)
+        self.assertEqual(sorted(keys), sorted(self.keys))
+
+    def test_error(self):
+        """test a failing listing raises in the caller"""
+        config = self.server.config()
+        config.endpoint = b'127.0.0.1:1'
+        config.retry_policy = NoRetryPolicy()
+        self.assertRaises(BceHttpClientError, self._keys, partitions=3, thread_num=2,
+                          config=config)
+
+
+class TestDeleteObjectsBulk(unittest.TestCase):
+    """test delete_objects_bulk against a local fake BOS"""
+    def setUp(self):
+        self.server = _FakeBosServer()
+        self.client = bos_client.BosClient(self.server.config())
+        self.keys = ['obj%05d' % i for i in range(2500)]
+        for key in self.keys:
+            self.server.objects[('bkt', key)] = b'x'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_delete(self):
+        """test keys are chunked to the per request limit and listed items are accepted"""
+        result = self.client.delete_objects_bulk(b'bkt', self.client.list_all_objects(b'bkt'),
+                                                 keys_per_request=5000, thread_num=3)
+        self.assertEqual((result.deleted, result.requests, result.errors), (2500, 3, []))
+        self.assertEqual(sorted(_FakeBosHandler.delete_sizes), [500, 1000, 1000])
+        self.assertEqual(self.server.objects, {})
+
+    def test_partial_failures(self):
+        """test only the keys failing transiently are deleted again"""
+        _FakeBosHandler.delete_failures = {'obj00001': ['InternalError', 'SlowDown'],
+                                           'obj00002': ['AccessDenied'],
+                                           'obj00003': ['InternalError'] * 5}
+        result = self.client.delete_objects_bulk(b'bkt', iter(self.keys[:100] + ['missing']),
+                                                 keys_per_request=40, thread_num=2,
+                                                 max_retries=2)
+        self.assertEqual(result.deleted, 98)
+        self.assertEqual(sorted((e.key, e.code) for e in result.errors),
+                         [('missing', 'NoSuchKey'), ('obj00002', 'AccessDenied'),
+                          ('obj00003', 'InternalError')])
+        self.assertEqual(sorted(_FakeBosHandler.delete_sizes), [2, 2, 21, 40, 40])
+        self.assertEqual(result.requests, 5)
+        self.assertEqual(sorted(k for _, k in self.server.objects)[:3],
+                         ['obj00002', 'obj00003', 'obj00100'])
+
+    def test_request_error(self):
+        """test errors of whole requests are raised"""
+        config = self.server.config()
+        config.retry_policy = NoRetryPolicy()
+        self.server.shutdown()
+        self.server.server_close()
+        self.assertRaises(BceHttpClientError, self.client.delete_objects_bulk, b'bkt',
+                          self.keys, config=config)
+
+
+class TestTransferManager(unittest.TestCase):
+    """test TransferManager against a local fake BOS"""
+    def setUp(self):
+        self.server = _FakeBosServer()
+        self.client = bos_client.BosClient(self.server.config())
+        self.local_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.local_dir)
+        self.files = {'a.txt': b'a' * 10, 'sub/b.bin': os.urandom(3000),
+                      'sub/deep/c.bin': os.urandom(12 * 1024 * 1024 + 5)}
+        for rel, data in self.files.items():
+            self._write(self.local_dir, rel, data)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    @staticmethod
+    def _write(local_dir, rel, data):
+        file_name = os.path.join(local_dir, *rel.split('/'))
+        if not os.path.isdir(os.path.dirname(file_name)):
+            os.makedirs(os.path.dirname(file_name))
+        with open(file_name, 'wb') as fp:
+            fp.write(data)
+        return file_name
+
+    def _manager(self, **kwargs):
+        kwargs.setdefault('max_workers', 2)
+        kwargs.setdefault('multipart_threshold', 5 * 1024 * 1024)
+        kwargs.setdefault('part_size', 5)
+        manager = bos_transfer_manager.TransferManager(self.client, **kwargs)
+        self.addCleanup(manager.close)
+        return manager
+
+    def test_upload_and_download(self):
+        """test directories are mirrored and unchanged files are skipped"""
+        progress = []
+        manager = self._manager()
+        result = manager.upload_dir(self.local_dir, 'bkt', 'backup/',
+                                    progress_callback=lambda *args: progress.append(args))
+        total = sum(len(data) for data in self.files.values())
+        self.assertEqual((result.transferred, result.skipped, result.errors), (3, 0, []))
+        self.assertEqual(result.transferred_bytes, total)
+        self.assertEqual(progress[-1], (total, total))
+        for rel, data in self.files.items():
+            self.assertEqual(self.server.objects[('bkt', 'backup/' + rel)], data)
+
+        result = manager.upload_dir(self.local_dir, 'bkt', 'backup/')
+        self.assertEqual((result.transferred, result.skipped), (0, 3))
+
+        target_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, target_dir)
+        self.server.objects[('bkt', 'backup/empty/')] = b''
+        result = manager.sync('bos://bkt/backup/', target_dir)
+        self.assertEqual((result.transferred, result.errors), (3, []))
+        for rel, data in self.files.items():
+            with open(os.path.join(target_dir, *rel.split('/')), 'rb') as fp:
+                self.assertEqual(fp.read(), data)
+        self.assertFalse(os.path.exists(os.path.join(target_dir, 'empty')))
+        result = manager.sync('bos://bkt/backup/', target_dir)
+        self.assertEqual((result.transferred, result.skipped), (0, 3))
+
+        self._write(target_dir, 'a.txt', b'changed')
+        self._write(target_dir, 'extra.txt', b'extra')
+        result = manager.sync('bos://bkt/backup/', target_dir, delete=True)
+        self.assertEqual((result.transferred, result.skipped, result.deleted), (1, 2, 1))
+        self.assertEqual(sorted(os.listdir(target_dir)), ['a.txt', 'sub'])
+
+    def test_compare_content(self):
+        """test the etag and crc32 comparisons, and deleting the extra objects"""
+        self.server.objects[('bkt', 'a.txt')] = self.files['a.txt']
+        self.server.objects[('bkt', 'sub/b.bin')] = b'x' * 3000
+        self.server.objects[('bkt', 'old.txt')] = b'old'
+        result = self._manager(compare='etag').upload_dir(self.local_dir, 'bkt', delete=True)
+        self.assertEqual((result.transferred, result.skipped, result.deleted), (2, 1, 1))
+        self.assertNotIn(('bkt', 'old.txt'), self.server.objects)
+        self.assertEqual(self.server.objects[('bkt', 'sub/b.bin')], self.files['sub/b.bin'])
+
+        self._write(self.local_dir, 'a.txt', b'b' * 10)
+        result = self._manager(compare='crc32').upload_dir(self.local_dir, 'bkt')
+        self.assertEqual((result.transferred, result.skipped), (1, 2))
+        self.assertRaises(ValueError, bos_transfer_manager.TransferManager, self.client,
+                          compare='md5')
+
+    def test_download_unsafe_keys(self):
+        """test keys which are not paths under the directory are not downloaded"""
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        target_dir = os.path.join(root, 'a', 'dst')
+        outside = os.path.join(root, 'outside')
+        os.makedirs(target_dir)
+        os.makedirs(outside)
+        keys = ['p/../../escaped.txt', 'p/x//y.txt', 'p/./z.txt', 'p/link/w.txt']
+        for key in keys + ['p/ok.txt']:
+            self.server.objects[('bkt', key)] = b'data'
+        if hasattr(os, 'symlink'):
+            os.symlink(outside, os.path.join(target_dir, 'link'))
+        else:
+            keys.remove('p/link/w.txt')
+        result = self._manager().download_dir('bkt', 'p/', target_dir, delete=True)
+        self.assertEqual(result.transferred, 1)
+        self.assertEqual(sorted(e.key for e in result.errors), sorted(keys))
+        self.assertFalse(os.path.exists(os.path.join(root, 'escaped.txt')))
+        self.assertEqual(os.listdir(outside), [])
+        self.assertTrue(os.path.isfile(os.path.join(target_dir, 'ok.txt')))
+
+    def test_errors_and_bandwidth(self):
+        """test failed transfers are reported and the bandwidth is limited"""
+        os.remove(os.path.join(self.local_dir, 'sub', 'deep', 'c.bin'))
+        manager = self._manager(max_bandwidth=2000)
+        start = time.time()
+        result = manager.upload_dir(self.local_dir, 'bkt')
+        self.assertEqual(result.transferred, 2)
+        self.assertGreater(time.time() - start, 0.4)
+
+        target_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, target_dir)
+        self.server.objects[('bkt', 'gone')] = b'x'
+        _FakeBosHandler.modified[('bkt', 'gone')] = time.time()
+        real_get = self.client.get_object_to_file
+
+        def get_object_to_file(bucket_name, key, file_name, **kwargs):
+            if key == b'gone':
+                raise BceClientError('gone')
+            return real_get(bucket_name, key, file_name, **kwargs)
+        self.client.get_object_to_file = get_object_to_file
+        result = manager.download_dir('bkt', '', target_dir)
+        self.assertEqual(result.transferred, 2)
+        self.assertEqual([(e.key, str(e.error)) for e in result.errors], [('gone', 'gone')])
+        self.assertEqual(sorted(os.listdir(target_dir)), ['a.txt', 'sub'])
+
+
+class TestPutObjectChecksum(unittest.TestCase):
+    """test checksums of put_object bodies against a local fake BOS"""
+    def setUp(self):
+        self.server = _FakeBosServer()
+        self.data = os.urandom(100000)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _put(self, data, under_line_headers=True):
+        config = self.server.config()
+        config.under_line_headers = under_line_headers
+        client = bos_client.BosClient(config)
+        return client.put_object(b'bkt', b'key', data, len(self.data))
+
+    def test_file_object(self):
+        """test the crc32 of a streamed body is checked, whatever the header style"""
+        self._put(_ReadOnlyStream(self.data))
+        self._put(_ReadOnlyStream(self.data), under_line_headers=False)
+        self.assertEqual(self.server.objects[('bkt', 'key')], self.data)
+
+    def test_missing_server_crc32(self):
+        """test a streamed body without a crc32 in the response is logged"""
+        _FakeBosHandler.put_returns_crc32 = False
+        with patch.object(bos_client._logger, 'warning') as warning:
+            self._put(_ReadOnlyStream(self.data))
+        self.assertEqual(warning.call_count, 1)
+        self.assertEqual(self.server.objects[('bkt', 'key')], self.data)
+
+    def test_wrong_server_crc32(self):
+        """test a streamed body whose crc32 differs from the response is an error"""
+        with patch.object(_FakeBosHandler, '_object_headers', _corrupted_object_headers):
+            self.assertRaises(BceClientError, self._put, _ReadOnlyStream(self.data))
+
+    def test_seekable_file_sends_crc32(self):
+        """test the crc32 of a seekable file is computed before sending it"""
+        _FakeBosHandler.put_returns_crc32 = False
+        fd, file_name = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, file_name)
+        with open(file_name, 'wb') as fp:
+            fp.write(self.data)
+        client = bos_client.BosClient(self.server.config())
+        with patch.object(bos_client._logger, 'warning') as warning:
+            client.put_object_from_file(b'bkt', b'key', file_name)
+            with open(file_name, 'rb') as fp:
+                client.put_object(b'bkt', b'fp', fp, len(self.data))
+        self.assertEqual(warning.call_count, 0)
+        self.assertEqual(int(_FakeBosHandler.last_put_headers['x-bce-content-crc32']),
+                         zlib.crc32(self.data) & 0xffffffff)
+        self.assertEqual(self.server.objects[('bkt', 'fp')], self.data)
+
+    def test_in_memory_body_sends_crc32(self):
+        """test the crc32 of an in memory body is sent for the server to check"""
+        _FakeBosHandler.put_returns_crc32 = False
+        self._put(io.BytesIO(self.data))
+        self.assertEqual(self.server.objects[('bkt', 'key')], self.data)
+        self.assertEqual(int(_FakeBosHandler.last_put_headers['x-bce-content-crc32']),
+                         zlib.crc32(self.data))
+
+
 class TestBceClientConfiguration(TestClient):
     """test BceClientConfiguration"""
     def test_init(self):
@@ -3572,6 +4797,102 @@ class TestDecorator(TestClient):
         self.assertRaises(TypeError, MyClass().my_func, a=1, b=[], c=[])
 
 
+def _select_message(message_type, payload=b'', crc=None, **headers):
+    headers['message-type'] = message_type
+    raw = b''.join(struct.pack('B', len(k)) + k.replace('_', '-').encode('utf-8') +
+                   struct.pack('>H', len(v)) + v.encode('utf-8')
+                   for k, v in sorted(headers.items()))
+    if crc is None:
+        crc = zlib.crc32(payload) & 0xffffffff
+    return struct.pack('>II', 12 + len(raw) + len(payload), len(raw)) + raw + payload + \
+        struct.pack('>I', crc)
+
+
+class _TrickleBody(io.BytesIO):
+    """body returning at most 7 bytes per read, as a slow network"""
+    def readinto(self, b):
+        return io.BytesIO.readinto(self, memoryview(b)[:7])
+
+
+class _ReadOnlyBody(object):
+    """body without readinto, as a buffered AsyncHttpResponse"""
+    def __init__(self, data):
+        self.fp = io.BytesIO(data)
+
+    def read(self, amt=None):
+        return self.fp.read(amt)
+
+    def close(self):
+        pass
+
+
+class TestSelectResponse(unittest.TestCase):
+    """test parsing the messages of a select response"""
+    def _response(self, *messages, **kwargs):
+        body = b''.join(messages)
+        select_response = bos_client.SelectResponse()
+        fp = _ReadOnlyBody(body) if kwargs.get('read_only') else _TrickleBody(body)
+        select_response.init_from_http_response(fp, BceResponse())
+        return select_response
+
+    def _messages(self, records, end='success'):
+        messages = [_select_message('Records', r) for r in records]
+        messages.insert(1, _select_message('Cont', struct.pack('>QQ', 100, 20)))
+        messages.append(_select_message('End', error_code=end, error_message='failed'))
+        return messages
+
+    def test_result(self):
+        """test the SelectMessage of every message"""
+        messages = list(self._response(*self._messages([b'a,1\n', b'b,2\n'])).result())
+        self.assertEqual([m.type for m in messages], ['Records', 'Cont', 'Records', 'End'])
+        self.assertEqual(messages[0].payload, 'a,1\n')
+        self.assertEqual(messages[0].headers, {'message-type': 'Records'})
+        self.assertEqual((messages[1].bytes_scanned, messages[1].bytes_returned), (100, 20))
+        self.assertEqual(messages[3].headers['error-code'], 'success')
+        self.assertRaises(BceServerError, list,
+                          self._response(*self._messages([b'a'], end='SqlError')).result())
+
+    def test_iter_rows(self):
+        """test rows split across messages and larger than the buffer"""
+        big = b'x' * (600 * 1024)
+        records = [b'a,1\nb,', b'2\n', b'c,3', b'', b'\nd,4\n' + big, b'\ne,5']
+        for read_only in (False, True):
+            response = self._response(*self._messages(records), read_only=read_only)
+            rows = [bytes(row) for row in response.iter_rows()]
+            self.assertEqual(rows, [b'a,1', b'b,2', b'c,3', b'd,4', big, b'e,5'])
+            self.assertEqual((response.bytes_scanned, response.bytes_returned), (100, 20))
+        response = self._response(*self._messages([b'{"a":1}\r', b'\n{"a":2}\r\n{', b'}']))
+        self.assertEqual([bytes(row) for row in response.iter_rows(b'\r\n')],
+                         [b'{"a":1}', b'{"a":2}', b'{}'])
+
+    def test_iter_rows_split_delimiter(self):
+        """test delimiters split at every offset, over one byte payloads too"""
+        for delimiter in (b'\r\n', b'<|>', b'#--#'):
+            rows = [b'a,1', b'', b'b' + delimiter[:1], delimiter[1:] + b'c', b'd' * 20]
+            body = delimiter.join(rows)
+            for size in range(1, len(delimiter) + 2):
+                for offset in range(len(body)):
+                    records = [body[:offset]] + [body[i:i + size]
+                                                 for i in range(offset, len(body), size)]
+                    response = self._response(*self._messages(records))
+                    self.assertEqual([bytes(row) for row in response.iter_rows(delimiter)],
+                                     rows, (delimiter, size, offset))
+
+    def test_iter_records(self):
+        """test payloads are checked and truncated bodies are errors"""
+        records = [bytes(r) for r in self._response(*self._messages([b'ab', b'cd'])).iter_records()]
+        self.assertEqual(records, [b'ab', b'cd'])
+        bad = _select_message('Records', b'ab', crc=1)
+        self.assertRaises(BceClientError, list, self._response(bad).iter_records())
+        self.assertEqual(len(list(self._response(bad).result())), 1)
+        message = _select_message('Records', b'abcdef')
+        self.assertRaises(BceClientError, list, self._response(message[:-3]).iter_records())
+        self.assertRaises(BceClientError, list, self._response(message[:5]).iter_records())
+        response = self._response()
+        self.assertEqual(list(response.iter_records()), [])
+        self.assertTrue(response.http_response.closed)
+
+
 class TestSelectObject(TestClient):
     """test select_object """
     def test_select_object_csv(self):
@@ -7576,11 +8897,16 @@ def run_test():
     runner.run(unittest.makeSuite(TestMultiUploadFile))
     runner.run(unittest.makeSuite(TestPutSuperObejctFromFile))
     runner.run(unittest.makeSuite(TestPutSuperObjectAutoChunkSize))
+    runner.run(unittest.makeSuite(TestUploadCheckpoint))
+    runner.run(unittest.makeSuite(TestCopySuperObject))
+    runner.run(unittest.makeSuite(TestGetSuperObjectToFile))
     runner.run(unittest.makeSuite(TestAuthorization))
     runner.run(unittest.makeSuite(TestAbortMultipartUpload))
     runner.run(unittest.makeSuite(TestUtil))
     runner.run(unittest.makeSuite(TestHandler))
     runner.run(unittest.makeSuite(TestBceHttpClient))
+    runner.run(unittest.makeSuite(TestConnectionPool))
+    runner.run(unittest.makeSuite(TestAsyncHttpClient))
     runner.run(unittest.makeSuite(TestDoesBucketExist))
     runner.run(unittest.makeSuite(TestBceClientConfiguration))
     runner.run(unittest.makeSuite(TestGetRangeHeaderDict))
@@ -26,11 +26,16 @@ PY2 = sys.version_info[0] == 2
 PY3 = sys.version_info[0] == 3
 if PY3:
     import unittest.mock as mock
+    from urllib.parse import quote
 else:
     import mock as mock
+    from urllib import quote
 
+from baidubce import utils
 from baidubce.auth.bce_credentials import BceCredentials
 from baidubce.bce_client_configuration import BceClientConfiguration
+from baidubce.bce_response import BceResponse
+from baidubce.exception import BceHttpClientError
 from baidubce.services.bts import bts_client as bts
 from baidubce.services.bts.model import BatchPutRowArgs
 from baidubce.services.bts.model import BatchQueryRowArgs
@@ -399,6 +404,127 @@ class TestBtsClient(unittest.TestCase):
         res = self.bts_client.batch_put_row(instance_name, table_name, batch_put_row)
         self.assertEqual(res.status, 200)
 
+    def test_batch_put_row_keeps_rows(self):
+        """
+        test case for batch_put_row leaving the rows of the caller untouched
+        """
+        send_http_request = mock.Mock(return_value=MockHttpResponse(200, result=json.dumps({})))
+        self.bts_client._send_request = send_http_request
+
+        row = {"rowkey": "row 1", "cells": [{"column": "c1", "value": "v 1"}]}
+        batch_put_row = BatchPutRowArgs()
+        batch_put_row.rows.append(row)
+        self.bts_client.batch_put_row(b'ins01', b'tab01', batch_put_row)
+        self.assertEqual(row, {"rowkey": "row 1", "cells": [{"column": "c1", "value": "v 1"}]})
+        body = json.loads(send_http_request.call_args[1]["body"])
+        self.assertEqual(body, {"rows": [{"rowkey": "row%201",
+                                          "cells": [{"column": "c1", "value": "v%201"}]}]})
+
+    def test_bulk_put_rows(self):
+        """
+        test case for bulk_put_rows cutting requests by rows and bytes
+        """
+        bodies = []
+
+        def send_request(http_method, path, body=None, **kwargs):
+            bodies.append(json.loads(body))
+            return MockHttpResponse(200, result=json.dumps({}))
+        self.bts_client._send_request = send_request
+
+        rows = ({"rowkey": "row%03d" % i, "cells": [{"column": "c", "value": "v" * (i % 7)}]}
+                for i in range(250))
+        failures = self.bts_client.bulk_put_rows(b'ins01', b'tab01', rows,
+                                                 max_rows_per_request=100, max_workers=3)
+        self.assertEqual(failures, [])
+        self.assertEqual(sorted(len(b["rows"]) for b in bodies), [50, 100, 100])
+        self.assertEqual(sorted(r["rowkey"] for b in bodies for r in b["rows"]),
+                         ["row%03d" % i for i in range(250)])
+
+        del bodies[:]
+        rows = [Row("row%d" % i) for i in range(10)]
+        for row in rows:
+            row.append_cell(Cell("c", "x" * 100))
+        size = len(json.dumps(rows[0].to_dict()))
+        self.bts_client.bulk_put_rows(b'ins01', b'tab01', rows,
+                                      max_bytes_per_request=3 * size + 20)
+        self.assertEqual([len(b["rows"]) for b in bodies], [3, 3, 3, 1])
+
+    def test_bulk_put_rows_failures(self):
+        """
+        test case for bulk_put_rows isolating rejected rows and retrying failed requests
+        """
+        sent = []
+        attempts = {}
+
+        def send_request(http_method, path, body=None, **kwargs):
+            rowkeys = [r["rowkey"] for r in json.loads(body)["rows"]]
+            sent.append(rowkeys)
+            if "bad" in rowkeys:
+                raise BceHttpClientError("invalid row", None, status_code=400,
+                                         code="InvalidArgument")
+            if "denied" in rowkeys:
+                raise BceHttpClientError("invalid request", None, status_code=400)
+            attempts[rowkeys[0]] = attempts.get(rowkeys[0], 0) + 1
+            if rowkeys[0] == "flaky" and attempts["flaky"] == 1:
+                raise BceHttpClientError("unavailable", None, status_code=503)
+            if rowkeys[0] == "down":
+                raise BceHttpClientError("unavailable", None, status_code=503)
+            return MockHttpResponse(200, result=json.dumps({}))
+        self.bts_client._send_request = send_request
+
+        rows = [{"rowkey": k, "cells": []} for k in
+                ["a", "b", "bad", "c", "flaky", "f1", "down", "d1", "denied", "e1"]]
+        failures = self.bts_client.bulk_put_rows(b'ins01', b'tab01', rows,
+                                                 max_rows_per_request=2, max_retries=1)
+        self.assertEqual([(row["rowkey"], e.status_code) for row, e in failures],
+                         [("bad", 400), ("down", 503), ("d1", 503), ("denied", 400),
+                          ("e1", 400)])
+        self.assertEqual(sent.count(["denied", "e1"]), 1)
+        self.assertNotIn(["denied"], sent)
+        self.assertEqual(attempts["flaky"], 2)
+        self.assertEqual(attempts["down"], 2)
+        self.assertIn(["a", "b"], sent)
+        self.assertIn(["c"], sent)
+
+    def test_bulk_put_rows_split_depth(self):
+        """
+        test case for bulk_put_rows reporting a rejected request once it was split 10 times
+        """
+        sent = []
+
+        def send_request(http_method, path, body=None, **kwargs):
+            rowkeys = [r["rowkey"] for r in json.loads(body)["rows"]]
+            sent.append(rowkeys)
+            if "r0000" in rowkeys:
+                raise BceHttpClientError("too large", None, status_code=413)
+            return MockHttpResponse(200, result=json.dumps({}))
+        self.bts_client._send_request = send_request
+
+        rows = [{"rowkey": "r%04d" % i, "cells": []} for i in range(2048)]
+        failures = self.bts_client.bulk_put_rows(b'ins01', b'tab01', rows,
+                                                 max_rows_per_request=2048)
+        self.assertEqual([row["rowkey"] for row, e in failures], ["r0000", "r0001"])
+        self.assertEqual(len(sent), 21)
+
+    def test_bulk_put_rows_utf8_bytes(self):
+        """
+        test case for bulk_put_rows cutting requests by the utf-8 size of their json
+        """
+        bodies = []
+
+        def send_request(http_method, path, body=None, **kwargs):
+            bodies.append(json.loads(body))
+            return MockHttpResponse(200, result=json.dumps({}))
+        self.bts_client._send_request = send_request
+        self.bts_client._json_dumps = lambda obj: json.dumps(obj, ensure_ascii=False)
+
+        rows = [{"rowkey": "row%d" % i, "cells": [{"column": u"\u5217" * 50, "value": "v"}]}
+                for i in range(6)]
+        size = len(json.dumps(rows[0], ensure_ascii=False).encode('utf-8'))
+        self.bts_client.bulk_put_rows(b'ins01', b'tab01', rows,
+                                      max_bytes_per_request=2 * size + 20)
+        self.assertEqual([len(b["rows"]) for b in bodies], [2, 2, 2])
+
     def test_delete_row(self):
         """
         test case for delete_row
@@ -713,6 +839,98 @@ class TestBtsClient(unittest.TestCase):
         res2 = self.bts_client.scan(instance_name, table_name, scan_args_obj)
         self.assertEqual(res2.status, 200)
 
+    def _mock_scan_table(self, rowkeys):
+        """
+        answer scan requests from the sorted rowkeys, return the list of the scan arguments
+        """
+        table = sorted(quote(k) for k in rowkeys)
+        requests = []
+
+        def send_request(http_method, path, body=None, body_parser=None, **kwargs):
+            args = json.loads(body)
+            requests.append(args)
+            rows = []
+            for key in table:
+                if args["startRowkey"] and (key < args["startRowkey"] or
+                                            key == args["startRowkey"] and
+                                            not args["includeStart"]):
+                    continue
+                if args["stopRowkey"] and (key > args["stopRowkey"] or
+                                           key == args["stopRowkey"] and
+                                           not args["includeStop"]):
+                    break
+                rows.append({"rowkey": key, "cells": [{"column": "c", "value": quote("v " + key),
+                                                       "timestamp": 1}]})
+                if len(rows) == args["limit"]:
+                    break
+            response = BceResponse()
+            body_parser(MockHttpResponse(200, result=json.dumps({"result": rows})), response)
+            return response
+        self.bts_client._send_request = send_request
+        return requests
+
+    def test_scan_iter(self):
+        """
+        test case for scan_iter paging from the last rowkey and decoding the rows
+        """
+        rowkeys = ["row %03d" % i for i in range(25)]
+        requests = self._mock_scan_table(rowkeys)
+        rows = list(self.bts_client.scan_iter(b'ins01', b'tab01', ScanArgs(), page_size=10))
+        self.assertEqual([row["rowkey"] for row in rows], rowkeys)
+        self.assertEqual(rows[0]["cells"], [{"column": "c", "value": "v row%20000",
+                                             "timestamp": 1}])
+        self.assertEqual([(r["startRowkey"], r["includeStart"]) for r in requests],
+                         [("", True), ("row%20009", False), ("row%20019", False),
+                          ("row%20024", False)])
+
+        del requests[:]
+        scan_args = ScanArgs(start_rowkey="row 003", stop_rowkey="row 020", limit=12)
+        rows = list(self.bts_client.scan_iter(b'ins01', b'tab01', scan_args, page_size=5))
+        self.assertEqual([row["rowkey"] for row in rows], rowkeys[3:15])
+        self.assertEqual([r["limit"] for r in requests], [5, 5, 2])
+
+    def test_scan_iter_segments(self):
+        """
+        test case for scan_iter scanning segments of the range at the same time
+        """
+        rowkeys = [chr(c) + "%02d" % i for c in range(ord("a"), ord("z") + 1) for i in range(4)]
+        requests = self._mock_scan_table(rowkeys)
+        scan_args = ScanArgs(start_rowkey="b", stop_rowkey="y", include_stop=True)
+        rows = self.bts_client.scan_iter(b'ins01', b'tab01', scan_args, page_size=7,
+                                         segments=4)
+        self.assertEqual([row["rowkey"] for row in rows],
+                         [k for k in rowkeys if "b" <= k <= "y"])
+        self.assertEqual(len(set(r["stopRowkey"] for r in requests)), 4)
+
+        rows = self.bts_client.scan_iter(b'ins01', b'tab01', ScanArgs(), page_size=3,
+                                         split_keys=["c", "m"])
+        self.assertEqual([row["rowkey"] for row in rows], sorted(rowkeys))
+
+        # the rows come in the order of the encoded rowkeys
+        rowkeys = [u"k%s%d" % (c, i) for c in u"Z[中 " for i in range(3)]
+        self._mock_scan_table(rowkeys)
+        rows = self.bts_client.scan_iter(b'ins01', b'tab01', ScanArgs(), page_size=2,
+                                         segments=5)
+        self.assertEqual([row["rowkey"] for row in rows],
+                         sorted(rowkeys, key=lambda k: quote(k.encode('utf-8'))))
+
+    def test_scan_iter_error(self):
+        """
+        test case for scan_iter raising the error of a page
+        """
+        self.bts_client._send_request = mock.Mock(side_effect=BceHttpClientError("down", None))
+        rows = self.bts_client.scan_iter(b'ins01', b'tab01', ScanArgs())
+        self.assertRaises(BceHttpClientError, list, rows)
+
+    def test_split_key_range(self):
+        """
+        test case for cutting a key range into segments
+        """
+        self.assertEqual(utils.split_key_range("a", "c", 2), ["b"])
+        split_keys = utils.split_key_range("", "", 8)
+        self.assertEqual(len(split_keys), 7)
+        self.assertEqual(split_keys, sorted(split_keys))
+
 
 class TestCell(object):
     """
@@ -0,0 +1,146 @@
+# Copyright (c) 2014 Baidu.com, Inc. All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""
+Unit tests for the columnar sql results of tsdb.
+"""
+import io
+import json
+import math
+import os
+import sys
+import unittest
+
+file_path = os.path.normpath(os.path.dirname(__file__))
+sys.path.append(file_path + '/../../')
+
+from baidubce import utils
+from baidubce.bce_client_configuration import BceClientConfiguration
+from baidubce.bce_response import BceResponse
+from baidubce.services.tsdb import tsdb_handler
+from baidubce.services.tsdb.tsdb_client import TsdbClient
+
+
+class _Response(object):
+    def __init__(self, body):
+        self.body = io.BytesIO(body)
+
+    def read(self):
+        return self.body.read()
+
+    def close(self):
+        pass
+
+
+class TestDecodeColumns(unittest.TestCase):
+    """
+    Test class for tsdb_handler.decode_columns
+    """
+
+    def test_typed_columns(self):
+        """
+        test integer, float, nullable and string columns
+        """
+        body = json.dumps({
+            "rows": [[1465376157007, 51, 1.5, "server1", None],
+                     [1465376157008, 52.5, None, "server2", 3]],
+            "columns": [{"name": "timestamp"}, {"name": "value"}, {"name": "load"},
+                        {"name": "host"}, {"name": "rack"}],
+            "truncated": False}, indent=2).encode('utf-8')
+        names, data, others = tsdb_handler.decode_columns(body)
+        self.assertEqual(names, ["timestamp", "value", "load", "host", "rack"])
+        self.assertEqual(others, {"truncated": False})
+        self.assertEqual(data["timestamp"].typecode, 'q')
+        self.assertEqual(data["timestamp"].tolist(), [1465376157007, 1465376157008])
+        self.assertEqual(data["value"].typecode, 'd')
+        self.assertEqual(data["value"].tolist(), [51.0, 52.5])
+        self.assertEqual(data["load"][0], 1.5)
+        self.assertTrue(math.isnan(data["load"][1]))
+        self.assertEqual(data["host"], ["server1", "server2"])
+        self.assertEqual(data["rack"].tolist()[1], 3.0)
+
+    def test_fallback_to_list(self):
+        """
+        test nulls are kept as None when a numeric column falls back to a list
+        """
+        body = b'{"columns": ["a", "b"], "rows": [[1, null], [2, 3], [true, 1e400], ' \
+               b'[99999999999999999999, "x"]]}'
+        names, data, others = tsdb_handler.decode_columns(body)
+        self.assertEqual(names, ["a", "b"])
+        self.assertEqual(data["a"], [1, 2, True, 99999999999999999999])
+        self.assertEqual(data["b"], [None, 3.0, float('inf'), "x"])
+
+    def test_empty_and_malformed(self):
+        """
+        test empty results keep their columns and malformed ones raise ValueError
+        """
+        names, data, others = tsdb_handler.decode_columns(b'{"columns": ["a"], "rows": []}')
+        self.assertEqual(list(data.items()), [("a", data["a"])])
+        self.assertEqual(len(data["a"]), 0)
+        self.assertRaises(ValueError, tsdb_handler.decode_columns,
+                          b'{"columns": ["a"], "rows": [[1], [1, 2]]}')
+        self.assertRaises(ValueError, tsdb_handler.decode_columns,
+                          b'{"columns": ["a"], "rows": [[1]')
+
+    def test_parse_columns(self):
+        """
+        test parse_columns sets columns and data on the response
+        """
+        response = BceResponse()
+        tsdb_handler.parse_columns(
+                _Response(b'{"columns": ["a"], "rows": [[1], [2]], "truncated": true}'), response)
+        self.assertEqual(response.columns, ["a"])
+        self.assertEqual(response.data["a"].tolist(), [1, 2])
+        self.assertTrue(response.truncated)
+
+
+class TestGetColumnsWithSql(unittest.TestCase):
+    """
+    Test class for TsdbClient.get_columns_with_sql
+    """
+
+    def setUp(self):
+        self.client = TsdbClient(BceClientConfiguration(endpoint=b'tsdb.example.com'))
+        self.params = []
+
+        def send_request(http_method, path, params=None, body_parser=None, **kwargs):
+            self.params.append(params)
+            response = BceResponse()
+            body_parser(_Response(b'{"columns": ["t", "v", "h"], '
+                                  b'"rows": [[1, 0.5, "a"], [2, null, "b"]]}'), response)
+            return response
+        self.client._send_request = send_request
+
+    def test_array(self):
+        """
+        test the default format keeps the typed arrays
+        """
+        response = self.client.get_columns_with_sql(b'select * from m')
+        self.assertEqual(self.params, [{'sql': b'select * from m'}])
+        self.assertEqual(response.data["t"].tolist(), [1, 2])
+        self.assertRaises(ValueError, self.client.get_columns_with_sql, b'', 'csv')
+
+    @unittest.skipUnless(utils._get_numpy(), "numpy is not installed")
+    def test_numpy(self):
+        """
+        test numpy arrays of the column types
+        """
+        data = self.client.get_columns_with_sql(b'select * from m', 'numpy').data
+        self.assertEqual(str(data["t"].dtype), "int64")
+        self.assertEqual(str(data["v"].dtype), "float64")
+        self.assertEqual(str(data["h"].dtype), "object")
+        self.assertEqual(data["t"].sum(), 3)
+        self.assertTrue(math.isnan(data["v"][1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+# Copyright (c) 2014 Baidu.com, Inc. All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""
+Unit tests for tsdb datapoint writer.
+"""
+import gzip
+import io
+import json
+import os
+import sys
+import threading
+import unittest
+
+file_path = os.path.normpath(os.path.dirname(__file__))
+sys.path.append(file_path + '/../../')
+
+from baidubce.exception import BceClientError
+from baidubce.services.tsdb.tsdb_datapoint_writer import DatapointWriter
+
+
+class RecordingClient(object):
+    """
+    records the request bodies instead of sending them
+    """
+
+    def __init__(self, gate=None, fail=False, failures=0):
+        self.bodies = []
+        self.gate = gate
+        self.fail = fail
+        self.failures = failures
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def _json_dumps(self, obj):
+        return json.dumps(obj)
+
+    def write_encoded_datapoints(self, body, use_gzip=False):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if self.gate is not None:
+                self.gate.wait()
+            with self.lock:
+                failing = self.fail or self.failures > 0
+                self.failures -= 1
+            if failing:
+                raise IOError("write failed")
+            if use_gzip:
+                body = gzip.GzipFile(fileobj=io.BytesIO(body)).read()
+            with self.lock:
+                self.bodies.append(json.loads(body.decode('utf-8'))["datapoints"])
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def _datapoint(i):
+    return {"metric": "cpu_idle", "field": "value", "tags": {"host": "server%d" % (i % 3)},
+            "timestamp": 1465376157007 + i, "value": i}
+
+
+class TestDatapointWriter(unittest.TestCase):
+    """
+    Test class for DatapointWriter
+    """
+
+    def test_batches(self):
+        """
+        test datapoints are cut into gzip compressed batches of batch_size
+        """
+        client = RecordingClient()
+        with DatapointWriter(client, batch_size=10) as writer:
+            writer.put_all(_datapoint(i) for i in range(25))
+        self.assertEqual(sorted(len(b) for b in client.bodies), [5, 10, 10])
+        values = sorted(d["value"] for b in client.bodies for d in b)
+        self.assertEqual(values, list(range(25)))
+        self.assertEqual(writer.requests_sent, 3)
+        self.assertEqual(writer.datapoints_sent, 25)
+        self.assertRaises(BceClientError, writer.put, _datapoint(0))
+
+    def test_max_batch_bytes(self):
+        """
+        test batches are cut at max_batch_bytes of json, without gzip
+        """
+        client = RecordingClient()
+        size = len(json.dumps(_datapoint(10)))
+        with DatapointWriter(client, max_batch_bytes=3 * size + 20, use_gzip=False) as writer:
+            writer.put_all(_datapoint(i) for i in range(10, 20))
+        self.assertEqual([len(b) for b in client.bodies], [3, 3, 3, 1])
+
+    def test_max_in_flight(self):
+        """
+        test put blocks while max_in_flight batches are being sent
+        """
+        gate = threading.Event()
+        client = RecordingClient(gate=gate)
+        writer = DatapointWriter(client, batch_size=1, max_in_flight=2)
+        writer.put(_datapoint(0))
+        writer.put(_datapoint(1))
+        blocked = threading.Thread(target=writer.put, args=(_datapoint(2),))
+        blocked.start()
+        blocked.join(0.1)
+        self.assertTrue(blocked.is_alive())
+        gate.set()
+        blocked.join(5)
+        writer.close()
+        self.assertEqual(writer.datapoints_sent, 3)
+        self.assertEqual(client.max_active, 2)
+
+    def test_error_callback(self):
+        """
+        test the datapoints of failed batches are handed to error_callback
+        """
+        failed = []
+        writer = DatapointWriter(RecordingClient(fail=True), batch_size=2,
+                                 error_callback=lambda e, datapoints: failed.append(datapoints))
+        writer.put_all(_datapoint(i) for i in range(3))
+        writer.close()
+        self.assertEqual(sorted(len(d) for d in failed), [1, 2])
+        self.assertEqual(writer.errors, 2)
+        self.assertEqual(writer.datapoints_sent, 0)
+
+    def test_error_callback_put_again(self):
+        """
+        test error_callback can put the datapoints of a failed batch again
+        """
+        client = RecordingClient(failures=6)
+        writer = DatapointWriter(client, batch_size=1, max_in_flight=2,
+                                 error_callback=lambda e, datapoints: writer.put_all(datapoints))
+        thread = threading.Thread(target=lambda: (writer.put_all(_datapoint(i) for i in range(5)),
+                                                  writer.close()))
+        thread.daemon = True
+        thread.start()
+        thread.join(10)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(writer.errors, 6)
+        self.assertEqual(writer.datapoints_sent, 5)
+        self.assertEqual(sorted(b[0]["value"] for b in client.bodies), list(range(5)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+# Copyright (c) 2014 Baidu.com, Inc. All Rights Reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file
+# except in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the
+# License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+
+"""
+Unit tests for tsdb query executor.
+"""
+import io
+import json
+import os
+import sys
+import threading
+import unittest
+
+file_path = os.path.normpath(os.path.dirname(__file__))
+sys.path.append(file_path + '/../../')
+
+from baidubce import utils
+from baidubce.bce_response import BceResponse
+from baidubce.services.tsdb import tsdb_handler
+from baidubce.services.tsdb.tsdb_query_executor import QueryExecutor
+
+
+class FakeClient(object):
+    """
+    answers datapoint queries from a dict of host -> [(timestamp, value)], page_size points
+    per page
+    """
+
+    def __init__(self, points, page_size=None):
+        self.points = points
+        self.page_size = page_size
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def _get_datapoint_results(self, query_list, disable_presampling=False):
+        with self.lock:
+            self.requests.append(json.loads(json.dumps(query_list)))
+        response = BceResponse()
+        response.results = [self._result(query) for query in query_list]
+        return response
+
+    def _result(self, query):
+        filters = query['filters']
+        end = filters.get('end')
+        if not isinstance(end, int):
+            end = float('inf')
+        groups = []
+        for host in sorted(self.points):
+            values = [[t, v] for t, v in self.points[host]
+                      if filters['start'] <= t <= end]
+            if values:
+                groups.append({"groupInfos": [{"name": "Tag", "tags": {"host": host}}],
+                               "values": values})
+        offset = int(query.get('marker', 0))
+        result = {"metric": query['metric'], "field": query['field'], "truncated": False}
+        if self.page_size is None:
+            result["groups"] = groups
+            return result
+        # cut the flattened points of the groups into pages
+        flat = [(g, p) for g in groups for p in g["values"]]
+        page = flat[offset:offset + self.page_size]
+        result["groups"] = []
+        for g, p in page:
+            if not result["groups"] or result["groups"][-1]["groupInfos"] is not g["groupInfos"]:
+                result["groups"].append({"groupInfos": g["groupInfos"], "values": []})
+            result["groups"][-1]["values"].append(p)
+        if offset + self.page_size < len(flat):
+            result["truncated"] = True
+            result["nextMarker"] = str(offset + self.page_size)
+        return result
+
+
+def _query(start, end, **kwargs):
+    query = {"metric": "cpu_idle", "field": "value", "filters": {"start": start, "end": end},
+             "groupBy": [{"name": "Tag", "tags": ["host"]}]}
+    query.update(kwargs)
+    return query
+
+
+class TestQueryExecutor(unittest.TestCase):
+    """
+    Test class for QueryExecutor
+    """
+
+    def setUp(self):
+        self.points = {"server1": [(t, t * 2) for t in range(0, 100, 5)],
+                       "server2": [(t, t * 3) for t in range(0, 100, 10)]}
+
+    def test_time_slices(self):
+        """
+        test long ranges are cut into slices whose rows come back in time order
+        """
+        client = FakeClient(self.points)
+        executor = QueryExecutor(client, max_queries_per_request=2, time_slice=25)
+        rows = list(executor.iter_rows([_query(0, 99)]))
+        queries = [q for request in client.requests for q in request]
+        self.assertEqual(sorted((q["filters"]["start"], q["filters"]["end"]) for q in queries),
+                         [(0, 24), (25, 49), (50, 74), (75, 99)])
+        self.assertEqual(len(client.requests), 2)
+        timestamps = {}
+        for metric, tags, ts, values in rows:
+            self.assertEqual(metric, "cpu_idle")
+            timestamps.setdefault(tags["host"], []).extend(ts)
+        self.assertEqual(timestamps["server1"], list(range(0, 100, 5)))
+        self.assertEqual(timestamps["server2"], list(range(0, 100, 10)))
+
+    def test_not_sliced(self):
+        """
+        test aggregated and relative queries are sent as they are, in query order
+        """
+        client = FakeClient(self.points)
+        executor = QueryExecutor(client, max_queries_per_request=1, time_slice=10)
+        aggregated = _query(0, 99, aggregators=[{"name": "Sum", "sampling": "1 hour"}])
+        relative = _query(50, "1 hour ago")
+        rows = list(executor.iter_rows([aggregated, relative]))
+        self.assertEqual(len(client.requests), 2)
+        self.assertEqual(client.requests[0][0]["filters"], {"start": 0, "end": 99})
+        self.assertEqual([(r[1]["host"], r[2][0]) for r in rows],
+                         [("server1", 0), ("server2", 0), ("server1", 50), ("server2", 50)])
+
+    def test_pages(self):
+        """
+        test truncated results are followed by marker and merged per series
+        """
+        client = FakeClient(self.points, page_size=7)
+        executor = QueryExecutor(client)
+        rows = list(executor.iter_rows([_query(0, 99)]))
+        self.assertEqual(len(client.requests), 5)
+        self.assertEqual(client.requests[1][0]["marker"], "7")
+        self.assertEqual([(r[1], r[2], r[3]) for r in rows], [
+            ({"host": "server1"}, list(range(0, 100, 5)), [t * 2 for t in range(0, 100, 5)]),
+            ({"host": "server2"}, list(range(0, 100, 10)), [t * 3 for t in range(0, 100, 10)])])
+
+    @unittest.skipUnless(utils._get_numpy(), "numpy is not installed")
+    def test_numpy(self):
+        """
+        test timestamps and values are numpy arrays with use_numpy
+        """
+        executor = QueryExecutor(FakeClient(self.points), time_slice=50, use_numpy=True)
+        rows = list(executor.iter_rows([_query(0, 99)]))
+        self.assertEqual(len(rows), 4)
+        metric, tags, timestamps, values = rows[0]
+        self.assertEqual(str(timestamps.dtype), "int64")
+        self.assertEqual(timestamps.tolist(), list(range(0, 50, 5)))
+        self.assertEqual(values.sum(), sum(t * 2 for t in range(0, 50, 5)))
+
+    def test_parse_results(self):
+        """
+        test parse_results keeps the decoded json
+        """
+        class _Response(object):
+            def __init__(self, body):
+                self.body = io.BytesIO(body)
+
+            def read(self):
+                return self.body.read()
+
+            def close(self):
+                pass
+
+        response = BceResponse()
+        body = b'{"results": [{"metric": "m", "groups": [{"values": [[1, 2]]}]}]}'
+        tsdb_handler.parse_results(_Response(body), response)
+        self.assertEqual(response.results, [{"metric": "m", "groups": [{"values": [[1, 2]]}]}])
+
+
+if __name__ == '__main__':
+    unittest.main()